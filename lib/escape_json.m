@@ -0,0 +1,17 @@
+function [str] = escape_json(str)
+%ESCAPE_JSON escape the backslashes and double quotes of a string for a JSON
+%string value, e.g., the file paths in the python display jobs.
+%Example:
+%   [str] = escape_json('C:\tmp\tmp.mat')
+%Inputs:
+%   str: char
+%Outputs:
+%   str: char
+%       escaped string, e.g., 'C:\\tmp\\tmp.mat'.
+%History:
+%   2026-10-17. First Edition
+
+str = strrep(str, '\', '\\');
+str = strrep(str, '"', '\"');
+
+end
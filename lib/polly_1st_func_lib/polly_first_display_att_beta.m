@@ -81,11 +81,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
     %% display rcs 
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'ATT_BETA_532', 'height', 'time', 'flagLC532', 'att_beta_cRange_532', 'yLim_att_beta', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'polly_first_display_att_beta.py'), tmpFile, saveFolder));
+    flag = run_python_display(fullfile(pyFolder, 'polly_first_display_att_beta.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'polly_first_display_att_beta.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
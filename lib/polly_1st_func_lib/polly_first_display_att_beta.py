@@ -1,8 +1,6 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,53 +9,9 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
                              MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -93,6 +47,8 @@ def polly_first_display_att_beta(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,28 +57,38 @@ def polly_first_display_att_beta(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        ATT_BETA_532 = mat['ATT_BETA_532'][:]
-        if mat['height'].size:
-            height = mat['height'][0][:]
-        else:
-            height = np.array([])
-        if mat['time'].size:
-            time = mat['time'][0][:]
-        else:
-            time = np.array([])
-        att_beta_cRange_532 = mat['att_beta_cRange_532'][0][:]
-        yLim_att_beta = mat['yLim_att_beta'][:][0]
-        flagLC532 = mat['flagLC532'][:][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'ATT_BETA_532': 'array',
+            'height': 'vector',
+            'time': 'vector',
+            'att_beta_cRange_532': 'vector',
+            'yLim_att_beta': 'vector',
+            'flagLC532': 'string',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        ATT_BETA_532 = mat['ATT_BETA_532']
+        height = mat['height']
+        time = mat['time']
+        att_beta_cRange_532 = mat['att_beta_cRange_532']
+        yLim_att_beta = mat['yLim_att_beta']
+        flagLC532 = mat['flagLC532']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -155,7 +121,7 @@ def polly_first_display_att_beta(tmpFile, saveFolder):
     ax.yaxis.set_major_locator(MultipleLocator(2000))
     ax.yaxis.set_minor_locator(MultipleLocator(500))
     ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticklabels(xticklabel)
     ax.tick_params(
         axis='both', which='major', labelsize=15,
         right=True, top=True, width=2, length=5)
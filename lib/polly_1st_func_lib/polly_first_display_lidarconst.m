@@ -102,11 +102,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
     %% display rcs 
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC532_klett', 'LC532_raman', 'LC607_raman', 'LC532_aeronet', 'yLim532', 'yLim607', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'polly_first_display_lidarconst.py'), tmpFile, saveFolder));
+    flag = run_python_display(fullfile(pyFolder, 'polly_first_display_lidarconst.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'polly_first_display_lidarconst.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
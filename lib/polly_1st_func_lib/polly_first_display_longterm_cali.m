@@ -190,11 +190,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
     %% display longterm cali results
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'LCTime532', 'LCTime607', 'LC532Status', 'LC532History', 'LCStd532History', 'LC607Status', 'LC607History', 'LCStd607History', 'logbookTime', 'flagOverlap', 'flagWindowwipe', 'flagFlashlamps', 'flagPulsepower', 'flagRestart', 'flag_CH_NDChange', 'flagCH532FR', 'flagCH607FR', 'else_time', 'else_label', 'yLim532', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'polly_first_display_longterm_cali.py'), tmpFile, saveFolder));
+    flag = run_python_display(fullfile(pyFolder, 'polly_first_display_longterm_cali.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'polly_first_display_longterm_cali.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
@@ -41,11 +41,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
     %% display monitor status
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'monitorStatus', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'mTime', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'polly_first_display_monitor.py'), tmpFile, saveFolder));
+    flag = run_python_display(fullfile(pyFolder, 'polly_first_display_monitor.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'polly_first_display_monitor.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
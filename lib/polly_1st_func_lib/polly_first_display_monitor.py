@@ -1,8 +1,6 @@
 import sys
 import os
-from datetime import datetime, timedelta
 import numpy as np
-import scipy.io as spio
 from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 from matplotlib.colors import ListedColormap
@@ -10,53 +8,9 @@ import matplotlib.pyplot as plt
 import matplotlib
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -92,6 +46,8 @@ def polly_first_display_monitor(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     """
 
     if not os.path.exists(tmpFile):
@@ -100,26 +56,46 @@ def polly_first_display_monitor(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        time = mat['monitorStatus']['time'][0][0]
-        mTime = mat['mTime'][0][:]
-        AD = mat['monitorStatus']['AD'][0][0]
-        EN = mat['monitorStatus']['EN'][0][0]
-        HT = mat['monitorStatus']['HT'][0][0]
-        WT = mat['monitorStatus']['WT'][0][0]
-        counts = mat['monitorStatus']['counts'][0][0]
-        Temp1064 = mat['monitorStatus']['Temp1064'][0][0]
-        Temp1 = mat['monitorStatus']['Temp1'][0][0]
-        Temp2 = mat['monitorStatus']['Temp2'][0][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'monitorStatus.time': 'array',
+            'mTime': 'vector',
+            'monitorStatus.AD': 'array',
+            'monitorStatus.EN': 'array',
+            'monitorStatus.HT': 'array',
+            'monitorStatus.WT': 'array',
+            'monitorStatus.counts': 'array',
+            'monitorStatus.Temp1064': 'array',
+            'monitorStatus.Temp1': 'array',
+            'monitorStatus.Temp2': 'array',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        time = mat['monitorStatus.time']
+        mTime = mat['mTime']
+        AD = mat['monitorStatus.AD']
+        EN = mat['monitorStatus.EN']
+        HT = mat['monitorStatus.HT']
+        WT = mat['monitorStatus.WT']
+        counts = mat['monitorStatus.counts']
+        Temp1064 = mat['monitorStatus.Temp1064']
+        Temp1 = mat['monitorStatus.Temp1']
+        Temp2 = mat['monitorStatus.Temp2']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
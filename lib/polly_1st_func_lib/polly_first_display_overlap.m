@@ -116,11 +116,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
 
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'overlap532', 'overlap532Defaults', 'sig532FR', 'sig532Gl', 'sigRatio532', 'normRange532', 'height', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'polly_first_display_overlap.py'), tmpFile, saveFolder));
+    flag = run_python_display(fullfile(pyFolder, 'polly_first_display_overlap.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'polly_first_display_overlap.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
@@ -1,8 +1,6 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,53 +9,9 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -93,6 +47,8 @@ def polly_first_display_rcs(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,29 +57,51 @@ def polly_first_display_rcs(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        mTime = mat['mTime'][0][:]
-        height = mat['height'][0][:]
-        depCalMask = mat['depCalMask'][0][:]
-        fogMask = mat['fogMask'][0][:]
-        RCS_FR_532 = mat['RCS_FR_532'][:]
-        RCS_NR_532 = mat['RCS_NR_532'][:]
-        volDepol_532 = mat['volDepol_532'][:]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'mTime': 'vector',
+            'height': 'vector',
+            'depCalMask': 'vector',
+            'fogMask': 'vector',
+            'RCS_FR_532': 'array',
+            'RCS_NR_532': 'array',
+            'volDepol_532': 'array',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string',
+            'yLim_FR_RCS': 'vector',
+            'yLim_NR_RCS': 'vector',
+            'yLim_FR_DR': 'vector',
+            'RCS532FRColorRange': 'vector',
+            'RCS532NRColorRange': 'vector'
+            })
+        figDPI = mat['figDPI']
+        mTime = mat['mTime']
+        height = mat['height']
+        depCalMask = mat['depCalMask']
+        fogMask = mat['fogMask']
+        RCS_FR_532 = mat['RCS_FR_532']
+        RCS_NR_532 = mat['RCS_NR_532']
+        volDepol_532 = mat['volDepol_532']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
-        yLim_FR_RCS = mat['yLim_FR_RCS'][:][0]
-        yLim_NR_RCS = mat['yLim_NR_RCS'][:][0]
-        yLim_FR_DR = mat['yLim_FR_DR'][:][0]
-        RCS532FRColorRange = mat['RCS532FRColorRange'][:][0]
-        RCS532NRColorRange = mat['RCS532NRColorRange'][:][0]
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
+        yLim_FR_RCS = mat['yLim_FR_RCS']
+        yLim_NR_RCS = mat['yLim_NR_RCS']
+        yLim_FR_DR = mat['yLim_FR_DR']
+        RCS532FRColorRange = mat['RCS532FRColorRange']
+        RCS532NRColorRange = mat['RCS532NRColorRange']
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -161,7 +139,7 @@ def polly_first_display_rcs(tmpFile, saveFolder):
     ax.yaxis.set_minor_locator(MultipleLocator(500))
     ax.set_ylim([yLim_FR_RCS[0], yLim_FR_RCS[1]])
     ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticklabels(xticklabel)
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
     ax.tick_params(axis='both', which='minor', width=1.5,
@@ -205,7 +183,7 @@ def polly_first_display_rcs(tmpFile, saveFolder):
     ax.yaxis.set_minor_locator(MultipleLocator(200))
     ax.set_ylim([yLim_NR_RCS[0], yLim_NR_RCS[1]])
     ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticklabels(xticklabel)
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
     ax.tick_params(axis='both', which='minor', width=1.5,
@@ -248,7 +226,7 @@ def polly_first_display_rcs(tmpFile, saveFolder):
     ax.yaxis.set_minor_locator(MultipleLocator(500))
     ax.set_ylim([yLim_FR_DR[0], yLim_FR_DR[1]])
     ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticklabels(xticklabel)
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
     ax.tick_params(axis='both', which='minor', width=1.5,
@@ -1,8 +1,6 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,53 +9,9 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -93,6 +47,8 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,42 +57,76 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        startIndx = mat['startIndx'][:][0][0]
-        endIndx = mat['endIndx'][:][0][0]
-        rcs532 = mat['rcs532'][:][0]
-        height = mat['height'][:][0]
-        time = mat['time'][:][0]
-        molRCS532 = mat['molRCS532'][:][0]
-        refHIndx532 = mat['refHIndx532'][:][0]
-        aerBsc_532_klett = mat['aerBsc_532_klett'][:][0]
-        aerBsc_532_raman = mat['aerBsc_532_raman'][:][0]
-        aerExt_532_klett = mat['aerExt_532_klett'][:][0]
-        aerExt_532_raman = mat['aerExt_532_raman'][:][0]
-        LR532_raman = mat['LR532_raman'][:][0]
-        meteorSource = mat['meteorSource'][:][0]
-        temperature = mat['temperature'][:][0]
-        pressure = mat['pressure'][:][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        yLim_Profi_Ext = mat['yLim_Profi_Ext'][:][0]
-        yLim_Profi_LR = mat['yLim_Profi_LR'][:][0]
-        yLim_Profi_DR = mat['yLim_Profi_DR'][:][0]
-        yLim_Profi_Bsc = mat['yLim_Profi_Bsc'][:][0]
-        yLim_FR_RCS = mat['yLim_FR_RCS'][:][0]
-        yLim_NR_RCS = mat['yLim_NR_RCS'][:][0]
-        xLim_Profi_Bsc = mat['xLim_Profi_Bsc'][:][0]
-        xLim_Profi_NR_Bsc = mat['xLim_Profi_NR_Bsc'][:][0]
-        xLim_Profi_Ext = mat['xLim_Profi_Ext'][:][0]
-        xLim_Profi_NR_Ext = mat['xLim_Profi_NR_Ext'][:][0]
-        xLim_Profi_RCS = mat['xLim_Profi_RCS'][:][0]
-        xLim_Profi_LR = mat['xLim_Profi_LR'][:][0]
-        imgForamt = mat['imgForamt'][:][0]
-
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'startIndx': 'scalar',
+            'endIndx': 'scalar',
+            'rcs532': 'vector',
+            'height': 'vector',
+            'time': 'vector',
+            'molRCS532': 'vector',
+            'refHIndx532': 'vector',
+            'aerBsc_532_klett': 'vector',
+            'aerBsc_532_raman': 'vector',
+            'aerExt_532_klett': 'vector',
+            'aerExt_532_raman': 'vector',
+            'LR532_raman': 'vector',
+            'meteorSource': 'string',
+            'temperature': 'vector',
+            'pressure': 'vector',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'yLim_Profi_Ext': 'vector',
+            'yLim_Profi_LR': 'vector',
+            'yLim_Profi_DR': 'vector',
+            'yLim_Profi_Bsc': 'vector',
+            'yLim_FR_RCS': 'vector',
+            'yLim_NR_RCS': 'vector',
+            'xLim_Profi_Bsc': 'vector',
+            'xLim_Profi_NR_Bsc': 'vector',
+            'xLim_Profi_Ext': 'vector',
+            'xLim_Profi_NR_Ext': 'vector',
+            'xLim_Profi_RCS': 'vector',
+            'xLim_Profi_LR': 'vector',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        startIndx = mat['startIndx']
+        endIndx = mat['endIndx']
+        rcs532 = mat['rcs532']
+        height = mat['height']
+        time = mat['time']
+        molRCS532 = mat['molRCS532']
+        refHIndx532 = mat['refHIndx532']
+        aerBsc_532_klett = mat['aerBsc_532_klett']
+        aerBsc_532_raman = mat['aerBsc_532_raman']
+        aerExt_532_klett = mat['aerExt_532_klett']
+        aerExt_532_raman = mat['aerExt_532_raman']
+        LR532_raman = mat['LR532_raman']
+        meteorSource = mat['meteorSource']
+        temperature = mat['temperature']
+        pressure = mat['pressure']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        yLim_Profi_Ext = mat['yLim_Profi_Ext']
+        yLim_Profi_LR = mat['yLim_Profi_LR']
+        yLim_Profi_DR = mat['yLim_Profi_DR']
+        yLim_Profi_Bsc = mat['yLim_Profi_Bsc']
+        yLim_FR_RCS = mat['yLim_FR_RCS']
+        yLim_NR_RCS = mat['yLim_NR_RCS']
+        xLim_Profi_Bsc = mat['xLim_Profi_Bsc']
+        xLim_Profi_NR_Bsc = mat['xLim_Profi_NR_Bsc']
+        xLim_Profi_Ext = mat['xLim_Profi_Ext']
+        xLim_Profi_NR_Ext = mat['xLim_Profi_NR_Ext']
+        xLim_Profi_RCS = mat['xLim_Profi_RCS']
+        xLim_Profi_LR = mat['xLim_Profi_LR']
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -195,7 +185,7 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
                 dataFilename=rmext(dataFilename),
                 starttime=datenum_to_datetime(starttime).strftime('%H%M'),
                 endtime=datenum_to_datetime(endtime).strftime('%H%M'),
-                imgFmt=imgForamt)),
+                imgFmt=imgFormat)),
         dpi=figDPI)
     plt.close()
 
@@ -239,7 +229,7 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
                 dataFilename=rmext(dataFilename),
                 starttime=datenum_to_datetime(starttime).strftime('%H%M'),
                 endtime=datenum_to_datetime(endtime).strftime('%H%M'),
-                imgFmt=imgForamt)),
+                imgFmt=imgFormat)),
         dpi=figDPI)
     plt.close()
 
@@ -283,7 +273,7 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
                 dataFilename=rmext(dataFilename),
                 starttime=datenum_to_datetime(starttime).strftime('%H%M'),
                 endtime=datenum_to_datetime(endtime).strftime('%H%M'),
-                imgFmt=imgForamt)),
+                imgFmt=imgFormat)),
         dpi=figDPI)
     plt.close()
 
@@ -327,7 +317,7 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
                 dataFilename=rmext(dataFilename),
                 starttime=datenum_to_datetime(starttime).strftime('%H%M'),
                 endtime=datenum_to_datetime(endtime).strftime('%H%M'),
-                imgFmt=imgForamt)),
+                imgFmt=imgFormat)),
         dpi=figDPI)
     plt.close()
 
@@ -371,7 +361,7 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
                 dataFilename=rmext(dataFilename),
                 starttime=datenum_to_datetime(starttime).strftime('%H%M'),
                 endtime=datenum_to_datetime(endtime).strftime('%H%M'),
-                imgFmt=imgForamt)),
+                imgFmt=imgFormat)),
         dpi=figDPI)
     plt.close()
 
@@ -415,7 +405,7 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
                 dataFilename=rmext(dataFilename),
                 starttime=datenum_to_datetime(starttime).strftime('%H%M'),
                 endtime=datenum_to_datetime(endtime).strftime('%H%M'),
-                imgFmt=imgForamt)),
+                imgFmt=imgFormat)),
         dpi=figDPI)
     plt.close()
 
@@ -458,7 +448,7 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
                 dataFilename=rmext(dataFilename),
                 starttime=datenum_to_datetime(starttime).strftime('%H%M'),
                 endtime=datenum_to_datetime(endtime).strftime('%H%M'),
-                imgFmt=imgForamt)),
+                imgFmt=imgFormat)),
         dpi=figDPI)
     plt.close()
 
@@ -501,7 +491,7 @@ def polly_first_display_retrieving(tmpFile, saveFolder):
                 dataFilename=rmext(dataFilename),
                 starttime=datenum_to_datetime(starttime).strftime('%H%M'),
                 endtime=datenum_to_datetime(endtime).strftime('%H%M'),
-                imgFmt=imgForamt)),
+                imgFmt=imgFormat)),
         dpi=figDPI)
     plt.close()
 
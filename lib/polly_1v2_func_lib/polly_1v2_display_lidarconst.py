@@ -1,8 +1,6 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,53 +9,9 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -93,6 +47,8 @@ def polly_1v2_display_lidarconst(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     '''
 
     if not os.path.exists(tmpFile):
@@ -101,34 +57,62 @@ def polly_1v2_display_lidarconst(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        thisTime = np.concatenate(mat['thisTime'][:])
-        time = mat['time'][0][:]
-        LC355_klett = mat['LC355_klett'][:]
-        LC355_raman = mat['LC355_raman'][:]
-        LC355_aeronet = mat['LC355_aeronet'][:]
-        LC532_klett = mat['LC532_klett'][:]
-        LC532_raman = mat['LC532_raman'][:]
-        LC532_aeronet = mat['LC532_aeronet'][:]
-        LC1064_klett = mat['LC1064_klett'][:]
-        LC1064_raman = mat['LC1064_raman'][:]
-        LC1064_aeronet = mat['LC1064_aeronet'][:]
-        LC387_raman = mat['LC387_raman'][:]
-        LC607_raman = mat['LC607_raman'][:]
-        yLim355 = mat['yLim355'][0][:]
-        yLim532 = mat['yLim532'][0][:]
-        yLim1064 = mat['yLim1064'][0][:]
-        yLim387 = mat['yLim387'][0][:]
-        yLim607 = mat['yLim607'][0][:]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'thisTime': 'vector',
+            'time': 'vector',
+            'LC355_klett': 'array',
+            'LC355_raman': 'array',
+            'LC355_aeronet': 'array',
+            'LC532_klett': 'array',
+            'LC532_raman': 'array',
+            'LC532_aeronet': 'array',
+            'LC1064_klett': 'array',
+            'LC1064_raman': 'array',
+            'LC1064_aeronet': 'array',
+            'LC387_raman': 'array',
+            'LC607_raman': 'array',
+            'yLim355': 'vector',
+            'yLim532': 'vector',
+            'yLim1064': 'vector',
+            'yLim387': 'vector',
+            'yLim607': 'vector',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        thisTime = mat['thisTime']
+        time = mat['time']
+        LC355_klett = mat['LC355_klett']
+        LC355_raman = mat['LC355_raman']
+        LC355_aeronet = mat['LC355_aeronet']
+        LC532_klett = mat['LC532_klett']
+        LC532_raman = mat['LC532_raman']
+        LC532_aeronet = mat['LC532_aeronet']
+        LC1064_klett = mat['LC1064_klett']
+        LC1064_raman = mat['LC1064_raman']
+        LC1064_aeronet = mat['LC1064_aeronet']
+        LC387_raman = mat['LC387_raman']
+        LC607_raman = mat['LC607_raman']
+        yLim355 = mat['yLim355']
+        yLim532 = mat['yLim532']
+        yLim1064 = mat['yLim1064']
+        yLim387 = mat['yLim387']
+        yLim607 = mat['yLim607']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -177,7 +161,7 @@ def polly_1v2_display_lidarconst(tmpFile, saveFolder):
 
     ax.set_xticks(xtick.tolist())
     ax.set_xlim([time[0], time[-1]])
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticklabels(xticklabel)
     ax.grid(False)
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
@@ -230,7 +214,7 @@ def polly_1v2_display_lidarconst(tmpFile, saveFolder):
     ax.yaxis.set_major_locator(plt.MaxNLocator(prune='lower'))
 
     ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticklabels(xticklabel)
     ax.grid(False)
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
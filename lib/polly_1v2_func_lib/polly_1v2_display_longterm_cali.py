@@ -1,8 +1,7 @@
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 import numpy as np
-import scipy.io as spio
 from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 from matplotlib.colors import ListedColormap
@@ -10,53 +9,9 @@ import matplotlib.pyplot as plt
 import matplotlib
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime, datenum_to_datetime64
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -92,6 +47,8 @@ def polly_1v2_display_longterm_cali(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Convert the dates of the history at once with 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     """
 
     if not os.path.exists(tmpFile):
@@ -100,89 +57,70 @@ def polly_1v2_display_longterm_cali(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        if mat['LCTime532'].size:
-            thisLCTime532 = mat['LCTime532'][0][:]
-        else:
-            thisLCTime532 = np.array([])
-        if mat['LCTime607'].size:
-            thisLCTime607 = mat['LCTime607'][0][:]
-        else:
-            thisLCTime607 = np.array([])
-        LC532Status = mat['LC532Status'][0][:]
-        LC532History = mat['LC532History'][0][:]
-        LC607Status = mat['LC607Status'][0][:]
-        LC607History = mat['LC607History'][0][:]
-        if mat['logbookTime'].size:
-            thisLogbookTime = mat['logbookTime'][0][:]
-        else:
-            thisLogbookTime = np.array([])
-        if mat['flagOverlap'].size:
-            flagOverlap = mat['flagOverlap'][0][:]
-        else:
-            flagOverlap = np.array([])
-        if mat['flagWindowwipe'].size:
-            flagWindowwipe = mat['flagWindowwipe'][0][:]
-        else:
-            flagWindowwipe = np.array([])
-        if mat['flagFlashlamps'].size:
-            flagFlashlamps = mat['flagFlashlamps'][0][:]
-        else:
-            flagFlashlamps = np.array([])
-        if mat['flagPulsepower'].size:
-            flagPulsepower = mat['flagPulsepower'][0][:]
-        else:
-            flagPulsepower = np.array([])
-        if mat['flagRestart'].size:
-            flagRestart = mat['flagRestart'][0][:]
-        else:
-            flagRestart = np.array([])
-        if mat['flag_CH_NDChange'].size:
-            flag_CH_NDChange = mat['flag_CH_NDChange'][:]
-        else:
-            flag_CH_NDChange = np.array([])
-        if mat['flagCH532FR'].size:
-            flagCH532FR = mat['flagCH532FR'][0][:]
-        else:
-            flagCH532FR = np.array([])
-        if mat['flagCH532FR_X'].size:
-            flagCH532FR_X = mat['flagCH532FR_X'][0][:]
-        else:
-            flagCH532FR_X = np.array([])
-        if mat['flagCH607FR'].size:
-            flagCH607FR = mat['flagCH607FR'][0][:]
-        else:
-            flagCH607FR = np.array([])
-        else_time = mat['else_time'][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'LCTime532': 'vector',
+            'LCTime607': 'vector',
+            'LC532Status': 'vector',
+            'LC532History': 'vector',
+            'LC607Status': 'vector',
+            'LC607History': 'vector',
+            'logbookTime': 'vector',
+            'flagOverlap': 'vector',
+            'flagWindowwipe': 'vector',
+            'flagFlashlamps': 'vector',
+            'flagPulsepower': 'vector',
+            'flagRestart': 'vector',
+            'flag_CH_NDChange': 'array',
+            'flagCH532FR': 'vector',
+            'flagCH532FR_X': 'vector',
+            'flagCH607FR': 'vector',
+            'else_time': 'array',
+            'else_label': 'array',
+            'depolCaliTime532': 'vector',
+            'depolCaliConst532': 'vector',
+            'yLim532': 'vector',
+            'yLim_LC_ratio_532_607': 'vector',
+            'depolConstLim532': 'vector',
+            'campaignInfo.name': 'string',
+            'taskInfo.dataTime': 'scalar',
+            'campaignInfo.location': 'string',
+            'campaignInfo.startTime': 'scalar',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        thisLCTime532 = mat['LCTime532']
+        thisLCTime607 = mat['LCTime607']
+        LC532Status = mat['LC532Status']
+        LC532History = mat['LC532History']
+        LC607Status = mat['LC607Status']
+        LC607History = mat['LC607History']
+        thisLogbookTime = mat['logbookTime']
+        flagOverlap = mat['flagOverlap']
+        flagWindowwipe = mat['flagWindowwipe']
+        flagFlashlamps = mat['flagFlashlamps']
+        flagPulsepower = mat['flagPulsepower']
+        flagRestart = mat['flagRestart']
+        flag_CH_NDChange = mat['flag_CH_NDChange']
+        flagCH532FR = mat['flagCH532FR']
+        flagCH532FR_X = mat['flagCH532FR_X']
+        flagCH607FR = mat['flagCH607FR']
+        else_time = mat['else_time']
         else_label = mat['else_label']
-        if mat['depolCaliTime532'].size:
-            thisDepolCaliTime532 = mat['depolCaliTime532'][0][:]
-        else:
-            thisDepolCaliTime532 = np.array([])
-        if mat['depolCaliConst532'].size:
-            depolCaliConst532 = mat['depolCaliConst532'][0][:]
-        else:
-            depolCaliConst532 = np.array([])
-        if mat['yLim532'].size:
-            yLim532 = mat['yLim532'][0][:]
-        else:
-            yLim532 = np.array([])
-        if mat['yLim_LC_ratio_532_607'].size:
-            yLim_LC_ratio_532_607 = mat['yLim_LC_ratio_532_607'][0][:]
-        else:
-            yLim_LC_ratio_532_607 = np.array([])
-        if mat['depolConstLim532'].size:
-            depolConstLim532 = mat['depolConstLim532'][0][:]
-        else:
-            depolConstLim532 = np.array([])
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        dataTime = mat['taskInfo']['dataTime'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        startTime = mat['campaignInfo']['startTime'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        imgFormat = mat['imgFormat'][:][0]
+        thisDepolCaliTime532 = mat['depolCaliTime532']
+        depolCaliConst532 = mat['depolCaliConst532']
+        yLim532 = mat['yLim532']
+        yLim_LC_ratio_532_607 = mat['yLim_LC_ratio_532_607']
+        depolConstLim532 = mat['depolConstLim532']
+        pollyVersion = mat['campaignInfo.name']
+        dataTime = mat['taskInfo.dataTime']
+        location = mat['campaignInfo.location']
+        startTime = mat['campaignInfo.startTime']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -192,17 +130,14 @@ def polly_1v2_display_longterm_cali(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # convert matlab datenum tp datetime
-    startTime = datenum_to_datetime(float(startTime[0]))
-    dataTime = datenum_to_datetime(float(dataTime[0]))
-    LCTime532 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime532]
-    LCTime607 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime607]
-    logbookTime = [datenum_to_datetime(thisTime)
-                   for thisTime in thisLogbookTime]
-    elseTime = [datenum_to_datetime(thisElseTime)
-                for thisElseTime in else_time]
-    depolCaliTime532 = [datenum_to_datetime(
-        thisTime) for thisTime in thisDepolCaliTime532]
+    # convert matlab datenum to datetime64
+    startTime = datenum_to_datetime(float(startTime))
+    dataTime = datenum_to_datetime(float(dataTime))
+    LCTime532 = datenum_to_datetime64(thisLCTime532)
+    LCTime607 = datenum_to_datetime64(thisLCTime607)
+    logbookTime = datenum_to_datetime64(thisLogbookTime)
+    elseTime = datenum_to_datetime64(np.ravel(else_time))
+    depolCaliTime532 = datenum_to_datetime64(thisDepolCaliTime532)
 
     lineColor = {
         'overlap': '#f48f42',
@@ -221,10 +156,7 @@ def polly_1v2_display_longterm_cali(tmpFile, saveFolder):
     plt.subplots_adjust(top=0.96, bottom=0.05, left=0.07, right=0.98)
 
     # lidar constant at 532 nm
-    LCTime532 = [
-        LCTime532[indx]
-        for indx in np.arange(0, len(LCTime532))
-        if LC532Status[indx] == 2]
+    LCTime532 = LCTime532[LC532Status == 2]
     p1 = ax1.scatter(
         LCTime532, LC532History[LC532Status == 2],
         s=7, c='#0000ff', marker='o')
@@ -249,8 +181,8 @@ def polly_1v2_display_longterm_cali(tmpFile, saveFolder):
             ax1.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax1.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax1.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax1.set_ylabel('LC @ 532nm')
     ax1.grid(False)
@@ -261,10 +193,7 @@ def polly_1v2_display_longterm_cali(tmpFile, saveFolder):
 
     # transmission ratio at 532/607 nm
     flagRamanLC = np.logical_and(LC532Status == 2, LC607Status == 2)
-    LCTimRaman = [
-        LCTime607[indx]
-        for indx in np.arange(0, len(LCTime607))
-        if flagRamanLC[indx]]
+    LCTimRaman = LCTime607[flagRamanLC]
     p1 = ax2.scatter(
         LCTimRaman, LC532History[flagRamanLC] / LC607History[flagRamanLC],
         s=7, c='#0000ff', marker='o')
@@ -290,8 +219,8 @@ def polly_1v2_display_longterm_cali(tmpFile, saveFolder):
             ax2.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax2.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax2.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax2.set_ylabel('Ratio 532/607')
     ax2.grid(False)
@@ -323,8 +252,8 @@ def polly_1v2_display_longterm_cali(tmpFile, saveFolder):
             ax3.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax3.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax3.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax3.set_ylabel('V* 532')
     ax3.set_xlabel('Date (mm-dd)')
@@ -120,11 +120,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
     %% display quasi results
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'quasi_bsc_532', 'quality_mask_532', 'quasi_pardepol_532', 'height', 'time', 'quasi_beta_cRange_532', 'quasi_Par_DR_cRange_532', 'yLim_Quasi_Params', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'polly_1v2_display_quasiretrieving.py'), tmpFile, saveFolder));
+    flag = run_python_display(fullfile(pyFolder, 'polly_1v2_display_quasiretrieving.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'polly_1v2_display_quasiretrieving.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
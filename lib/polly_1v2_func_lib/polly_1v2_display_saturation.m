@@ -125,11 +125,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
 
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'time', 'height', 'xtick', 'xtickstr', 'SAT_FR_532', 'SAT_NR_532', 'yLim_FR_RCS', 'yLim_NR_RCS', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'polly_1v2_display_saturation.py'), tmpFile, saveFolder));
+    flag = run_python_display(fullfile(pyFolder, 'polly_1v2_display_saturation.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'polly_1v2_display_saturation.py');
     end
-    delete(tmpFile);
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
 end
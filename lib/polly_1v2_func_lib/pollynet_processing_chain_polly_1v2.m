@@ -309,6 +309,7 @@ if processInfo.flagEnableDataVisualization
     end
 
     fprintf('\n[%s] Start to visualize results.\n', tNow());
+    python_display_batch('start');
 
     %% display monitor status
     disp('Display housekeeping')
@@ -350,6 +351,9 @@ if processInfo.flagEnableDataVisualization
     disp('Display Long-Term lidar cosntants.')
     polly_1v2_display_longterm_cali(dbFile, taskInfo, config);
 
+    %% render all the queued python display jobs
+    python_display_batch('run');
+
     fprintf('[%s] Finish.\n', tNow());
 end
 
@@ -0,0 +1,533 @@
+"""
+Rendering benchmark of the python display scripts with synthetic fixtures.
+
+For every display function with a fixture (see `polly_fixtures`), a
+synthetic handoff file at production sizes is generated and the display
+function is run in a new interpreter, like it is started by the MATLAB
+wrappers. The elapsed time is split into the phases
+
+    import: python modules and the display script
+    load:   reading the handoff file (`load_variables`, `load_handoff`)
+    mask:   cropping, reducing and masking the products (`decimate`,
+            `profile_mask`)
+    draw:   everything else of the display function (figures and artists,
+            including the masks of `np.ma` applied by the script)
+    save:   rendering and writing the images (`savefig` of the PNG files,
+            `save_quicklook`, `save_figure`, the extra outputs, tile
+            pyramids) and waiting for the PNG files written in background
+            threads (see `polly_encode`)
+
+from the timing spans of the display function (see `polly_timing`). Nested
+spans are counted for the outermost phase only. The peak resident memory of
+the process is recorded as well.
+
+The results are saved in a JSON report. The display functions without fixture
+(see `polly_fixtures.EXCLUDED_FUNCS`) are listed under 'skipped' with the
+reason. With a baseline report, the changes of each phase are compared and
+the products which became slower or larger than the tolerance are flagged.
+
+Usage
+-----
+benchmark all the general display functions and save the baseline::
+
+    python polly_benchmark.py --report baseline.json
+
+benchmark the changed plotting code against the baseline::
+
+    python polly_benchmark.py --report report.json --baseline baseline.json
+
+benchmark the instrument-specific scripts of the time-height products with
+a quarter of the profiles::
+
+    python polly_benchmark.py --funcs pollyxt_dwd_display_rcs \
+        pollyxt_dwd_display_saturation --scale 0.25
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Sum the phases from the timing spans of `polly_timing`.
+2026-10-17. Write the PNG files in background threads like the display jobs.
+2026-10-17. Save the extra outputs of 'pyOutputSpecs' like the display jobs.
+2026-10-17. Update the phases for the explicit timing spans.
+2026-10-17. Use the fixtures of the instrument schemas.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import traceback
+import statistics
+import multiprocessing
+from datetime import datetime
+
+LIB_DIR = os.path.dirname(os.path.abspath(__file__))
+if LIB_DIR not in sys.path:
+    sys.path.insert(0, LIB_DIR)
+
+# version of the report
+REPORT_VERSION = 1
+
+PHASES = ('import', 'load', 'mask', 'draw', 'save')
+
+# phase of each timing span (see `polly_timing`)
+SPAN_PHASES = {
+    'loadmat': 'load',
+    'extract': 'load',
+    'mask': 'mask',
+    'savefig': 'save',
+    'encoding': 'save'
+    }
+
+# changes smaller than this are not flagged (s)
+MIN_TIME_CHANGE = 0.05
+
+# changes of the peak memory smaller than this are not flagged (MB)
+MIN_RSS_CHANGE = 20
+
+
+def peak_rss():
+    """
+    Peak resident memory of the current process and its children. (MB)
+    None if it is not available (e.g., windows).
+
+    'ru_maxrss' of linux is kept over `exec`, which would report the peak of
+    the benchmark process for the new interpreters. 'VmHWM' of the process
+    is read from '/proc/self/status' instead.
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        with open('/proc/self/status', 'r') as fh:
+            for line in fh:
+                if line.startswith('VmHWM:'):
+                    rss = int(line.split()[1])
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    rss = max(rss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+    # bytes on macOS and kilobytes on linux
+    return rss / 1024 ** 2 if sys.platform == 'darwin' else rss / 1024
+
+
+def _run_display(funcName, scriptFile, tmpFile, saveFolder, logFile, queue):
+    """
+    Run one display function in the current (new) process and put the
+    timing of the phases into the queue.
+    """
+
+    tStart = time.perf_counter()
+    result = {'status': 0}
+
+    with open(logFile, 'w') as log:
+        sys.stdout = sys.stderr = log
+        try:
+            from polly_timing import display_job, outermost_durations
+            from polly_handoff import load_process_info
+            from polly_encode import background_writes, png_compress_level
+            from polly_outputs import extra_outputs, output_specs
+            from polly_display import load_display_func
+            func = load_display_func(funcName, {funcName: scriptFile})
+            phases = {phase: 0.0 for phase in PHASES}
+            phases['import'] = time.perf_counter() - tStart
+
+            processInfo = load_process_info(tmpFile)
+            tFunc = time.perf_counter()
+            with display_job(funcName, tmpFile, saveFolder,
+                             save=False) as trace, \
+                    background_writes(png_compress_level(processInfo)), \
+                    extra_outputs(output_specs(processInfo)):
+                func(tmpFile, saveFolder)
+            total = time.perf_counter() - tFunc
+
+            for name, duration in outermost_durations(trace.spans).items():
+                if name in SPAN_PHASES:
+                    phases[SPAN_PHASES[name]] += duration
+            phases['draw'] = max(0.0, total - sum(
+                phases[phase] for phase in ('load', 'mask', 'save')))
+            result['phases'] = phases
+        except Exception:
+            traceback.print_exc()
+            result['status'] = 1
+        finally:
+            log.flush()
+
+    result['total'] = time.perf_counter() - tStart
+    result['peakRSS'] = peak_rss()
+    queue.put(result)
+
+
+def benchmark_func(funcName, scriptFile, tmpFile, workDir, repeat=1):
+    """
+    Run the display function with the fixture in new interpreters.
+
+    Parameters
+    ----------
+    funcName: str
+        display function name, e.g., 'pollyxt_display_rcs'.
+    scriptFile: str
+        python script of the display function.
+    tmpFile: str
+        fixture. (see `polly_fixtures.save_fixture`)
+    workDir: str
+        folder for the figures and the log of each run.
+    repeat: int
+        number of runs. The median of each phase is reported.
+
+    Returns
+    -------
+    result: dict
+        {'status', 'phases', 'total', 'peakRSS', 'nFigures',
+         'figureBytes', 'runs', 'log'}
+    """
+
+    ctx = multiprocessing.get_context('spawn')
+    runs = []
+    for iRun in range(repeat):
+        saveFolder = os.path.join(workDir, funcName, 'run{0}'.format(iRun))
+        if os.path.exists(saveFolder):
+            shutil.rmtree(saveFolder)
+        os.makedirs(saveFolder)
+        logFile = os.path.join(workDir, funcName, 'run{0}.log'.format(iRun))
+
+        queue = ctx.Queue()
+        proc = ctx.Process(
+            target=_run_display,
+            args=(funcName, scriptFile, tmpFile, saveFolder, logFile, queue))
+        proc.start()
+        try:
+            run = queue.get()
+        except (EOFError, OSError):
+            run = {'status': 1}
+        proc.join()
+        if proc.exitcode:
+            run['status'] = 1
+
+        figures = [os.path.join(root, filename)
+                   for root, _, filenames in os.walk(saveFolder)
+                   for filename in filenames]
+        run['nFigures'] = len(figures)
+        run['figureBytes'] = sum(os.path.getsize(f) for f in figures)
+        run['log'] = logFile
+
+        # the display scripts print the errors instead of raising them
+        if not figures:
+            run['status'] = 1
+
+        runs.append(run)
+
+    done = [run for run in runs if run['status'] == 0]
+    result = {
+        'status': 0 if len(done) == len(runs) else 1,
+        'runs': len(runs),
+        'log': runs[-1]['log']
+        }
+    if done:
+        result['phases'] = {
+            phase: statistics.median(run['phases'][phase] for run in done)
+            for phase in PHASES}
+        result['total'] = statistics.median(run['total'] for run in done)
+        if all(run['peakRSS'] is not None for run in done):
+            result['peakRSS'] = statistics.median(
+                run['peakRSS'] for run in done)
+        else:
+            result['peakRSS'] = None
+        result['nFigures'] = done[-1]['nFigures']
+        result['figureBytes'] = done[-1]['figureBytes']
+
+    return result
+
+
+def select_funcs(funcNames=None):
+    """
+    Display functions to benchmark.
+
+    Parameters
+    ----------
+    funcNames: list
+        display function names. All the functions of the general library
+        ('pollyxt_display_*') with a fixture by default.
+
+    Returns
+    -------
+    funcs: dict
+        {funcName: (fixture, product, scriptFile)}
+    skipped: dict
+        {funcName: reason} of the functions without fixture.
+    """
+
+    from polly_display import list_display_funcs
+    from polly_fixtures import fixture_of, product_of, EXCLUDED_FUNCS
+
+    allFuncs = list_display_funcs()
+    if not funcNames:
+        funcNames = [funcName for funcName in allFuncs
+                     if funcName.startswith('pollyxt_display_')]
+
+    funcs = {}
+    skipped = {}
+    for funcName in funcNames:
+        if funcName not in allFuncs:
+            raise ValueError('Unknown display function: {0}'.format(
+                funcName))
+        fixture = fixture_of(funcName)
+        if fixture is None:
+            skipped[funcName] = EXCLUDED_FUNCS.get(funcName, 'no fixture')
+            print('Skip {0}: {1}.'.format(funcName, skipped[funcName]))
+            continue
+        funcs[funcName] = (fixture, product_of(funcName), allFuncs[funcName])
+
+    return funcs, skipped
+
+
+def run_benchmark(funcNames=None, workDir=None, scale=1.0, repeat=1,
+                  nWorkers=1, baselineFile=None, tolerance=0.1):
+    """
+    Benchmark the display functions with the synthetic fixtures.
+
+    Parameters
+    ----------
+    funcNames: list
+        display function names. (see `select_funcs`)
+    workDir: str
+        folder for the fixtures, figures and logs. A temporary folder will
+        be used and removed if it was None.
+    scale: float
+        scale of the number of profiles of the production sizes.
+    repeat: int
+        number of runs of each display function.
+    nWorkers: int
+        'pyFigureWorkers' of the fixtures. The phases are only measured in
+        the main process of the display function.
+    baselineFile: str
+        JSON report to compare with.
+    tolerance: float
+        relative change to be flagged.
+
+    Returns
+    -------
+    report: dict
+    """
+
+    from polly_fixtures import PRODUCTION_SIZES, save_fixture
+
+    funcs, skipped = select_funcs(funcNames)
+    sizes = {'nTime': max(2, int(round(PRODUCTION_SIZES['nTime'] * scale)))}
+
+    flagTmp = workDir is None
+    if flagTmp:
+        workDir = tempfile.mkdtemp(prefix='polly_benchmark_')
+    fixtureFolder = os.path.join(workDir, 'fixtures')
+    if not os.path.exists(fixtureFolder):
+        os.makedirs(fixtureFolder)
+
+    import numpy
+    import matplotlib
+    report = {
+        'version': REPORT_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'matplotlib': matplotlib.__version__,
+        'scale': scale,
+        'repeat': repeat,
+        'workers': nWorkers,
+        'results': {},
+        'skipped': skipped
+        }
+
+    fixtures = {}
+    try:
+        for funcName, (fixture, product, scriptFile) in funcs.items():
+            if fixture not in fixtures:
+                tmpFile = os.path.join(fixtureFolder, fixture + '.mat')
+                fixtures[fixture] = (tmpFile, save_fixture(
+                    fixture, tmpFile, sizes=sizes,
+                    processInfo={'pyFigureWorkers': float(nWorkers)}))
+            tmpFile, info = fixtures[fixture]
+
+            result = benchmark_func(funcName, scriptFile, tmpFile, workDir,
+                                    repeat=repeat)
+            result['product'] = product
+            result['fixture'] = {'name': fixture,
+                                 'shapes': info['shapes'],
+                                 'bytes': info['bytes']}
+            report['results'][funcName] = result
+            print(_format_result(funcName, result))
+    finally:
+        if flagTmp:
+            shutil.rmtree(workDir, ignore_errors=True)
+
+    if baselineFile:
+        with open(baselineFile, 'r') as f:
+            baseline = json.load(f)
+        report['baseline'] = os.path.abspath(baselineFile)
+        report['comparison'] = compare_reports(baseline, report, tolerance)
+
+    return report
+
+
+def compare_reports(baseline, report, tolerance=0.1):
+    """
+    Compare the phases and the peak memory of each display function with
+    the baseline.
+
+    Parameters
+    ----------
+    baseline, report: dict
+        reports from `run_benchmark`.
+    tolerance: float
+        relative change to be flagged.
+
+    Returns
+    -------
+    comparison: dict
+        {funcName: {metric: {'baseline', 'current', 'change', 'flag'}}}.
+        'change' is relative to the baseline and 'flag' is 'slower',
+        'faster', 'larger', 'smaller' or ''.
+    """
+
+    comparison = {}
+    for funcName, result in report['results'].items():
+        base = baseline.get('results', {}).get(funcName)
+        if (base is None) or base['status'] or result['status']:
+            continue
+
+        metrics = [('total', base['total'], result['total'])]
+        metrics += [(phase, base['phases'][phase], result['phases'][phase])
+                    for phase in PHASES]
+        metrics.append(('peakRSS', base['peakRSS'], result['peakRSS']))
+
+        comparison[funcName] = {}
+        for metric, baseValue, value in metrics:
+            if (baseValue is None) or (value is None):
+                continue
+
+            minChange = MIN_RSS_CHANGE if metric == 'peakRSS' \
+                else MIN_TIME_CHANGE
+            change = (value - baseValue) / baseValue if baseValue else 0.0
+            flag = ''
+            if abs(value - baseValue) >= minChange:
+                if change > tolerance:
+                    flag = 'larger' if metric == 'peakRSS' else 'slower'
+                elif change < - tolerance:
+                    flag = 'smaller' if metric == 'peakRSS' else 'faster'
+
+            comparison[funcName][metric] = {
+                'baseline': baseValue,
+                'current': value,
+                'change': change,
+                'flag': flag}
+
+    return comparison
+
+
+def regressions(comparison):
+    """
+    Display functions which became slower or larger than the baseline.
+
+    Returns
+    -------
+    items: list
+        [(funcName, metric, change), ...]
+    """
+
+    return [(funcName, metric, item['change'])
+            for funcName, metrics in comparison.items()
+            for metric, item in metrics.items()
+            if item['flag'] in ('slower', 'larger')]
+
+
+def _format_result(funcName, result):
+    """
+    One line summary of the benchmark result.
+    """
+
+    if result['status']:
+        return '{func}: failed (see {log})'.format(
+            func=funcName, log=result['log'])
+
+    rss = result['peakRSS']
+    return '{func}: {total:.2f}s ({phases}), {nFigures} figures, ' \
+        'peak {rss}'.format(
+            func=funcName,
+            total=result['total'],
+            phases=', '.join('{0} {1:.2f}'.format(
+                phase, result['phases'][phase]) for phase in PHASES),
+            nFigures=result['nFigures'],
+            rss='{0:.0f} MB'.format(rss) if rss is not None else 'n/a')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rendering benchmark of the PollyNET display scripts.')
+    parser.add_argument('--funcs', nargs='+', default=None,
+                        help='display function names (default: all the '
+                        'pollyxt_display_* functions with a fixture).')
+    parser.add_argument('--report', default='benchmark_report.json',
+                        help='JSON file to save the results.')
+    parser.add_argument('--baseline', default=None,
+                        help='JSON report to compare with.')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='relative change to be flagged (default: 0.1).')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='scale of the number of profiles.')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='number of runs of each display function.')
+    parser.add_argument('--workers', type=int, default=1,
+                        help="'pyFigureWorkers' of the fixtures.")
+    parser.add_argument('--workdir', default=None,
+                        help='folder to keep the fixtures and figures.')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='exit with 1 if any function became slower.')
+    parser.add_argument('--list', action='store_true',
+                        help='list the display functions with a fixture.')
+
+    args = parser.parse_args()
+
+    if args.list:
+        from polly_display import list_display_funcs
+        from polly_fixtures import fixture_of
+        for funcName in list_display_funcs():
+            if fixture_of(funcName) is not None:
+                print('{func}: {fixture}'.format(
+                    func=funcName, fixture=fixture_of(funcName)))
+        return
+
+    try:
+        report = run_benchmark(
+            funcNames=args.funcs, workDir=args.workdir, scale=args.scale,
+            repeat=max(1, args.repeat), nWorkers=args.workers,
+            baselineFile=args.baseline, tolerance=args.tolerance)
+    except ValueError as e:
+        parser.error(str(e))
+
+    with open(args.report, 'w') as f:
+        json.dump(report, f, indent=4)
+    print('Report saved in {0}'.format(args.report))
+
+    nFailed = sum(result['status'] != 0
+                  for result in report['results'].values())
+    items = regressions(report.get('comparison', {}))
+    for funcName, metric, change in items:
+        print('{func}: {metric} {change:+.0%} against the baseline'.format(
+            func=funcName, metric=metric, change=change))
+
+    if nFailed or (args.fail_on_regression and items):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,470 @@
+"""
+Cache of the rendered figures for the reprocessing.
+
+The history data are processed again whenever the config was changed, but
+most of the figures are the same as before (e.g., only the lidar ratio of
+the 1064 nm retrieval was changed). Before a figure is saved, the content of
+the figure is hashed: the data of the lines, images and collections, the
+texts, axis limits and scales, the formatted ticks, the colors and styles,
+the figure size, dpi, the image format and the compression level of the
+PNG files. If the hash is found in the cache, the cached image is
+hard-linked (or copied) to the output file instead of rendering the figure.
+
+The cache is enabled with 'pyRenderCacheFolder' in the pollynet processing
+chain config and its size is bounded by 'pyRenderCacheSize' (MB). The least
+recently used images are removed when the cache is full. The output files
+linked to the cache are removed before they are written again (see
+`release_output`).
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Support the background writes of `polly_encode`.
+2026-10-17. Save the extra outputs of the cached figures.
+2026-10-17. Record the timing spans of saving the figures.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+import matplotlib
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.axis import Axis
+from matplotlib.collections import Collection
+from matplotlib.colors import to_rgba
+from matplotlib.font_manager import findfont
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch, Rectangle, FancyBboxPatch
+from matplotlib.spines import Spine
+from matplotlib.text import Text
+
+from polly_encode import after_write, compress_level
+from polly_outputs import save_outputs
+from polly_timing import span
+
+# version of the figure hash
+CACHE_VERSION = 2
+
+# default size of the cache (MB)
+DEFAULT_CACHE_SIZE = 2048
+
+# the cache is cleaned to this fraction of the size
+EVICT_RATIO = 0.9
+
+# render cache of the current process (see `set_render_cache`)
+_RENDER_CACHE = None
+
+
+class RenderCache(object):
+    """
+    Size-bounded store of the rendered images, which is indexed by the hash
+    of the figures.
+
+    The images are saved as '{folder}/{key[:2]}/{key}{ext}' and the
+    modification time of the images is the last time they were used. The
+    cache is cleaned after 10% of the size was added, so each process can
+    exceed the size by up to 10% between two cleanings.
+    """
+
+    def __init__(self, folder, maxBytes):
+        self.folder = folder
+        self.maxBytes = maxBytes
+        self._added = 0
+        self._scanned = False
+
+    def path(self, key, filename):
+        """
+        Path of the cached image for the output file.
+        """
+
+        return os.path.join(self.folder, key[:2], key +
+                            os.path.splitext(filename)[1].lower())
+
+    def fetch(self, key, filename):
+        """
+        Link the cached image to the output file.
+
+        Returns
+        -------
+        flag: bool
+            True if the image was in the cache. If not, an output file
+            linked to the cache will be removed, so the new image will not
+            be written into the cache.
+        """
+
+        cacheFile = self.path(key, filename)
+        if os.path.exists(cacheFile):
+            try:
+                _link(cacheFile, filename)
+                os.utime(cacheFile)
+                return True
+            except OSError:
+                pass
+
+        release_output(filename)
+
+        return False
+
+    def store(self, key, filename):
+        """
+        Add the output file to the cache and remove the least recently used
+        images if the cache is full.
+        """
+
+        cacheFile = self.path(key, filename)
+        try:
+            if not os.path.exists(os.path.dirname(cacheFile)):
+                os.makedirs(os.path.dirname(cacheFile), exist_ok=True)
+            _link(filename, cacheFile)
+            self._added += os.path.getsize(cacheFile)
+        except OSError:
+            return
+
+        if (not self._scanned) or (self._added > self.maxBytes / 10):
+            self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used images until the cache is smaller
+        than `EVICT_RATIO` of the size.
+        """
+
+        entries = []
+        for root, _, filenames in os.walk(self.folder):
+            for filename in filenames:
+                filename = os.path.join(root, filename)
+                try:
+                    stat = os.stat(filename)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, filename))
+
+        self._scanned = True
+        self._added = 0
+
+        total = sum(entry[1] for entry in entries)
+        if total <= self.maxBytes:
+            return
+
+        for _, size, filename in sorted(entries):
+            try:
+                os.remove(filename)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.maxBytes * EVICT_RATIO:
+                break
+
+
+def set_render_cache(processInfo):
+    """
+    Configure the render cache of the current process with
+    'pyRenderCacheFolder' and 'pyRenderCacheSize' from the processInfo
+    struct of the .mat file.
+
+    Parameters
+    ----------
+    processInfo: numpy structured array
+        mat['processInfo'] from `scipy.io.loadmat`.
+
+    Returns
+    -------
+    cache: RenderCache
+        None if the cache was not configured.
+    """
+
+    global _RENDER_CACHE
+
+    folder = ''
+    size = DEFAULT_CACHE_SIZE
+    try:
+        names = processInfo.dtype.names
+        if 'pyRenderCacheFolder' in names:
+            value = np.asarray(processInfo['pyRenderCacheFolder'][0][0])
+            folder = str(value.ravel()[0]) if value.size else ''
+        if 'pyRenderCacheSize' in names:
+            size = float(processInfo['pyRenderCacheSize'][0][0][0][0])
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    if folder and (size > 0):
+        _RENDER_CACHE = RenderCache(folder, size * 1024 ** 2)
+    else:
+        _RENDER_CACHE = None
+
+    return _RENDER_CACHE
+
+
+def get_render_cache():
+    """
+    Render cache of the current process. None if it was not configured.
+    """
+
+    return _RENDER_CACHE
+
+
+def release_output(filename):
+    """
+    Remove the output file if it is hard-linked to the render cache. It must
+    be called before the output file is written in place, otherwise the
+    cached image would be changed.
+    """
+
+    try:
+        if os.stat(filename).st_nlink > 1:
+            os.remove(filename)
+    except OSError:
+        pass
+
+
+def save_figure(fig, filename, dpi=None, cache=None):
+    """
+    Save the figure with `savefig` unless the same figure is in the render
+    cache.
+
+    Parameters
+    ----------
+    fig: matplotlib figure
+    filename: str
+    dpi: int
+        figure resolution.
+    cache: RenderCache
+        the render cache of the current process will be used if it was
+        None.
+
+    Usage
+    -----
+    set_render_cache(mat['processInfo'])
+    save_figure(fig, 'SIG.png', dpi=figDPI)
+    """
+
+    with span('savefig', call='save_figure',
+              file=os.path.basename(filename)):
+        cache = cache if cache is not None else _RENDER_CACHE
+        if cache is None:
+            release_output(filename)
+            fig.savefig(filename, dpi=dpi)
+            return
+
+        key = figure_key(fig, filename, dpi)
+        if cache.fetch(key, filename):
+            save_outputs(fig, filename, dpi, cached=True)
+            return
+
+        fig.savefig(filename, dpi=dpi)
+        after_write(filename, cache.store, key, filename)
+
+
+def figure_key(fig, filename, dpi):
+    """
+    Hash of everything which is drawn in the figure and the compression level
+    of the PNG files.
+
+    Parameters
+    ----------
+    fig: matplotlib figure
+    filename: str
+        output file. Only the extension is hashed.
+    dpi: int
+        figure resolution.
+
+    Returns
+    -------
+    key: str
+    """
+
+    blake = hashlib.blake2b(digest_size=20)
+    blake.update(json.dumps(
+        [CACHE_VERSION, matplotlib.__version__,
+         os.path.splitext(filename)[1].lower(), compress_level(),
+         float(dpi or fig.dpi),
+         _value(fig.get_size_inches()), _color(fig.get_facecolor())]
+        ).encode())
+
+    # the ticks and the positions of the titles and axis labels are only
+    # updated while drawing. The ticks are hashed by the locations, the
+    # formatted labels and the style of the first tick of each axis.
+    skip = set()
+    derived = set()
+    for ax in fig.axes:
+        derived.update((id(ax.title), id(ax._left_title),
+                        id(ax._right_title)))
+        for axis in (ax.xaxis, ax.yaxis):
+            derived.add(id(axis.label))
+            skip.add(id(axis.offsetText))
+            for tick in axis.majorTicks + axis.minorTicks:
+                skip.update(id(obj) for obj in tick.findobj(Artist))
+
+    for artist in fig.findobj(Artist):
+        if id(artist) in skip:
+            continue
+        for item in _artist_items(artist, id(artist) in derived):
+            if isinstance(item, np.ndarray):
+                blake.update(str((item.dtype, item.shape)).encode())
+                blake.update(np.ascontiguousarray(item).tobytes())
+            else:
+                blake.update(json.dumps(item, default=str).encode())
+
+    return blake.hexdigest()
+
+
+def _artist_items(artist, derived=False):
+    """
+    Content of the artist which changes the image. The position of the
+    derived texts (titles and axis labels) is not included.
+    """
+
+    items = [type(artist).__name__, artist.get_visible(),
+             _value(artist.get_alpha()), artist.get_zorder()]
+    if not artist.get_visible():
+        return items
+
+    if isinstance(artist, Axes):
+        items += [_value(artist.get_position().bounds),
+                  _value(artist.get_xlim()), _value(artist.get_ylim()),
+                  artist.get_xscale(), artist.get_yscale(),
+                  _color(artist.get_facecolor())]
+    elif isinstance(artist, Axis):
+        majorLocs = artist.get_majorticklocs()
+        formatter = artist.get_major_formatter()
+        items += [_value(majorLocs), _value(artist.get_minorticklocs()),
+                  list(formatter.format_ticks(majorLocs)),
+                  str(getattr(formatter, 'get_offset', str)())]
+        for ticks in (artist.get_major_ticks(1), artist.get_minor_ticks(1)):
+            items += [_tick_style(tick) for tick in ticks]
+    elif isinstance(artist, Line2D):
+        items += [np.asarray(artist.get_xydata(), dtype=np.float64),
+                  _color(artist.get_color()), str(artist.get_linestyle()),
+                  artist.get_linewidth(), str(artist.get_marker()),
+                  artist.get_markersize(),
+                  _color(artist.get_markerfacecolor()),
+                  _color(artist.get_markeredgecolor()),
+                  str(artist.get_drawstyle())]
+    elif isinstance(artist, Text):
+        # the font family is resolved with the rcParams (e.g., 'fontname'
+        # of the config)
+        items += [artist.get_text(), artist.get_fontsize(),
+                  _color(artist.get_color()),
+                  findfont(artist.get_fontproperties()),
+                  str(artist.get_fontweight()), str(artist.get_fontstyle()),
+                  artist.get_rotation(), artist.get_horizontalalignment(),
+                  artist.get_verticalalignment()]
+        if not derived:
+            items.append(_value(artist.get_position()))
+    elif isinstance(artist, AxesImage):
+        array = artist.get_array()
+        items += [_value(artist.get_extent()),
+                  str(artist.get_interpolation())]
+        if array is not None:
+            items += _mapping(artist) + \
+                [np.ma.getdata(array), np.ma.getmaskarray(array)]
+    elif isinstance(artist, Collection):
+        array = artist.get_array()
+        items += [np.asarray(artist.get_offsets(), dtype=np.float64),
+                  np.asarray(artist.get_linewidth())]
+        # the colors of the mapped collections are only updated while
+        # drawing
+        if array is None:
+            items += [np.asarray(artist.get_facecolor()),
+                      np.asarray(artist.get_edgecolor())]
+        else:
+            items += _mapping(artist) + \
+                [np.ma.getdata(array), np.ma.getmaskarray(array)]
+        if hasattr(artist, 'get_sizes'):
+            items.append(np.asarray(artist.get_sizes()))
+        if hasattr(artist, 'get_coordinates'):
+            items.append(np.asarray(artist.get_coordinates()))
+        else:
+            items += [np.asarray(path.vertices)
+                      for path in artist.get_paths()]
+    elif isinstance(artist, Patch):
+        items += [_color(artist.get_facecolor()),
+                  _color(artist.get_edgecolor()), artist.get_linewidth(),
+                  str(artist.get_linestyle()), str(artist.get_hatch())]
+        # the spines and the frames of the legends are placed while drawing
+        if isinstance(artist, Rectangle):
+            items += [_value(artist.get_xy()), artist.get_width(),
+                      artist.get_height()]
+        elif not isinstance(artist, (Spine, FancyBboxPatch)):
+            items += [np.asarray(artist.get_path().vertices),
+                      artist.get_patch_transform().get_matrix()]
+
+    return items
+
+
+def _mapping(mappable):
+    """
+    Colormap (including the under, over and bad colors) and norm of the
+    mappable.
+    """
+
+    cmap = mappable.get_cmap()
+    norm = mappable.norm
+
+    return [cmap.name, cmap(np.arange(cmap.N)), _color(cmap.get_under()),
+            _color(cmap.get_over()), _color(cmap.get_bad()),
+            type(norm).__name__, _value([norm.vmin, norm.vmax])]
+
+
+def _tick_style(tick):
+    """
+    Style of the tick marks, labels and grid lines of an axis.
+    """
+
+    return [[line.get_visible(), str(line.get_marker()),
+             line.get_markersize(), line.get_markeredgewidth(),
+             _color(line.get_color())]
+            for line in (tick.tick1line, tick.tick2line)] + \
+        [[line.get_visible(), str(line.get_linestyle()),
+          line.get_linewidth(), _color(line.get_color())]
+         for line in (tick.gridline, )] + \
+        [[label.get_visible(), label.get_fontsize(),
+          _color(label.get_color()), findfont(label.get_fontproperties()),
+          tick.get_pad()]
+         for label in (tick.label1, tick.label2)]
+
+
+def _color(color):
+    """
+    RGBA of the color.
+    """
+
+    try:
+        return list(to_rgba(color))
+    except (TypeError, ValueError):
+        return str(color)
+
+
+def _value(value):
+    """
+    JSON value of the numbers, tuples and arrays.
+    """
+
+    if value is None:
+        return None
+
+    try:
+        return np.asarray(value, dtype=np.float64).tolist()
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _link(src, dst):
+    """
+    Hard-link (or copy) src to dst, which is replaced atomically.
+    """
+
+    tmpFile = '{0}.{1}.tmp'.format(dst, os.getpid())
+    try:
+        try:
+            os.link(src, tmpFile)
+        except OSError:
+            shutil.copyfile(src, tmpFile)
+        os.replace(tmpFile, dst)
+    finally:
+        if os.path.exists(tmpFile):
+            os.remove(tmpFile)
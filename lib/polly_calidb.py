@@ -0,0 +1,473 @@
+"""
+Read the calibration constants from the SQLite database of the processing
+chain.
+
+The calibration constants are saved by `save_liconst.m`, `save_depolconst.m`
+and `save_wvconst.m`. The long-term calibration plots used to load the full
+history of each product before the processing time with `load_liconst.m`
+(one connection for each wavelength) and hand it over to python. Here, all
+the products are read with one connection and only the calibrations inside
+the window of the figure are fetched.
+
+The queries are filtered by the center of the calibration period, which is
+the same as `load_liconst.m`. Additionally, they are limited by the start of
+the calibration period, so that the indexes on (polly type, wavelength,
+method, telescope, start time) can be used for the time window. The indexes
+are created if they do not exist yet.
+
+The long-term plots are made for each processed file, but only the latest
+calibrations are new. `cached_calibrations` keeps the plotted series of each
+instrument in a columnar cache (.npz) and only queries the calibrations after
+the end of the cache, so the daily costs do not grow with the years of
+measurements.
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Add the incremental cache of the calibrations.
+2026-10-17. Query without the cache if no cache file is given.
+"""
+
+import os
+import json
+import sqlite3
+import warnings
+from datetime import datetime, timedelta
+import numpy as np
+
+# maximum length of a calibration period. The calibrations which started
+# earlier than this before the window will not be searched.
+MAX_CALI_DURATION = timedelta(days=1)
+
+# tables of the calibration constants
+TABLES = {
+    'liconst': {
+        'table': 'lidar_calibration_constant',
+        'value': 'liconst',
+        'uncertainty': 'uncertainty_liconst',
+        'keys': ('polly_type', 'wavelength', 'cali_method', 'telescope'),
+        'index': 'lc_query_index'
+        },
+    'depolconst': {
+        'table': 'depol_calibration_constant',
+        'value': 'depol_const',
+        'uncertainty': 'uncertainty_depol_const',
+        'keys': ('polly_type', 'wavelength'),
+        'index': 'depol_query_index'
+        },
+    'wvconst': {
+        'table': 'wv_calibration_constant',
+        'value': 'wv_const',
+        'uncertainty': 'uncertainty_wv_const',
+        'keys': ('polly_type',),
+        'index': 'wv_query_index'
+        }
+    }
+
+# columns of the calibrations
+COLUMNS = ('caliStartTime', 'caliStopTime', 'caliTime', 'value',
+           'uncertainty')
+
+# version of the layout of the cache files
+CACHE_VERSION = 1
+
+# center of the calibration period (unix time, the same as `load_liconst.m`)
+CALI_TIME = "(CAST(strftime('%s', cali_start_time) AS INTEGER) + " \
+            "CAST(strftime('%s', cali_stop_time) AS INTEGER)) / 2"
+
+
+class CalibrationDB(object):
+    """
+    Calibration database with one connection for all the queries.
+
+    Usage
+    -----
+    with CalibrationDB(dbFile) as db:
+        LC355 = db.liconst('PollyXT_LACROS', '355', 'Raman_Method',
+                           'far_range', window=(startTime, dataTime))
+    ax.scatter(LC355['caliTime'], LC355['value'])
+    """
+
+    def __init__(self, dbFile, createIndexes=True, timeout=10):
+        """
+        Parameters
+        ----------
+        dbFile: str
+            absolute path of the SQLite database. All the queries return
+            empty arrays if it does not exist (the same as `load_liconst.m`).
+        createIndexes: bool
+            create the indexes for the time-windowed queries if they do not
+            exist. It will be skipped if the database is read-only or locked.
+        timeout: float
+            seconds to wait for the lock of the database.
+        """
+
+        self.dbFile = dbFile
+        self._tables = set()
+        self._conn = None
+        if not os.path.exists(dbFile):
+            warnings.warn('dbFile does not exist!\n{0}'.format(dbFile))
+            return
+
+        self._conn = sqlite3.connect(dbFile, timeout=timeout)
+        self._tables = set(
+            row[0] for row in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"))
+
+        if createIndexes:
+            self.create_indexes()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def create_indexes(self):
+        """
+        Create the indexes for the time-windowed queries (the same as the
+        `save_*const.m` functions).
+        """
+
+        for product in TABLES.values():
+            if product['table'] not in self._tables:
+                continue
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        'CREATE INDEX IF NOT EXISTS {index} ON {table}'
+                        '({keys}, cali_start_time)'.format(
+                            index=product['index'], table=product['table'],
+                            keys=', '.join(product['keys'])))
+            except sqlite3.OperationalError:
+                # read-only or locked database. The queries still work.
+                pass
+
+    def liconst(self, pollyType, wavelength, caliMethod, telescope,
+                window=(None, None)):
+        """
+        Lidar calibration constants (see `query`).
+        """
+
+        return self.query('liconst', window, polly_type=pollyType,
+                          wavelength=wavelength, cali_method=caliMethod,
+                          telescope=telescope)
+
+    def depolconst(self, pollyType, wavelength, window=(None, None)):
+        """
+        Depolarization calibration constants (see `query`).
+        """
+
+        return self.query('depolconst', window, polly_type=pollyType,
+                          wavelength=wavelength)
+
+    def wvconst(self, pollyType, window=(None, None)):
+        """
+        Water vapor calibration constants (see `query`).
+        """
+
+        return self.query('wvconst', window, polly_type=pollyType)
+
+    def query(self, product, window=(None, None), **keys):
+        """
+        Calibration constants with the center of the calibration period
+        inside the time window.
+
+        Parameters
+        ----------
+        product: str
+            'liconst', 'depolconst' or 'wvconst'.
+        window: tuple
+            (start, stop) of the window as datetime or datetime64. The
+            calibrations with start <= center < stop will be returned. None
+            for no limit.
+        keys:
+            values of the key columns of the product, e.g.
+            polly_type='PollyXT_LACROS', wavelength='355'.
+
+        Returns
+        -------
+        calibrations: dict
+            'caliStartTime', 'caliStopTime' and 'caliTime' (center of the
+            calibration period) as datetime64[s] arrays, 'value' and
+            'uncertainty' as float arrays, ordered by 'caliTime'. The arrays
+            are empty if the table does not exist.
+        """
+
+        if product not in TABLES:
+            raise ValueError('Unknown product: {0}'.format(product))
+        product = TABLES[product]
+        if set(keys) != set(product['keys']):
+            raise ValueError('Keys of {0}: {1}'.format(
+                product['table'], ', '.join(product['keys'])))
+
+        if product['table'] not in self._tables:
+            return _calibrations(np.zeros((0, 5)))
+
+        conditions = ['{0} = ?'.format(key) for key in product['keys']]
+        params = [keys[key] for key in product['keys']]
+
+        start, stop = [_to_datetime(thisTime) for thisTime in window]
+        if start is not None:
+            conditions.append('cali_start_time >= ?')
+            params.append(_to_sql(start - MAX_CALI_DURATION))
+            conditions.append('{0} >= ?'.format(CALI_TIME))
+            params.append(_to_unix(start))
+        if stop is not None:
+            # start <= center < stop
+            conditions.append('cali_start_time < ?')
+            params.append(_to_sql(stop))
+            conditions.append('{0} < ?'.format(CALI_TIME))
+            params.append(_to_unix(stop))
+
+        rows = self._conn.execute(
+            "SELECT CAST(strftime('%s', cali_start_time) AS INTEGER), "
+            "CAST(strftime('%s', cali_stop_time) AS INTEGER), {caliTime}, "
+            "{value}, {uncertainty} FROM {table} WHERE {conditions} "
+            "ORDER BY {caliTime} ASC".format(
+                caliTime=CALI_TIME, value=product['value'],
+                uncertainty=product['uncertainty'], table=product['table'],
+                conditions=' AND '.join(conditions)), params).fetchall()
+
+        return _calibrations(np.array(rows, dtype=np.float64).reshape(-1, 5))
+
+
+def query_calibrations(dbFile, queries, window):
+    """
+    Query several series of calibrations with one connection.
+
+    Parameters
+    ----------
+    dbFile: str
+        absolute path of the SQLite database.
+    queries: dict
+        product and keys of each series (see `CalibrationDB.query`), e.g.
+        {'LC355': ('liconst', {'polly_type': 'PollyXT_LACROS',
+                               'wavelength': '355',
+                               'cali_method': 'Raman_Method',
+                               'telescope': 'far_range'})}
+    window: tuple
+        (start, stop) of the window. (see `CalibrationDB.query`)
+
+    Returns
+    -------
+    calibrations: dict
+        calibrations of each series.
+    """
+
+    with CalibrationDB(dbFile) as db:
+        return {name: db.query(product, window, **keys)
+                for name, (product, keys) in queries.items()}
+
+
+def cached_calibrations(cacheFile, dbFile, queries, window, refreshFrom=None):
+    """
+    Query several series of calibrations through the incremental cache.
+
+    Only the calibrations after the end of the cache (or after `refreshFrom`
+    if it is earlier) are queried from the database and replace the cached
+    ones. The calibrations before the start of the cache are added if the
+    window starts earlier. The cache is rebuilt if it was made for another
+    database or other queries.
+
+    Parameters
+    ----------
+    cacheFile: str
+        .npz file of the cache, e.g. in the results folder of the instrument.
+        None to query the database without the cache.
+    dbFile: str
+        absolute path of the SQLite database. The cache will not be used if
+        it does not exist.
+    queries: dict
+        product and keys of each series. (see `query_calibrations`)
+    window: tuple
+        (start, stop) of the window as datetime or datetime64.
+    refreshFrom: datetime
+        the calibrations after this time are queried again, e.g. the day
+        before the processed data, whose calibrations could be replaced by
+        reprocessing.
+
+    Returns
+    -------
+    calibrations: dict
+        calibrations of each series inside the window.
+
+    Usage
+    -----
+    cali = cached_calibrations(
+        os.path.join(resultsFolder, pollyType, 'longterm_cali_cache.npz'),
+        dbFile, queries, (startTime, dataTime),
+        refreshFrom=dataTime - timedelta(days=1))
+    """
+
+    start, stop = [_to_datetime(thisTime) for thisTime in window]
+    if (cacheFile is None) or (not os.path.exists(dbFile)):
+        return query_calibrations(dbFile, queries, (start, stop))
+
+    signature = json.dumps({'dbFile': os.path.abspath(dbFile),
+                            'queries': queries}, sort_keys=True)
+    cache = _load_cache(cacheFile, signature)
+
+    if cache is None:
+        cacheStart, refresh, cacheStop = start, start, stop
+        series = {name: None for name in queries}
+    else:
+        cacheStart, cacheStop = cache['start'], max(cache['stop'], stop)
+        refresh = cache['stop'] if refreshFrom is None else \
+            min(cache['stop'], _to_datetime(refreshFrom))
+        refresh = max(refresh, cacheStart)
+        series = {name: _select(cache['series'][name], None, refresh)
+                  for name in queries}
+
+        # the window starts before the cache (e.g., the margin of the figure
+        # grows with the period of the measurements)
+        if start < cacheStart:
+            series = _join(
+                query_calibrations(dbFile, queries, (start, cacheStart)),
+                series)
+            cacheStart = start
+
+    # append the new calibrations
+    series = _join(series,
+                   query_calibrations(dbFile, queries, (refresh, cacheStop)))
+
+    try:
+        _save_cache(cacheFile, signature, cacheStart, cacheStop, series)
+    except OSError as e:
+        warnings.warn('Failed to save the calibration cache {0}: {1}'.format(
+            cacheFile, e))
+
+    return {name: _select(series[name], start, stop) for name in queries}
+
+
+def _load_cache(cacheFile, signature):
+    """
+    Load the cache. None will be returned if it does not exist, cannot be
+    read or was made for other queries.
+    """
+
+    if not os.path.exists(cacheFile):
+        return None
+
+    try:
+        with np.load(cacheFile, allow_pickle=False) as npz:
+            if (int(npz['version']) != CACHE_VERSION) or \
+               (str(npz['signature']) != signature):
+                return None
+            names = json.loads(signature)['queries']
+            return {
+                'start': _to_datetime(npz['start'][()]),
+                'stop': _to_datetime(npz['stop'][()]),
+                'series': {name: {column: npz['{0}.{1}'.format(name, column)]
+                                  for column in COLUMNS}
+                           for name in names}
+                }
+    except (OSError, ValueError, KeyError) as e:
+        warnings.warn('Rebuild the calibration cache {0}: {1}'.format(
+            cacheFile, e))
+        return None
+
+
+def _save_cache(cacheFile, signature, start, stop, series):
+    """
+    Save the cache to a temporary file and replace the old one, so that the
+    other processes never read a half-written cache.
+    """
+
+    arrays = {
+        'version': np.array(CACHE_VERSION),
+        'signature': np.array(signature),
+        'start': np.datetime64(start, 's'),
+        'stop': np.datetime64(stop, 's')
+        }
+    for name, calibrations in series.items():
+        for column in COLUMNS:
+            arrays['{0}.{1}'.format(name, column)] = calibrations[column]
+
+    folder = os.path.dirname(os.path.abspath(cacheFile))
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+
+    tmpFile = '{0}.{1}.tmp'.format(cacheFile, os.getpid())
+    try:
+        with open(tmpFile, 'wb') as fh:
+            np.savez(fh, **arrays)
+        os.replace(tmpFile, cacheFile)
+    finally:
+        if os.path.exists(tmpFile):
+            os.remove(tmpFile)
+
+
+def _join(series1, series2):
+    """
+    Concatenate the calibrations of each series. None for no calibrations.
+    """
+
+    series = {}
+    for name in series2:
+        if series1[name] is None:
+            series[name] = series2[name]
+        else:
+            series[name] = {
+                column: np.concatenate((series1[name][column],
+                                        series2[name][column]))
+                for column in COLUMNS}
+
+    return series
+
+
+def _select(calibrations, start, stop):
+    """
+    Calibrations with start <= caliTime < stop. None for no limit.
+    """
+
+    flag = np.ones(calibrations['caliTime'].shape, dtype=bool)
+    if start is not None:
+        flag &= calibrations['caliTime'] >= np.datetime64(start, 's')
+    if stop is not None:
+        flag &= calibrations['caliTime'] < np.datetime64(stop, 's')
+
+    return {column: calibrations[column][flag] for column in COLUMNS}
+
+
+def _calibrations(rows):
+    """
+    Convert the rows of the query to the arrays of the calibrations.
+    """
+
+    times = [rows[:, iCol].astype(np.int64).astype('datetime64[s]')
+             for iCol in range(3)]
+
+    return dict(zip(COLUMNS, times + [rows[:, 3], rows[:, 4]]))
+
+
+def _to_datetime(thisTime):
+    """
+    Convert datetime64 to datetime (with the resolution of seconds).
+    """
+
+    if (thisTime is None) or isinstance(thisTime, datetime):
+        return thisTime
+
+    return np.datetime64(thisTime, 's').item()
+
+
+def _to_sql(thisTime):
+    """
+    Time format of the database.
+    """
+
+    return thisTime.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _to_unix(thisTime):
+    """
+    Seconds since 1970-01-01 (UTC, the same as strftime('%s') of SQLite).
+    """
+
+    return int((thisTime - datetime(1970, 1, 1)).total_seconds())
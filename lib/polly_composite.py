@@ -0,0 +1,289 @@
+"""
+Daily composite quicklooks of the time-height products.
+
+The measurement files are split into chunks of a few hours (e.g., 00:00 -
+05:59) and each chunk has its own quicklooks. For the 24-hour quicklook of a
+day, every chunk saves its products reduced to the pixel grid of the day
+(`polly_decimate.decimate` with the time limits of the day) into a small
+.npz file. The composite is filled by reading these files one after another
+into a raster of the day, which is allocated once. Only the reduced product
+of one chunk is held besides the raster, and the chunks at full resolution
+are never loaded.
+
+The chunk files are kept in a folder for each day and product, and the files
+older than `CHUNK_MAX_AGE` are removed.
+
+History
+-------
+2026-10-17. First edition
+"""
+
+import os
+import time
+import numpy as np
+
+from polly_decimate import decimate
+from polly_time import DATENUM_EPOCH
+
+# version of the chunk files
+CHUNK_VERSION = 1
+
+# chunk files older than this will be removed (s)
+CHUNK_MAX_AGE = 2 * 86400
+
+# interval of the time ticks of the daily composite (hours)
+TICK_INTERVAL = 4
+
+
+def daily_composite_enabled(processInfo):
+    """
+    Read 'pyDailyComposite' in the pollynet processing chain config from the
+    processInfo struct of the .mat file.
+
+    Parameters
+    ----------
+    processInfo: numpy structured array
+        mat['processInfo'] from `scipy.io.loadmat`.
+
+    Returns
+    -------
+    flag: bool
+        False if it was not configured.
+    """
+
+    try:
+        if 'pyDailyComposite' in processInfo.dtype.names:
+            return bool(processInfo['pyDailyComposite'][0][0][0][0])
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    return False
+
+
+def day_limits(time):
+    """
+    Time limits of the day of the first profile.
+
+    Parameters
+    ----------
+    time: array
+        measurement time. (datenum)
+
+    Returns
+    -------
+    timeLim: list
+        [start, stop] of the day. (datenum)
+    """
+
+    day = np.floor(time[0])
+
+    return [day, day + 1]
+
+
+def daily_xticks(timeLim):
+    """
+    Ticks of the time axis of the daily composite, the same as the layout of
+    `timelabellayout.m` for a full day.
+
+    Parameters
+    ----------
+    timeLim: list
+        [start, stop] of the day. (datenum)
+
+    Returns
+    -------
+    xtick: list
+        datenum of each tick.
+    xticklabel: list
+        'HH:MM' of each tick.
+    """
+
+    hours = np.arange(0, 24 + TICK_INTERVAL, TICK_INTERVAL)
+    xtick = [timeLim[0] + hour / 24 for hour in hours]
+    xticklabel = ['{0:02d}:00'.format(hour % 24) for hour in hours]
+
+    return xtick, xticklabel
+
+
+def composite_folder(resultsFolder, pollyVersion, timeLim):
+    """
+    Folder of the chunk files of the day. The files of each product are
+    kept in a subfolder named by the product tag.
+
+    Parameters
+    ----------
+    resultsFolder: str
+        'results_folder' of the pollynet processing chain config.
+    pollyVersion: str
+    timeLim: list
+        [start, stop] of the day. (datenum)
+
+    Returns
+    -------
+    folder: str
+        {resultsFolder}/{pollyVersion}/daily_composite/{yyyymmdd}
+    """
+
+    day = np.datetime64(int(round(timeLim[0])) - DATENUM_EPOCH, 'D')
+
+    return os.path.join(resultsFolder, pollyVersion, 'daily_composite',
+                        str(day).replace('-', ''))
+
+
+def save_chunk(folder, tag, chunkName, time, height, matrix, yLim, pixels,
+               timeLim, reducer='mean', masks=(), scale=1):
+    """
+    Reduce the product of one chunk to the pixel grid of the day and save
+    the columns covered by the chunk.
+
+    Parameters
+    ----------
+    folder: str
+        folder of the chunk files of the day. (see `composite_folder`)
+    tag: str
+        product tag, e.g. 'RCS_FR_532'.
+    chunkName: str
+        name of the chunk, e.g., the data filename without extension. The
+        chunk will be saved as '{folder}/{tag}/{chunkName}.npz'.
+    time, height, matrix, yLim, pixels, reducer, masks, scale:
+        see `polly_decimate.decimate`.
+    timeLim: list
+        [start, stop] of the day. (see `day_limits`)
+
+    Usage
+    -----
+    timeLim = day_limits(mTime)
+    save_chunk(composite_folder(resultsFolder, pollyVersion, timeLim),
+               'RCS_FR_532', rmext(dataFilename), mTime, height, RCS_FR_532,
+               yLim, pixels, timeLim, masks=[profileMask], scale=1e-6)
+    """
+
+    blockTime, blockHeight, reduced = decimate(
+        time, height, matrix, yLim, pixels, reducer=reducer, masks=masks,
+        scale=scale, timeLim=timeLim)
+    if blockTime.size < 2:
+        return
+
+    # columns with at least one valid block
+    cols = np.nonzero(~ np.ma.getmaskarray(reduced).all(axis=0))[0]
+    if not cols.size:
+        return
+    cols = slice(cols[0], cols[-1] + 1)
+
+    values = np.ma.filled(
+        reduced[:, cols].astype(np.float32), np.float32(np.nan))
+
+    tagFolder = os.path.join(folder, tag)
+    if not os.path.exists(tagFolder):
+        os.makedirs(tagFolder)
+
+    chunkFile = os.path.join(tagFolder, '{0}.npz'.format(chunkName))
+    tmpFile = '{0}.{1}.tmp'.format(chunkFile, os.getpid())
+    try:
+        with open(tmpFile, 'wb') as fh:
+            np.savez(fh, version=np.array(CHUNK_VERSION),
+                     time=blockTime, height=blockHeight,
+                     col0=np.array(cols.start), data=values)
+        os.replace(tmpFile, chunkFile)
+    finally:
+        if os.path.exists(tmpFile):
+            os.remove(tmpFile)
+
+    _remove_old_chunks(os.path.dirname(os.path.abspath(folder)),
+                       os.path.abspath(folder))
+
+
+def load_composite(folder, tag):
+    """
+    Fill the raster of the day with the chunk files of the product one after
+    another.
+
+    Parameters
+    ----------
+    folder: str
+        folder of the chunk files of the day. (see `composite_folder`)
+    tag: str
+        product tag, e.g. 'RCS_FR_532'.
+
+    Returns
+    -------
+    time: array
+        time of each column of the day. (datenum)
+    height: array
+        height of each row.
+    matrix: masked array
+        product of the day, which is masked without chunks. None if there
+        was no chunk file.
+
+    Usage
+    -----
+    time, height, RCS = load_composite(folder, 'RCS_FR_532')
+    """
+
+    tagFolder = os.path.join(folder, tag)
+    if not os.path.isdir(tagFolder):
+        return None, None, None
+
+    chunkFiles = sorted(os.path.join(tagFolder, filename)
+                        for filename in os.listdir(tagFolder)
+                        if filename.endswith('.npz'))
+
+    time = height = raster = None
+    for chunkFile in chunkFiles:
+        try:
+            with np.load(chunkFile, allow_pickle=False) as npz:
+                if int(npz['version']) != CHUNK_VERSION:
+                    continue
+
+                if raster is None:
+                    time, height = npz['time'], npz['height']
+                    raster = np.full((height.size, time.size), np.nan,
+                                     dtype=np.float32)
+                elif (npz['time'].shape != time.shape) or \
+                     (npz['height'].shape != height.shape) or \
+                     (not np.allclose(npz['time'], time,
+                                      rtol=0, atol=1e-6)) or \
+                     (not np.allclose(npz['height'], height,
+                                      rtol=0, atol=1e-3)):
+                    # e.g., a different resolution of the measurements
+                    print('Skip {0} with a different grid.'.format(chunkFile))
+                    continue
+
+                col0 = int(npz['col0'])
+                values = npz['data']
+        except (OSError, ValueError, KeyError):
+            print('Failed reading {0}'.format(chunkFile))
+            continue
+
+        # the blocks at the borders of the chunks are shared with the
+        # neighbours and only the valid values are pasted
+        columns = raster[:, col0:(col0 + values.shape[1])]
+        flagValid = ~ np.isnan(values)
+        columns[flagValid] = values[flagValid]
+
+    if raster is None:
+        return None, None, None
+
+    return time, height, np.ma.masked_invalid(raster, copy=False)
+
+
+def _remove_old_chunks(compositeFolder, currentFolder):
+    """
+    Remove the chunk files older than `CHUNK_MAX_AGE` and the empty folders
+    (except for the folders of the current day).
+    """
+
+    now = time.time()
+    for root, _, filenames in os.walk(compositeFolder, topdown=False):
+        try:
+            for filename in filenames:
+                filename = os.path.join(root, filename)
+                if filename.endswith('.npz') and \
+                   (now - os.path.getmtime(filename) > CHUNK_MAX_AGE):
+                    os.remove(filename)
+            if (root != compositeFolder) and \
+               (not root.startswith(currentFolder)) and \
+               (not os.listdir(root)):
+                os.rmdir(root)
+        except OSError:
+            pass
@@ -0,0 +1,330 @@
+"""
+Reduce the time-height products to the resolution of the figure.
+
+A quicklook of 10 x 5 inch at 150 dpi only has about 1200 x 560 pixels for
+the data, but the products of a full day have e.g. 2880 profiles x 3000 bins
+and most of the range bins are above the y-limits of the figure. Before
+plotting, the range bins outside of the y-limits are cropped and the time and
+height are reduced in blocks to the pixel grid of the axes. The resolution
+will never be lower than the pixel grid.
+
+The invalid values (NaN, masked values and the masks given by the display
+functions, e.g. depCalMask, fogMask and quality_mask) are excluded from the
+blocks. A block will be masked if more than half of its cells were invalid,
+so the masked periods keep their width in the figure.
+
+The masks are only applied to the cropped range bins. The masks of the
+profiles (e.g. depCalMask and fogMask) are combined once with `profile_mask`
+and broadcast over the range bins instead of being tiled to the shape of the
+product. The invalid cells are set to NaN in the buffer of the blocks, which
+keeps the precision of float32 products, and the reduced product is scaled
+in place.
+
+With `timeLim`, the product is put on a fixed time grid over the limits
+(e.g., the period of the current file in the near-real-time processing), so
+the blocks of the existing profiles do not change when new profiles are
+appended (see `polly_raster.append_quicklook`).
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Apply the masks in place and add `profile_mask`.
+2026-10-17. Add the fixed time grid with `timeLim`.
+2026-10-17. Sample the nearest cells without copying the product.
+2026-10-17. Record the timing spans of masking the products.
+"""
+
+import numpy as np
+from polly_mesh import regular_grid
+from polly_timing import span
+
+REDUCERS = ('mean', 'max', 'nearest')
+
+
+def axes_pixels(figSize, axPosition, dpi):
+    """
+    Number of pixels of the axes.
+
+    Parameters
+    ----------
+    figSize: list
+        [width, height] of the figure. (inch)
+    axPosition: list
+        [left, bottom, width, height] of the axes relative to the figure.
+    dpi: int
+        figure resolution.
+
+    Returns
+    -------
+    pixels: tuple
+        (number of pixel rows, number of pixel columns)
+    """
+
+    return (int(np.ceil(figSize[1] * axPosition[3] * dpi)),
+            int(np.ceil(figSize[0] * axPosition[2] * dpi)))
+
+
+def profile_mask(*masks):
+    """
+    Combine the masks of the profiles into one boolean mask.
+
+    Parameters
+    ----------
+    masks: arrays
+        boolean masks of the invalid profiles (True) with the length of the
+        time, e.g. `depCalMask != 0`.
+
+    Returns
+    -------
+    mask: array
+        1-D boolean array, which is True if any of the masks is True.
+
+    Usage
+    -----
+    mask = profile_mask(depCalMask != 0, fogMask == 1)
+    """
+
+    with span('mask', call='profile_mask'):
+        mask = np.zeros(np.size(masks[0]), dtype=bool)
+        for thisMask in masks:
+            mask |= np.asarray(thisMask, dtype=bool).ravel()
+
+    return mask
+
+
+def decimate(time, height, matrix, yLim, pixels, reducer='mean', masks=(),
+             scale=1, timeLim=None):
+    """
+    Crop the product to the y-limits and reduce it to the pixel grid.
+
+    Parameters
+    ----------
+    time: array
+        measurement time of each profile. (datenum)
+    height: array
+        height of each range bin.
+    matrix: 2-D array
+        product with the shape of (height, time).
+    yLim: list
+        y-limits of the figure.
+    pixels: tuple
+        (number of pixel rows, number of pixel columns) of the axes. (see
+        `axes_pixels`)
+    reducer: str
+        'mean', 'max' or 'nearest'. 'nearest' takes the center cell of each
+        block and should be used for the classifications and flags.
+    masks: list
+        arrays of the invalid values (True or nonzero), which need to be
+        broadcastable to the matrix, e.g. the 1-D mask of the profiles from
+        `profile_mask` or the 2-D `quality_mask`. The 2-D masks are cropped
+        to the y-limits before they are checked.
+    scale: float
+        factor which is multiplied to the reduced product.
+    timeLim: list
+        fixed time limits of the figure. (datenum) The time grid starts at
+        timeLim[0] with the resolution of the measurements (in seconds) and
+        the columns without profiles are masked. The profiles outside of the
+        limits are dropped.
+
+    Returns
+    -------
+    time: array
+        time of each column. (datenum)
+    height: array
+        height of each row.
+    matrix: masked array
+        reduced product. If the grid is not regular, only the masks will be
+        applied and the product will not be cropped or reduced.
+
+    Usage
+    -----
+    time, height, RCS = decimate(
+        mTime, height, RCS_FR_532, [0, 15000], axes_pixels(
+            [10, 5], [0.11, 0.15, 0.79, 0.75], 150),
+        masks=[profile_mask(depCalMask != 0, fogMask == 1)], scale=1e-6)
+    """
+
+    if reducer not in REDUCERS:
+        raise ValueError('Unknown reducer: {0}'.format(reducer))
+
+    with span('mask', call='decimate', shape=list(np.shape(matrix))):
+        time = np.asarray(time, dtype=np.float64).ravel()
+        height = np.asarray(height, dtype=np.float64).ravel()
+
+        grid = regular_grid(time, height)
+        if grid is None:
+            data, invalid = _mask_invalid(matrix, masks, slice(None))
+            if scale != 1:
+                data = data * scale
+            return time, height, np.ma.masked_array(data, mask=invalid)
+
+        # crop the range bins to the y-limits
+        dh = np.abs(height[-1] - height[0]) / (height.size - 1)
+        flagVisible = (height + dh / 2 >= min(yLim)) & \
+            (height - dh / 2 <= max(yLim))
+        if np.any(flagVisible):
+            rows = np.nonzero(flagVisible)[0]
+            rows = slice(rows[0], rows[-1] + 1)
+        else:
+            rows = slice(None)
+        height = height[rows]
+
+        # time grid
+        dt = (grid['extent'][1] - grid['extent'][0]) / grid['nTime']
+        profiles = np.arange(time.size)
+        if timeLim is None:
+            time0, timeIndx, nTime = time[0], grid['timeIndx'], grid['nTime']
+        else:
+            # the resolution is rounded to seconds to keep the grid the same
+            # for the following profiles
+            dt = max(1, round(dt * 86400)) / 86400
+            nTime = max(1, int(round((timeLim[1] - timeLim[0]) / dt)))
+            dt = (timeLim[1] - timeLim[0]) / nTime
+            time0 = timeLim[0]
+            timeIndx = np.rint((time - time0) / dt).astype(np.int64)
+            flagIn = (timeIndx >= 0) & (timeIndx < nTime)
+            profiles, timeIndx = profiles[flagIn], timeIndx[flagIn]
+
+        # block sizes
+        nRow = height.size
+        kRow = max(1, nRow // pixels[0])
+        kTime = max(1, nTime // pixels[1])
+        nBlockRow = int(np.ceil(nRow / kRow))
+        nBlockTime = int(np.ceil(nTime / kTime))
+
+        if reducer == 'nearest':
+            rowIndx = np.minimum(np.arange(nBlockRow) * kRow + kRow // 2,
+                                 nRow - 1)
+            gridIndx = np.minimum(np.arange(nBlockTime) * kTime + kTime // 2,
+                                  nTime - 1)
+            reduced = _sample_nearest(matrix, masks, rows, profiles, timeIndx,
+                                      nTime, rowIndx, gridIndx)
+        else:
+            reduced = _reduce_blocks(matrix, masks, rows, profiles, timeIndx,
+                                     nTime, (kRow, kTime), reducer)
+
+        if scale != 1:
+            reduced *= scale
+
+        # center of each block
+        dh = height[1] - height[0] if nRow > 1 else dh
+        blockTime = time0 + (np.arange(nBlockTime) * kTime +
+                             (kTime - 1) / 2) * dt
+        blockHeight = height[0] + (np.arange(nBlockRow) * kRow +
+                                   (kRow - 1) / 2) * dh
+
+        return blockTime, blockHeight, reduced
+
+
+def _reduce_blocks(matrix, masks, rows, profiles, timeIndx, nTime, blocks,
+                   reducer):
+    """
+    Reduce the valid cells of each block with the mean or the maximum.
+    """
+
+    data, invalid = _mask_invalid(matrix, masks, rows)
+    if profiles.size < data.shape[1]:
+        data, invalid = data[:, profiles], invalid[:, profiles]
+
+    nRow = data.shape[0]
+    kRow, kTime = blocks
+    nBlockRow = int(np.ceil(nRow / kRow))
+    nBlockTime = int(np.ceil(nTime / kTime))
+
+    # put the profiles on the regular time grid. The gaps, the padding of
+    # the last blocks and the invalid cells are NaN.
+    dtype = np.float32 if data.dtype == np.float32 else np.float64
+    values = np.full((nBlockRow * kRow, nBlockTime * kTime), np.nan,
+                     dtype=dtype)
+    if np.array_equal(timeIndx, np.arange(nTime)):
+        block = values[:nRow, :nTime]
+        block[...] = data
+        block[invalid] = np.nan
+    else:
+        values[:nRow, timeIndx] = np.where(invalid, np.nan, data)
+    invalid = np.isnan(values)
+
+    shape = (nBlockRow, kRow, nBlockTime, kTime)
+    nValid = kRow * kTime - invalid.reshape(shape).sum(axis=(1, 3))
+    if reducer == 'mean':
+        values[invalid] = 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            reduced = values.reshape(shape).sum(axis=(1, 3))
+            reduced /= nValid
+    else:
+        values[invalid] = -np.inf
+        reduced = values.reshape(shape).max(axis=(1, 3))
+
+    # number of the cells inside the product (the last blocks can be
+    # smaller)
+    nCell = np.outer(
+        np.minimum(nRow - np.arange(nBlockRow) * kRow, kRow),
+        np.minimum(nTime - np.arange(nBlockTime) * kTime, kTime))
+
+    return np.ma.masked_where(
+        (nValid == 0) | (2 * nValid < nCell), reduced, copy=False)
+
+
+def _sample_nearest(matrix, masks, rows, profiles, timeIndx, nTime, rowIndx,
+                    gridIndx):
+    """
+    Center cell of each block. Only these cells are read from the product
+    and the masks, so the product (e.g., the uint8 signal status or a
+    memory-mapped handoff) is neither copied nor converted to float.
+    """
+
+    # profile of each column of the time grid (-1 for the gaps)
+    columnProfile = np.full(nTime, -1, dtype=np.int64)
+    columnProfile[timeIndx] = profiles
+    cols = columnProfile[gridIndx]
+    gap = cols < 0
+    cols[gap] = 0
+
+    cropped = np.arange(matrix.shape[0])[rows]
+    cells = np.ix_(cropped[rowIndx], cols)
+    sample = np.ma.getdata(matrix)[cells]
+    if np.ma.getmask(matrix) is not np.ma.nomask:
+        sample = np.ma.masked_array(sample,
+                                    mask=np.ma.getmask(matrix)[cells])
+
+    sampledMasks = []
+    for mask in masks:
+        mask = np.asarray(mask)
+        if (mask.ndim == 2) and (mask.shape[0] != matrix.shape[0]):
+            # mask of the cropped range bins
+            mask = np.broadcast_to(
+                mask, (cropped.size, matrix.shape[1]))[np.ix_(rowIndx, cols)]
+        else:
+            mask = np.broadcast_to(mask, matrix.shape)[cells]
+        sampledMasks.append(mask)
+
+    data, invalid = _mask_invalid(sample, sampledMasks, slice(None))
+    invalid[:, gap] = True
+
+    dtype = np.float32 if data.dtype == np.float32 else np.float64
+    values = data.astype(dtype)
+    values[invalid] = np.nan
+
+    return np.ma.masked_array(values, mask=invalid)
+
+
+def _mask_invalid(matrix, masks, rows):
+    """
+    Data and invalid cells (NaN, masked values and the given masks) of the
+    selected rows. The 1-D masks of the profiles are broadcast over the rows.
+    """
+
+    data = np.ma.getdata(matrix)[rows]
+    invalid = np.isfinite(data)
+    np.logical_not(invalid, out=invalid)
+    if np.ma.is_masked(matrix):
+        invalid |= np.ma.getmaskarray(matrix)[rows]
+    for mask in masks:
+        mask = np.asarray(mask)
+        if (mask.ndim == 2) and (mask.shape[0] == matrix.shape[0]):
+            mask = mask[rows]
+        if mask.dtype != bool:
+            mask = mask != 0
+        invalid |= mask
+
+    return data, invalid
@@ -0,0 +1,574 @@
+"""
+Render server and batch runner for the python display scripts of the Pollynet
+Processing Chain.
+
+Every display wrapper in MATLAB used to launch a new python interpreter for
+each product, which has to import scipy.io, numpy and matplotlib again before
+anything is plotted. The render server imports all display scripts once and
+executes the display functions by name for every incoming job. The batch
+runner renders all the products of one measurement file listed in a manifest
+within one interpreter or a pool of worker processes.
+
+Usage
+-----
+start the server (unix socket or tcp address)::
+
+    python polly_display.py serve --server /tmp/pollynet_display.sock
+    python polly_display.py serve --server localhost:5678
+
+render all the jobs listed in a manifest file with a worker pool::
+
+    python polly_display.py run manifest.json --workers 4
+
+send a job to the running server::
+
+    python polly_display.py send --server /tmp/pollynet_display.sock \
+        pollyxt_display_rcs tmpFile saveFolder
+
+run one display script in this interpreter (used by run_python_display.m
+without render server)::
+
+    python polly_display.py exec pollyxt_display_rcs.py tmpFile saveFolder
+
+list all available display functions::
+
+    python polly_display.py list
+
+The timing spans of every job are written into the 'log_folder' of the
+processing chain (see `polly_timing`). The PNG files of every job are encoded
+and written in background threads (see `polly_encode`), and the extra
+outputs of each figure are saved from the same rendering (see
+`polly_outputs`).
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Record the timing spans of each display job.
+2026-10-17. Write the PNG files of each display job in background threads.
+2026-10-17. Save the extra outputs of the figures with 'pyOutputSpecs'.
+2026-10-17. Reset the matplotlib settings and catch sys.exit of each job.
+2026-10-17. Pass the folder of the timing log to each job.
+"""
+
+import os
+import sys
+import io
+import copy
+import glob
+import json
+import time
+import socket
+import argparse
+import traceback
+import contextlib
+import socketserver
+import importlib
+import importlib.util
+import multiprocessing
+
+from polly_timing import display_job, timing_log_folder
+from polly_handoff import load_process_info
+from polly_encode import background_writes, png_compress_level
+from polly_outputs import extra_outputs, output_specs
+
+LIB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# status code of display jobs
+STATUS_SUCCESS = 0
+STATUS_UNKNOWN_FUNC = 1
+STATUS_FAILURE = 2
+STATUS_BAD_REQUEST = 3
+STATUS_NO_SERVER = 4
+
+# loaded display modules
+_DISPLAY_MODULES = {}
+
+
+def list_display_funcs():
+    """
+    Search for all the python display scripts under the polly function
+    libraries.
+
+    Returns
+    -------
+    funcs: dict
+        display function name with the absolute path of the python script.
+        e.g., {'pollyxt_display_rcs': '/lib/polly_general_func_lib/...'}
+    """
+
+    funcs = {}
+    for pyFile in sorted(glob.glob(
+            os.path.join(LIB_DIR, '*_func_lib', '*_display_*.py'))):
+        funcName, _ = os.path.splitext(os.path.basename(pyFile))
+        funcs[funcName] = pyFile
+
+    return funcs
+
+
+def load_display_func(funcName, funcs=None):
+    """
+    Import the display script and return the display function with the same
+    name. The imported module will be cached for the next jobs.
+
+    Parameters
+    ----------
+    funcName: str
+        display function name, e.g., 'pollyxt_display_rcs'.
+    funcs: dict
+        output from `list_display_funcs`.
+
+    Returns
+    -------
+    func: callable or None
+    """
+
+    if funcName in _DISPLAY_MODULES:
+        return getattr(_DISPLAY_MODULES[funcName], funcName, None)
+
+    if funcs is None:
+        funcs = list_display_funcs()
+
+    if funcName not in funcs:
+        return None
+
+    spec = importlib.util.spec_from_file_location(funcName, funcs[funcName])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _DISPLAY_MODULES[funcName] = module
+
+    return getattr(module, funcName, None)
+
+
+def preload_display_funcs(funcs=None):
+    """
+    Import numpy, scipy.io, matplotlib and all the display scripts.
+
+    Parameters
+    ----------
+    funcs: dict
+        output from `list_display_funcs`.
+    """
+
+    # import the heavy modules once, so that the first job does not wait
+    # for them
+    for moduleName in ['numpy', 'scipy.io']:
+        importlib.import_module(moduleName)
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot
+
+    if funcs is None:
+        funcs = list_display_funcs()
+
+    for funcName in funcs.keys():
+        try:
+            load_display_func(funcName, funcs)
+        except Exception as e:
+            print('Failed importing {func}: {err}'.format(
+                func=funcName, err=e))
+
+
+@contextlib.contextmanager
+def isolated_job():
+    """
+    Reset the global matplotlib settings changed by a display job, because
+    the render server runs all the jobs in one process. The display scripts
+    set the fonts in `matplotlib.rcParams` and the under, over and bad
+    colors of the shared colormaps (e.g., `plt.cm.jet.set_bad`).
+    """
+
+    import matplotlib
+    import matplotlib.cm
+    from matplotlib.colors import Colormap
+
+    # the scripts look up the colormaps in matplotlib.cm for every job, so
+    # the unchanged copies are put back after the job
+    colormaps = {name: copy.copy(cmap)
+                 for name, cmap in vars(matplotlib.cm).items()
+                 if isinstance(cmap, Colormap)}
+
+    try:
+        with matplotlib.rc_context():
+            yield
+    finally:
+        for name, cmap in colormaps.items():
+            setattr(matplotlib.cm, name, cmap)
+
+
+def run_display_job(funcName, tmpFile, saveFolder, funcs=None):
+    """
+    Run the display function with the given temporary file.
+
+    Parameters
+    ----------
+    funcName: str
+        display function name, e.g., 'pollyxt_display_rcs'.
+    tmpFile: str
+        the .mat file which stores the data for visualization.
+    saveFolder: str
+        folder to save the figures.
+    funcs: dict
+        output from `list_display_funcs`.
+
+    Returns
+    -------
+    status: int
+        0: success; 1: unknown display function; 2: failure in displaying.
+    output: str
+        the printed messages from the display function.
+    """
+
+    buffer = io.StringIO()
+    status = STATUS_SUCCESS
+
+    with contextlib.redirect_stdout(buffer):
+        try:
+            func = load_display_func(funcName, funcs)
+            if func is None:
+                status = STATUS_UNKNOWN_FUNC
+                print('Unknown display function: {func}'.format(
+                    func=funcName))
+            else:
+                processInfo = load_process_info(tmpFile)
+                with isolated_job(), \
+                        display_job(funcName, tmpFile, saveFolder,
+                                    timing_log_folder(processInfo)), \
+                        background_writes(png_compress_level(processInfo)), \
+                        extra_outputs(output_specs(processInfo)):
+                    func(tmpFile, saveFolder)
+        except (Exception, SystemExit):
+            # sys.exit of a display script must not stop the render server
+            status = STATUS_FAILURE
+            traceback.print_exc(file=buffer)
+        finally:
+            # release all the figures left by the failed jobs
+            if 'matplotlib.pyplot' in sys.modules:
+                sys.modules['matplotlib.pyplot'].close('all')
+
+    return status, buffer.getvalue()
+
+
+def _run_manifest_job(job):
+    """
+    Run one job from the manifest and collect the status.
+    """
+
+    tStart = time.time()
+    try:
+        funcName = job['func']
+        tmpFile = job['tmpFile']
+        saveFolder = job['saveFolder']
+    except (KeyError, TypeError) as e:
+        return {'job': job,
+                'status': STATUS_BAD_REQUEST,
+                'output': 'Missing field {0} in job.'.format(e),
+                'elapsed': 0.0}
+
+    status, output = run_display_job(funcName, tmpFile, saveFolder)
+
+    return {'func': funcName,
+            'tmpFile': tmpFile,
+            'saveFolder': saveFolder,
+            'status': status,
+            'output': output,
+            'elapsed': time.time() - tStart}
+
+
+def run_manifest(manifestFile, nWorkers=None, summaryFile=None):
+    """
+    Render all the display jobs in the manifest file within one interpreter
+    or a pool of worker processes.
+
+    Parameters
+    ----------
+    manifestFile: str
+        JSON file with the display jobs::
+
+            {"workers": 4,
+             "jobs": [{"func": "pollyxt_display_rcs",
+                       "tmpFile": "/tmp/xxx.mat",
+                       "saveFolder": "/recent_plots/..."}, ...]}
+
+    nWorkers: int
+        number of worker processes. It will overwrite the 'workers' in the
+        manifest file. (default: 1)
+    summaryFile: str
+        JSON file to save the result summary of each job. By default, it will
+        be saved next to the manifest file with the suffix '_summary.json'.
+
+    Returns
+    -------
+    summary: dict
+        {'nJobs': int, 'nFailed': int, 'elapsed': float, 'jobs': list}
+    """
+
+    with open(manifestFile, 'r') as f:
+        manifest = json.load(f)
+
+    jobs = manifest.get('jobs', [])
+    if nWorkers is None:
+        nWorkers = manifest.get('workers', 1)
+    nWorkers = max(1, min(int(nWorkers), len(jobs)))
+
+    tStart = time.time()
+    if nWorkers == 1:
+        results = [_run_manifest_job(job) for job in jobs]
+    else:
+        # each worker imports the display scripts only once and keeps them
+        # for the following jobs.
+        with multiprocessing.Pool(nWorkers) as pool:
+            results = pool.map(_run_manifest_job, jobs, chunksize=1)
+
+    summary = {
+        'manifest': os.path.abspath(manifestFile),
+        'workers': nWorkers,
+        'nJobs': len(results),
+        'nFailed': sum([res['status'] != STATUS_SUCCESS for res in results]),
+        'elapsed': time.time() - tStart,
+        'jobs': results
+    }
+
+    if summaryFile is None:
+        summaryFile = os.path.splitext(manifestFile)[0] + '_summary.json'
+    with open(summaryFile, 'w') as f:
+        json.dump(summary, f, indent=4)
+
+    return summary
+
+
+def parse_address(address):
+    """
+    Parse the server address.
+
+    Parameters
+    ----------
+    address: str
+        'unix:/tmp/display.sock', '/tmp/display.sock' or 'localhost:5678'.
+
+    Returns
+    -------
+    family: int
+        socket.AF_UNIX or socket.AF_INET
+    address: str or tuple
+    """
+
+    if address.startswith('unix:'):
+        return socket.AF_UNIX, address[len('unix:'):]
+
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit() and (os.sep not in host):
+        return socket.AF_INET, (host or 'localhost', int(port))
+
+    return socket.AF_UNIX, address
+
+
+class DisplayRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle newline-delimited JSON requests.
+
+    Request: {"func": "pollyxt_display_rcs", "tmpFile": ...,
+              "saveFolder": ...} or {"cmd": "ping"} or {"cmd": "shutdown"}
+    Response: {"status": 0, "output": "..."}
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                req = json.loads(line.decode('utf-8'))
+                cmd = req.get('cmd', 'display')
+            except (ValueError, AttributeError):
+                self.reply(STATUS_BAD_REQUEST, 'Invalid request.')
+                continue
+
+            if cmd == 'ping':
+                self.reply(STATUS_SUCCESS, 'pong')
+            elif cmd == 'shutdown':
+                self.reply(STATUS_SUCCESS, 'shutdown')
+                self.server.flagShutdown = True
+                return
+            elif cmd == 'display':
+                try:
+                    funcName = req['func']
+                    tmpFile = req['tmpFile']
+                    saveFolder = req['saveFolder']
+                except KeyError as e:
+                    self.reply(STATUS_BAD_REQUEST,
+                               'Missing field {0} in request.'.format(e))
+                    continue
+
+                status, output = run_display_job(
+                    funcName, tmpFile, saveFolder, self.server.funcs)
+                print('[{func}] status {status}: {tmpFile}'.format(
+                    func=funcName, status=status, tmpFile=tmpFile))
+                self.reply(status, output)
+            else:
+                self.reply(STATUS_BAD_REQUEST,
+                           'Unknown command {0}.'.format(cmd))
+
+    def reply(self, status, output):
+        res = json.dumps({'status': status, 'output': output}) + '\n'
+        self.wfile.write(res.encode('utf-8'))
+        self.wfile.flush()
+
+
+def serve(address, preload=True):
+    """
+    Start the render server. Jobs are executed one after another, because
+    matplotlib.pyplot is not thread-safe.
+
+    Parameters
+    ----------
+    address: str
+        server address. (see `parse_address`)
+    preload: bool
+        whether to import all the display scripts before listening.
+    """
+
+    family, addr = parse_address(address)
+    funcs = list_display_funcs()
+    if preload:
+        preload_display_funcs(funcs)
+
+    if family == socket.AF_UNIX:
+        if os.path.exists(addr):
+            os.remove(addr)
+        server = socketserver.UnixStreamServer(addr, DisplayRequestHandler)
+    else:
+        socketserver.TCPServer.allow_reuse_address = True
+        server = socketserver.TCPServer(addr, DisplayRequestHandler)
+
+    server.funcs = funcs
+    server.flagShutdown = False
+    print('Render server is listening on {address} with {n} display '
+          'functions.'.format(address=address, n=len(funcs)))
+    sys.stdout.flush()
+
+    try:
+        while not server.flagShutdown:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if (family == socket.AF_UNIX) and os.path.exists(addr):
+            os.remove(addr)
+
+
+def send_request(address, req, timeout=None):
+    """
+    Send one request to the render server and wait for the response.
+
+    Parameters
+    ----------
+    address: str
+        server address. (see `parse_address`)
+    req: dict
+        request.
+    timeout: float
+        socket timeout in seconds. None means blocking.
+
+    Returns
+    -------
+    res: dict
+        {'status': int, 'output': str}
+    """
+
+    family, addr = parse_address(address)
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(addr)
+        sock.sendall((json.dumps(req) + '\n').encode('utf-8'))
+        with sock.makefile('rb') as f:
+            line = f.readline()
+
+    if not line:
+        raise ConnectionError('No response from {0}'.format(address))
+
+    return json.loads(line.decode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Render server for the PollyNET display scripts.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    p_serve = subparsers.add_parser('serve', help='start the render server.')
+    p_serve.add_argument('--server', required=True,
+                         help='unix socket path or host:port.')
+    p_serve.add_argument('--no-preload', action='store_true',
+                         help='import the display scripts on demand.')
+
+    p_send = subparsers.add_parser('send', help='send a job to the server.')
+    p_send.add_argument('--server', required=True,
+                        help='unix socket path or host:port.')
+    p_send.add_argument('func', help='display function name.')
+    p_send.add_argument('tmpFile')
+    p_send.add_argument('saveFolder')
+
+    p_stop = subparsers.add_parser('stop', help='stop the render server.')
+    p_stop.add_argument('--server', required=True,
+                        help='unix socket path or host:port.')
+
+    p_run = subparsers.add_parser(
+        'run', help='render all the jobs in the manifest file.')
+    p_run.add_argument('manifest', help='JSON file with the display jobs.')
+    p_run.add_argument('--workers', type=int, default=None,
+                       help='number of worker processes.')
+    p_run.add_argument('--summary', default=None,
+                       help='JSON file to save the result of each job.')
+
+    p_exec = subparsers.add_parser(
+        'exec', help='run one display script in this interpreter.')
+    p_exec.add_argument('pyFile', help='python display script.')
+    p_exec.add_argument('tmpFile')
+    p_exec.add_argument('saveFolder')
+
+    subparsers.add_parser('list', help='list all display functions.')
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(args.server, preload=not args.no_preload)
+    elif args.command == 'send':
+        try:
+            res = send_request(args.server, {'func': args.func,
+                                             'tmpFile': args.tmpFile,
+                                             'saveFolder': args.saveFolder})
+        except (OSError, ValueError) as e:
+            print('Render server {server} is not available: {err}'.format(
+                server=args.server, err=e))
+            sys.exit(STATUS_NO_SERVER)
+        sys.stdout.write(res['output'])
+        sys.exit(res['status'])
+    elif args.command == 'stop':
+        send_request(args.server, {'cmd': 'shutdown'})
+    elif args.command == 'run':
+        summary = run_manifest(args.manifest, nWorkers=args.workers,
+                               summaryFile=args.summary)
+        for res in summary['jobs']:
+            sys.stdout.write(res['output'])
+            print('[{func}] status {status} ({elapsed:.1f}s): {tmpFile}'.format(
+                func=res.get('func'), status=res['status'],
+                elapsed=res['elapsed'], tmpFile=res.get('tmpFile')))
+        print('{nJobs} jobs finished in {elapsed:.1f}s with {nFailed} '
+              'failures.'.format(**summary))
+        sys.exit(0 if summary['nFailed'] == 0 else STATUS_FAILURE)
+    elif args.command == 'exec':
+        funcName, _ = os.path.splitext(os.path.basename(args.pyFile))
+        status, output = run_display_job(
+            funcName, args.tmpFile, args.saveFolder,
+            {funcName: os.path.abspath(args.pyFile)})
+        sys.stdout.write(output)
+        sys.exit(status)
+    elif args.command == 'list':
+        for funcName, pyFile in list_display_funcs().items():
+            print('{func}: {file}'.format(func=funcName, file=pyFile))
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,378 @@
+"""
+Encode and write the PNG files of the figures in background threads.
+
+`savefig` of a PNG draws the figure and then compresses and writes the image
+before the display function continues with the next figure. Within
+`background_writes`, the RGBA buffer of the Agg canvas is copied after
+drawing and the zlib compression and the file writing are done by a pool of
+threads (Pillow releases the GIL while compressing), which overlaps with the
+drawing of the next figure. All the writes are joined when the block is left,
+so the files are complete when the display function returns.
+
+This covers `Figure.savefig` of the PNG files (by wrapping
+`FigureCanvasAgg.print_png`) and the quicklooks of `polly_raster`. The other
+formats and the tile pyramids are written immediately. Everything that needs
+a written file (e.g., adding it to the render cache) is deferred with
+`after_write`.
+
+The PNG files of `savefig` are recorded as the timing span 'savefig' and the
+writes in the foreground as 'encoding' (see `polly_timing`).
+
+The compression level of the PNG files (0-9) is read from
+'pyPNGCompressLevel' in the pollynet processing chain config. Pillow's
+default (6) is used if it was not configured.
+
+Usage
+-----
+run the display function with background writes::
+
+    processInfo = load_process_info(tmpFile)
+    with background_writes(png_compress_level(processInfo)):
+        pollyxt_display_rcs(tmpFile, saveFolder)
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Wait for the running writes before forking.
+2026-10-17. Record the timing spans of savefig and the foreground writes.
+"""
+
+import os
+import threading
+import functools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from polly_timing import span, background_span
+
+# maximum number of threads encoding the images. One core is left for the
+# drawing.
+MAX_THREADS = 4
+
+# maximum number of copied buffers waiting for the threads, which bounds the
+# memory of the queued images
+MAX_PENDING = 8
+
+# writer of the running block (see `background_writes`)
+_WRITER = None
+
+# compression level of the PNG files, None for the default of Pillow
+_COMPRESS_LEVEL = None
+
+# original `FigureCanvasAgg.print_png`
+_PRINT_PNG = None
+
+
+class BackgroundWriter(object):
+    """
+    Thread pool which writes the images of one display function.
+    """
+
+    def __init__(self, nThreads=MAX_THREADS, maxPending=MAX_PENDING):
+        self._executor = ThreadPoolExecutor(
+            max_workers=nThreads, thread_name_prefix='polly_encode')
+        self._slots = threading.BoundedSemaphore(maxPending)
+        self._pending = {}
+        self._callbacks = {}
+
+    def submit(self, filename, func, *args, **kwargs):
+        """
+        Call func(*args, **kwargs) in a thread, which writes the file.
+        """
+
+        # the earlier write of the same file must not finish after this one
+        previous = self._pending.get(filename)
+        if previous is not None:
+            previous.exception()
+
+        self._slots.acquire()
+        try:
+            self._pending[filename] = self._executor.submit(
+                self._write, filename, func, args, kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def after(self, filename, callback, *args):
+        """
+        Call callback(*args) after the file was written, or immediately if
+        the file is not written by this writer.
+        """
+
+        if filename in self._pending:
+            self._callbacks.setdefault(filename, []).append((callback, args))
+        else:
+            callback(*args)
+
+    def wait(self):
+        """
+        Wait for the running writes without calling the deferred callbacks.
+        The failed writes are raised by `join`.
+        """
+
+        for future in list(self._pending.values()):
+            future.exception()
+
+    def join(self):
+        """
+        Wait for all the writes and call the deferred callbacks of the
+        written files. The first failed write is raised.
+        """
+
+        error = None
+        for filename, future in self._pending.items():
+            exc = future.exception()
+            callbacks = self._callbacks.get(filename, [])
+            if exc is not None:
+                error = error or exc
+                continue
+            for callback, args in callbacks:
+                callback(*args)
+
+        self._pending.clear()
+        self._callbacks.clear()
+
+        if error is not None:
+            raise error
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def _write(self, filename, func, args, kwargs):
+        try:
+            with background_span('encoding',
+                                 file=os.path.basename(filename)):
+                func(*args, **kwargs)
+        finally:
+            self._slots.release()
+
+
+def png_compress_level(processInfo):
+    """
+    Read the compression level of the PNG files from the processInfo struct
+    of the .mat file ('pyPNGCompressLevel' in the pollynet processing chain
+    config).
+
+    Parameters
+    ----------
+    processInfo: numpy structured array
+        mat['processInfo'] from `scipy.io.loadmat`.
+
+    Returns
+    -------
+    level: int
+        0 (no compression) to 9 (smallest files). None if it was not
+        configured.
+    """
+
+    try:
+        if 'pyPNGCompressLevel' in processInfo.dtype.names:
+            level = int(processInfo['pyPNGCompressLevel'][0][0][0][0])
+            return min(9, max(0, level))
+    except (AttributeError, TypeError, ValueError, IndexError):
+        pass
+
+    return None
+
+
+@contextlib.contextmanager
+def background_writes(compressLevel=None, nThreads=None):
+    """
+    Write the PNG files in background threads within the block and wait for
+    all of them when it is left.
+
+    Parameters
+    ----------
+    compressLevel: int
+        compression level of the PNG files. The level of the enclosing block
+        is kept if it was None.
+    nThreads: int
+        number of threads encoding the images. One less than the number of
+        cores by default (at least one and up to `MAX_THREADS`).
+
+    Usage
+    -----
+    with background_writes(6):
+        fig.savefig('RCS_FR_532.png', dpi=150)
+        fig.savefig('RCS_FR_355.png', dpi=150)
+    """
+
+    global _WRITER, _COMPRESS_LEVEL
+
+    if nThreads is None:
+        nThreads = min(MAX_THREADS, max(1, (os.cpu_count() or 1) - 1))
+
+    install()
+    previous = (_WRITER, _COMPRESS_LEVEL)
+    writer = BackgroundWriter(nThreads)
+    _WRITER = writer
+    if compressLevel is not None:
+        _COMPRESS_LEVEL = compressLevel
+
+    try:
+        yield writer
+    except BaseException:
+        # the figures of a failed display function are still written
+        writer.close()
+        raise
+    else:
+        with span('savefig', call='join'):
+            writer.close()
+            writer.join()
+    finally:
+        _WRITER, _COMPRESS_LEVEL = previous
+
+
+def compress_level():
+    """
+    Compression level of the PNG files in the running block. None for the
+    default of Pillow.
+    """
+
+    return _COMPRESS_LEVEL
+
+
+def write_png(filename, rgba, dpi=None, metadata=None, pil_kwargs=None,
+              strict=True):
+    """
+    Write the image as PNG file, in a background thread within
+    `background_writes`. The array must not be changed afterwards.
+
+    Parameters
+    ----------
+    filename: str
+    rgba: uint8 array
+        RGB or RGBA image (rows from the top).
+    dpi: float
+        resolution saved in the file.
+    metadata: dict
+        PNG text chunks (see `matplotlib.image.imsave`).
+    pil_kwargs: dict
+        keyword arguments of `PIL.Image.save`.
+    strict: bool
+        whether a failed write is raised (at the end of `background_writes`).
+        Otherwise it is only printed, e.g., for the extra outputs of
+        `polly_outputs`.
+    """
+
+    kwargs = {'format': 'png', 'origin': 'upper', 'dpi': dpi,
+              'metadata': metadata, 'pil_kwargs': _png_kwargs(pil_kwargs)}
+
+    writer = _WRITER
+    if writer is None:
+        with span('encoding', file=os.path.basename(filename),
+                  size=list(np.shape(rgba)[1::-1])):
+            _imsave(filename, rgba, strict, kwargs)
+    else:
+        writer.submit(filename, _imsave, filename, rgba, strict, kwargs)
+
+
+def wait_writes():
+    """
+    Wait for the running writes of the block, e.g. before forking the
+    workers of `polly_parallel.render_figures`. A process forked while the
+    threads are compressing could inherit the locks of zlib, Pillow or the
+    memory allocator in a locked state and hang.
+    """
+
+    writer = _WRITER
+    if writer is not None:
+        writer.wait()
+
+
+def after_write(filename, callback, *args):
+    """
+    Call callback(*args) after the file was written by `write_png` or
+    `savefig`, e.g., to add it to the render cache.
+    """
+
+    writer = _WRITER
+    if writer is None:
+        callback(*args)
+    else:
+        writer.after(filename, callback, *args)
+
+
+def install():
+    """
+    Wrap `FigureCanvasAgg.print_png`, which copies the buffer of the canvas
+    and writes it with `write_png`. Without background writes, the figures
+    are saved as before, only with the configured compression level.
+    """
+
+    global _PRINT_PNG
+    if _PRINT_PNG is not None:
+        return
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    _PRINT_PNG = FigureCanvasAgg.print_png
+
+    # matplotlib only drops the options of the other formats (e.g.,
+    # 'facecolor') for its own print methods
+    @functools.wraps(_PRINT_PNG)
+    def print_png(self, filename_or_obj, *, metadata=None, pil_kwargs=None):
+        if not isinstance(filename_or_obj, (str, os.PathLike)):
+            return _PRINT_PNG(self, filename_or_obj, metadata=metadata,
+                              pil_kwargs=_png_kwargs(pil_kwargs))
+
+        filename = os.fspath(filename_or_obj)
+        with span('savefig', call='savefig',
+                  file=os.path.basename(filename)):
+            if _WRITER is None:
+                return _PRINT_PNG(self, filename, metadata=metadata,
+                                  pil_kwargs=_png_kwargs(pil_kwargs))
+
+            # the figure dpi is only changed while saving
+            FigureCanvasAgg.draw(self)
+            rgba = np.array(self.buffer_rgba())
+            write_png(filename, rgba, dpi=self.figure.dpi,
+                      metadata=metadata, pil_kwargs=pil_kwargs)
+
+    FigureCanvasAgg.print_png = print_png
+
+
+def _imsave(filename, rgba, strict, kwargs):
+    """
+    Write the image with `matplotlib.image.imsave`.
+    """
+
+    import matplotlib.image as mpimg
+
+    try:
+        mpimg.imsave(filename, rgba, **kwargs)
+    except Exception as e:
+        if strict:
+            raise
+        print('Failed writing {0}: {1}'.format(filename, e))
+
+
+def _png_kwargs(pil_kwargs):
+    """
+    Keyword arguments of `PIL.Image.save` with the compression level.
+    """
+
+    if _COMPRESS_LEVEL is None:
+        return pil_kwargs
+
+    pil_kwargs = dict(pil_kwargs or {})
+    pil_kwargs.setdefault('compress_level', _COMPRESS_LEVEL)
+
+    return pil_kwargs
+
+
+def _reset_after_fork():
+    """
+    The threads of the writer do not exist in a forked process.
+    """
+
+    global _WRITER
+    _WRITER = None
+
+
+if hasattr(os, 'register_at_fork'):
+    # the writes are also drained before any other fork of the process
+    os.register_at_fork(before=wait_writes,
+                        after_in_child=_reset_after_fork)
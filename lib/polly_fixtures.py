@@ -0,0 +1,1028 @@
+"""
+Synthetic handoff files of the python display scripts for benchmarking.
+
+Each display product has a generator which returns the variables declared
+by the display script (see `load_variables` in the scripts) at production
+sizes, e.g., 2880 profiles (24 hours of 30 s profiles) x 3000 range bins
+(7.5 m) for the time-height products. Most of the instrument-specific
+scripts read a subset of the same variables, so they use the fixture of the
+product with the same name (`{instrument}_display_{product}`). The
+instrument wrappers which hand over another schema have their own fixture
+(`INSTRUMENT_FIXTURES`), e.g., one cloud free group for each call of the
+retrieving scripts or the calibration histories of the long-term
+calibrations. The scripts which cannot be run with any fixture are left out
+with the reason (`EXCLUDED_FUNCS`).
+
+The fields are smooth (aerosol layers, clouds and the diurnal cycle) with a
+small noise, so the compression of the images is comparable to the real
+quicklooks. The generators are deterministic for a given seed.
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Derive the time ticks from the time span.
+2026-10-17. Save the logbook file of the long-term calibrations.
+2026-10-17. Add the fixtures of the instrument schemas.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+import numpy as np
+import scipy.io as spio
+
+from polly_time import DATENUM_EPOCH
+
+# production sizes of the fixtures
+PRODUCTION_SIZES = {
+    'nTime': 2880,          # 24 hours of 30 s profiles
+    'nHeight': 3000,        # 7.5 m range bins up to 22.5 km
+    'nGroups': 4,           # cloud free groups of one measurement file
+    'nYears': 5,            # long-term calibrations and logbook
+    'nCaliPerDay': 2,       # calibrations of each product per day
+    'nLogbook': 1000        # logbook events
+    }
+
+# day of the synthetic measurements
+FIXTURE_DAY = datetime(2020, 1, 1)
+
+# range resolution (m)
+RANGE_RESOLUTION = 7.5
+
+# resolution of the profiles (s)
+TIME_RESOLUTION = 30
+
+# intervals of the time ticks by the time span (minutes), like
+# timelabellayout.m
+TICK_INTERVALS = ((30, 5), (180, 30), (360, 60), (1440, 240))
+
+# fixtures of the instrument-specific scripts whose MATLAB wrapper hands over
+# another schema than the general script ({instrument: {product: fixture}})
+INSTRUMENT_FIXTURES = {
+    'polly_first': {
+        'retrieving': 'retrieving_group',
+        'longterm_cali': 'longterm_cali_history'
+        },
+    'polly_1v2': {
+        'retrieving': 'retrieving_group',
+        'longterm_cali': 'longterm_cali_history'
+        },
+    'pollyxt_cge': {
+        'retrieving': 'retrieving_group',
+        'longterm_cali': 'longterm_cali_history',
+        'monitor': 'monitor_cge'
+        },
+    'pollyxt_dwd': {
+        'retrieving': 'retrieving_group',
+        'longterm_cali': 'longterm_cali_history'
+        },
+    'pollyxt_ift': {
+        'longterm_cali': 'longterm_cali_history',
+        'monitor': 'monitor_ift'
+        }
+    }
+
+# display functions which are left out of the benchmark
+EXCLUDED_FUNCS = {
+    'polly_first_display_overlap':
+        'the script defines pollyxt_dwd_display_overlap instead of the '
+        'display function',
+    'pollyxt_ift_display_retrieving':
+        'the script defines pollyxt_ift_display_lidarconst instead of the '
+        'display function',
+    'pollyxt_ift_display_longterm_cali':
+        'the script uses flagCH407FR for the ND filter changes, which is '
+        'not handed over by pollyxt_ift_display_longterm_cali.m'
+    }
+
+
+def fixture_products():
+    """
+    Fixtures of the display products.
+
+    Returns
+    -------
+    fixtures: list
+        e.g., ['NR_att_beta', 'OC_att_beta', ..., 'targetclassi_V2'],
+        including the fixtures of the instrument schemas (see
+        `INSTRUMENT_FIXTURES`).
+    """
+
+    return sorted(_FIXTURES.keys())
+
+
+def fixture_of(funcName):
+    """
+    Fixture of the display function.
+
+    Parameters
+    ----------
+    funcName: str
+        e.g., 'pollyxt_dwd_display_retrieving'.
+
+    Returns
+    -------
+    fixture: str
+        e.g., 'retrieving_group'. None if there was no fixture for it or it
+        was excluded (see `EXCLUDED_FUNCS`).
+    """
+
+    instrument, sep, product = funcName.partition('_display_')
+    if (not sep) or (funcName in EXCLUDED_FUNCS):
+        return None
+
+    fixture = INSTRUMENT_FIXTURES.get(instrument, {}).get(product, product)
+
+    return fixture if fixture in _FIXTURES else None
+
+
+def product_of(funcName):
+    """
+    Display product of the display function.
+
+    Parameters
+    ----------
+    funcName: str
+        e.g., 'pollyxt_dwd_display_rcs'.
+
+    Returns
+    -------
+    product: str
+        e.g., 'rcs'. None if there was no fixture for it.
+    """
+
+    if fixture_of(funcName) is None:
+        return None
+
+    return funcName.partition('_display_')[2]
+
+
+def save_fixture(product, filename, sizes=None, processInfo=None, seed=0):
+    """
+    Save the synthetic handoff of the display product.
+
+    Parameters
+    ----------
+    product: str
+        fixture of the display product, e.g., 'rcs' or 'retrieving_group'.
+        (see `fixture_products` and `fixture_of`)
+    filename: str
+        output .mat file. The calibration database and the logbook of
+        'longterm_cali' will be saved next to it.
+    sizes: dict
+        items to overwrite `PRODUCTION_SIZES`.
+    processInfo: dict
+        items of the processInfo struct, e.g., {'pyFigureWorkers': 1}.
+    seed: int
+        seed of the random fields.
+
+    Returns
+    -------
+    info: dict
+        {'product': str, 'sizes': dict, 'shapes': dict, 'bytes': int}.
+        'shapes' holds the shape of every array with more than one element.
+
+    Usage
+    -----
+    save_fixture('rcs', '/tmp/rcs.mat', sizes={'nTime': 720})
+    """
+
+    if product not in _FIXTURES:
+        raise ValueError('No fixture for {0}'.format(product))
+
+    thisSizes = dict(PRODUCTION_SIZES)
+    thisSizes.update(sizes or {})
+    rng = np.random.default_rng(seed)
+
+    variables = _common(thisSizes, processInfo or {},
+                        os.path.dirname(os.path.abspath(filename)))
+    variables.update(_FIXTURES[product](thisSizes, rng, filename))
+
+    spio.savemat(filename, variables)
+
+    shapes = {}
+    for name, value in variables.items():
+        if isinstance(value, np.ndarray) and (value.dtype != object) and \
+           (value.size > 1):
+            shapes[name] = list(value.shape)
+
+    return {'product': product,
+            'sizes': thisSizes,
+            'shapes': shapes,
+            'bytes': os.path.getsize(filename)}
+
+
+def _datenum(thisTime):
+    """
+    MATLAB datenum of the datetime.
+    """
+
+    return DATENUM_EPOCH + (thisTime - datetime(1970, 1, 1)).total_seconds() \
+        / 86400
+
+
+def _time(sizes):
+    """
+    Time of the profiles. (datenum)
+    """
+
+    return _datenum(FIXTURE_DAY) + \
+        np.arange(sizes['nTime']) * TIME_RESOLUTION / 86400
+
+
+def _time_ticks(time):
+    """
+    Ticks and labels of the time axis, like timelabellayout.m: the first and
+    the last profile and the full intervals in between. The labels of the
+    intervals too close to the first or last profile are left empty. The
+    interval of a day is used for longer spans. (datenum)
+    """
+
+    span = (time[-1] - time[0]) * 1440
+    interval = TICK_INTERVALS[-1][1]
+    for maxSpan, thisInterval in TICK_INTERVALS:
+        if span <= maxSpan:
+            interval = thisInterval
+            break
+    interval = interval / 1440
+
+    first = np.floor(time[0] / interval + 1) * interval
+    last = np.ceil(time[-1] / interval - 1) * interval
+    inner = np.arange(first, last + interval / 2, interval)
+    xtick = np.concatenate(([time[0]], inner, [time[-1]]))
+
+    minutes = np.floor((xtick % 1) * 1440 + 1e-6).astype(int)
+    xticklabel = ['{0:02d}:{1:02d}'.format(minute // 60, minute % 60)
+                  for minute in minutes]
+    if inner.size:
+        if (first - time[0]) <= interval / 3:
+            xticklabel[1] = ''
+        if (time[-1] - last) <= interval / 3:
+            xticklabel[-2] = ''
+
+    return xtick, xticklabel
+
+
+def _height(sizes):
+    """
+    Height of the range bins. (m)
+    """
+
+    return (np.arange(sizes['nHeight']) + 0.5) * RANGE_RESOLUTION
+
+
+def _row(values, dtype=np.float64):
+    """
+    Row vector of MATLAB. The indices used for slicing by the display
+    scripts are saved as integers.
+    """
+
+    return np.asarray(values, dtype=dtype).reshape(1, -1)
+
+
+def _column(values):
+    """
+    Column vector of MATLAB.
+    """
+
+    return np.asarray(values, dtype=np.float64).reshape(-1, 1)
+
+
+def _cellstr(strings):
+    """
+    Cell array of strings of MATLAB. (column)
+    """
+
+    cell = np.empty((len(strings), 1), dtype=object)
+    for iString, string in enumerate(strings):
+        cell[iString, 0] = np.array([string]) if string else np.array([])
+
+    return cell
+
+
+def _common(sizes, processInfo, folder):
+    """
+    Variables shared by all the display scripts.
+    """
+
+    time = _time(sizes)
+    xtick, xticklabel = _time_ticks(time)
+
+    thisProcessInfo = {
+        'programVersion': '2.0',
+        'fontname': 'DejaVu Sans',
+        'results_folder': os.path.join(folder, 'results')
+        }
+    thisProcessInfo.update(processInfo)
+
+    return {
+        'figDPI': 150.0,
+        'imgFormat': 'png',
+        'height': _row(_height(sizes)),
+        'time': _row(time),
+        'xtick': _row(xtick),
+        'xtickstr': _cellstr(xticklabel),
+        'processInfo': thisProcessInfo,
+        'campaignInfo': {
+            'name': 'arielle',
+            'location': 'Leipzig',
+            'startTime': float(time[0])
+            },
+        'taskInfo': {
+            'dataFilename': '{0}_ARI_00_00_01.nc'.format(
+                FIXTURE_DAY.strftime('%Y_%m_%d_%a')),
+            'dataTime': float(time[0])
+            }
+        }
+
+
+def _layers(sizes, rng, scale=1.0):
+    """
+    Smooth time-height field with an aerosol layer, a cloud layer with gaps
+    and the diurnal cycle of the boundary layer.
+    """
+
+    h = np.linspace(0, 1, sizes['nHeight'])[:, np.newaxis]
+    t = np.linspace(0, 1, sizes['nTime'])[np.newaxis, :]
+
+    blh = 0.05 + 0.05 * np.sin(np.pi * t)
+    field = np.exp(- h * 5) * (1 + 2 * (h < blh))
+    field = field + 0.5 * np.exp(- ((h - 0.15 - 0.02 * np.sin(
+        6 * np.pi * t)) / 0.02) ** 2)
+    cloud = (np.sin(40 * np.pi * t) > 0.3) & (t > 0.6)
+    field = field + 5 * np.exp(- ((h - 0.3) / 0.005) ** 2) * cloud
+    field = field * (1 + 0.05 * rng.standard_normal(field.shape))
+
+    return field * scale
+
+
+def _mask(sizes, rng, fraction=0.1):
+    """
+    Quality mask of MATLAB (0: valid, 1: invalid) with the invalid pixels at
+    the top of the profiles.
+    """
+
+    h = np.linspace(0, 1, sizes['nHeight'])[:, np.newaxis]
+    noise = rng.random((sizes['nHeight'], sizes['nTime']))
+
+    return ((h > 1 - fraction) | (noise < fraction / 10)).astype(np.float64)
+
+
+def _fixture_rcs(sizes, rng, filename):
+    """
+    pollyxt_display_rcs
+    """
+
+    nTime = sizes['nTime']
+    variables = {
+        'mTime': _row(_time(sizes)),
+        'depCalMask': _row(np.arange(nTime) % 240 < 10),
+        'fogMask': _row(np.zeros(nTime)),
+        'yLim_FR_RCS': _row([0, 15000]),
+        'yLim_NR_RCS': _row([0, 3000]),
+        'yLim_FR_DR': _row([0, 15000]),
+        'RCS355FRColorRange': _row([0, 15]),
+        'RCS532FRColorRange': _row([0, 15]),
+        'RCS1064FRColorRange': _row([0, 15]),
+        'RCS355NRColorRange': _row([0, 15]),
+        'RCS532NRColorRange': _row([0, 15])
+        }
+    for name in ['RCS_FR_355', 'RCS_FR_532', 'RCS_FR_1064', 'RCS_NR_355',
+                 'RCS_NR_532']:
+        variables[name] = _layers(sizes, rng, 5e6)
+    for name in ['volDepol_355', 'volDepol_532']:
+        variables[name] = _layers(sizes, rng, 0.05)
+
+    return variables
+
+
+def _fixture_att_beta(sizes, rng, filename):
+    """
+    pollyxt_display_att_beta, pollyxt_display_NR_att_beta and
+    pollyxt_display_OC_att_beta
+    """
+
+    variables = {
+        'yLim_att_beta': _row([0, 15000]),
+        'att_beta_cRange_355': _row([0, 15]),
+        'att_beta_cRange_532': _row([0, 10]),
+        'att_beta_cRange_1064': _row([0, 5]),
+        'flagLC355': 'Klett',
+        'flagLC532': 'Raman',
+        'flagLC1064': 'Constant'
+        }
+    for wavelength in ['355', '532', '1064']:
+        variables['ATT_BETA_' + wavelength] = _layers(sizes, rng, 2e-6)
+        variables['quality_mask_' + wavelength] = _mask(sizes, rng)
+
+    return variables
+
+
+def _fixture_wv(sizes, rng, filename):
+    """
+    pollyxt_display_WV
+    """
+
+    return {
+        'WVMR': _layers(sizes, rng, 4),
+        'RH': np.clip(_layers(sizes, rng, 50), 0, 100),
+        'lowSNRMask': _mask(sizes, rng, 0.6),
+        'flagCalibrated': 'yes',
+        'meteorSource': 'gdas1',
+        'yLim_WV_RH': _row([0, 7000]),
+        'xLim_Profi_WV_RH': _row([0, 10])
+        }
+
+
+def _fixture_saturation(sizes, rng, filename):
+    """
+    pollyxt_display_saturation
+    """
+
+    h = np.linspace(0, 1, sizes['nHeight'])[:, np.newaxis]
+    variables = {
+        'yLim_FR_RCS': _row([0, 15000]),
+        'yLim_NR_RCS': _row([0, 3000]),
+        'yLim_WV_RH': _row([0, 7000])
+        }
+    for name in ['SAT_FR_355', 'SAT_FR_532', 'SAT_FR_1064', 'SAT_NR_355',
+                 'SAT_NR_532', 'SAT_FR_407', 'SAT_FR_387', 'SAT_FR_607',
+                 'SAT_NR_387', 'SAT_NR_607', 'SAT_FR_355s', 'SAT_FR_532s']:
+        # 0: normal; 1: saturated; 2: no signal (uint8 as it is saved by
+        # pollyxt_display_saturation.m)
+        field = _layers(sizes, rng)
+        variables[name] = np.where(
+            field > 2.5, 1, np.where(h > 0.9, 2, 0)).astype(np.uint8)
+
+    return variables
+
+
+def _fixture_quasiretrieving(sizes, rng, filename):
+    """
+    pollyxt_display_quasiretrieving and pollyxt_display_quasiretrieving_V2
+    """
+
+    variables = {
+        'yLim_Quasi_Params': _row([0, 12000]),
+        'quasi_beta_cRange_355': _row([0, 2]),
+        'quasi_beta_cRange_532': _row([0, 2]),
+        'quasi_beta_cRange_1064': _row([0, 2]),
+        'quasi_Par_DR_cRange_532': _row([0, 0.4]),
+        'quasi_pardepol_532': _layers(sizes, rng, 0.1),
+        'quasi_ang_532_1064': _layers(sizes, rng, 1)
+        }
+    for wavelength in ['355', '532', '1064']:
+        variables['quasi_bsc_' + wavelength] = _layers(sizes, rng, 5e-7)
+        variables['quality_mask_' + wavelength] = _mask(sizes, rng)
+
+    return variables
+
+
+def _fixture_targetclassi(sizes, rng, filename):
+    """
+    pollyxt_display_targetclassi and pollyxt_display_targetclassi_V2
+    """
+
+    # classes 0 - 11 from the layered field
+    field = _layers(sizes, rng)
+    tcMask = np.digitize(field, [0.05, 0.1, 0.2, 0.4, 0.6, 0.8, 1.0, 1.3,
+                                 1.7, 2.2, 3.0])
+
+    return {
+        'TC_mask': tcMask.astype(np.float64),
+        'yLim_Quasi_Params': _row([0, 12000])
+        }
+
+
+def _profiles(sizes, rng, names, nGroups):
+    """
+    Smooth profiles (nGroups x nHeight) of the retrieving products.
+    """
+
+    h = np.linspace(0, 1, sizes['nHeight'])
+    profiles = {}
+    for name in names:
+        profile = np.exp(- h * 5) + 0.3 * np.exp(- ((h - 0.15) / 0.02) ** 2)
+        profiles[name] = profile[np.newaxis, :] * rng.uniform(
+            0.5, 1.5, (nGroups, 1)) * \
+            (1 + 0.05 * rng.standard_normal((nGroups, h.size)))
+
+    return profiles
+
+
+def _retrieving_limits():
+    """
+    Axis limits of the retrieving profiles.
+    """
+
+    return {
+        'yLim_Profi_Ext': _row([0, 5000]),
+        'yLim_Profi_LR': _row([0, 5000]),
+        'yLim_Profi_DR': _row([0, 5000]),
+        'yLim_Profi_Bsc': _row([0, 5000]),
+        'yLim_Profi_WV_RH': _row([0, 7000]),
+        'yLim_FR_RCS': _row([0, 15000]),
+        'yLim_NR_RCS': _row([0, 3000]),
+        'xLim_Profi_Bsc': _row([-0.1, 10]),
+        'xLim_Profi_NR_Bsc': _row([-0.1, 10]),
+        'xLim_Profi_Ext': _row([-1, 300]),
+        'xLim_Profi_NR_Ext': _row([-1, 300]),
+        'xLim_Profi_WV_RH': _row([0, 10]),
+        'xLim_Profi_RCS': _row([1e-2, 1e2]),
+        'xLim_Profi_LR': _row([0, 100])
+        }
+
+
+def _fixture_retrieving(sizes, rng, filename):
+    """
+    pollyxt_display_retrieving (all the cloud free groups in one file)
+    """
+
+    from polly_general_func_lib.pollyxt_display_retrieving import \
+        GROUP_PROFILES
+
+    nGroups = sizes['nGroups']
+    refHIndx = [n for n in GROUP_PROFILES if n.startswith('refHIndx')]
+    variables = _profiles(
+        sizes, rng, [n for n in GROUP_PROFILES if n not in refHIndx],
+        nGroups)
+
+    # groups of up to 1 hour in the second half of the day
+    groupLen = sizes['nTime'] // 2 // nGroups
+    startIndx = sizes['nTime'] // 2 + np.arange(nGroups) * groupLen
+    endIndx = startIndx + min(groupLen, 3600 // TIME_RESOLUTION) - 1
+    refBins = [int(sizes['nHeight'] * 0.6), int(sizes['nHeight'] * 0.65)]
+    for name in refHIndx:
+        variables[name] = np.tile(np.array(refBins, dtype=np.float64),
+                                  (nGroups, 1))
+
+    variables.update(_retrieving_limits())
+    variables.update({
+        'nGroups': float(nGroups),
+        'startIndx': _column(startIndx + 1),
+        'endIndx': _column(endIndx + 1),
+        'meteorSource': _cellstr(['gdas1'] * nGroups),
+        'flagWVCalibration': 'yes'
+        })
+
+    return variables
+
+
+def _group_retrieving(sizes, rng, names):
+    """
+    Profiles of one cloud free group with the indices of the group and the
+    reference heights, like the handoff of each group.
+    """
+
+    variables = {name: _row(profile)
+                 for name, profile in _profiles(sizes, rng, names, 1).items()}
+
+    refBins = [int(sizes['nHeight'] * 0.6), int(sizes['nHeight'] * 0.65)]
+    groupLen = min(sizes['nTime'] // 2, 3600 // TIME_RESOLUTION)
+    variables.update(_retrieving_limits())
+    variables.update({
+        'startIndx': np.int32(sizes['nTime'] // 2 + 1),
+        'endIndx': np.int32(sizes['nTime'] // 2 + groupLen),
+        'refHIndx355': _row(refBins, np.int32),
+        'refHIndx532': _row(refBins, np.int32),
+        'refHIndx1064': _row(refBins, np.int32),
+        'meteorSource': 'gdas1'
+        })
+
+    return variables
+
+
+def _fixture_oc_retrieving(sizes, rng, filename):
+    """
+    pollyxt_display_OC_retrieving (one cloud free group)
+    """
+
+    names = [
+        'rcs355', 'rcs532', 'rcs1064', 'molRCS355', 'molRCS532',
+        'molRCS1064', 'aerBsc_355_klett', 'aerBsc_532_klett',
+        'aerBsc_1064_klett', 'aerBsc_355_raman', 'aerBsc_532_raman',
+        'aerBsc_1064_raman', 'aerExt_355_klett', 'aerExt_532_klett',
+        'aerExt_1064_klett', 'aerExt_355_raman', 'aerExt_532_raman',
+        'aerExt_1064_raman', 'LR355_raman', 'LR532_raman',
+        'ang_bsc_355_532_klett', 'ang_bsc_532_1064_klett',
+        'ang_bsc_355_532_raman', 'ang_bsc_532_1064_raman',
+        'ang_ext_355_532_raman', 'voldepol355_klett', 'voldepol532_klett',
+        'voldepol355_raman', 'voldepol532_raman', 'pardepol355_klett',
+        'pardepol532_klett', 'pardepolStd355_klett', 'pardepolStd532_klett',
+        'pardepol355_raman', 'pardepol532_raman', 'pardepolStd355_raman',
+        'pardepolStd532_raman', 'temperature', 'pressure']
+
+    return _group_retrieving(sizes, rng, names)
+
+
+def _fixture_retrieving_group(sizes, rng, filename):
+    """
+    {instrument}_display_retrieving of polly_first, polly_1v2, pollyxt_cge
+    and pollyxt_dwd, which are called for each cloud free group (with the
+    rotational Raman and AERONET profiles)
+    """
+
+    names = ['rcs355', 'rcs532', 'rcs1064', 'molRCS355', 'molRCS532',
+             'molRCS1064', 'temperature', 'pressure',
+             'ang_bsc_355_532_klett', 'ang_bsc_532_1064_klett',
+             'ang_bsc_355_532_raman', 'ang_bsc_532_1064_raman',
+             'ang_ext_355_532_raman']
+    for wavelength in ['355', '532', '1064']:
+        for method in ['klett', 'raman', 'RR', 'aeronet']:
+            names.append('aerBsc_{0}_{1}'.format(wavelength, method))
+            names.append('aerExt_{0}_{1}'.format(wavelength, method))
+        names += ['LR{0}_raman'.format(wavelength),
+                  'LR{0}_RR'.format(wavelength)]
+    for wavelength in ['355', '532']:
+        for method in ['klett', 'raman']:
+            names += ['voldepol{0}_{1}'.format(wavelength, method),
+                      'pardepol{0}_{1}'.format(wavelength, method),
+                      'pardepolStd{0}_{1}'.format(wavelength, method)]
+
+    return _group_retrieving(sizes, rng, names)
+
+
+def _fixture_depolcali(sizes, rng, filename):
+    """
+    pollyxt_display_depolcali
+    """
+
+    nHeight = sizes['nHeight']
+    caliHIndxRange = [40, min(nHeight, 400)]
+    nCali = caliHIndxRange[1] - caliHIndxRange[0] + 1
+    segmentLen = 40
+    nSeg = nCali - segmentLen
+    h = np.linspace(0, 1, nHeight)
+    signal = 1e3 * np.exp(- h * 5)
+    start = sizes['nTime'] // 2
+
+    return {
+        'sig_t_p': _row(signal * 1.2),
+        'sig_t_m': _row(signal * 1.1),
+        'sig_x_p': _row(signal * 0.3),
+        'sig_x_m': _row(signal * 0.2),
+        'wavelength': 532.0,
+        'caliHIndxRange': _row(caliHIndxRange, np.int32),
+        'indx_45p': _row(np.arange(start, start + 10) + 1, np.int32),
+        'indx_45m': _row(np.arange(start + 10, start + 20) + 1, np.int32),
+        'dplus': _row(0.8 + 0.01 * rng.standard_normal(nCali)),
+        'dminus': _row(0.7 + 0.01 * rng.standard_normal(nCali)),
+        'segmentLen': np.int32(segmentLen),
+        'indx': np.int32(100),
+        'mean_dplus_tmp': _row(0.8 + 0.01 * rng.standard_normal(nSeg)),
+        'std_dplus_tmp': _row(0.01 + 0.001 * rng.random(nSeg)),
+        'mean_dminus_tmp': _row(0.7 + 0.01 * rng.standard_normal(nSeg)),
+        'std_dminus_tmp': _row(0.01 + 0.001 * rng.random(nSeg)),
+        'TR_t': 0.9,
+        'TR_x': 500.0,
+        'segIndx': np.int32(100),
+        'caliTime': _row(_time(sizes)[start])
+        }
+
+
+def _fixture_lidarconst(sizes, rng, filename):
+    """
+    pollyxt_display_lidarconst
+    """
+
+    nGroups = sizes['nGroups']
+    time = _time(sizes)
+    variables = {
+        'thisTime': _column(time[0] + (np.arange(nGroups) + 0.5) / nGroups)
+        }
+    for wavelength in ['355', '532', '1064', '387', '607']:
+        methods = ['raman'] if wavelength in ['387', '607'] else \
+            ['klett', 'raman', 'aeronet']
+        for method in methods:
+            variables['LC{0}_{1}'.format(wavelength, method)] = _column(
+                rng.uniform(3e13, 5e13, nGroups))
+        variables['yLim' + wavelength] = _row([0, 1e14])
+
+    return variables
+
+
+def _fixture_longterm_cali(sizes, rng, filename):
+    """
+    pollyxt_display_longterm_cali with the calibration database and the
+    logbook of `nYears` before the measurement.
+    """
+
+    dbFile = os.path.splitext(filename)[0] + '.db'
+    _save_calibration_db(dbFile, sizes, rng)
+
+    nChannel = 13
+    time = _time(sizes)
+    startTime = time[0] - 365 * sizes['nYears']
+    logbookFile = os.path.splitext(filename)[0] + '_logbook.csv'
+    _save_logbook(logbookFile, startTime, time[0], sizes, nChannel, rng)
+
+    variables = _longterm_cali_settings(nChannel, startTime)
+    variables.update({
+        'dbFile': os.path.abspath(dbFile),
+        'logbookFile': os.path.abspath(logbookFile),
+        'nChannel': np.int32(nChannel)
+        })
+
+    return variables
+
+
+def _fixture_longterm_cali_history(sizes, rng, filename):
+    """
+    {instrument}_display_longterm_cali of polly_first, polly_1v2,
+    pollyxt_cge, pollyxt_dwd and pollyxt_ift, whose wrappers hand over the
+    calibrations and the logbook events of `nYears` before the measurement
+    """
+
+    nChannel = 13
+    time = _time(sizes)
+    startTime = time[0] - 365 * sizes['nYears']
+    nCali = 365 * sizes['nYears'] * sizes['nCaliPerDay']
+
+    def caliTime():
+        return _row(np.sort(rng.uniform(startTime, time[0], nCali)))
+
+    variables = _longterm_cali_settings(nChannel, startTime)
+    for wavelength in ['355', '532', '1064', '387', '607']:
+        variables.update({
+            'LCTime' + wavelength: caliTime(),
+            'LC{0}History'.format(wavelength): _row(
+                rng.uniform(3e13, 5e13, nCali)),
+            'LCStd{0}History'.format(wavelength): _row(np.full(nCali, 1e12)),
+            # 2: Raman method (see `load_liconst.m`)
+            'LC{0}Status'.format(wavelength): _row(np.full(nCali, 2))
+            })
+    for wavelength in ['355', '532']:
+        variables['depolCaliTime' + wavelength] = caliTime()
+        variables['depolCaliConst' + wavelength] = _row(
+            rng.uniform(0.05, 0.1, nCali))
+    variables['WVCaliTime'] = caliTime()
+    variables['WVConst'] = _row(rng.uniform(10, 20, nCali))
+
+    # logbook events (see `read_logbook.m`)
+    nLogbook = sizes['nLogbook']
+    variables['logbookTime'] = _column(
+        np.sort(rng.uniform(startTime, time[0], nLogbook)))
+    for name in ['flagOverlap', 'flagWindowwipe', 'flagFlashlamps',
+                 'flagPulsepower', 'flagRestart']:
+        variables[name] = _column(rng.random(nLogbook) < 0.2)
+    variables['flag_CH_NDChange'] = rng.random((nLogbook, nChannel)) < 0.05
+
+    return variables
+
+
+def _longterm_cali_settings(nChannel, startTime):
+    """
+    Channels, axis limits and the campaign of the long-term calibrations.
+    """
+
+    variables = {
+        'else_time': np.zeros((0, 0)),
+        'else_label': 'else',
+        'yLim355': _row([0, 1e14]),
+        'yLim532': _row([0, 1e14]),
+        'yLim1064': _row([0, 1e14]),
+        'yLim_LC_ratio_355_387': _row([0, 5]),
+        'yLim_LC_ratio_532_607': _row([0, 5]),
+        'wvLim': _row([0, 30]),
+        'depolConstLim355': _row([0, 0.2]),
+        'depolConstLim532': _row([0, 0.2])
+        }
+    for iChannel, name in enumerate(
+            ['flagCH355FR', 'flagCH532FR', 'flagCH1064FR', 'flagCH387FR',
+             'flagCH607FR', 'flagCH407FR', 'flagCH355FR_X', 'flagCH532FR_X']):
+        variables[name] = _row(np.arange(nChannel) == iChannel)
+
+    variables['campaignInfo'] = {
+        'name': 'arielle',
+        'location': 'Leipzig',
+        'startTime': float(startTime)
+        }
+
+    return variables
+
+
+def _save_logbook(logbookFile, startTime, stopTime, sizes, nChannel, rng):
+    """
+    Logbook of the pollylog program (see doc/polly_logbook.md) with
+    `nLogbook` entries between startTime and stopTime (datenum).
+    """
+
+    nLogbook = sizes['nLogbook']
+    logbookTime = np.sort(rng.uniform(startTime, stopTime, nLogbook))
+    keywords = ['overlap', 'windowwipe', 'flashlamps', 'pulsepower',
+                'restarted']
+
+    lines = ['"id";"time";"operator";"changes";"ndfilters";"comment"']
+    for iEntry, thisTime in enumerate(logbookTime):
+        changes = ','.join('"{0}"'.format(keyword) for keyword in keywords
+                           if rng.random() < 0.2)
+        ndFilters = ', '.join(
+            '{0} {1:.1f}'.format(iChannel + 1, rng.uniform(1, 4))
+            for iChannel in range(nChannel) if rng.random() < 0.05)
+        lines.append('{0};"{1}";["op"];[{2}];{{{3}}};"fixture"'.format(
+            iEntry + 1,
+            (datetime(1970, 1, 1) + timedelta(
+                days=thisTime - DATENUM_EPOCH)).strftime('%Y%m%d-%H%M'),
+            changes, ndFilters))
+
+    with open(logbookFile, 'w') as fh:
+        fh.write('\n'.join(lines) + '\n')
+
+
+def _save_calibration_db(dbFile, sizes, rng):
+    """
+    Calibration database with the tables of `save_liconst.m`,
+    `save_depolconst.m` and `save_wvconst.m`.
+    """
+
+    if os.path.exists(dbFile):
+        os.remove(dbFile)
+
+    stop = FIXTURE_DAY
+    start = stop - timedelta(days=365 * sizes['nYears'])
+    nCali = 365 * sizes['nYears'] * sizes['nCaliPerDay']
+
+    def periods():
+        offsets = np.sort(rng.uniform(
+            0, (stop - start).total_seconds(), nCali))
+        durations = rng.uniform(600, 3 * 3600, nCali)
+        return [((start + timedelta(seconds=offset)).strftime(
+                    '%Y-%m-%d %H:%M:%S'),
+                 (start + timedelta(seconds=offset + duration)).strftime(
+                    '%Y-%m-%d %H:%M:%S'))
+                for offset, duration in zip(offsets, durations)]
+
+    conn = sqlite3.connect(dbFile)
+    try:
+        conn.execute(
+            'CREATE TABLE lidar_calibration_constant '
+            '(id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'cali_start_time TEXT, cali_stop_time TEXT, '
+            'liconst REAL, uncertainty_liconst REAL, '
+            'wavelength TEXT, nc_zip_file TEXT, polly_type TEXT, '
+            'cali_method TEXT, telescope TEXT);')
+        conn.execute(
+            'CREATE TABLE depol_calibration_constant '
+            '(id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'cali_start_time TEXT, cali_stop_time TEXT, '
+            'depol_const REAL, uncertainty_depol_const REAL, '
+            'wavelength TEXT, nc_zip_file TEXT, polly_type TEXT);')
+        conn.execute(
+            'CREATE TABLE wv_calibration_constant '
+            '(id INTEGER PRIMARY KEY AUTOINCREMENT, cali_start_time TEXT, '
+            'cali_stop_time TEXT, standard_instrument TEXT, '
+            'standard_instrument_meas_time TEXT, wv_const REAL, '
+            'uncertainty_wv_const REAL, nc_zip_file TEXT, polly_type TEXT);')
+
+        for wavelength in ['355', '532', '1064', '387', '607']:
+            for method in ['Raman_Method', 'Klett_Method']:
+                conn.executemany(
+                    'INSERT INTO lidar_calibration_constant '
+                    '(cali_start_time, cali_stop_time, liconst, '
+                    'uncertainty_liconst, wavelength, nc_zip_file, '
+                    'polly_type, cali_method, telescope) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(caliStart, caliStop, rng.uniform(3e13, 5e13), 1e12,
+                      wavelength, 'fixture.nc.zip', 'arielle', method,
+                      'far_range')
+                     for caliStart, caliStop in periods()])
+        for wavelength in ['355', '532']:
+            conn.executemany(
+                'INSERT INTO depol_calibration_constant '
+                '(cali_start_time, cali_stop_time, depol_const, '
+                'uncertainty_depol_const, wavelength, nc_zip_file, '
+                'polly_type) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(caliStart, caliStop, rng.uniform(0.05, 0.1), 0.01,
+                  wavelength, 'fixture.nc.zip', 'arielle')
+                 for caliStart, caliStop in periods()])
+        conn.executemany(
+            'INSERT INTO wv_calibration_constant '
+            '(cali_start_time, cali_stop_time, standard_instrument, '
+            'standard_instrument_meas_time, wv_const, uncertainty_wv_const, '
+            'nc_zip_file, polly_type) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(caliStart, caliStop, 'AERONET', caliStart,
+              rng.uniform(10, 20), 1.0, 'fixture.nc.zip', 'arielle')
+             for caliStart, caliStop in periods()])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _monitor_status(sizes, rng, fields):
+    """
+    monitorStatus with the given fields of the housekeeping data (one record
+    for each profile).
+    """
+
+    nTime = sizes['nTime']
+    time = _time(sizes)
+    diurnal = np.sin(np.linspace(0, 2 * np.pi, nTime))
+
+    status = {
+        'time': time,
+        'AD': 180 + 5 * rng.standard_normal(nTime),
+        'EN': 480 + 5 * rng.standard_normal(nTime),
+        'HT': 25 + diurnal,
+        'WT': 20 + diurnal,
+        'LS': np.zeros(nTime),
+        'counts': np.cumsum(np.full(nTime, 600)),
+        'HV1064': 1200 + 10 * rng.standard_normal(nTime),
+        'ExtPyro': 20 + rng.standard_normal(nTime),
+        'Temp1064': -30 + 0.5 * diurnal,
+        'Temp1': 22 + diurnal,
+        'Temp2': 23 + diurnal,
+        'OutsideT': 10 + 5 * diurnal,
+        'OutsideTemp': 10 + 5 * diurnal,
+        'OutsideRH': 60 + 20 * diurnal,
+        'roof': np.zeros(nTime),
+        'rain': rng.random(nTime) < 0.05,
+        'shutter': np.zeros(nTime)
+        }
+
+    return {
+        'mTime': _row(time),
+        'monitorStatus': {field: _column(status[field]) for field in fields}
+        }
+
+
+def _fixture_monitor(sizes, rng, filename):
+    """
+    pollyxt_display_monitor (one housekeeping record for each profile)
+    """
+
+    return _monitor_status(sizes, rng, [
+        'time', 'AD', 'EN', 'HT', 'WT', 'LS', 'counts', 'ExtPyro',
+        'Temp1064', 'Temp1', 'Temp2', 'OutsideT', 'OutsideRH', 'roof',
+        'rain', 'shutter'])
+
+
+def _fixture_monitor_cge(sizes, rng, filename):
+    """
+    pollyxt_cge_display_monitor (see `pollyxt_cge_read_laserlogbook.m`)
+    """
+
+    return _monitor_status(sizes, rng, [
+        'time', 'AD', 'EN', 'HT', 'WT', 'LS', 'counts', 'HV1064', 'Temp1',
+        'Temp2'])
+
+
+def _fixture_monitor_ift(sizes, rng, filename):
+    """
+    pollyxt_ift_display_monitor (see `pollyxt_ift_read_laserlogbook.m`)
+    """
+
+    return _monitor_status(sizes, rng, [
+        'time', 'AD', 'EN', 'HT', 'WT', 'LS', 'counts', 'Temp1', 'Temp2',
+        'Temp1064', 'OutsideTemp', 'OutsideRH'])
+
+
+def _fixture_overlap(sizes, rng, filename):
+    """
+    pollyxt_display_overlap
+    """
+
+    h = _height(sizes)
+    overlap = 1 - np.exp(- h / 300)
+    signal = 1e3 * np.exp(- h / 2000) / h ** 2 * 1e6
+
+    variables = {
+        'overlap355': _row(overlap),
+        'overlap532': _row(overlap),
+        'overlap355Defaults': _row(1 - np.exp(- h / 350)),
+        'overlap532Defaults': _row(1 - np.exp(- h / 350)),
+        'normRange355': _row([200, 300], np.int32),
+        'normRange532': _row([200, 300], np.int32)
+        }
+    for wavelength in ['355', '532']:
+        variables['sig{0}FR'.format(wavelength)] = _row(signal * overlap)
+        variables['sig{0}NR'.format(wavelength)] = _row(signal * 0.1)
+        variables['sig{0}Gl'.format(wavelength)] = _row(signal)
+        variables['sigRatio{0}'.format(wavelength)] = _row(overlap * 10)
+
+    return variables
+
+
+# fixture generators of the display products and the instrument schemas
+_FIXTURES = {
+    'rcs': _fixture_rcs,
+    'att_beta': _fixture_att_beta,
+    'NR_att_beta': _fixture_att_beta,
+    'OC_att_beta': _fixture_att_beta,
+    'WV': _fixture_wv,
+    'saturation': _fixture_saturation,
+    'quasiretrieving': _fixture_quasiretrieving,
+    'quasiretrieving_V2': _fixture_quasiretrieving,
+    'targetclassi': _fixture_targetclassi,
+    'targetclassi_V2': _fixture_targetclassi,
+    'retrieving': _fixture_retrieving,
+    'retrieving_group': _fixture_retrieving_group,
+    'OC_retrieving': _fixture_oc_retrieving,
+    'depolcali': _fixture_depolcali,
+    'lidarconst': _fixture_lidarconst,
+    'longterm_cali': _fixture_longterm_cali,
+    'longterm_cali_history': _fixture_longterm_cali_history,
+    'monitor': _fixture_monitor,
+    'monitor_cge': _fixture_monitor_cge,
+    'monitor_ift': _fixture_monitor_ift,
+    'overlap': _fixture_overlap
+    }
@@ -6,6 +6,7 @@ function pollyxt_display_NR_att_beta(data, taskInfo, config)
 %   data, taskInfo, config
 %History:
 %   2018-12-30. First Edition by Zhenping
+%   2026-10-17. Save the python handoff with save_python_handoff.
 %Contact:
 %   zhenping@tropos.de
 
@@ -114,12 +115,11 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
 
     %% display rcs 
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-    save(tmpFile, 'figDPI', 'ATT_BETA_355', 'ATT_BETA_532', 'height', 'time', 'flagLC355', 'flagLC532', 'att_beta_cRange_355', 'att_beta_cRange_532', 'yLim_att_beta', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_NR_att_beta.py'), tmpFile, saveFolder));
+    tmpFile = save_python_handoff(tmpFile, 'figDPI', 'ATT_BETA_355', 'ATT_BETA_532', 'height', 'time', 'flagLC355', 'flagLC532', 'att_beta_cRange_355', 'att_beta_cRange_532', 'yLim_att_beta', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'imgFormat');
+    flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_NR_att_beta.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyxt_display_NR_att_beta.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
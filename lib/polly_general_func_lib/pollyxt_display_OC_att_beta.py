@@ -1,65 +1,26 @@
 import matplotlib.pyplot as plt
 from matplotlib.colors import ListedColormap
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
+from matplotlib.ticker import MultipleLocator, FormatStrFormatter, \
+    FixedLocator
 from matplotlib.dates import DateFormatter, \
                              DayLocator, HourLocator, MinuteLocator, date2num
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 
 # generating figure without X server
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_parallel import render_figures, figure_workers
+from polly_mesh import TimeHeightMesh
+from polly_template import figure_template, release_templates
+from polly_raster import save_quicklook
+from polly_decimate import decimate, axes_pixels
+from polly_cache import set_render_cache
+from polly_handoff import load_variables
+from polly_time import datenum_to_datetime
 
 
 def rmext(filename):
@@ -95,6 +56,13 @@ def pollyxt_display_OC_att_beta(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Reuse one figure template for all the wavelengths.
+    2026-10-17. Crop and reduce the products to the pixels of the figure.
+    2026-10-17. Load the memory-mapped handoffs with 'load_handoff'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
+    2026-10-17. Apply the quality mask and the scale in 'decimate'.
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Reuse the unchanged figures with 'pyRenderCacheFolder'.
     """
 
     if not os.path.exists(tmpFile):
@@ -103,37 +71,59 @@ def pollyxt_display_OC_att_beta(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        ATT_BETA_355 = mat['ATT_BETA_355'][:]
-        ATT_BETA_532 = mat['ATT_BETA_532'][:]
-        ATT_BETA_1064 = mat['ATT_BETA_1064'][:]
-        quality_mask_355 = mat['quality_mask_355'][:]
-        quality_mask_532 = mat['quality_mask_532'][:]
-        quality_mask_1064 = mat['quality_mask_1064'][:]
-        if mat['height'].size:
-            height = mat['height'][0][:]
-        else:
-            height = np.array([])
-        if mat['time'].size:
-            time = mat['time'][0][:]
-        else:
-            time = np.array([])
-        att_beta_cRange_355 = mat['att_beta_cRange_355'][0][:]
-        att_beta_cRange_532 = mat['att_beta_cRange_532'][0][:]
-        att_beta_cRange_1064 = mat['att_beta_cRange_1064'][0][:]
-        yLim_att_beta = mat['yLim_att_beta'][:][0]
-        flagLC355 = mat['flagLC355'][:][0]
-        flagLC532 = mat['flagLC532'][:][0]
-        flagLC1064 = mat['flagLC1064'][:][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'ATT_BETA_355': 'array',
+            'ATT_BETA_532': 'array',
+            'ATT_BETA_1064': 'array',
+            'quality_mask_355': 'array',
+            'quality_mask_532': 'array',
+            'quality_mask_1064': 'array',
+            'height': 'vector',
+            'time': 'vector',
+            'att_beta_cRange_355': 'vector',
+            'att_beta_cRange_532': 'vector',
+            'att_beta_cRange_1064': 'vector',
+            'yLim_att_beta': 'vector',
+            'flagLC355': 'string',
+            'flagLC532': 'string',
+            'flagLC1064': 'string',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string',
+            'processInfo': 'struct'
+            })
+        figDPI = mat['figDPI']
+        ATT_BETA_355 = mat['ATT_BETA_355']
+        ATT_BETA_532 = mat['ATT_BETA_532']
+        ATT_BETA_1064 = mat['ATT_BETA_1064']
+        quality_mask_355 = mat['quality_mask_355']
+        quality_mask_532 = mat['quality_mask_532']
+        quality_mask_1064 = mat['quality_mask_1064']
+        height = mat['height']
+        time = mat['time']
+        att_beta_cRange_355 = mat['att_beta_cRange_355']
+        att_beta_cRange_532 = mat['att_beta_cRange_532']
+        att_beta_cRange_1064 = mat['att_beta_cRange_1064']
+        yLim_att_beta = mat['yLim_att_beta']
+        flagLC355 = mat['flagLC355']
+        flagLC532 = mat['flagLC532']
+        flagLC1064 = mat['flagLC1064']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
+        set_render_cache(mat['processInfo'])
+        nWorkers = figure_workers(mat['processInfo'])
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -143,196 +133,154 @@ def pollyxt_display_OC_att_beta(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # meshgrid
-    Time, Height = np.meshgrid(time, height)
-    ATT_BETA_355 = np.ma.masked_where(quality_mask_355 > 0, ATT_BETA_355)
-    ATT_BETA_532 = np.ma.masked_where(quality_mask_532 > 0, ATT_BETA_532)
-    ATT_BETA_1064 = np.ma.masked_where(quality_mask_1064 > 0, ATT_BETA_1064)
-
     # define the colormap
     cmap = plt.cm.jet
     cmap.set_bad('k', alpha=1)
     cmap.set_over('w', alpha=1)
     cmap.set_under('k', alpha=1)
 
-    # display attenuate backscatter at 355 FR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, ATT_BETA_355 * 1e6,
-        vmin=att_beta_cRange_355[0],
-        vmax=att_beta_cRange_355[1],
-        cmap=cmap,
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_att_beta.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2000))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
+    data = {
+        'time': time,
+        'height': height,
+        'ATT_BETA_355': ATT_BETA_355,
+        'ATT_BETA_532': ATT_BETA_532,
+        'ATT_BETA_1064': ATT_BETA_1064,
+        'quality_mask_355': quality_mask_355,
+        'quality_mask_532': quality_mask_532,
+        'quality_mask_1064': quality_mask_1064,
+        'cmap': cmap,
+        'yLim_att_beta': yLim_att_beta.tolist(),
+        'xtick': xtick.tolist(),
+        'xticklabel': xticklabel,
+        'date': datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
+        'version': version,
+        'pollyVersion': pollyVersion,
+        'figDPI': figDPI,
+        'figSize': [10, 5],
+        'axPosition': [0.11, 0.15, 0.79, 0.75],
+        'saveFolder': saveFolder,
+        'dataFilename': rmext(dataFilename),
+        'imgFormat': imgFormat
+    }
+
+    # specification of each figure
+    figures = []
+    for wave, cRange, flagLC in zip(
+            [355, 532, 1064],
+            [att_beta_cRange_355, att_beta_cRange_532, att_beta_cRange_1064],
+            [flagLC355, flagLC532, flagLC1064]):
+        figures.append({
+            'wave': wave,
+            'cRange': cRange,
+            'title': 'Merged Attenuated Backscatter at {wave}nm'.format(
+                        wave=wave) +
+                     ' from {instrument} at {location}'.format(
+                        instrument=pollyVersion,
+                        location=location),
+            'method': flagLC
+        })
 
-    ax.set_title(
-        'Merged Attenuated Backscatter at {wave}nm'.format(wave=355) +
-        ' from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
+    try:
+        render_figures(_display_OC_att_beta_figure, data, figures, nWorkers)
+    finally:
+        release_templates()
 
-    cb_ax = fig.add_axes([0.93, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(att_beta_cRange_355[0], att_beta_cRange_355[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      $Mm^{-1}*sr^{-1}$\n', fontsize=12)
 
-    fig.text(
-        0.05, 0.04,
-        datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-        fontsize=15)
-    fig.text(
-        0.8, 0.02,
-        'Version: {version}\nCalibration: {method}'.format(
-            version=version,
-            method=flagLC355),
-        fontsize=12)
+def _build_OC_att_beta_template(data, figure, time, height, matrix):
+    """
+    Build the figure template for the merged attenuated backscatter at all the
+    wavelengths.
+    """
 
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_ATT_BETA_OC_355.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat)),
-        dpi=figDPI)
-    plt.close()
-
-    # display attenuate backscatter at 532 FR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, ATT_BETA_532 * 1e6,
-        vmin=att_beta_cRange_532[0],
-        vmax=att_beta_cRange_532[1],
-        cmap=cmap,
+    fig = plt.figure(figsize=data['figSize'])
+    ax = fig.add_axes(data['axPosition'])
+    mesh = TimeHeightMesh(
+        ax, time, height, matrix,
+        vmin=figure['cRange'][0],
+        vmax=figure['cRange'][1],
+        cmap=data['cmap'],
         rasterized=True)
     ax.set_xlabel('UTC', fontsize=15)
     ax.set_ylabel('Height (m)', fontsize=15)
 
-    ax.set_ylim(yLim_att_beta.tolist())
+    ax.set_ylim(data['yLim_att_beta'])
     ax.yaxis.set_major_locator(MultipleLocator(2000))
     ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticks(data['xtick'])
+    ax.set_xticklabels(data['xticklabel'])
     ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True, top=True,
-        width=2, length=5)
+        axis='both', which='major', labelsize=15, right=True,
+        top=True, width=2, length=5)
     ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5, right=True,
-        top=True)
-
-    ax.set_title(
-        'Merged Attenuated Backscatter at {wave}nm'.format(wave=532) +
-        ' from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
+        axis='both', which='minor', width=1.5, length=3.5,
+        right=True, top=True)
 
     cb_ax = fig.add_axes([0.93, 0.25, 0.02, 0.55])
     cbar = fig.colorbar(
-        pcmesh,
+        mesh.mappable,
         cax=cb_ax,
-        ticks=np.linspace(att_beta_cRange_532[0], att_beta_cRange_532[1], 5),
+        ticks=np.linspace(figure['cRange'][0], figure['cRange'][1], 5),
         orientation='vertical')
     cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
     cbar.ax.set_title('      $Mm^{-1}*sr^{-1}$\n', fontsize=12)
 
-    fig.text(
-        0.05, 0.04,
-        datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-        fontsize=15)
-    fig.text(
-        0.8, 0.02,
-        'Version: {version}\nCalibration: {method}'.format(
-            version=version,
-            method=flagLC532),
-        fontsize=12)
+    fig.text(0.05, 0.04, data['date'], fontsize=15)
+    footer = fig.text(0.8, 0.02, '', fontsize=12)
 
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_ATT_BETA_OC_532.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat)),
-        dpi=figDPI)
-    plt.close()
-
-    # display attenuate backscatter at 1064 FR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, ATT_BETA_1064 * 1e6,
-        vmin=att_beta_cRange_1064[0],
-        vmax=att_beta_cRange_1064[1],
-        cmap=cmap,
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+    return {'fig': fig, 'ax': ax, 'mesh': mesh, 'cbar': cbar,
+            'footer': footer}
 
-    ax.set_ylim(yLim_att_beta.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2000))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(
-        axis='both', which='major', labelsize=15,
-        right=True, top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5,
-        length=3.5, right=True, top=True)
 
-    ax.set_title(
-        'Merged Attenuated Backscatter at {wave}nm'.format(wave=1064) +
-        ' from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
+def _display_OC_att_beta_figure(data, figure):
+    """
+    Display the merged attenuated backscatter at one wavelength.
 
-    cb_ax = fig.add_axes([0.93, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh, cax=cb_ax,
-        ticks=np.linspace(att_beta_cRange_1064[0], att_beta_cRange_1064[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      $Mm^{-1}*sr^{-1}$\n', fontsize=12)
+    Parameters
+    ----------
+    data: dict
+        input arrays and settings shared by all the figures.
+    figure: dict
+        specification of the figure. (see `pollyxt_display_OC_att_beta`)
+    """
 
-    fig.text(
-        0.05, 0.04,
-        datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-        fontsize=15)
-    fig.text(
-        0.8, 0.02,
+    wave = figure['wave']
+
+    # crop to the y-limits and reduce to the pixels of the axes
+    time, height, ATT_BETA = decimate(
+        data['time'], data['height'], data['ATT_BETA_{0}'.format(wave)],
+        data['yLim_att_beta'],
+        axes_pixels(data['figSize'], data['axPosition'], data['figDPI']),
+        masks=[data['quality_mask_{0}'.format(wave)]], scale=1e6)
+
+    # only the data, color limits, title and calibration method will be
+    # updated
+    template = figure_template(
+        'OC_att_beta', _build_OC_att_beta_template, data, figure,
+        time, height, ATT_BETA)
+
+    template['cbar'].locator = FixedLocator(
+        np.linspace(figure['cRange'][0], figure['cRange'][1], 5))
+    template['mesh'].set_data(ATT_BETA, time, height)
+    template['mesh'].mappable.set_clim(
+        figure['cRange'][0], figure['cRange'][1])
+
+    template['ax'].set_title(figure['title'], fontsize=15)
+    template['footer'].set_text(
         'Version: {version}\nCalibration: {method}'.format(
-            version=version,
-            method=flagLC1064),
-        fontsize=12)
+            version=data['version'],
+            method=figure['method']))
 
-    fig.savefig(
+    save_quicklook(
+        template['fig'], template['mesh'],
         os.path.join(
-            saveFolder,
-            '{dataFilename}_ATT_BETA_OC_1064.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat)),
-        dpi=figDPI)
-    plt.close()
+            data['saveFolder'],
+            '{dataFilename}_ATT_BETA_OC_{wave}.{imgFmt}'.format(
+                dataFilename=data['dataFilename'],
+                wave=wave,
+                imgFmt=data['imgFormat'])),
+        data['figDPI'],
+        frameKey=(data['pollyVersion'], 'ATT_BETA_OC_{0}'.format(wave),
+                  data['figDPI']))
 
 
 def main():
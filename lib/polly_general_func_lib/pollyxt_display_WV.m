@@ -6,6 +6,7 @@ function pollyxt_display_WV(data, taskInfo, config)
 %   data, taskInfo, config
 %History:
 %   2018-12-31. First Edition by Zhenping
+%   2026-10-17. Save the python handoff with save_python_handoff.
 %Contact:
 %   zhenping@tropos.de
 
@@ -119,12 +120,11 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
     end
 
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-    save(tmpFile, 'figDPI', 'WVMR', 'RH', 'lowSNRMask', 'flagCalibrated', 'meteorSource', 'height', 'time', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'xLim_Profi_WV_RH', 'yLim_WV_RH', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_WV.py'), tmpFile, saveFolder));
+    tmpFile = save_python_handoff(tmpFile, 'figDPI', 'WVMR', 'RH', 'lowSNRMask', 'flagCalibrated', 'meteorSource', 'height', 'time', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'xLim_Profi_WV_RH', 'yLim_WV_RH', 'imgFormat');
+    flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_WV.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyxt_display_WV.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
@@ -1,63 +1,25 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
+from matplotlib.ticker import MultipleLocator, FormatStrFormatter, \
+    FixedLocator
 from matplotlib.colors import ListedColormap
 from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_parallel import render_figures, figure_workers
+from polly_mesh import TimeHeightMesh
+from polly_template import figure_template, release_templates
+from polly_raster import save_quicklook
+from polly_decimate import decimate, axes_pixels
+from polly_tiles import tile_pyramid_enabled, save_tile_pyramid
+from polly_cache import set_render_cache
+from polly_handoff import load_variables
+from polly_time import datenum_to_datetime
 
 
 def rmext(filename):
@@ -93,6 +55,14 @@ def pollyxt_display_WV(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Reuse one figure template for WVMR and RH.
+    2026-10-17. Crop and reduce the products to the pixels of the figure.
+    2026-10-17. Load the memory-mapped handoffs with 'load_handoff'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
+    2026-10-17. Apply the low SNR mask in 'decimate'.
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Save the tile pyramids with 'pyTilePyramid'.
+    2026-10-17. Reuse the unchanged figures with 'pyRenderCacheFolder'.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,25 +71,48 @@ def pollyxt_display_WV(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        WVMR = mat['WVMR'][:]
-        RH = mat['RH'][:]
-        lowSNRMask = mat['lowSNRMask'][:]
-        height = mat['height'][0][:]
-        time = mat['time'][0][:]
-        flagCalibrated = mat['flagCalibrated'][:][0]
-        meteorSource = mat['meteorSource'][:][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        yLim_WV_RH = mat['yLim_WV_RH'][:][0]
-        xLim_Profi_WV_RH = mat['xLim_Profi_WV_RH'][:][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'WVMR': 'array',
+            'RH': 'array',
+            'lowSNRMask': 'array',
+            'height': 'vector',
+            'time': 'vector',
+            'flagCalibrated': 'string',
+            'meteorSource': 'string',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'yLim_WV_RH': 'vector',
+            'xLim_Profi_WV_RH': 'vector',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string',
+            'processInfo': 'struct'
+            })
+        figDPI = mat['figDPI']
+        WVMR = mat['WVMR']
+        RH = mat['RH']
+        lowSNRMask = mat['lowSNRMask']
+        height = mat['height']
+        time = mat['time']
+        flagCalibrated = mat['flagCalibrated']
+        meteorSource = mat['meteorSource']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        yLim_WV_RH = mat['yLim_WV_RH']
+        xLim_Profi_WV_RH = mat['xLim_Profi_WV_RH']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
+        set_render_cache(mat['processInfo'])
+        nWorkers = figure_workers(mat['processInfo'])
+        flagTiles = tile_pyramid_enabled(mat['processInfo'])
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -129,111 +122,164 @@ def pollyxt_display_WV(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # meshgrid
-    Time, Height = np.meshgrid(time, height)
-    WVMR = np.ma.masked_where(lowSNRMask != 0, WVMR)
-    RH = np.ma.masked_where(lowSNRMask != 0, RH)
-
     # define the colormap
     cmap = plt.cm.jet
     cmap.set_bad('k', alpha=1)
     cmap.set_over('w', alpha=1)
     cmap.set_under('k', alpha=1)
 
-    # display WVMR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.1, 0.15, 0.8, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, WVMR,
-        vmin=xLim_Profi_WV_RH[0],
-        vmax=xLim_Profi_WV_RH[1],
-        cmap=cmap,
+    data = {
+        'time': time,
+        'height': height,
+        'WVMR': WVMR,
+        'RH': RH,
+        'lowSNRMask': lowSNRMask,
+        'cmap': cmap,
+        'yLim_WV_RH': yLim_WV_RH.tolist(),
+        'xtick': xtick.tolist(),
+        'xticklabel': xticklabel,
+        'date': datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
+        'meteorSource': meteorSource,
+        'flagCalibrated': flagCalibrated,
+        'version': version,
+        'pollyVersion': pollyVersion,
+        'figDPI': figDPI,
+        'figSize': [10, 5],
+        'axPosition': [0.1, 0.15, 0.8, 0.75],
+        'saveFolder': saveFolder,
+        'dataFilename': rmext(dataFilename),
+        'imgFormat': imgFormat,
+        'tiles': flagTiles
+    }
+
+    # specification of each figure
+    figures = [
+        {
+            'var': 'WVMR',
+            'cRange': xLim_Profi_WV_RH,
+            'cbarTicks': np.linspace(
+                xLim_Profi_WV_RH[0], xLim_Profi_WV_RH[1], 5),
+            'title': 'Water vapor mixing ratio from ' +
+                     '{instrument} at {location}'.format(
+                        instrument=pollyVersion, location=location),
+            'cbarTitle': '[$g*kg^{-1}$]'
+        },
+        {
+            'var': 'RH',
+            'cRange': [0, 100],
+            'cbarTicks': np.arange(0, 100.1, 20),
+            'title': 'Relative humidity from ' +
+                     '{instrument} at {location}'.format(
+                        instrument=pollyVersion, location=location),
+            'cbarTitle': '[$\%$]'
+        }
+    ]
+
+    try:
+        render_figures(_display_WV_figure, data, figures, nWorkers)
+    finally:
+        release_templates()
+
+
+def _build_WV_template(data, figure, time, height, matrix):
+    """
+    Build the figure template for the water vapor mixing ratio and relative
+    humidity.
+    """
+
+    fig = plt.figure(figsize=data['figSize'])
+    ax = fig.add_axes(data['axPosition'])
+    mesh = TimeHeightMesh(
+        ax, time, height, matrix,
+        vmin=figure['cRange'][0],
+        vmax=figure['cRange'][1],
+        cmap=data['cmap'],
         rasterized=True
         )
     ax.set_xlabel('UTC', fontsize=15)
     ax.set_ylabel('Height (m)', fontsize=15)
 
-    ax.set_ylim(yLim_WV_RH.tolist())
+    ax.set_ylim(data['yLim_WV_RH'])
     ax.yaxis.set_major_locator(MultipleLocator(2000))
     ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticks(data['xtick'])
+    ax.set_xticklabels(data['xticklabel'])
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
     ax.tick_params(axis='both', which='minor', width=1.5,
                    length=3.5, right=True, top=True)
 
-    ax.set_title(
-        'Water vapor mixing ratio from {instrument} at {location}'.format(
-            instrument=pollyVersion, location=location
-            ),
-        fontsize=15
-        )
-
     cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=np.linspace(
-        xLim_Profi_WV_RH[0], xLim_Profi_WV_RH[1], 5), orientation='vertical')
+    cbar = fig.colorbar(mesh.mappable, cax=cb_ax, ticks=figure['cbarTicks'],
+                        orientation='vertical')
     cbar.ax.tick_params(direction='in', labelsize=15, pad=10)
-    cbar.ax.set_title('[$g*kg^{-1}$]', fontsize=10)
 
     fig.text(
         0.05, 0.02,
         '{time}\nMeteor Data: {meteorSource}'.format(
-            time=datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            meteorSource=meteorSource
+            time=data['date'],
+            meteorSource=data['meteorSource']
             ),
         fontsize=12
         )
     fig.text(0.8, 0.02, 'Version: {version}\nCalibration: {status}'.format(
-        version=version, status=flagCalibrated), fontsize=12)
-
-    fig.savefig(os.path.join(saveFolder, '{dataFilename}_WVMR.{imgFmt}'.format(
-        dataFilename=rmext(dataFilename),
-        imgFmt=imgFormat)), dpi=figDPI)
-    plt.close()
-
-    # display RH
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.1, 0.15, 0.8, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, RH, vmin=0, vmax=100, cmap=cmap, rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+        version=data['version'], status=data['flagCalibrated']), fontsize=12)
 
-    ax.set_ylim(yLim_WV_RH.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2000))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+    return {'fig': fig, 'ax': ax, 'mesh': mesh, 'cbar': cbar}
 
-    ax.set_title('Relative humidity from {instrument} at {location}'.format(
-        instrument=pollyVersion, location=location), fontsize=15)
 
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=np.arange(
-        0, 100.1, 20), orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=10)
-    cbar.ax.set_title('[$\%$]', fontsize=10)
+def _display_WV_figure(data, figure):
+    """
+    Display the water vapor mixing ratio or relative humidity.
 
-    fig.text(
-        0.05, 0.02,
-        '{time}\nMeteor Data: {meteorSource}'.format(
-            time=datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            meteorSource=meteorSource
-            ),
-        fontsize=12
-        )
-    fig.text(0.8, 0.02, 'Version: {version}\nCalibration: {status}'.format(
-        version=version, status=flagCalibrated), fontsize=12)
+    Parameters
+    ----------
+    data: dict
+        input arrays and settings shared by all the figures.
+    figure: dict
+        specification of the figure. (see `pollyxt_display_WV`)
+    """
 
-    fig.savefig(os.path.join(saveFolder, '{dataFilename}_RH.{imgFmt}'.format(
-        dataFilename=rmext(dataFilename),
-        imgFmt=imgFormat)), dpi=figDPI)
-    plt.close()
+    # crop to the y-limits, reduce to the pixels of the axes and filter out
+    # the invalid values
+    time, height, matrix = decimate(
+        data['time'], data['height'], data[figure['var']],
+        data['yLim_WV_RH'],
+        axes_pixels(data['figSize'], data['axPosition'], data['figDPI']),
+        masks=[data['lowSNRMask']])
+
+    # only the data, color limits and title will be updated
+    template = figure_template(
+        'WV', _build_WV_template, data, figure, time, height, matrix)
+
+    template['cbar'].locator = FixedLocator(figure['cbarTicks'])
+    template['mesh'].set_data(matrix, time, height)
+    template['mesh'].mappable.set_clim(
+        figure['cRange'][0], figure['cRange'][1])
+
+    template['ax'].set_title(figure['title'], fontsize=15)
+    template['cbar'].ax.set_title(figure['cbarTitle'], fontsize=10)
+
+    save_quicklook(
+        template['fig'], template['mesh'],
+        os.path.join(
+            data['saveFolder'], '{dataFilename}_{var}.{imgFmt}'.format(
+                dataFilename=data['dataFilename'],
+                var=figure['var'],
+                imgFmt=data['imgFormat'])),
+        data['figDPI'],
+        frameKey=(data['pollyVersion'], figure['var'], data['figDPI']))
+
+    if data['tiles']:
+        save_tile_pyramid(
+            os.path.join(
+                data['saveFolder'], '{dataFilename}_{var}_tiles'.format(
+                    dataFilename=data['dataFilename'], var=figure['var'])),
+            data['time'], data['height'], data[figure['var']],
+            data['yLim_WV_RH'], data['cmap'], figure['cRange'],
+            masks=[data['lowSNRMask']],
+            metadata={'product': figure['var'], 'title': figure['title'],
+                      'unit': figure['cbarTitle']})
 
 
 def main():
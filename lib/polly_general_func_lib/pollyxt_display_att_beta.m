@@ -6,6 +6,8 @@ function pollyxt_display_att_beta(data, taskInfo, config)
 %   data, taskInfo, config
 %History:
 %   2018-12-30. First Edition by Zhenping
+%   2026-10-17. Save the python handoff with save_python_handoff.
+%   2026-10-17. Fixed time axis with 'pyQuicklookAppendHours'.
 %Contact:
 %   zhenping@tropos.de
 
@@ -24,7 +26,16 @@ figDPI = processInfo.figDPI;
 flagLC355 = char(config.LCCalibrationStatus{data.LCUsed.LCUsedTag355 + 1});
 flagLC532 = char(config.LCCalibrationStatus{data.LCUsed.LCUsedTag532 + 1});
 flagLC1064 = char(config.LCCalibrationStatus{data.LCUsed.LCUsedTag1064 + 1});
-[xtick, xtickstr] = timelabellayout(data.mTime, 'HH:MM');
+if strcmpi(processInfo.visualizationMode, 'python') && ...
+   isfield(processInfo, 'pyQuicklookAppendHours') && ...
+   (processInfo.pyQuicklookAppendHours > 0)
+    % fixed time axis for the near-real-time quicklooks
+    [xtick, xtickstr] = timelabellayout([data.mTime(1), ...
+        data.mTime(1) + processInfo.pyQuicklookAppendHours / 24], ...
+        'HH:MM');
+else
+    [xtick, xtickstr] = timelabellayout(data.mTime, 'HH:MM');
+end
 att_beta_cRange_355 = config.zLim_att_beta_355;
 att_beta_cRange_532 = config.zLim_att_beta_532;
 att_beta_cRange_1064 = config.zLim_att_beta_1064;
@@ -159,12 +170,11 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
 
     %% display rcs 
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-    save(tmpFile, 'figDPI', 'ATT_BETA_355', 'ATT_BETA_532', 'ATT_BETA_1064', 'quality_mask_355', 'quality_mask_532', 'quality_mask_1064', 'height', 'time', 'flagLC355', 'flagLC532', 'flagLC1064', 'att_beta_cRange_355', 'att_beta_cRange_532', 'att_beta_cRange_1064', 'yLim_att_beta', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_att_beta.py'), tmpFile, saveFolder));
+    tmpFile = save_python_handoff(tmpFile, 'figDPI', 'ATT_BETA_355', 'ATT_BETA_532', 'ATT_BETA_1064', 'quality_mask_355', 'quality_mask_532', 'quality_mask_1064', 'height', 'time', 'flagLC355', 'flagLC532', 'flagLC1064', 'att_beta_cRange_355', 'att_beta_cRange_532', 'att_beta_cRange_1064', 'yLim_att_beta', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'imgFormat');
+    flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_att_beta.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyxt_display_att_beta.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
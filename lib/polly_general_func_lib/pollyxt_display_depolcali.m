@@ -198,11 +198,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
         %% display rcs 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'wavelength', 'time', 'height', 'sig_t_p', 'sig_t_m', 'sig_x_p', 'sig_x_m', 'caliHIndxRange', 'indx_45m', 'indx_45p', 'dplus', 'dminus', 'segmentLen', 'indx', 'mean_dplus_tmp', 'std_dplus_tmp', 'mean_dminus_tmp', 'std_dminus_tmp', 'TR_t', 'TR_x', 'segIndx', 'caliTime', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_depolcali.py'), tmpFile, saveFolder));
+        flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_depolcali.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyxt_display_depolcali.py');
         end
-        delete(tmpFile);
     end
 
     % 355 nm
@@ -234,11 +233,10 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
         %% display rcs 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'wavelength', 'time', 'height', 'sig_t_p', 'sig_t_m', 'sig_x_p', 'sig_x_m', 'caliHIndxRange', 'indx_45m', 'indx_45p', 'dplus', 'dminus', 'segmentLen', 'indx', 'mean_dplus_tmp', 'std_dplus_tmp', 'mean_dminus_tmp', 'std_dminus_tmp', 'TR_t', 'TR_x', 'segIndx', 'caliTime', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_depolcali.py'), tmpFile, saveFolder));
+        flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_depolcali.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyxt_display_depolcali.py');
         end
-        delete(tmpFile);
     end
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
@@ -9,84 +9,95 @@ function pollyxt_display_longterm_cali(dbFile, taskInfo, config)
 %       More detailed information can be found in doc/pollynet_processing_program.md
 %History:
 %   2019-02-08. First Edition by Zhenping
+%   2026-10-17. Pass the dbFile to the python display script instead of the
+%               calibration history.
+%   2026-10-17. Pass the logbookFile to the python display script instead of
+%               the logbook entries.
 %Contact:
 %   zhenping@tropos.de
 
 global processInfo campaignInfo
 
-%% read lidar constant
-[LC355History, LCStd355History, startTime355, stopTime355] = ...
-    load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '355', ...
-        'Raman_Method', 'far_range', 'flagBeforeQuery', true);
-[LC532History, LCStd532History, startTime532, stopTime532] = ...
-    load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '532', ...
-        'Raman_Method', 'far_range', 'flagBeforeQuery', true);
-[LC1064History, LCStd1064History, startTime1064, stopTime1064] = ...
-    load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '1064', ...
-        'Raman_Method', 'far_range', 'flagBeforeQuery', true);
-[LC387History, LCStd387History, startTime387, stopTime387] = ...
-    load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '387', ...
-        'Raman_Method', 'far_range', 'flagBeforeQuery', true);
-[LC607History, LCStd607History, startTime607, stopTime607] = ...
-    load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '607', ...
-        'Raman_Method', 'far_range', 'flagBeforeQuery', true);
-if ~ isempty(startTime355)
-    LCTime355 = mean([startTime355; stopTime355], 1);
-else
-    LCTime355 = [];
-end
-LC355Status = 2 * ones(size(startTime355));
-if ~ isempty(startTime532)
-    LCTime532 = mean([startTime532; stopTime532], 1);
-else
-    LCTime532 = [];
-end
-LC532Status = 2 * ones(size(startTime532));
-if ~ isempty(startTime1064)
-    LCTime1064 = mean([startTime1064; stopTime1064], 1);
-else
-    LCTime1064 = [];
-end
-LC1064Status = 2 * ones(size(startTime1064));
-if ~ isempty(startTime387)
-    LCTime387 = mean([startTime387; stopTime387], 1);
-else
-    LCTime387 = [];
-end
-LC387Status = 2 * ones(size(startTime387));
-if ~ isempty(startTime607)
-    LCTime607 = mean([startTime607; stopTime607], 1);
-else
-    LCTime607 = [];
-end
-LC607Status = 2 * ones(size(startTime607));
+%% read calibration constants
+% the python display script queries the calibrations inside the window of the
+% figure from the database by itself
+if strcmpi(processInfo.visualizationMode, 'matlab')
 
-%% read wv calibration constant
-[WVConst, ~, WVCaliStartTime, WVCaliStopTime] = ...
-    load_wvconst(taskInfo.dataTime, dbFile, campaignInfo.name, 'flagBeforeQuery', true);
-if ~ isempty(WVCaliStartTime)
-    WVCaliTime = mean([WVCaliStartTime; WVCaliStopTime], 1);
-else
-    WVCaliTime = [];
-end
+    %% read lidar constant
+    [LC355History, LCStd355History, startTime355, stopTime355] = ...
+        load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '355', ...
+            'Raman_Method', 'far_range', 'flagBeforeQuery', true);
+    [LC532History, LCStd532History, startTime532, stopTime532] = ...
+        load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '532', ...
+            'Raman_Method', 'far_range', 'flagBeforeQuery', true);
+    [LC1064History, LCStd1064History, startTime1064, stopTime1064] = ...
+        load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '1064', ...
+            'Raman_Method', 'far_range', 'flagBeforeQuery', true);
+    [LC387History, LCStd387History, startTime387, stopTime387] = ...
+        load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '387', ...
+            'Raman_Method', 'far_range', 'flagBeforeQuery', true);
+    [LC607History, LCStd607History, startTime607, stopTime607] = ...
+        load_liconst(taskInfo.dataTime, dbFile, campaignInfo.name, '607', ...
+            'Raman_Method', 'far_range', 'flagBeforeQuery', true);
+    if ~ isempty(startTime355)
+        LCTime355 = mean([startTime355; stopTime355], 1);
+    else
+        LCTime355 = [];
+    end
+    LC355Status = 2 * ones(size(startTime355));
+    if ~ isempty(startTime532)
+        LCTime532 = mean([startTime532; stopTime532], 1);
+    else
+        LCTime532 = [];
+    end
+    LC532Status = 2 * ones(size(startTime532));
+    if ~ isempty(startTime1064)
+        LCTime1064 = mean([startTime1064; stopTime1064], 1);
+    else
+        LCTime1064 = [];
+    end
+    LC1064Status = 2 * ones(size(startTime1064));
+    if ~ isempty(startTime387)
+        LCTime387 = mean([startTime387; stopTime387], 1);
+    else
+        LCTime387 = [];
+    end
+    LC387Status = 2 * ones(size(startTime387));
+    if ~ isempty(startTime607)
+        LCTime607 = mean([startTime607; stopTime607], 1);
+    else
+        LCTime607 = [];
+    end
+    LC607Status = 2 * ones(size(startTime607));
+
+    %% read wv calibration constant
+    [WVConst, ~, WVCaliStartTime, WVCaliStopTime] = ...
+        load_wvconst(taskInfo.dataTime, dbFile, campaignInfo.name, 'flagBeforeQuery', true);
+    if ~ isempty(WVCaliStartTime)
+        WVCaliTime = mean([WVCaliStartTime; WVCaliStopTime], 1);
+    else
+        WVCaliTime = [];
+    end
 
-%% read depol calibration constant
-% 355 nm
-[depolCaliConst355, ~, caliStartTime355, caliStopTime355] = ...
-    load_depolconst(taskInfo.dataTime, dbFile, campaignInfo.name, '355', 'flagBeforeQuery', true);
-if ~ isempty(caliStartTime355)
-    depolCaliTime355 = mean([caliStartTime355; caliStopTime355], 1);
-else
-    depolCaliTime355 = [];
-end
+    %% read depol calibration constant
+    % 355 nm
+    [depolCaliConst355, ~, caliStartTime355, caliStopTime355] = ...
+        load_depolconst(taskInfo.dataTime, dbFile, campaignInfo.name, '355', 'flagBeforeQuery', true);
+    if ~ isempty(caliStartTime355)
+        depolCaliTime355 = mean([caliStartTime355; caliStopTime355], 1);
+    else
+        depolCaliTime355 = [];
+    end
+
+    % 532 nm
+    [depolCaliConst532, ~, caliStartTime532, caliStopTime532] = ...
+        load_depolconst(taskInfo.dataTime, dbFile, campaignInfo.name, '532', 'flagBeforeQuery', true);
+    if ~ isempty(caliStartTime532)
+        depolCaliTime532 = mean([caliStartTime532; caliStopTime532], 1);
+    else
+        depolCaliTime532 = [];
+    end
 
-% 532 nm
-[depolCaliConst532, ~, caliStartTime532, caliStopTime532] = ...
-    load_depolconst(taskInfo.dataTime, dbFile, campaignInfo.name, '532', 'flagBeforeQuery', true);
-if ~ isempty(caliStartTime532)
-    depolCaliTime532 = mean([caliStartTime532; caliStopTime532], 1);
-else
-    depolCaliTime532 = [];
 end
 
 %% read logbook file
@@ -94,15 +105,22 @@ if ~ isfield(config, 'logbookFile')
     % if 'logbookFile' was no set
     config.logbookFile = '';
 end
-logbookInfo = read_logbook(config.logbookFile, numel(config.first_range_gate_indx));
-flagLogbookTillNow = (logbookInfo.datetime <= taskInfo.dataTime);
-logbookTime = logbookInfo.datetime(flagLogbookTillNow);
-flagOverlap = logbookInfo.changes.flagOverlap(flagLogbookTillNow);
-flagWindowwipe = logbookInfo.changes.flagWindowwipe(flagLogbookTillNow);
-flagFlashlamps = logbookInfo.changes.flagFlashlamps(flagLogbookTillNow);
-flagPulsepower = logbookInfo.changes.flagPulsepower(flagLogbookTillNow);
-flagRestart = logbookInfo.changes.flagRestart(flagLogbookTillNow);
-flag_CH_NDChange = logbookInfo.flag_CH_NDChange(flagLogbookTillNow, :);
+logbookFile = config.logbookFile;
+nChannel = numel(config.first_range_gate_indx);
+
+% the python display script reads the logbook through the incremental cache
+% in the results folder by itself
+if strcmpi(processInfo.visualizationMode, 'matlab')
+    logbookInfo = read_logbook(logbookFile, nChannel);
+    flagLogbookTillNow = (logbookInfo.datetime <= taskInfo.dataTime);
+    logbookTime = logbookInfo.datetime(flagLogbookTillNow);
+    flagOverlap = logbookInfo.changes.flagOverlap(flagLogbookTillNow);
+    flagWindowwipe = logbookInfo.changes.flagWindowwipe(flagLogbookTillNow);
+    flagFlashlamps = logbookInfo.changes.flagFlashlamps(flagLogbookTillNow);
+    flagPulsepower = logbookInfo.changes.flagPulsepower(flagLogbookTillNow);
+    flagRestart = logbookInfo.changes.flagRestart(flagLogbookTillNow);
+    flag_CH_NDChange = logbookInfo.flag_CH_NDChange(flagLogbookTillNow, :);
+end
 
 %% leave a 'else' category for future development
 else_time = [];
@@ -393,12 +411,11 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
 
     %% display longterm cali results
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-    save(tmpFile, 'figDPI', 'LCTime355', 'LCTime532', 'LCTime1064', 'LCTime387', 'LCTime607', 'LC355Status', 'LC532Status', 'LC1064Status', 'LC387Status', 'LC607Status', 'LC355History', 'LCStd355History', 'LC532History', 'LCStd532History', 'LC1064History', 'LCStd1064History', 'LC387History', 'LCStd387History', 'LC607History', 'LCStd607History', 'logbookTime', 'flagOverlap', 'flagWindowwipe', 'flagFlashlamps', 'flagPulsepower', 'flagRestart', 'flag_CH_NDChange', 'flagCH355FR', 'flagCH532FR', 'flagCH1064FR', 'flagCH387FR', 'flagCH607FR', 'flagCH407FR', 'flagCH355FR_X', 'flagCH532FR_X', 'else_time', 'else_label', 'WVCaliTime', 'WVConst', 'depolCaliTime355', 'depolCaliConst355', 'depolCaliTime532', 'depolCaliConst532', 'yLim355', 'yLim532', 'yLim1064', 'yLim_LC_ratio_355_387', 'yLim_LC_ratio_532_607', 'wvLim', 'depolConstLim355', 'depolConstLim532', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_longterm_cali.py'), tmpFile, saveFolder));
+    save(tmpFile, 'figDPI', 'dbFile', 'logbookFile', 'nChannel', 'flagCH355FR', 'flagCH532FR', 'flagCH1064FR', 'flagCH387FR', 'flagCH607FR', 'flagCH407FR', 'flagCH355FR_X', 'flagCH532FR_X', 'else_time', 'else_label', 'yLim355', 'yLim532', 'yLim1064', 'yLim_LC_ratio_355_387', 'yLim_LC_ratio_532_607', 'wvLim', 'depolConstLim355', 'depolConstLim532', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat', '-v6');
+    flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_longterm_cali.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyxt_display_longterm_cali.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
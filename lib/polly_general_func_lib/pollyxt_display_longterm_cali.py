@@ -1,8 +1,7 @@
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 import numpy as np
-import scipy.io as spio
 from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
                              MinuteLocator, date2num
 from matplotlib.colors import ListedColormap
@@ -10,6 +9,12 @@ import matplotlib.pyplot as plt
 import matplotlib
 plt.switch_backend('Agg')
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_handoff import load_variables
+from polly_time import datenum_to_datetime, datenum_to_datetime64
+from polly_calidb import cached_calibrations
+from polly_logbook import cached_logbook
+
 
 def celltolist(xtickstr):
     """
@@ -32,44 +37,94 @@ def celltolist(xtickstr):
     return tmp
 
 
-def datenum_to_datetime(datenum):
+def rmext(filename):
     """
-    Convert Matlab datenum into Python datetime.
+    remove the file extension.
 
     Parameters
     ----------
-    Date: float
+    filename: str
+    """
+
+    file, _ = os.path.splitext(filename)
+    return file
 
-    Returns
-    -------
-    dtObj: datetime object
 
+def _nd_change_time(logbookTime, flag_CH_NDChange, *channelFlags):
     """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
+    Time of the logbook entries with ND filter changes of any of the
+    channels.
 
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
+    Parameters
+    ----------
+    logbookTime: array
+        time of the logbook entries.
+    flag_CH_NDChange: 2-D array
+        ND filter changes of each channel (entry x channel). The logbook
+        could have more channels than the channel flags.
+    channelFlags: arrays
+        flags of the channels (e.g., flagCH355FR).
+    """
 
-    return dtObj
+    if not logbookTime.size:
+        return logbookTime
 
+    flagChannel = np.zeros(flag_CH_NDChange.shape[1], dtype=bool)
+    for channelFlag in channelFlags:
+        flagChannel[:channelFlag.size] |= (channelFlag == 1)
 
-def rmext(filename):
+    return logbookTime[np.any(flag_CH_NDChange[:, flagChannel], axis=1)]
+
+
+def _add_event_lines(ax, events, lineColor):
     """
-    remove the file extension.
+    Draw the logbook events as vertical lines over the whole axes, with one
+    line collection for each category instead of one line for each event.
 
     Parameters
     ----------
-    filename: str
+    ax: matplotlib axes
+    events: list
+        (category, time of the events) for each category.
+    lineColor: dict
+        color of each category.
     """
 
-    file, _ = os.path.splitext(filename)
-    return file
+    for category, eventTime in events:
+        if eventTime.size:
+            ax.vlines(eventTime, 0, 1, transform=ax.get_xaxis_transform(),
+                      linestyle='--', color=lineColor[category])
+
+
+def _calibration_queries(pollyType):
+    """
+    Series of the calibration constants in the figure (see `polly_calidb`).
+    """
+
+    queries = {}
+    for wavelength in ['355', '532', '1064', '387', '607']:
+        queries['LC' + wavelength] = ('liconst', {
+            'polly_type': pollyType, 'wavelength': wavelength,
+            'cali_method': 'Raman_Method', 'telescope': 'far_range'})
+    queries['WV'] = ('wvconst', {'polly_type': pollyType})
+    for wavelength in ['355', '532']:
+        queries['depol' + wavelength] = ('depolconst', {
+            'polly_type': pollyType, 'wavelength': wavelength})
+
+    return queries
+
+
+def _lc_ratio(elasticLC, ramanLC):
+    """
+    Ratio of the lidar constants of the elastic and Raman channels from the
+    same calibration periods.
+    """
+
+    _, iElastic, iRaman = np.intersect1d(
+        elasticLC['caliTime'], ramanLC['caliTime'], return_indices=True)
+
+    return (ramanLC['caliTime'][iRaman],
+            elasticLC['value'][iElastic] / ramanLC['value'][iRaman])
 
 
 def pollyxt_display_longterm_cali(tmpFile, saveFolder):
@@ -92,6 +147,12 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Read only the declared variables with 'load_variables'.
+    2026-10-17. Convert the dates of the history at once with 'polly_time'.
+    2026-10-17. Draw the logbook events as one line collection per category.
+    2026-10-17. Query the calibrations of the figure window from the database.
+    2026-10-17. Read the calibrations through the incremental cache.
+    2026-10-17. Read the logbook through the incremental cache.
     '''
 
     if not os.path.exists(tmpFile):
@@ -100,193 +161,68 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        if mat['LCTime355'].size:
-            thisLCTime355 = mat['LCTime355'][0][:]
-        else:
-            thisLCTime355 = np.array([])
-        if mat['LCTime532'].size:
-            thisLCTime532 = mat['LCTime532'][0][:]
-        else:
-            thisLCTime532 = np.array([])
-        if mat['LCTime1064'].size:
-            thisLCTime1064 = mat['LCTime1064'][0][:]
-        else:
-            thisLCTime1064 = np.array([])
-        if mat['LCTime387'].size:
-            thisLCTime387 = mat['LCTime387'][0][:]
-        else:
-            thisLCTime387 = np.array([])
-        if mat['LCTime607'].size:
-            thisLCTime607 = mat['LCTime607'][0][:]
-        else:
-            thisLCTime607 = np.array([])
-        if mat['LC355Status'].size:
-            LC355Status = mat['LC355Status'][0][:]
-        else:
-            LC355Status = np.array([])
-        if mat['LC532Status'].size:
-            LC532Status = mat['LC532Status'][0][:]
-        else:
-            LC532Status = np.array([])
-        if mat['LC1064Status'].size:
-            LC1064Status = mat['LC1064Status'][0][:]
-        else:
-            LC1064Status = np.array([])
-        if mat['LC387Status'].size:
-            LC387Status = mat['LC387Status'][0][:]
-        else:
-            LC387Status = np.array([])
-        if mat['LC607Status'].size:
-            LC607Status = mat['LC607Status'][0][:]
-        else:
-            LC607Status = np.array([])
-        if mat['LC355History'].size:
-            LC355History = mat['LC355History'][0][:]
-        else:
-            LC355History = np.array([])
-        if mat['LC532History'].size:
-            LC532History = mat['LC532History'][0][:]
-        else:
-            LC532History = np.array([])
-        if mat['LC1064History'].size:
-            LC1064History = mat['LC1064History'][0][:]
-        else:
-            LC1064History = np.array([])
-        if mat['LC387History'].size:
-            LC387History = mat['LC387History'][0][:]
-        else:
-            LC387History = np.array([])
-        if mat['LC607History'].size:
-            LC607History = mat['LC607History'][0][:]
-        else:
-            LC607History = np.array([])
-        if mat['logbookTime'].size:
-            thisLogbookTime = mat['logbookTime'][0][:]
-        else:
-            thisLogbookTime = np.array([])
-        if mat['flagOverlap'].size:
-            flagOverlap = mat['flagOverlap'][0][:]
-        else:
-            flagOverlap = np.array([])
-        if mat['flagWindowwipe'].size:
-            flagWindowwipe = mat['flagWindowwipe'][0][:]
-        else:
-            flagWindowwipe = np.array([])
-        if mat['flagFlashlamps'].size:
-            flagFlashlamps = mat['flagFlashlamps'][0][:]
-        else:
-            flagFlashlamps = np.array([])
-        if mat['flagPulsepower'].size:
-            flagPulsepower = mat['flagPulsepower'][0][:]
-        else:
-            flagPulsepower = np.array([])
-        if mat['flagRestart'].size:
-            flagRestart = mat['flagRestart'][0][:]
-        else:
-            flagRestart = np.array([])
-        if mat['flag_CH_NDChange'].size:
-            flag_CH_NDChange = mat['flag_CH_NDChange'][:]
-        else:
-            flag_CH_NDChange = np.array([])
-        if mat['flagCH355FR'].size:
-            flagCH355FR = mat['flagCH355FR'][0][:]
-        else:
-            flagCH355FR = np.array([])
-        if mat['flagCH532FR'].size:
-            flagCH532FR = mat['flagCH532FR'][0][:]
-        else:
-            flagCH532FR = np.array([])
-        if mat['flagCH1064FR'].size:
-            flagCH1064FR = mat['flagCH1064FR'][0][:]
-        else:
-            flagCH1064FR = np.array([])
-        if mat['flagCH387FR'].size:
-            flagCH387FR = mat['flagCH387FR'][0][:]
-        else:
-            flagCH387FR = np.array([])
-        if mat['flagCH607FR'].size:
-            flagCH607FR = mat['flagCH607FR'][0][:]
-        else:
-            flagCH607FR = np.array([])
-        if mat['flagCH407FR'].size:
-            flagCH407FR = mat['flagCH407FR'][0][:]
-        else:
-            flagCH407FR = np.array([])
-        if mat['flagCH355FR_X'].size:
-            flagCH355FR_X = mat['flagCH355FR_X'][0][:]
-        else:
-            flagCH355FR_X = np.array([])
-        if mat['flagCH532FR_X'].size:
-            flagCH532FR_X = mat['flagCH532FR_X'][0][:]
-        else:
-            flagCH532FR_X = np.array([])
-        else_time = mat['else_time'][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'dbFile': 'string',
+            'logbookFile': 'string',
+            'nChannel': 'scalar',
+            'flagCH355FR': 'vector',
+            'flagCH532FR': 'vector',
+            'flagCH1064FR': 'vector',
+            'flagCH387FR': 'vector',
+            'flagCH607FR': 'vector',
+            'flagCH407FR': 'vector',
+            'flagCH355FR_X': 'vector',
+            'flagCH532FR_X': 'vector',
+            'else_time': 'array',
+            'else_label': 'array',
+            'yLim355': 'vector',
+            'yLim532': 'vector',
+            'yLim1064': 'vector',
+            'yLim_LC_ratio_355_387': 'vector',
+            'yLim_LC_ratio_532_607': 'vector',
+            'wvLim': 'vector',
+            'depolConstLim355': 'vector',
+            'depolConstLim532': 'vector',
+            'campaignInfo.name': 'string',
+            'taskInfo.dataTime': 'scalar',
+            'campaignInfo.location': 'string',
+            'campaignInfo.startTime': 'scalar',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'processInfo.results_folder': 'string',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        dbFile = mat['dbFile']
+        logbookFile = mat['logbookFile']
+        nChannel = mat['nChannel']
+        flagCH355FR = mat['flagCH355FR']
+        flagCH532FR = mat['flagCH532FR']
+        flagCH1064FR = mat['flagCH1064FR']
+        flagCH387FR = mat['flagCH387FR']
+        flagCH607FR = mat['flagCH607FR']
+        flagCH407FR = mat['flagCH407FR']
+        flagCH355FR_X = mat['flagCH355FR_X']
+        flagCH532FR_X = mat['flagCH532FR_X']
+        else_time = mat['else_time']
         else_label = mat['else_label']
-        if mat['WVCaliTime'].size:
-            thisWVCaliTime = mat['WVCaliTime'][0][:]
-        else:
-            thisWVCaliTime = np.array([])
-        if mat['WVConst'].size:
-            WVConst = mat['WVConst'][0][:]
-        else:
-            WVConst = np.array([])
-        if mat['depolCaliTime355'].size:
-            thisDepolCaliTime355 = mat['depolCaliTime355'][0][:]
-        else:
-            thisDepolCaliTime355 = np.array([])
-        if mat['depolCaliConst355'].size:
-            depolCaliConst355 = mat['depolCaliConst355'][0][:]
-        else:
-            depolCaliConst355 = np.array([])
-        if mat['depolCaliTime532'].size:
-            thisDepolCaliTime532 = mat['depolCaliTime532'][0][:]
-        else:
-            thisDepolCaliTime532 = np.array([])
-        if mat['depolCaliConst532'].size:
-            depolCaliConst532 = mat['depolCaliConst532'][0][:]
-        else:
-            depolCaliConst532 = np.array([])
-        if mat['yLim355'].size:
-            yLim355 = mat['yLim355'][0][:]
-        else:
-            yLim355 = np.array([])
-        if mat['yLim532'].size:
-            yLim532 = mat['yLim532'][0][:]
-        else:
-            yLim532 = np.array([])
-        if mat['yLim1064'].size:
-            yLim1064 = mat['yLim1064'][0][:]
-        else:
-            yLim1064 = np.array([])
-        if mat['yLim_LC_ratio_355_387'].size:
-            yLim_LC_ratio_355_387 = mat['yLim_LC_ratio_355_387'][0][:]
-        else:
-            yLim_LC_ratio_355_387 = np.array([])
-        if mat['yLim_LC_ratio_532_607'].size:
-            yLim_LC_ratio_532_607 = mat['yLim_LC_ratio_532_607'][0][:]
-        else:
-            yLim_LC_ratio_532_607 = np.array([])
-        if mat['wvLim'].size:
-            wvLim = mat['wvLim'][0][:]
-        else:
-            wvLim = np.array([])
-        if mat['depolConstLim355'].size:
-            depolConstLim355 = mat['depolConstLim355'][0][:]
-        else:
-            depolConstLim355 = np.array([])
-        if mat['depolConstLim532'].size:
-            depolConstLim532 = mat['depolConstLim532'][0][:]
-        else:
-            depolConstLim532 = np.array([])
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        dataTime = mat['taskInfo']['dataTime'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        startTime = mat['campaignInfo']['startTime'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        imgFormat = mat['imgFormat'][:][0]
+        yLim355 = mat['yLim355']
+        yLim532 = mat['yLim532']
+        yLim1064 = mat['yLim1064']
+        yLim_LC_ratio_355_387 = mat['yLim_LC_ratio_355_387']
+        yLim_LC_ratio_532_607 = mat['yLim_LC_ratio_532_607']
+        wvLim = mat['wvLim']
+        depolConstLim355 = mat['depolConstLim355']
+        depolConstLim532 = mat['depolConstLim532']
+        pollyVersion = mat['campaignInfo.name']
+        dataTime = mat['taskInfo.dataTime']
+        location = mat['campaignInfo.location']
+        startTime = mat['campaignInfo.startTime']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        resultsFolder = mat['processInfo.results_folder']
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -296,23 +232,37 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # convert matlab datenum tp datetime
-    startTime = datenum_to_datetime(float(startTime[0]))
-    dataTime = datenum_to_datetime(float(dataTime[0]))
-    LCTime355 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime355]
-    LCTime532 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime532]
-    LCTime1064 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime1064]
-    LCTime387 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime387]
-    LCTime607 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime607]
-    logbookTime = [datenum_to_datetime(thisTime)
-                   for thisTime in thisLogbookTime]
-    elseTime = [datenum_to_datetime(thisElseTime)
-                for thisElseTime in else_time]
-    WVCaliTime = [datenum_to_datetime(thisTime) for thisTime in thisWVCaliTime]
-    depolCaliTime355 = [datenum_to_datetime(
-        thisTime) for thisTime in thisDepolCaliTime355]
-    depolCaliTime532 = [datenum_to_datetime(
-        thisTime) for thisTime in thisDepolCaliTime532]
+    # convert matlab datenum to datetime64
+    startTime = datenum_to_datetime(startTime)
+    dataTime = datenum_to_datetime(dataTime)
+    elseTime = datenum_to_datetime64(np.ravel(else_time))
+
+    # the caches are saved in the results folder of the instrument
+    if resultsFolder:
+        caliCacheFile = os.path.join(
+            resultsFolder, pollyVersion, 'longterm_cali_cache.npz')
+        logbookCacheFile = os.path.join(
+            resultsFolder, pollyVersion, 'longterm_logbook_cache.npz')
+    else:
+        print('results_folder is not set. Read the calibrations and the ' +
+              'logbook without the cache.')
+        caliCacheFile = logbookCacheFile = None
+
+    # calibrations inside the window of the figure (before the processing
+    # time). The markers just outside of the x-limits are partially visible.
+    # Only the new calibrations are queried and added to the cache.
+    xLim = [startTime - timedelta(days=2), dataTime + timedelta(days=2)]
+    cali = cached_calibrations(
+        caliCacheFile, dbFile, _calibration_queries(pollyVersion),
+        (xLim[0] - (xLim[1] - xLim[0]) / 100, dataTime),
+        refreshFrom=dataTime - timedelta(days=1))
+
+    # logbook entries before the processing time. Only the new lines of the
+    # logbook are parsed and added to the cache.
+    logbook = cached_logbook(logbookCacheFile, logbookFile, nChannel,
+                             stop=dataTime)
+    logbookTime = logbook['datetime']
+    flag_CH_NDChange = logbook['flag_CH_NDChange']
 
     lineColor = {
         'overlap': '#f48f42',
@@ -324,6 +274,17 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
         'else': '#00ff00'
         }
 
+    # logbook events, which are the same for all the subplots except the ND
+    # filter changes
+    logbookEvents = [
+        (category, logbookTime[logbook[flag]])
+        for category, flag in [('overlap', 'flagOverlap'),
+                               ('pulsepower', 'flagPulsepower'),
+                               ('windowwipe', 'flagWindowwipe'),
+                               ('restart', 'flagRestart'),
+                               ('flashlamps', 'flagFlashlamps')]
+        ]
+
     # display lidar constants at 355mn
     fig, (ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8) = plt.subplots(
         8,
@@ -334,11 +295,8 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     plt.subplots_adjust(top=0.96, bottom=0.05, left=0.07, right=0.98)
 
     # lidar constants at 355 nm
-    LCTime355 = [LCTime355[indx]
-                 for indx in np.arange(0, len(LCTime355))
-                 if LC355Status[indx] == 2]
     p1 = ax1.scatter(
-        LCTime355, LC355History[LC355Status == 2],
+        cali['LC355']['caliTime'], cali['LC355']['value'],
         s=7, c='#0000ff', marker='o', label='lidar constant'
         )
     # default line for create legend
@@ -363,28 +321,10 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
         fontsize=11
         )
 
-    for iLogbookInfo in np.arange(0, len(logbookTime)):
-        if flagOverlap[iLogbookInfo]:
-            ax1.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['overlap'])
-        if flagPulsepower[iLogbookInfo]:
-            ax1.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['pulsepower'])
-        if flagWindowwipe[iLogbookInfo]:
-            ax1.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['windowwipe'])
-        if flagRestart[iLogbookInfo]:
-            ax1.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['restart'])
-        if flagFlashlamps[iLogbookInfo]:
-            ax1.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['flashlamps'])
-        if flag_CH_NDChange[iLogbookInfo, flagCH355FR == 1]:
-            ax1.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['NDChange'])
-
-    for elseTime in else_time:
-        ax1.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    _add_event_lines(ax1, logbookEvents + [
+        ('NDChange', _nd_change_time(
+            logbookTime, flag_CH_NDChange, flagCH355FR)),
+        ('else', elseTime)], lineColor)
 
     ax1.set_ylabel('LC @ 355nm')
     ax1.grid(False)
@@ -394,36 +334,15 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     ax1.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # lidar constant at 532 nm
-    LCTime532 = [LCTime532[indx]
-                 for indx in np.arange(0, len(LCTime532))
-                 if LC532Status[indx] == 2]
     p1 = ax2.scatter(
-        LCTime532, LC532History[LC532Status == 2],
+        cali['LC532']['caliTime'], cali['LC532']['value'],
         s=7, c='#0000ff', marker='o'
         )
 
-    for iLogbookInfo in np.arange(0, len(logbookTime)):
-        if flagOverlap[iLogbookInfo]:
-            ax2.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['overlap'])
-        if flagPulsepower[iLogbookInfo]:
-            ax2.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['pulsepower'])
-        if flagWindowwipe[iLogbookInfo]:
-            ax2.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['windowwipe'])
-        if flagRestart[iLogbookInfo]:
-            ax2.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['restart'])
-        if flagFlashlamps[iLogbookInfo]:
-            ax2.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['flashlamps'])
-        if flag_CH_NDChange[iLogbookInfo, flagCH532FR == 1]:
-            ax2.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['NDChange'])
-
-    for elseTime in else_time:
-        ax2.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    _add_event_lines(ax2, logbookEvents + [
+        ('NDChange', _nd_change_time(
+            logbookTime, flag_CH_NDChange, flagCH532FR)),
+        ('else', elseTime)], lineColor)
 
     ax2.set_ylabel('LC @ 532nm')
     ax2.grid(False)
@@ -431,36 +350,15 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     ax2.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # lidar constant at 1064 nm
-    LCTime1064 = [LCTime1064[indx]
-                  for indx in np.arange(0, len(LCTime1064))
-                  if LC1064Status[indx] == 2]
     p1 = ax3.scatter(
-        LCTime1064, LC1064History[LC1064Status == 2],
+        cali['LC1064']['caliTime'], cali['LC1064']['value'],
         s=7, c='#0000ff', marker='o'
         )
 
-    for iLogbookInfo in np.arange(0, len(logbookTime)):
-        if flagOverlap[iLogbookInfo]:
-            ax3.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['overlap'])
-        if flagPulsepower[iLogbookInfo]:
-            ax3.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['pulsepower'])
-        if flagWindowwipe[iLogbookInfo]:
-            ax3.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['windowwipe'])
-        if flagRestart[iLogbookInfo]:
-            ax3.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['restart'])
-        if flagFlashlamps[iLogbookInfo]:
-            ax3.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['flashlamps'])
-        if flag_CH_NDChange[iLogbookInfo, flagCH1064FR == 1]:
-            ax3.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['NDChange'])
-
-    for elseTime in else_time:
-        ax3.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    _add_event_lines(ax3, logbookEvents + [
+        ('NDChange', _nd_change_time(
+            logbookTime, flag_CH_NDChange, flagCH1064FR)),
+        ('else', elseTime)], lineColor)
 
     ax3.set_ylabel('LC @ 1064nm')
     ax3.grid(False)
@@ -468,38 +366,15 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     ax3.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # transmission ratio at 355/387 nm
-    flagRamanLC = np.logical_and(LC355Status == 2, LC387Status == 2)
-    LCTime387 = [LCTime387[indx]
-                 for indx in np.arange(0, len(LCTime387))
-                 if LC387Status[indx] == 2]
     p1 = ax4.scatter(
-        LCTime387, LC355History[flagRamanLC] / LC387History[flagRamanLC],
+        *_lc_ratio(cali['LC355'], cali['LC387']),
         s=7, c='#0000ff', marker='o'
         )
 
-    for iLogbookInfo in np.arange(0, len(logbookTime)):
-        if flagOverlap[iLogbookInfo]:
-            ax4.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['overlap'])
-        if flagPulsepower[iLogbookInfo]:
-            ax4.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['pulsepower'])
-        if flagWindowwipe[iLogbookInfo]:
-            ax4.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['windowwipe'])
-        if flagRestart[iLogbookInfo]:
-            ax4.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['restart'])
-        if flagFlashlamps[iLogbookInfo]:
-            ax4.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['flashlamps'])
-        if flag_CH_NDChange[iLogbookInfo, flagCH355FR == 1] or \
-           flag_CH_NDChange[iLogbookInfo, flagCH387FR == 1]:
-            ax4.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['NDChange'])
-
-    for elseTime in else_time:
-        ax4.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    _add_event_lines(ax4, logbookEvents + [
+        ('NDChange', _nd_change_time(
+            logbookTime, flag_CH_NDChange, flagCH355FR, flagCH387FR)),
+        ('else', elseTime)], lineColor)
 
     ax4.set_ylabel('Ratio 355/387')
     ax4.grid(False)
@@ -507,38 +382,15 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     ax4.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # transmission ratio at 532/607 nm
-    flagRamanLC = np.logical_and(LC532Status == 2, LC607Status == 2)
-    LCTime607 = [LCTime607[indx]
-                 for indx in np.arange(0, len(LCTime607))
-                 if LC607Status[indx] == 2]
     p1 = ax5.scatter(
-        LCTime607, LC532History[flagRamanLC] / LC607History[flagRamanLC],
+        *_lc_ratio(cali['LC532'], cali['LC607']),
         s=7, c='#0000ff', marker='o'
         )
 
-    for iLogbookInfo in np.arange(0, len(logbookTime)):
-        if flagOverlap[iLogbookInfo]:
-            ax5.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['overlap'])
-        if flagPulsepower[iLogbookInfo]:
-            ax5.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['pulsepower'])
-        if flagWindowwipe[iLogbookInfo]:
-            ax5.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['windowwipe'])
-        if flagRestart[iLogbookInfo]:
-            ax5.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['restart'])
-        if flagFlashlamps[iLogbookInfo]:
-            ax5.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['flashlamps'])
-        if flag_CH_NDChange[iLogbookInfo, flagCH532FR == 1] or \
-           flag_CH_NDChange[iLogbookInfo, flagCH607FR == 1]:
-            ax5.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['NDChange'])
-
-    for elseTime in else_time:
-        ax5.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    _add_event_lines(ax5, logbookEvents + [
+        ('NDChange', _nd_change_time(
+            logbookTime, flag_CH_NDChange, flagCH532FR, flagCH607FR)),
+        ('else', elseTime)], lineColor)
 
     ax5.set_ylabel('Ratio 532/607')
     ax5.grid(False)
@@ -546,31 +398,13 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     ax5.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # wv calibration constant
-    p1 = ax6.scatter(WVCaliTime, WVConst, s=7, c='#0000ff', marker='o')
-
-    for iLogbookInfo in np.arange(0, len(logbookTime)):
-        if flagOverlap[iLogbookInfo]:
-            ax6.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['overlap'])
-        if flagPulsepower[iLogbookInfo]:
-            ax6.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['pulsepower'])
-        if flagWindowwipe[iLogbookInfo]:
-            ax6.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['windowwipe'])
-        if flagRestart[iLogbookInfo]:
-            ax6.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['restart'])
-        if flagFlashlamps[iLogbookInfo]:
-            ax6.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['flashlamps'])
-        if flag_CH_NDChange[iLogbookInfo, flagCH407FR == 1] or \
-           flag_CH_NDChange[iLogbookInfo, flagCH387FR == 1]:
-            ax6.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['NDChange'])
-
-    for elseTime in else_time:
-        ax6.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    p1 = ax6.scatter(cali['WV']['caliTime'], cali['WV']['value'],
+                     s=7, c='#0000ff', marker='o')
+
+    _add_event_lines(ax6, logbookEvents + [
+        ('NDChange', _nd_change_time(
+            logbookTime, flag_CH_NDChange, flagCH407FR, flagCH387FR)),
+        ('else', elseTime)], lineColor)
 
     ax6.set_ylabel('WV const [g*kg^{-1}]')
     ax6.grid(False)
@@ -578,32 +412,15 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     ax6.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # depolarization calibration constant at 355 nm
-    p1 = ax7.scatter(depolCaliTime355, depolCaliConst355,
-                     s=7, c='#0000ff', marker='o')
+    p1 = ax7.scatter(
+        cali['depol355']['caliTime'], cali['depol355']['value'],
+        s=7, c='#0000ff', marker='o'
+        )
 
-    for iLogbookInfo in np.arange(0, len(logbookTime)):
-        if flagOverlap[iLogbookInfo]:
-            ax7.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['overlap'])
-        if flagPulsepower[iLogbookInfo]:
-            ax7.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['pulsepower'])
-        if flagWindowwipe[iLogbookInfo]:
-            ax7.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['windowwipe'])
-        if flagRestart[iLogbookInfo]:
-            ax7.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['restart'])
-        if flagFlashlamps[iLogbookInfo]:
-            ax7.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['flashlamps'])
-        if flag_CH_NDChange[iLogbookInfo, flagCH355FR == 1] or \
-           flag_CH_NDChange[iLogbookInfo, flagCH355FR_X == 1]:
-            ax7.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['NDChange'])
-
-    for elseTime in else_time:
-        ax7.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    _add_event_lines(ax7, logbookEvents + [
+        ('NDChange', _nd_change_time(
+            logbookTime, flag_CH_NDChange, flagCH355FR, flagCH355FR_X)),
+        ('else', elseTime)], lineColor)
 
     ax7.set_ylabel('V* 355')
     ax7.grid(False)
@@ -611,32 +428,15 @@ def pollyxt_display_longterm_cali(tmpFile, saveFolder):
     ax7.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # depolarization calibration constant at 532 nm
-    p1 = ax8.scatter(depolCaliTime532, depolCaliConst532,
-                     s=7, c='#0000ff', marker='o')
+    p1 = ax8.scatter(
+        cali['depol532']['caliTime'], cali['depol532']['value'],
+        s=7, c='#0000ff', marker='o'
+        )
 
-    for iLogbookInfo in np.arange(0, len(logbookTime)):
-        if flagOverlap[iLogbookInfo]:
-            ax8.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['overlap'])
-        if flagPulsepower[iLogbookInfo]:
-            ax8.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['pulsepower'])
-        if flagWindowwipe[iLogbookInfo]:
-            ax8.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['windowwipe'])
-        if flagRestart[iLogbookInfo]:
-            ax8.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['restart'])
-        if flagFlashlamps[iLogbookInfo]:
-            ax8.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['flashlamps'])
-        if flag_CH_NDChange[iLogbookInfo, flagCH532FR == 1] or \
-           flag_CH_NDChange[iLogbookInfo, flagCH532FR_X == 1]:
-            ax8.axvline(x=logbookTime[iLogbookInfo],
-                        linestyle='--', color=lineColor['NDChange'])
-
-    for elseTime in else_time:
-        ax8.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    _add_event_lines(ax8, logbookEvents + [
+        ('NDChange', _nd_change_time(
+            logbookTime, flag_CH_NDChange, flagCH532FR, flagCH532FR_X)),
+        ('else', elseTime)], lineColor)
 
     ax8.set_ylabel('V* 532')
     ax8.set_xlabel('Date (mm-dd)')
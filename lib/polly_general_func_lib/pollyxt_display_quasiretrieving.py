@@ -1,63 +1,25 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
+from matplotlib.ticker import MultipleLocator, FormatStrFormatter, \
+    FixedLocator
 from matplotlib.colors import ListedColormap
 from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_parallel import render_figures, figure_workers
+from polly_mesh import TimeHeightMesh
+from polly_template import figure_template, release_templates
+from polly_raster import save_quicklook
+from polly_decimate import decimate, axes_pixels
+from polly_tiles import tile_pyramid_enabled, save_tile_pyramid
+from polly_cache import set_render_cache
+from polly_handoff import load_variables
+from polly_time import datenum_to_datetime
 
 
 def rmext(filename):
@@ -93,6 +55,15 @@ def pollyxt_display_quasiretrieving(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Load the memory-mapped handoffs with 'load_handoff'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Render the figures in parallel with 'pyFigureWorkers'.
+    2026-10-17. Reuse one figure template for the same layout.
+    2026-10-17. Crop and reduce the products to the pixels of the figure.
+    2026-10-17. Apply the quality masks and the scale in 'decimate'.
+    2026-10-17. Save the tile pyramids with 'pyTilePyramid'.
+    2026-10-17. Reuse the unchanged figures with 'pyRenderCacheFolder'.
     '''
 
     if not os.path.exists(tmpFile):
@@ -101,31 +72,60 @@ def pollyxt_display_quasiretrieving(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        quasi_bsc_532 = mat['quasi_bsc_532'][:]
-        quality_mask_532 = mat['quality_mask_532'][:]
-        quasi_bsc_355 = mat['quasi_bsc_355'][:]
-        quality_mask_355 = mat['quality_mask_355'][:]
-        quasi_bsc_1064 = mat['quasi_bsc_1064'][:]
-        quality_mask_1064 = mat['quality_mask_1064'][:]
-        quasi_pardepol_532 = mat['quasi_pardepol_532'][:]
-        quasi_ang_532_1064 = mat['quasi_ang_532_1064'][:]
-        height = mat['height'][0][:]
-        time = mat['time'][0][:]
-        yLim_Quasi_Params = mat['yLim_Quasi_Params'][:][0]
-        quasi_beta_cRange_355 = mat['quasi_beta_cRange_355'][0][:]
-        quasi_beta_cRange_532 = mat['quasi_beta_cRange_532'][0][:]
-        quasi_beta_cRange_1064 = mat['quasi_beta_cRange_1064'][0][:]
-        quasi_Par_DR_cRange_532 = mat['quasi_Par_DR_cRange_532'][0][:]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'quasi_bsc_532': 'array',
+            'quality_mask_532': 'array',
+            'quasi_bsc_355': 'array',
+            'quality_mask_355': 'array',
+            'quasi_bsc_1064': 'array',
+            'quality_mask_1064': 'array',
+            'quasi_pardepol_532': 'array',
+            'quasi_ang_532_1064': 'array',
+            'height': 'vector',
+            'time': 'vector',
+            'yLim_Quasi_Params': 'vector',
+            'quasi_beta_cRange_355': 'vector',
+            'quasi_beta_cRange_532': 'vector',
+            'quasi_beta_cRange_1064': 'vector',
+            'quasi_Par_DR_cRange_532': 'vector',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string',
+            'processInfo': 'struct'
+            })
+        figDPI = mat['figDPI']
+        quasi_bsc_532 = mat['quasi_bsc_532']
+        quality_mask_532 = mat['quality_mask_532']
+        quasi_bsc_355 = mat['quasi_bsc_355']
+        quality_mask_355 = mat['quality_mask_355']
+        quasi_bsc_1064 = mat['quasi_bsc_1064']
+        quality_mask_1064 = mat['quality_mask_1064']
+        quasi_pardepol_532 = mat['quasi_pardepol_532']
+        quasi_ang_532_1064 = mat['quasi_ang_532_1064']
+        height = mat['height']
+        time = mat['time']
+        yLim_Quasi_Params = mat['yLim_Quasi_Params']
+        quasi_beta_cRange_355 = mat['quasi_beta_cRange_355']
+        quasi_beta_cRange_532 = mat['quasi_beta_cRange_532']
+        quasi_beta_cRange_1064 = mat['quasi_beta_cRange_1064']
+        quasi_Par_DR_cRange_532 = mat['quasi_Par_DR_cRange_532']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
+        set_render_cache(mat['processInfo'])
+        nWorkers = figure_workers(mat['processInfo'])
+        flagTiles = tile_pyramid_enabled(mat['processInfo'])
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -135,146 +135,117 @@ def pollyxt_display_quasiretrieving(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # meshgrid
-    Time, Height = np.meshgrid(time, height)
-    quasi_bsc_355 = np.ma.masked_where(quality_mask_355 > 0, quasi_bsc_355)
-    quasi_bsc_532 = np.ma.masked_where(quality_mask_532 > 0, quasi_bsc_532)
-    quasi_bsc_1064 = np.ma.masked_where(quality_mask_1064 > 0, quasi_bsc_1064)
-    quasi_pardepol_532 = np.ma.masked_where(
-        quality_mask_532 > 0,
-        quasi_pardepol_532
-    )
-    quasi_ang_532_1064 = np.ma.masked_where(
-        np.logical_or(quality_mask_532 > 0, quality_mask_1064 > 0),
-        quasi_ang_532_1064
-    )
-
     # define the colormap
     cmap = plt.cm.jet
     cmap.set_bad('k', alpha=1)
     cmap.set_over('w', alpha=1)
     cmap.set_under('k', alpha=1)
 
-    # display quasi backscatter at 355 nm
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, quasi_bsc_355 * 1e6,
-        vmin=quasi_beta_cRange_355[0],
-        vmax=quasi_beta_cRange_355[1],
-        cmap=cmap,
-        rasterized=True
-        )
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+    data = {
+        'time': time,
+        'height': height,
+        'quasi_bsc_355': quasi_bsc_355,
+        'quasi_bsc_532': quasi_bsc_532,
+        'quasi_bsc_1064': quasi_bsc_1064,
+        'quasi_pardepol_532': quasi_pardepol_532,
+        'quasi_ang_532_1064': quasi_ang_532_1064,
+        'quality_mask_355': quality_mask_355,
+        'quality_mask_532': quality_mask_532,
+        'quality_mask_1064': quality_mask_1064,
+        'cmap': cmap,
+        'yLim_Quasi_Params': yLim_Quasi_Params.tolist(),
+        'xtick': xtick.tolist(),
+        'xticklabel': xticklabel,
+        'date': datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
+        'version': version,
+        'pollyVersion': pollyVersion,
+        'figDPI': figDPI,
+        'figSize': [10, 5],
+        'axPosition': [0.11, 0.15, 0.79, 0.75],
+        'saveFolder': saveFolder,
+        'dataFilename': rmext(dataFilename),
+        'imgFormat': imgFormat,
+        'tiles': flagTiles
+    }
+
+    # specification of each figure
+    figures = []
+    for wave, cRange in zip(
+            [355, 532, 1064],
+            [quasi_beta_cRange_355, quasi_beta_cRange_532,
+             quasi_beta_cRange_1064]):
+        figures.append({
+            'var': 'quasi_bsc_{0}'.format(wave),
+            'masks': ['quality_mask_{0}'.format(wave)],
+            'scale': 1e6,
+            'cRange': cRange,
+            'title': 'Quasi backscatter coefficient at {wave}nm'.format(
+                        wave=wave) +
+                     ' from {instrument} at {location}'.format(
+                        instrument=pollyVersion,
+                        location=location
+                        ),
+            'layout': 'bsc',
+            'cbarPos': [0.94, 0.20, 0.02, 0.65],
+            'cbarTicks': np.linspace(cRange[0], cRange[1], 5),
+            'cbarTitle': '$Mm^{-1}*sr^{-1}$',
+            'tag': 'Quasi_Bsc_{0}'.format(wave)
+        })
+    figures.append({
+        'var': 'quasi_pardepol_532',
+        'masks': ['quality_mask_532'],
+        'scale': 1,
+        'cRange': quasi_Par_DR_cRange_532,
+        'title': 'Quasi particle depolarization ratio at {wave}nm'.format(
+                    wave=532) +
+                 ' from {instrument} at {location}'.format(
+                    instrument=pollyVersion,
+                    location=location
+                    ),
+        'layout': 'ratio',
+        'cbarPos': [0.92, 0.20, 0.02, 0.65],
+        'cbarTicks': np.arange(0, 0.41, 0.05),
+        'cbarTitle': '',
+        'tag': 'Quasi_PDR_532'
+    })
+    figures.append({
+        'var': 'quasi_ang_532_1064',
+        'masks': ['quality_mask_532', 'quality_mask_1064'],
+        'scale': 1,
+        'cRange': [0, 2],
+        'title': 'Quasi BSC Angstoem Exponent 532-1064 from ' +
+                 '{instrument} at {location}'.format(
+                    instrument=pollyVersion,
+                    location=location
+                    ),
+        'layout': 'ratio',
+        'cbarPos': [0.92, 0.20, 0.02, 0.65],
+        'cbarTicks': np.arange(0, 2.1, 0.5),
+        'cbarTitle': '',
+        'tag': 'Quasi_ANGEXP_532_1064'
+    })
 
-    ax.yaxis.set_major_locator(MultipleLocator(2000))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim(yLim_Quasi_Params.tolist())
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Quasi backscatter coefficient at {wave}nm'.format(wave=355) +
-        ' from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.94, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(
-        pcmesh, cax=cb_ax, ticks=np.linspace(
-            quasi_beta_cRange_355[0],
-            quasi_beta_cRange_355[1],
-            5
-            ),
-        orientation='vertical'
-        )
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('$Mm^{-1}*sr^{-1}$', fontsize=12)
-
-    fig.text(0.05, 0.02, datenum_to_datetime(
-        time[0]).strftime("%Y-%m-%d"), fontsize=12)
-    fig.text(0.8, 0.02, 'Version: {version}'.format(
-        version=version), fontsize=12)
-
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_Quasi_Bsc_355.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-            )), dpi=figDPI)
-    plt.close()
-
-    # display quasi backscatter at 532 nm
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, quasi_bsc_532 * 1e6,
-        vmin=quasi_beta_cRange_532[0],
-        vmax=quasi_beta_cRange_532[1],
-        cmap=cmap,
-        rasterized=True
-        )
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.yaxis.set_major_locator(MultipleLocator(2000))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim(yLim_Quasi_Params.tolist())
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+    try:
+        render_figures(
+            _display_quasiretrieving_figure, data, figures, nWorkers)
+    finally:
+        release_templates()
 
-    ax.set_title(
-        'Quasi backscatter coefficient at {wave}nm'.format(wave=532) +
-        ' from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
 
-    cb_ax = fig.add_axes([0.94, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(
-        pcmesh, cax=cb_ax, ticks=np.linspace(
-            quasi_beta_cRange_532[0],
-            quasi_beta_cRange_532[1],
-            5
-            ),
-        orientation='vertical'
-        )
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('$Mm^{-1}*sr^{-1}$', fontsize=12)
+def _build_quasiretrieving_template(data, figure, time, height,
+                                       matrix):
+    """
+    Build the figure template for the quasi retrieving products with the same
+    layout.
+    """
 
-    fig.text(0.05, 0.02, datenum_to_datetime(
-        time[0]).strftime("%Y-%m-%d"), fontsize=12)
-    fig.text(0.8, 0.02, 'Version: {version}'.format(
-        version=version), fontsize=12)
-
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_Quasi_Bsc_532.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
-    plt.close()
-
-    # display quasi backscatter at 1064 nm
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, quasi_bsc_1064 * 1e6,
-        vmin=quasi_beta_cRange_1064[0],
-        vmax=quasi_beta_cRange_1064[1],
-        cmap=cmap,
+    fig = plt.figure(figsize=data['figSize'])
+    ax = fig.add_axes(data['axPosition'])
+    mesh = TimeHeightMesh(
+        ax, time, height, matrix,
+        vmin=figure['cRange'][0],
+        vmax=figure['cRange'][1],
+        cmap=data['cmap'],
         rasterized=True
         )
     ax.set_xlabel('UTC', fontsize=15)
@@ -282,142 +253,88 @@ def pollyxt_display_quasiretrieving(tmpFile, saveFolder):
 
     ax.yaxis.set_major_locator(MultipleLocator(2000))
     ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim(yLim_Quasi_Params.tolist())
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_ylim(data['yLim_Quasi_Params'])
+    ax.set_xticks(data['xtick'])
+    ax.set_xticklabels(data['xticklabel'])
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
     ax.tick_params(axis='both', which='minor', width=1.5,
                    length=3.5, right=True, top=True)
 
-    ax.set_title(
-        'Quasi backscatter coefficient at {wave}nm'.format(wave=1064) +
-        ' from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.94, 0.20, 0.02, 0.65])
+    cb_ax = fig.add_axes(figure['cbarPos'])
     cbar = fig.colorbar(
-        pcmesh, cax=cb_ax, ticks=np.linspace(
-            quasi_beta_cRange_1064[0],
-            quasi_beta_cRange_1064[1],
-            5
-            ),
+        mesh.mappable, cax=cb_ax, ticks=figure['cbarTicks'],
         orientation='vertical'
         )
     cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('$Mm^{-1}*sr^{-1}$', fontsize=12)
+    cbar.ax.set_title(figure['cbarTitle'], fontsize=12)
 
-    fig.text(0.05, 0.02, datenum_to_datetime(
-        time[0]).strftime("%Y-%m-%d"), fontsize=12)
+    fig.text(0.05, 0.02, data['date'], fontsize=12)
     fig.text(0.8, 0.02, 'Version: {version}'.format(
-        version=version), fontsize=12)
-
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_Quasi_Bsc_1064.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
-    plt.close()
-
-    # display quasi particle depolarization ratio at 532 nm
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, quasi_pardepol_532,
-        vmin=quasi_Par_DR_cRange_532[0],
-        vmax=quasi_Par_DR_cRange_532[1],
-        cmap=cmap,
-        rasterized=True
-        )
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.yaxis.set_major_locator(MultipleLocator(2000))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim(yLim_Quasi_Params.tolist())
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+        version=data['version']), fontsize=12)
 
-    ax.set_title(
-        'Quasi particle depolarization ratio at 532nm ' +
-        'from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
+    return {'fig': fig, 'ax': ax, 'mesh': mesh, 'cbar': cbar}
 
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=np.arange(
-        0, 0.41, 0.05), orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('', fontsize=12)
 
-    fig.text(0.05, 0.02, datenum_to_datetime(
-        time[0]).strftime("%Y-%m-%d"), fontsize=12)
-    fig.text(0.8, 0.02, 'Version: {version}'.format(
-        version=version), fontsize=12)
-
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_Quasi_PDR_532.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
-    plt.close()
-
-    # display quasi angtroem exponent 532-1064
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, quasi_ang_532_1064, vmin=0, vmax=2, cmap=cmap,
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+def _display_quasiretrieving_figure(data, figure):
+    """
+    Display one quasi retrieving product.
 
-    ax.yaxis.set_major_locator(MultipleLocator(2000))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim(yLim_Quasi_Params.tolist())
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+    Parameters
+    ----------
+    data: dict
+        input arrays and settings shared by all the figures.
+    figure: dict
+        specification of the figure.
+        (see `pollyxt_display_quasiretrieving`)
+    """
 
-    ax.set_title(
-        'Quasi BSC Angstoem Exponent 532-1064 ' +
-        'from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location
+    # crop to the y-limits, reduce to the pixels of the axes and filter out
+    # the invalid values
+    time, height, matrix = decimate(
+        data['time'], data['height'], data[figure['var']],
+        data['yLim_Quasi_Params'],
+        axes_pixels(data['figSize'], data['axPosition'], data['figDPI']),
+        masks=[data[maskName] for maskName in figure['masks']],
+        scale=figure['scale'])
+
+    # only the data, color limits and title will be updated
+    template = figure_template(
+        figure['layout'], _build_quasiretrieving_template,
+        data, figure, time, height, matrix)
+
+    template['cbar'].locator = FixedLocator(figure['cbarTicks'])
+    template['mesh'].set_data(matrix, time, height)
+    template['mesh'].mappable.set_clim(
+        figure['cRange'][0], figure['cRange'][1])
+
+    template['ax'].set_title(figure['title'], fontsize=15)
+
+    save_quicklook(
+        template['fig'], template['mesh'],
+        os.path.join(
+            data['saveFolder'],
+            '{dataFilename}_{tag}.{imgFmt}'.format(
+                dataFilename=data['dataFilename'],
+                tag=figure['tag'],
+                imgFmt=data['imgFormat']
+                )
             ),
-        fontsize=15
+        data['figDPI'],
+        frameKey=(data['pollyVersion'], figure['tag'], data['figDPI'])
         )
 
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=np.arange(
-        0, 2.1, 0.5), orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('', fontsize=12)
-
-    fig.text(0.05, 0.02, datenum_to_datetime(
-        time[0]).strftime("%Y-%m-%d"), fontsize=12)
-    fig.text(0.8, 0.02, 'Version: {version}'.format(
-        version=version), fontsize=12)
-
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_Quasi_ANGEXP_532_1064.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-            )), dpi=figDPI)
-    plt.close()
+    if data['tiles']:
+        save_tile_pyramid(
+            os.path.join(
+                data['saveFolder'], '{dataFilename}_{tag}_tiles'.format(
+                    dataFilename=data['dataFilename'], tag=figure['tag'])),
+            data['time'], data['height'], data[figure['var']],
+            data['yLim_Quasi_Params'], data['cmap'], figure['cRange'],
+            masks=[data[maskName] for maskName in figure['masks']],
+            scale=figure['scale'],
+            metadata={'product': figure['tag'], 'title': figure['title'],
+                      'unit': figure['cbarTitle']})
 
 
 def main():
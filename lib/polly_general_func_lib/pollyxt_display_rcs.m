@@ -9,6 +9,8 @@ function pollyxt_display_rcs(data, taskInfo, config)
 %       More detailed information can be found in doc/pollynet_processing_program.md
 %History:
 %   2018-12-29. First Edition by Zhenping
+%   2026-10-17. Save the python handoff with save_python_handoff.
+%   2026-10-17. Fixed time axis with 'pyQuicklookAppendHours'.
 %Contact:
 %   zhenping@tropos.de
 
@@ -21,7 +23,16 @@ flagChannel532NR = config.isNR & config.is532nm & config.isTot;
 flagChannel355NR = config.isNR & config.is355nm & config.isTot;
 
 %% preparing the data
-[xtick, xtickstr] = timelabellayout(data.mTime, 'HH:MM');
+if strcmpi(processInfo.visualizationMode, 'python') && ...
+   isfield(processInfo, 'pyQuicklookAppendHours') && ...
+   (processInfo.pyQuicklookAppendHours > 0)
+    % fixed time axis for the near-real-time quicklooks
+    [xtick, xtickstr] = timelabellayout([data.mTime(1), ...
+        data.mTime(1) + processInfo.pyQuicklookAppendHours / 24], ...
+        'HH:MM');
+else
+    [xtick, xtickstr] = timelabellayout(data.mTime, 'HH:MM');
+end
 mTime = data.mTime;
 height = data.height;
 figDPI = processInfo.figDPI;
@@ -350,12 +361,11 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
 
     %% display rcs 
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-    save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_RCS', 'yLim_NR_RCS', 'yLim_FR_DR', 'RCS_FR_355', 'RCS_FR_532', 'RCS_FR_1064', 'RCS_NR_355', 'RCS_NR_532', 'volDepol_355', 'volDepol_532', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'RCS355FRColorRange', 'RCS532FRColorRange', 'RCS1064FRColorRange', 'RCS355NRColorRange', 'RCS532NRColorRange', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_rcs.py'), tmpFile, saveFolder));
+    tmpFile = save_python_handoff(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_RCS', 'yLim_NR_RCS', 'yLim_FR_DR', 'RCS_FR_355', 'RCS_FR_532', 'RCS_FR_1064', 'RCS_NR_355', 'RCS_NR_532', 'volDepol_355', 'volDepol_532', 'processInfo', 'campaignInfo', 'taskInfo', 'xtick', 'xtickstr', 'RCS355FRColorRange', 'RCS532FRColorRange', 'RCS1064FRColorRange', 'RCS355NRColorRange', 'RCS532NRColorRange', 'imgFormat');
+    flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_rcs.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyxt_display_rcs.py');
     end
-    delete(tmpFile);
 
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
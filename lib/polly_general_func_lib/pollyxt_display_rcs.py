@@ -1,63 +1,28 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
+from matplotlib.ticker import MultipleLocator, FormatStrFormatter, \
+    AutoLocator, FixedLocator
 from matplotlib.colors import ListedColormap
 from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_parallel import render_figures, figure_workers
+from polly_mesh import TimeHeightMesh
+from polly_template import figure_template, release_templates
+from polly_raster import save_quicklook, append_quicklook, \
+    quicklook_append_hours
+from polly_decimate import decimate, axes_pixels, profile_mask
+from polly_composite import daily_composite_enabled, day_limits, \
+    daily_xticks, composite_folder, save_chunk, load_composite
+from polly_tiles import tile_pyramid_enabled, save_tile_pyramid
+from polly_cache import set_render_cache
+from polly_handoff import load_variables
+from polly_time import datenum_to_datetime
 
 
 def rmext(filename):
@@ -93,6 +58,19 @@ def pollyxt_display_rcs(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Render the figures in parallel with 'pyFigureWorkers'.
+    2026-10-17. Reuse one figure template for all the channels.
+    2026-10-17. Crop and reduce the products to the pixels of the figure.
+    2026-10-17. Load the memory-mapped handoffs with 'load_handoff'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
+    2026-10-17. Combine the masks of the profiles once with 'profile_mask'.
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Append the new profiles with 'pyQuicklookAppendHours'.
+    2026-10-17. Add the daily composites with 'pyDailyComposite'.
+    2026-10-17. Save the tile pyramids with 'pyTilePyramid'.
+    2026-10-17. Reuse the unchanged figures with 'pyRenderCacheFolder'.
+    2026-10-17. Disable the appending and the daily composites without
+                results_folder.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,379 +79,343 @@ def pollyxt_display_rcs(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        mTime = mat['mTime'][0][:]
-        height = mat['height'][0][:]
-        depCalMask = mat['depCalMask'][0][:]
-        fogMask = mat['fogMask'][0][:]
-        RCS_FR_355 = mat['RCS_FR_355'][:]
-        RCS_FR_532 = mat['RCS_FR_532'][:]
-        RCS_FR_1064 = mat['RCS_FR_1064'][:]
-        RCS_NR_355 = mat['RCS_NR_355'][:]
-        RCS_NR_532 = mat['RCS_NR_532'][:]
-        volDepol_355 = mat['volDepol_355'][:]
-        volDepol_532 = mat['volDepol_532'][:]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        RCS355FRColorRange = mat['RCS355FRColorRange'][:][0]
-        yLim_FR_RCS = mat['yLim_FR_RCS'][:][0]
-        yLim_NR_RCS = mat['yLim_NR_RCS'][:][0]
-        yLim_FR_DR = mat['yLim_FR_DR'][:][0]
-        RCS532FRColorRange = mat['RCS532FRColorRange'][:][0]
-        RCS1064FRColorRange = mat['RCS1064FRColorRange'][:][0]
-        RCS355NRColorRange = mat['RCS355NRColorRange'][:][0]
-        RCS532NRColorRange = mat['RCS532NRColorRange'][:][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'mTime': 'vector',
+            'height': 'vector',
+            'depCalMask': 'vector',
+            'fogMask': 'vector',
+            'RCS_FR_355': 'array',
+            'RCS_FR_532': 'array',
+            'RCS_FR_1064': 'array',
+            'RCS_NR_355': 'array',
+            'RCS_NR_532': 'array',
+            'volDepol_355': 'array',
+            'volDepol_532': 'array',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'processInfo.results_folder': 'string',
+            'taskInfo.dataFilename': 'string',
+            'RCS355FRColorRange': 'vector',
+            'yLim_FR_RCS': 'vector',
+            'yLim_NR_RCS': 'vector',
+            'yLim_FR_DR': 'vector',
+            'RCS532FRColorRange': 'vector',
+            'RCS1064FRColorRange': 'vector',
+            'RCS355NRColorRange': 'vector',
+            'RCS532NRColorRange': 'vector',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string',
+            'processInfo': 'struct'
+            }, optional=['processInfo.results_folder'])
+        figDPI = mat['figDPI']
+        mTime = mat['mTime']
+        height = mat['height']
+        depCalMask = mat['depCalMask']
+        fogMask = mat['fogMask']
+        RCS_FR_355 = mat['RCS_FR_355']
+        RCS_FR_532 = mat['RCS_FR_532']
+        RCS_FR_1064 = mat['RCS_FR_1064']
+        RCS_NR_355 = mat['RCS_NR_355']
+        RCS_NR_532 = mat['RCS_NR_532']
+        volDepol_355 = mat['volDepol_355']
+        volDepol_532 = mat['volDepol_532']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        resultsFolder = mat.get('processInfo.results_folder', '')
+        dataFilename = mat['taskInfo.dataFilename']
+        RCS355FRColorRange = mat['RCS355FRColorRange']
+        yLim_FR_RCS = mat['yLim_FR_RCS']
+        yLim_NR_RCS = mat['yLim_NR_RCS']
+        yLim_FR_DR = mat['yLim_FR_DR']
+        RCS532FRColorRange = mat['RCS532FRColorRange']
+        RCS1064FRColorRange = mat['RCS1064FRColorRange']
+        RCS355NRColorRange = mat['RCS355NRColorRange']
+        RCS532NRColorRange = mat['RCS532NRColorRange']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
+        set_render_cache(mat['processInfo'])
+        nWorkers = figure_workers(mat['processInfo'])
+        appendHours = quicklook_append_hours(mat['processInfo'])
+        flagComposite = daily_composite_enabled(mat['processInfo'])
+        flagTiles = tile_pyramid_enabled(mat['processInfo'])
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
         return
 
+    # the append states and the chunk files are kept in the results folder.
+    # Without it, they would be written relative to the working directory.
+    if (appendHours or flagComposite) and (not resultsFolder):
+        print('Warning: results_folder is not set. The quicklooks are ' +
+              'drawn without appending and daily composites.')
+        appendHours = 0
+        flagComposite = False
+
     # set the default font
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # meshgrid
-    Time, Height = np.meshgrid(mTime, height)
-    depCalMask = np.tile(depCalMask, (RCS_FR_1064.shape[0], 1))
-    fogMask = np.tile(fogMask, (RCS_FR_1064.shape[0], 1))
-
     # define the colormap
     cmap = plt.cm.jet
     cmap.set_bad('k', alpha=1)
     cmap.set_over('w', alpha=1)
     cmap.set_under('k', alpha=1)
 
-    # display 355 FR
-    # filter out the invalid values
-    RCS_FR_355 = np.ma.masked_where(depCalMask != 0, RCS_FR_355)
-    RCS_FR_355 = np.ma.masked_where(fogMask == 1, RCS_FR_355)
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, RCS_FR_355/1e6,
-        vmin=RCS355FRColorRange[0],
-        vmax=RCS355FRColorRange[1],
-        cmap=cmap, rasterized=True
-        )
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+    data = {
+        'time': mTime,
+        'height': height,
+        'profileMask': profile_mask(depCalMask != 0, fogMask == 1),
+        'RCS_FR_355': RCS_FR_355,
+        'RCS_FR_532': RCS_FR_532,
+        'RCS_FR_1064': RCS_FR_1064,
+        'RCS_NR_355': RCS_NR_355,
+        'RCS_NR_532': RCS_NR_532,
+        'volDepol_355': volDepol_355,
+        'volDepol_532': volDepol_532,
+        'cmap': cmap,
+        'xtick': xtick.tolist(),
+        'xticklabel': xticklabel,
+        'date': datenum_to_datetime(mTime[0]).strftime("%Y-%m-%d"),
+        'version': version,
+        'pollyVersion': pollyVersion,
+        'figDPI': figDPI,
+        'figSize': [10, 5],
+        'axPosition': [0.11, 0.15, 0.79, 0.75],
+        'saveFolder': saveFolder,
+        'dataFilename': rmext(dataFilename),
+        'imgFormat': imgFormat,
+        'appendHours': appendHours,
+        'stateFolder': os.path.join(
+            resultsFolder, pollyVersion, 'quicklook_append'),
+        'composite': flagComposite,
+        'tiles': flagTiles,
+        'dayLim': day_limits(mTime),
+        'compositeFolder': composite_folder(
+            resultsFolder, pollyVersion, day_limits(mTime))
+    }
+
+    # specification of each figure
+    figures = []
+    for wave, cRange in zip(
+            [355, 532, 1064],
+            [RCS355FRColorRange, RCS532FRColorRange, RCS1064FRColorRange]):
+        figures.append({
+            'var': 'RCS_FR_{0}'.format(wave),
+            'scale': 1e-6,
+            'cRange': cRange,
+            'yLim': yLim_FR_RCS,
+            'yLocator': [2500, 500],
+            'title': 'Range-Corrected Signal at {wave}nm'.format(wave=wave) +
+                     ' Far-Range from {instrument} at {location}'.format(
+                        instrument=pollyVersion, location=location),
+            'cbarTicks': None,
+            'cbarTitle': '[a.u.]',
+            'tag': 'RCS_FR_{0}'.format(wave)
+        })
+    for wave, cRange in zip(
+            [355, 532], [RCS355NRColorRange, RCS532NRColorRange]):
+        figures.append({
+            'var': 'RCS_NR_{0}'.format(wave),
+            'scale': 1e-6,
+            'cRange': cRange,
+            'yLim': yLim_NR_RCS,
+            'yLocator': [1000, 200],
+            'title': 'Range-Corrected Signal at {wave}nm'.format(wave=wave) +
+                     ' Near-Range from {instrument} at {location}'.format(
+                        instrument=pollyVersion, location=location),
+            'cbarTicks': None,
+            'cbarTitle': '[a.u.]',
+            'tag': 'RCS_NR_{0}'.format(wave)
+        })
+    for wave in [532, 355]:
+        figures.append({
+            'var': 'volDepol_{0}'.format(wave),
+            'scale': 1,
+            'cRange': [0.0, 0.3],
+            'yLim': yLim_FR_DR,
+            'yLocator': [2500, 500],
+            'title': 'Volume Depolarization Ratio at {wave}nm'.format(
+                        wave=wave) +
+                     ' from {instrument} at {location}'.format(
+                        instrument=pollyVersion, location=location),
+            'cbarTicks': np.arange(0, 0.41, 0.05),
+            'cbarTitle': '',
+            'tag': 'VDR_{0}'.format(wave)
+        })
 
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim([yLim_FR_RCS[0], yLim_FR_RCS[1]])
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+    try:
+        render_figures(_display_rcs_figure, data, figures, nWorkers)
+    finally:
+        release_templates()
 
-    ax.set_title(
-        'Range-Corrected Signal at {wave}nm'.format(wave=355) +
-        ' Far-Range from {instrument} at {location}'.format(
-            instrument=pollyVersion, location=location), fontsize=15)
 
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(
-        pcmesh, cax=cb_ax, orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=12, pad=5, )
-    cbar.ax.set_title('[a.u.]', fontsize=12)
+def _build_rcs_template(data, figure, time, height, matrix):
+    """
+    Build the figure template for all the range-corrected signal and volume
+    depolarization ratio figures.
+    """
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_RCS_FR_355.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
-    plt.close()
-
-    # display 532 FR
-    # filter out the invalid values
-    RCS_FR_532 = np.ma.masked_where(depCalMask != 0, RCS_FR_532)
-    RCS_FR_532 = np.ma.masked_where(fogMask == 1, RCS_FR_532)
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, RCS_FR_532/1e6,
-        vmin=RCS532FRColorRange[0],
-        vmax=RCS532FRColorRange[1],
-        cmap=cmap,
-        rasterized=True)
+    fig = plt.figure(figsize=data['figSize'])
+    ax = fig.add_axes(data['axPosition'])
+    mesh = TimeHeightMesh(
+        ax, time, height, matrix,
+        vmin=figure['cRange'][0],
+        vmax=figure['cRange'][1],
+        cmap=data['cmap'], rasterized=True
+        )
     ax.set_xlabel('UTC', fontsize=15)
     ax.set_ylabel('Height (m)', fontsize=15)
 
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim([yLim_FR_RCS[0], yLim_FR_RCS[1]])
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticks(data['xtick'])
+    ax.set_xticklabels(data['xticklabel'])
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
     ax.tick_params(axis='both', which='minor', width=1.5,
                    length=3.5, right=True, top=True)
 
-    ax.set_title(
-        'Range-Corrected Signal at {wave}nm'.format(wave=532) +
-        ' Far-Range from {instrument} at {location}'.format(
-            instrument=pollyVersion, location=location), fontsize=15)
-
     cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
     cbar = fig.colorbar(
-        pcmesh, cax=cb_ax, orientation='vertical')
+        mesh.mappable, cax=cb_ax, ticks=figure['cbarTicks'],
+        orientation='vertical')
     cbar.ax.tick_params(direction='in', labelsize=12, pad=5)
-    cbar.ax.set_title('[a.u.]', fontsize=12)
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
+    fig.text(0.05, 0.04, data['date'], fontsize=15)
     fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_RCS_FR_532.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
-    plt.close()
-
-    # display 1064 FR
-    # filter out the invalid values
-    RCS_FR_1064 = np.ma.masked_where(depCalMask != 0, RCS_FR_1064)
-    RCS_FR_1064 = np.ma.masked_where(fogMask == 1, RCS_FR_1064)
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, RCS_FR_1064/1e6,
-        vmin=RCS1064FRColorRange[0],
-        vmax=RCS1064FRColorRange[1],
-        cmap=cmap,
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+        version=data['version']), fontsize=14)
 
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim([yLim_FR_RCS[0], yLim_FR_RCS[1]])
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Range-Corrected Signal at {wave}nm'.format(wave=1064) +
-        ' Far-Range from {instrument} at {location}'.format(
-            instrument=pollyVersion, location=location), fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(
-        pcmesh, cax=cb_ax, orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=12, pad=5)
-    cbar.ax.set_title('[a.u.]', fontsize=12)
+    return {'fig': fig, 'ax': ax, 'mesh': mesh, 'cbar': cbar}
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_RCS_FR_1064.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
-    plt.close()
-
-    # display 355 NR
-    # filter out the invalid values
-    RCS_NR_355 = np.ma.masked_where(depCalMask != 0, RCS_NR_355)
-    RCS_NR_355 = np.ma.masked_where(fogMask == 1, RCS_NR_355)
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, RCS_NR_355/1e6,
-        vmin=RCS355NRColorRange[0],
-        vmax=RCS355NRColorRange[1],
-        cmap=cmap,
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
 
-    ax.yaxis.set_major_locator(MultipleLocator(1000))
-    ax.yaxis.set_minor_locator(MultipleLocator(200))
-    ax.set_ylim([yLim_NR_RCS[0], yLim_NR_RCS[1]])
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Range-Corrected Signal at {wave}nm'.format(wave=355) +
-        ' Near-Range from {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location
-            ), fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(
-        pcmesh, cax=cb_ax, orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=12, pad=5)
-    cbar.ax.set_title('[a.u.]', fontsize=12)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_RCS_NR_355.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-            )), dpi=figDPI)
-    plt.close()
-
-    # display 532 NR
-    # filter out the invalid values
-    RCS_NR_532 = np.ma.masked_where(depCalMask != 0, RCS_NR_532)
-    RCS_NR_532 = np.ma.masked_where(fogMask == 1, RCS_NR_532)
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, RCS_NR_532/1e6,
-        vmin=RCS532NRColorRange[0],
-        vmax=RCS532NRColorRange[1],
-        cmap=cmap,
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.yaxis.set_major_locator(MultipleLocator(1000))
-    ax.yaxis.set_minor_locator(MultipleLocator(200))
-    ax.set_ylim([yLim_NR_RCS[0], yLim_NR_RCS[1]])
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+def _display_rcs_figure(data, figure):
+    """
+    Display one range-corrected signal or volume depolarization ratio figure.
 
-    ax.set_title(
-        'Range-Corrected Signal at {wave}nm'.format(wave=532) +
-        ' Near-Range from {instrument} at {location}'.format(
-            instrument=pollyVersion, location=location), fontsize=15)
+    Parameters
+    ----------
+    data: dict
+        input arrays and settings shared by all the figures.
+    figure: dict
+        specification of the figure. (see `pollyxt_display_rcs`)
+    """
 
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(
-        pcmesh, cax=cb_ax, orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=12, pad=5)
-    cbar.ax.set_title('[a.u.]', fontsize=12)
+    # fixed time axis of the near-real-time quicklooks
+    timeLim = None
+    if data['appendHours']:
+        timeLim = [data['time'][0],
+                   data['time'][0] + data['appendHours'] / 24]
+
+    # crop to the y-limits, reduce to the pixels of the axes and filter out
+    # the invalid values
+    time, height, matrix = decimate(
+        data['time'], data['height'], data[figure['var']], figure['yLim'],
+        axes_pixels(data['figSize'], data['axPosition'], data['figDPI']),
+        masks=[data['profileMask']], scale=figure['scale'], timeLim=timeLim)
+
+    # only the data, color limits, axis range and title will be updated
+    template = figure_template(
+        'rcs', _build_rcs_template, data, figure, time, height, matrix)
+    _update_rcs_template(template, figure, time, height, matrix)
+
+    filename = os.path.join(
+        data['saveFolder'], '{dataFilename}_{tag}.{imgFmt}'.format(
+            dataFilename=data['dataFilename'],
+            tag=figure['tag'],
+            imgFmt=data['imgFormat']
+        ))
+    frameKey = (data['pollyVersion'], figure['tag'], data['figDPI'])
+    if timeLim is None:
+        save_quicklook(template['fig'], template['mesh'], filename,
+                       data['figDPI'], frameKey=frameKey)
+    else:
+        # only the new profiles are colored
+        append_quicklook(
+            template['fig'], template['mesh'], filename, data['figDPI'],
+            os.path.join(
+                data['stateFolder'], '{dataFilename}_{tag}.npz'.format(
+                    dataFilename=data['dataFilename'], tag=figure['tag'])),
+            data['time'][-1], frameKey=frameKey)
+
+    if data['tiles']:
+        save_tile_pyramid(
+            os.path.join(
+                data['saveFolder'], '{dataFilename}_{tag}_tiles'.format(
+                    dataFilename=data['dataFilename'], tag=figure['tag'])),
+            data['time'], data['height'], data[figure['var']],
+            figure['yLim'], data['cmap'], figure['cRange'],
+            masks=[data['profileMask']], scale=figure['scale'],
+            metadata={'product': figure['tag'], 'title': figure['title'],
+                      'unit': figure['cbarTitle']})
+
+    if data['composite']:
+        _display_rcs_composite(data, figure)
+
+
+def _update_rcs_template(template, figure, time, height, matrix):
+    """
+    Update the data, color limits, axis range and title of the template.
+    """
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_RCS_NR_532.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
-    plt.close()
-
-    # display voldepol 532
-    # filter out the invalid values
-    volDepol_532 = np.ma.masked_where(depCalMask != 0, volDepol_532)
-    volDepol_532 = np.ma.masked_where(fogMask == 1, volDepol_532)
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, volDepol_532,
-        vmin=0.0, vmax=0.3, cmap=cmap, rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+    ax = template['ax']
 
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim([yLim_FR_DR[0], yLim_FR_DR[1]])
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+    if figure['cbarTicks'] is None:
+        template['cbar'].locator = AutoLocator()
+    else:
+        template['cbar'].locator = FixedLocator(figure['cbarTicks'])
+    template['mesh'].set_data(matrix, time, height)
+    template['mesh'].mappable.set_clim(
+        figure['cRange'][0], figure['cRange'][1])
 
-    ax.set_title(
-        'Volume Depolarization Ratio at {wave}nm'.format(wave=532) +
-        ' from {instrument} at {location}'.format(
-            instrument=pollyVersion, location=location), fontsize=15)
+    ax.yaxis.set_major_locator(MultipleLocator(figure['yLocator'][0]))
+    ax.yaxis.set_minor_locator(MultipleLocator(figure['yLocator'][1]))
+    ax.set_ylim([figure['yLim'][0], figure['yLim'][1]])
+    ax.set_title(figure['title'], fontsize=15)
 
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=np.arange(
-        0, 0.41, 0.05), orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=12, pad=5)
-    cbar.ax.set_title('', fontsize=12)
+    template['cbar'].ax.set_title(figure['cbarTitle'], fontsize=12)
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-    fig.savefig(
-        os.path.join(
-            saveFolder, '{dataFilename}_VDR_532.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat)), dpi=figDPI)
-    plt.close()
-
-    # display voldepol 355
-    # filter out the invalid values
-    volDepol_355 = np.ma.masked_where(depCalMask != 0, volDepol_355)
-    volDepol_355 = np.ma.masked_where(fogMask == 1, volDepol_355)
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, volDepol_355,
-        vmin=0.0, vmax=0.3, cmap=cmap, rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
 
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_ylim([yLim_FR_DR[0], yLim_FR_DR[1]])
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+def _display_rcs_composite(data, figure):
+    """
+    Save the product of the current file as chunk of the day and display the
+    24-hour composite of all the chunks of the day.
+    """
 
-    ax.set_title(
-        'Volume Depolarization Ratio at {wave}nm'.format(wave=355) +
-        ' from {instrument} at {location}'.format(
-            instrument=pollyVersion, location=location), fontsize=15)
+    save_chunk(
+        data['compositeFolder'], figure['tag'], data['dataFilename'],
+        data['time'], data['height'], data[figure['var']], figure['yLim'],
+        axes_pixels(data['figSize'], data['axPosition'], data['figDPI']),
+        data['dayLim'], masks=[data['profileMask']], scale=figure['scale'])
 
-    cb_ax = fig.add_axes([0.92, 0.20, 0.02, 0.65])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=np.arange(
-        0, 0.41, 0.05), orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=12, pad=5)
-    cbar.ax.set_title('', fontsize=12)
+    time, height, matrix = load_composite(
+        data['compositeFolder'], figure['tag'])
+    if matrix is None:
+        return
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-    fig.savefig(
-        os.path.join(
-            saveFolder, '{dataFilename}_VDR_355.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat)), dpi=figDPI)
-    plt.close()
+    xtick, xticklabel = daily_xticks(data['dayLim'])
+    template = figure_template(
+        'rcs_daily', _build_rcs_template,
+        dict(data, xtick=xtick, xticklabel=xticklabel), figure,
+        time, height, matrix)
+    _update_rcs_template(template, figure, time, height, matrix)
+
+    filename = os.path.join(
+        data['saveFolder'],
+        '{date}_{pollyVersion}_{tag}_daily.{imgFmt}'.format(
+            date=data['date'].replace('-', '_'),
+            pollyVersion=data['pollyVersion'],
+            tag=figure['tag'],
+            imgFmt=data['imgFormat']
+        ))
+    save_quicklook(
+        template['fig'], template['mesh'], filename, data['figDPI'],
+        frameKey=(data['pollyVersion'], figure['tag'] + '_daily',
+                  data['figDPI']))
 
 
 def main():
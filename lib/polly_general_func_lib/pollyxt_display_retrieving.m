@@ -6,6 +6,7 @@ function pollyxt_display_retrieving(data, taskInfo, config)
 %   data, taskInfo, config
 %History:
 %   2018-12-30. First Edition by Zhenping
+%   2026-10-17. Display all the cloud free groups with one python call.
 %Contact:
 %   zhenping@tropos.de
 
@@ -19,6 +20,10 @@ flagChannel355_NR = config.isNR & config.is355nm & config.isTot;
 flagChannel532_NR = config.isNR & config.is532nm & config.isTot;
 imgFormat = config.imgFormat;
 
+%% profiles of all the cloud free groups for python display (group x height)
+pyGroupVars = {'startIndx', 'endIndx', 'rcs355', 'rcs532', 'rcs1064', 'molRCS355', 'molRCS532', 'molRCS1064', 'refHIndx355', 'refHIndx532', 'refHIndx1064', 'aerBsc_355_klett', 'aerBsc_532_klett', 'aerBsc_1064_klett', 'aerBsc355_NR_klett', 'aerBsc532_NR_klett', 'aerBsc_355_raman', 'aerBsc_532_raman', 'aerBsc_1064_raman', 'aerBsc355_NR_raman', 'aerBsc532_NR_raman', 'aerBsc_355_aeronet', 'aerBsc_532_aeronet', 'aerBsc_1064_aeronet', 'aerExt_355_klett', 'aerExt_532_klett', 'aerExt_1064_klett', 'aerExt355_NR_klett', 'aerExt532_NR_klett', 'aerExt_355_raman', 'aerExt_532_raman', 'aerExt_1064_raman', 'aerExt355_NR_raman', 'aerExt532_NR_raman', 'aerExt_355_aeronet', 'aerExt_532_aeronet', 'aerExt_1064_aeronet', 'LR355_raman', 'LR532_raman', 'LR355_NR_raman', 'LR532_NR_raman', 'ang_bsc_355_532_klett', 'ang_bsc_532_1064_klett', 'ang_bsc_355_532_raman', 'ang_bsc_532_1064_raman', 'ang_ext_355_532_raman', 'ang_bsc_355_532_klett_NR', 'ang_bsc_355_532_raman_NR', 'ang_ext_355_532_raman_NR', 'voldepol355_klett', 'voldepol355_raman', 'voldepol532_klett', 'voldepol532_raman', 'pardepol355_klett', 'pardepol532_klett', 'pardepolStd355_klett', 'pardepolStd532_klett', 'pardepol355_raman', 'pardepol532_raman', 'pardepolStd355_raman', 'pardepolStd532_raman', 'wvmr', 'rh', 'rh_meteor', 'temperature', 'pressure'};
+pyProfiles = struct();
+
 %% data visualization for each cloud free period
 for iGroup = 1:size(data.cloudFreeGroups, 1)
     % read data
@@ -663,27 +668,62 @@ for iGroup = 1:size(data.cloudFreeGroups, 1)
         close();
 
     elseif strcmpi(processInfo.visualizationMode, 'python')
-        fprintf('Display the results with Python.\n');
-        pyFolder = fileparts(mfilename('fullpath'));   % folder of the python scripts for data visualization
-        tmpFolder = fullfile(parentFolder(mfilename('fullpath'), 3), 'tmp');
-        saveFolder = fullfile(processInfo.pic_folder, taskInfo.pollyVersion, datestr(data.mTime(1), 'yyyy'), datestr(data.mTime(1), 'mm'), datestr(data.mTime(1), 'dd'));
-
-        % create tmp folder by force, if it does not exist.
-        if ~ exist(tmpFolder, 'dir')
-            fprintf('Create the tmp folder to save the temporary results.\n');
-            mkdir(tmpFolder);
-        end
-        
-        %% display rcs 
-        tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'startIndx', 'endIndx', 'rcs355', 'rcs532', 'rcs1064', 'height', 'time', 'molRCS355', 'molRCS532', 'molRCS1064', 'refHIndx355', 'refHIndx532', 'refHIndx1064', 'aerBsc_355_klett', 'aerBsc_532_klett', 'aerBsc_1064_klett', 'aerBsc355_NR_klett', 'aerBsc532_NR_klett', 'aerBsc_355_raman', 'aerBsc_532_raman', 'aerBsc_1064_raman', 'aerBsc355_NR_raman', 'aerBsc532_NR_raman', 'aerBsc_355_aeronet', 'aerBsc_532_aeronet', 'aerBsc_1064_aeronet', 'aerExt_355_klett', 'aerExt_532_klett', 'aerExt_1064_klett', 'aerExt355_NR_klett', 'aerExt532_NR_klett', 'aerExt_355_raman', 'aerExt_532_raman', 'aerExt_1064_raman', 'aerExt355_NR_raman', 'aerExt532_NR_raman', 'aerExt_355_aeronet', 'aerExt_532_aeronet', 'aerExt_1064_aeronet', 'LR355_raman', 'LR532_raman', 'LR355_NR_raman', 'LR532_NR_raman', 'ang_bsc_355_532_klett', 'ang_bsc_532_1064_klett', 'ang_bsc_355_532_raman', 'ang_bsc_532_1064_raman', 'ang_ext_355_532_raman', 'ang_bsc_355_532_klett_NR', 'ang_bsc_355_532_raman_NR', 'ang_ext_355_532_raman_NR', 'voldepol355_klett', 'voldepol355_raman', 'voldepol532_klett', 'voldepol532_raman', 'pardepol355_klett', 'pardepol532_klett', 'pardepolStd355_klett', 'pardepolStd532_klett', 'pardepol355_raman', 'pardepol532_raman', 'pardepolStd355_raman', 'pardepolStd532_raman', 'wvmr', 'flagWVCalibration', 'flagWVCalibration', 'rh', 'rh_meteor', 'meteorSource', 'temperature', 'pressure', 'processInfo', 'campaignInfo', 'taskInfo', 'yLim_Profi_Ext', 'yLim_Profi_LR', 'yLim_Profi_DR', 'yLim_Profi_Bsc', 'yLim_Profi_WV_RH', 'yLim_FR_RCS', 'yLim_NR_RCS', 'xLim_Profi_Bsc', 'xLim_Profi_NR_Bsc', 'xLim_Profi_Ext', 'xLim_Profi_NR_Ext', 'xLim_Profi_WV_RH', 'xLim_Profi_RCS', 'xLim_Profi_LR', 'imgFormat', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_retrieving.py'), tmpFile, saveFolder));
-        if flag ~= 0
-            warning('Error in executing %s', 'pollyxt_display_retrieving.py');
+        % collect the profiles of each group. All the groups will be displayed
+        % with one python call.
+        for iVar = 1:length(pyGroupVars)
+            pyProfiles.(pyGroupVars{iVar})(iGroup, :) = eval(pyGroupVars{iVar});
         end
-        delete(tmpFile);
+        pyProfiles.meteorSource{iGroup, 1} = meteorSource;
     else
         error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
     end
 
+end
+
+%% display all the cloud free groups with python
+nGroups = size(data.cloudFreeGroups, 1);
+if strcmpi(processInfo.visualizationMode, 'python') && (nGroups > 0)
+    fprintf('Display the results with Python.\n');
+    pyFolder = fileparts(mfilename('fullpath'));   % folder of the python scripts for data visualization
+    tmpFolder = fullfile(parentFolder(mfilename('fullpath'), 3), 'tmp');
+    saveFolder = fullfile(processInfo.pic_folder, taskInfo.pollyVersion, datestr(data.mTime(1), 'yyyy'), datestr(data.mTime(1), 'mm'), datestr(data.mTime(1), 'dd'));
+
+    % create tmp folder by force, if it does not exist.
+    if ~ exist(tmpFolder, 'dir')
+        fprintf('Create the tmp folder to save the temporary results.\n');
+        mkdir(tmpFolder);
+    end
+
+    % settings shared by all the groups
+    pyProfiles.nGroups = nGroups;
+    pyProfiles.figDPI = figDPI;
+    pyProfiles.height = height;
+    pyProfiles.time = time;
+    pyProfiles.flagWVCalibration = flagWVCalibration;
+    pyProfiles.processInfo = processInfo;
+    pyProfiles.campaignInfo = campaignInfo;
+    pyProfiles.taskInfo = taskInfo;
+    pyProfiles.yLim_Profi_Ext = yLim_Profi_Ext;
+    pyProfiles.yLim_Profi_LR = yLim_Profi_LR;
+    pyProfiles.yLim_Profi_DR = yLim_Profi_DR;
+    pyProfiles.yLim_Profi_Bsc = yLim_Profi_Bsc;
+    pyProfiles.yLim_Profi_WV_RH = yLim_Profi_WV_RH;
+    pyProfiles.yLim_FR_RCS = yLim_FR_RCS;
+    pyProfiles.yLim_NR_RCS = yLim_NR_RCS;
+    pyProfiles.xLim_Profi_Bsc = xLim_Profi_Bsc;
+    pyProfiles.xLim_Profi_NR_Bsc = xLim_Profi_NR_Bsc;
+    pyProfiles.xLim_Profi_Ext = xLim_Profi_Ext;
+    pyProfiles.xLim_Profi_NR_Ext = xLim_Profi_NR_Ext;
+    pyProfiles.xLim_Profi_WV_RH = xLim_Profi_WV_RH;
+    pyProfiles.xLim_Profi_RCS = xLim_Profi_RCS;
+    pyProfiles.xLim_Profi_LR = xLim_Profi_LR;
+    pyProfiles.imgFormat = imgFormat;
+
+    %% display all the groups
+    tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
+    save(tmpFile, '-struct', 'pyProfiles', '-v6');
+    flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_retrieving.py'), tmpFile, saveFolder);
+    if flag ~= 0
+        warning('Error in executing %s', 'pollyxt_display_retrieving.py');
+    end
 end
\ No newline at end of file
@@ -1,8 +1,6 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,6 +9,37 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_parallel import render_figures, figure_workers
+from polly_cache import set_render_cache, save_figure
+from polly_handoff import load_variables
+from polly_time import datenum_to_datetime
+
+# profiles of each cloud free group, which are saved as
+# (group x height) arrays in the .mat file
+GROUP_PROFILES = [
+    'rcs355', 'rcs532', 'rcs1064', 'molRCS355', 'molRCS532', 'molRCS1064',
+    'refHIndx355', 'refHIndx532', 'refHIndx1064', 'aerBsc_355_klett',
+    'aerBsc_532_klett', 'aerBsc_1064_klett', 'aerBsc355_NR_klett',
+    'aerBsc532_NR_klett', 'aerBsc_355_raman', 'aerBsc_532_raman',
+    'aerBsc_1064_raman', 'aerBsc355_NR_raman', 'aerBsc532_NR_raman',
+    'aerBsc_355_aeronet', 'aerBsc_532_aeronet', 'aerBsc_1064_aeronet',
+    'aerExt_355_klett', 'aerExt_532_klett', 'aerExt_1064_klett',
+    'aerExt355_NR_klett', 'aerExt532_NR_klett', 'aerExt_355_raman',
+    'aerExt_532_raman', 'aerExt_1064_raman', 'aerExt355_NR_raman',
+    'aerExt532_NR_raman', 'aerExt_355_aeronet', 'aerExt_532_aeronet',
+    'aerExt_1064_aeronet', 'LR355_raman', 'LR532_raman', 'LR355_NR_raman',
+    'LR532_NR_raman', 'ang_bsc_355_532_klett', 'ang_bsc_532_1064_klett',
+    'ang_bsc_355_532_klett_NR', 'ang_bsc_355_532_raman',
+    'ang_bsc_532_1064_raman', 'ang_ext_355_532_raman',
+    'ang_ext_355_532_raman_NR', 'ang_bsc_355_532_raman_NR',
+    'voldepol355_klett', 'voldepol532_klett', 'voldepol355_raman',
+    'voldepol532_raman', 'pardepol355_klett', 'pardepol532_klett',
+    'pardepolStd355_klett', 'pardepolStd532_klett', 'pardepol355_raman',
+    'pardepol532_raman', 'pardepolStd355_raman', 'pardepolStd532_raman',
+    'wvmr', 'rh', 'rh_meteor', 'temperature', 'pressure'
+    ]
+
 
 def celltolist(xtickstr):
     """
@@ -33,44 +62,39 @@ def celltolist(xtickstr):
     return tmp
 
 
-def datenum_to_datetime(datenum):
+def rmext(filename):
     """
-    Convert Matlab datenum into Python datetime.
+    remove the file extension.
 
     Parameters
     ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
+    filename: str
     """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
 
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+    file, _ = os.path.splitext(filename)
+    return file
 
 
-def rmext(filename):
+def read_group_str(matStr, iGroup):
     """
-    remove the file extension.
+    read the string of the given group.
 
     Parameters
     ----------
-    filename: str
+    matStr: ndarray
+        char array (single group) or cell array (multiple groups) from
+        `scipy.io.loadmat`.
+    iGroup: int
+        index of the group.
     """
 
-    file, _ = os.path.splitext(filename)
-    return file
+    if matStr.dtype == object:
+        matStr = matStr[iGroup][0]
+
+    if not len(matStr):
+        return ''
+
+    return matStr[0]
 
 
 def pollyxt_display_retrieving(tmpFile, saveFolder):
@@ -78,6 +102,8 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     Description
     -----------
     Display the profiles of aerosol optical properties and meteorological data.
+    All the cloud free groups in the .mat file will be displayed (in parallel
+    with 'pyFigureWorkers' in the processInfo).
 
     Parameters
     ----------
@@ -93,6 +119,10 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Display all the cloud free groups from one .mat file.
+    2026-10-17. Read only the declared variables with 'load_variables'.
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Reuse the unchanged figures with 'pyRenderCacheFolder'.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,99 +131,87 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        startIndx = mat['startIndx'][:][0][0]
-        endIndx = mat['endIndx'][:][0][0]
-        rcs355 = mat['rcs355'][:][0]
-        rcs532 = mat['rcs532'][:][0]
-        rcs1064 = mat['rcs1064'][:][0]
-        height = mat['height'][:][0]
-        time = mat['time'][:][0]
-        molRCS355 = mat['molRCS355'][:][0]
-        molRCS532 = mat['molRCS532'][:][0]
-        molRCS1064 = mat['molRCS1064'][:][0]
-        refHIndx355 = mat['refHIndx355'][:][0]
-        refHIndx532 = mat['refHIndx532'][:][0]
-        refHIndx1064 = mat['refHIndx1064'][:][0]
-        aerBsc_355_klett = mat['aerBsc_355_klett'][:][0]
-        aerBsc_532_klett = mat['aerBsc_532_klett'][:][0]
-        aerBsc_1064_klett = mat['aerBsc_1064_klett'][:][0]
-        aerBsc355_NR_klett = mat['aerBsc355_NR_klett'][:][0]
-        aerBsc532_NR_klett = mat['aerBsc532_NR_klett'][:][0]
-        aerBsc_355_raman = mat['aerBsc_355_raman'][:][0]
-        aerBsc_532_raman = mat['aerBsc_532_raman'][:][0]
-        aerBsc_1064_raman = mat['aerBsc_1064_raman'][:][0]
-        aerBsc355_NR_raman = mat['aerBsc355_NR_raman'][:][0]
-        aerBsc532_NR_raman = mat['aerBsc532_NR_raman'][:][0]
-        aerBsc_355_aeronet = mat['aerBsc_355_aeronet'][:][0]
-        aerBsc_532_aeronet = mat['aerBsc_532_aeronet'][:][0]
-        aerBsc_1064_aeronet = mat['aerBsc_1064_aeronet'][:][0]
-        aerExt_355_klett = mat['aerExt_355_klett'][:][0]
-        aerExt_532_klett = mat['aerExt_532_klett'][:][0]
-        aerExt_1064_klett = mat['aerExt_1064_klett'][:][0]
-        aerExt355_NR_klett = mat['aerExt355_NR_klett'][:][0]
-        aerExt532_NR_klett = mat['aerExt532_NR_klett'][:][0]
-        aerExt_355_raman = mat['aerExt_355_raman'][:][0]
-        aerExt_532_raman = mat['aerExt_532_raman'][:][0]
-        aerExt_1064_raman = mat['aerExt_1064_raman'][:][0]
-        aerExt355_NR_raman = mat['aerExt355_NR_raman'][:][0]
-        aerExt532_NR_raman = mat['aerExt532_NR_raman'][:][0]
-        aerExt_355_aeronet = mat['aerExt_355_aeronet'][:][0]
-        aerExt_532_aeronet = mat['aerExt_532_aeronet'][:][0]
-        aerExt_1064_aeronet = mat['aerExt_1064_aeronet'][:][0]
-        LR355_raman = mat['LR355_raman'][:][0]
-        LR532_raman = mat['LR532_raman'][:][0]
-        LR355_NR_raman = mat['LR355_NR_raman'][:][0]
-        LR532_NR_raman = mat['LR532_NR_raman'][:][0]
-        ang_bsc_355_532_klett = mat['ang_bsc_355_532_klett'][:][0]
-        ang_bsc_532_1064_klett = mat['ang_bsc_532_1064_klett'][:][0]
-        ang_bsc_355_532_klett_NR = mat['ang_bsc_355_532_klett_NR'][:][0]
-        ang_bsc_355_532_raman = mat['ang_bsc_355_532_raman'][:][0]
-        ang_bsc_532_1064_raman = mat['ang_bsc_532_1064_raman'][:][0]
-        ang_ext_355_532_raman = mat['ang_ext_355_532_raman'][:][0]
-        ang_ext_355_532_raman_NR = mat['ang_ext_355_532_raman_NR'][:][0]
-        ang_bsc_355_532_raman_NR = mat['ang_bsc_355_532_raman_NR'][:][0]
-        voldepol355_klett = mat['voldepol355_klett'][:][0]
-        voldepol532_klett = mat['voldepol532_klett'][:][0]
-        voldepol355_raman = mat['voldepol355_raman'][:][0]
-        voldepol532_raman = mat['voldepol532_raman'][:][0]
-        pardepol355_klett = mat['pardepol355_klett'][:][0]
-        pardepol532_klett = mat['pardepol532_klett'][:][0]
-        pardepolStd355_klett = mat['pardepolStd355_klett'][:][0]
-        pardepolStd532_klett = mat['pardepolStd532_klett'][:][0]
-        pardepol355_raman = mat['pardepol355_raman'][:][0]
-        pardepol532_raman = mat['pardepol532_raman'][:][0]
-        pardepolStd355_raman = mat['pardepolStd355_raman'][:][0]
-        pardepolStd532_raman = mat['pardepolStd532_raman'][:][0]
-        wvmr = mat['wvmr'][:][0]
-        flagWVCalibration = mat['flagWVCalibration'][:][0]
-        flagWVCalibration = mat['flagWVCalibration'][:][0]
-        rh = mat['rh'][:][0]
-        rh_meteor = mat['rh_meteor'][:][0]
-        meteorSource = mat['meteorSource'][:][0]
-        temperature = mat['temperature'][:][0]
-        pressure = mat['pressure'][:][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        yLim_Profi_Ext = mat['yLim_Profi_Ext'][:][0]
-        yLim_Profi_LR = mat['yLim_Profi_LR'][:][0]
-        yLim_Profi_DR = mat['yLim_Profi_DR'][:][0]
-        yLim_Profi_Bsc = mat['yLim_Profi_Bsc'][:][0]
-        yLim_Profi_WV_RH = mat['yLim_Profi_WV_RH'][:][0]
-        yLim_FR_RCS = mat['yLim_FR_RCS'][:][0]
-        yLim_NR_RCS = mat['yLim_NR_RCS'][:][0]
-        xLim_Profi_Bsc = mat['xLim_Profi_Bsc'][:][0]
-        xLim_Profi_NR_Bsc = mat['xLim_Profi_NR_Bsc'][:][0]
-        xLim_Profi_Ext = mat['xLim_Profi_Ext'][:][0]
-        xLim_Profi_NR_Ext = mat['xLim_Profi_NR_Ext'][:][0]
-        xLim_Profi_WV_RH = mat['xLim_Profi_WV_RH'][:][0]
-        xLim_Profi_RCS = mat['xLim_Profi_RCS'][:][0]
-        xLim_Profi_LR = mat['xLim_Profi_LR'][:][0]
-        imgFormat = mat['imgFormat'][:][0]
+        variables = {
+            'nGroups': 'scalar',
+            'startIndx': 'vector',
+            'endIndx': 'vector',
+            'meteorSource': 'array',
+            'figDPI': 'scalar',
+            'height': 'vector',
+            'time': 'vector',
+            'flagWVCalibration': 'string',
+            'yLim_Profi_Ext': 'vector',
+            'yLim_Profi_LR': 'vector',
+            'yLim_Profi_DR': 'vector',
+            'yLim_Profi_Bsc': 'vector',
+            'yLim_Profi_WV_RH': 'vector',
+            'yLim_FR_RCS': 'vector',
+            'yLim_NR_RCS': 'vector',
+            'xLim_Profi_Bsc': 'vector',
+            'xLim_Profi_NR_Bsc': 'vector',
+            'xLim_Profi_Ext': 'vector',
+            'xLim_Profi_NR_Ext': 'vector',
+            'xLim_Profi_WV_RH': 'vector',
+            'xLim_Profi_RCS': 'vector',
+            'xLim_Profi_LR': 'vector',
+            'imgFormat': 'string',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'processInfo': 'struct'
+        }
+        variables.update((varName, 'array') for varName in GROUP_PROFILES)
+        mat = load_variables(tmpFile, variables, optional=['nGroups'])
+
+        # all the cloud free groups were saved in one file. The files with a
+        # single group from older versions can also be displayed.
+        if 'nGroups' in mat:
+            nGroups = int(mat['nGroups'])
+        else:
+            nGroups = 1
+
+        groups = []
+        for iGroup in range(nGroups):
+            group = {
+                'startIndx': int(mat['startIndx'][iGroup]),
+                'endIndx': int(mat['endIndx'][iGroup]),
+                'meteorSource': read_group_str(mat['meteorSource'], iGroup)
+            }
+            for varName in GROUP_PROFILES:
+                group[varName] = mat[varName][iGroup]
+            groups.append(group)
+
+        data = {
+            'figDPI': mat['figDPI'],
+            'height': mat['height'],
+            'time': mat['time'],
+            'flagWVCalibration': mat['flagWVCalibration'],
+            'yLim_Profi_Ext': mat['yLim_Profi_Ext'],
+            'yLim_Profi_LR': mat['yLim_Profi_LR'],
+            'yLim_Profi_DR': mat['yLim_Profi_DR'],
+            'yLim_Profi_Bsc': mat['yLim_Profi_Bsc'],
+            'yLim_Profi_WV_RH': mat['yLim_Profi_WV_RH'],
+            'yLim_FR_RCS': mat['yLim_FR_RCS'],
+            'yLim_NR_RCS': mat['yLim_NR_RCS'],
+            'xLim_Profi_Bsc': mat['xLim_Profi_Bsc'],
+            'xLim_Profi_NR_Bsc': mat['xLim_Profi_NR_Bsc'],
+            'xLim_Profi_Ext': mat['xLim_Profi_Ext'],
+            'xLim_Profi_NR_Ext': mat['xLim_Profi_NR_Ext'],
+            'xLim_Profi_WV_RH': mat['xLim_Profi_WV_RH'],
+            'xLim_Profi_RCS': mat['xLim_Profi_RCS'],
+            'xLim_Profi_LR': mat['xLim_Profi_LR'],
+            'imgFormat': mat['imgFormat'],
+            'pollyVersion': mat['campaignInfo.name'],
+            'location': mat['campaignInfo.location'],
+            'version': mat['processInfo.programVersion'],
+            'dataFilename': mat['taskInfo.dataFilename'],
+            'saveFolder': saveFolder
+        }
+        fontname = mat['processInfo.fontname']
+        nWorkers = figure_workers(mat['processInfo'])
+        set_render_cache(mat['processInfo'])
 
     except Exception as e:
         print(e)
@@ -204,6 +222,115 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
+    # the figures of each group are independent
+    render_figures(_display_retrieving_group, data, groups, nWorkers)
+
+
+def _display_retrieving_group(data, group):
+    """
+    Display the profiles of one cloud free group.
+
+    Parameters
+    ----------
+    data: dict
+        settings and variables shared by all the groups.
+    group: dict
+        profiles of the cloud free group.
+    """
+
+    figDPI = data['figDPI']
+    height = data['height']
+    time = data['time']
+    flagWVCalibration = data['flagWVCalibration']
+    pollyVersion = data['pollyVersion']
+    location = data['location']
+    version = data['version']
+    dataFilename = data['dataFilename']
+    saveFolder = data['saveFolder']
+    yLim_Profi_Ext = data['yLim_Profi_Ext']
+    yLim_Profi_LR = data['yLim_Profi_LR']
+    yLim_Profi_DR = data['yLim_Profi_DR']
+    yLim_Profi_Bsc = data['yLim_Profi_Bsc']
+    yLim_Profi_WV_RH = data['yLim_Profi_WV_RH']
+    yLim_FR_RCS = data['yLim_FR_RCS']
+    yLim_NR_RCS = data['yLim_NR_RCS']
+    xLim_Profi_Bsc = data['xLim_Profi_Bsc']
+    xLim_Profi_NR_Bsc = data['xLim_Profi_NR_Bsc']
+    xLim_Profi_Ext = data['xLim_Profi_Ext']
+    xLim_Profi_NR_Ext = data['xLim_Profi_NR_Ext']
+    xLim_Profi_WV_RH = data['xLim_Profi_WV_RH']
+    xLim_Profi_RCS = data['xLim_Profi_RCS']
+    xLim_Profi_LR = data['xLim_Profi_LR']
+    imgFormat = data['imgFormat']
+
+    startIndx = group['startIndx']
+    endIndx = group['endIndx']
+    meteorSource = group['meteorSource']
+    rcs355 = group['rcs355']
+    rcs532 = group['rcs532']
+    rcs1064 = group['rcs1064']
+    molRCS355 = group['molRCS355']
+    molRCS532 = group['molRCS532']
+    molRCS1064 = group['molRCS1064']
+    refHIndx355 = group['refHIndx355']
+    refHIndx532 = group['refHIndx532']
+    refHIndx1064 = group['refHIndx1064']
+    aerBsc_355_klett = group['aerBsc_355_klett']
+    aerBsc_532_klett = group['aerBsc_532_klett']
+    aerBsc_1064_klett = group['aerBsc_1064_klett']
+    aerBsc355_NR_klett = group['aerBsc355_NR_klett']
+    aerBsc532_NR_klett = group['aerBsc532_NR_klett']
+    aerBsc_355_raman = group['aerBsc_355_raman']
+    aerBsc_532_raman = group['aerBsc_532_raman']
+    aerBsc_1064_raman = group['aerBsc_1064_raman']
+    aerBsc355_NR_raman = group['aerBsc355_NR_raman']
+    aerBsc532_NR_raman = group['aerBsc532_NR_raman']
+    aerBsc_355_aeronet = group['aerBsc_355_aeronet']
+    aerBsc_532_aeronet = group['aerBsc_532_aeronet']
+    aerBsc_1064_aeronet = group['aerBsc_1064_aeronet']
+    aerExt_355_klett = group['aerExt_355_klett']
+    aerExt_532_klett = group['aerExt_532_klett']
+    aerExt_1064_klett = group['aerExt_1064_klett']
+    aerExt355_NR_klett = group['aerExt355_NR_klett']
+    aerExt532_NR_klett = group['aerExt532_NR_klett']
+    aerExt_355_raman = group['aerExt_355_raman']
+    aerExt_532_raman = group['aerExt_532_raman']
+    aerExt_1064_raman = group['aerExt_1064_raman']
+    aerExt355_NR_raman = group['aerExt355_NR_raman']
+    aerExt532_NR_raman = group['aerExt532_NR_raman']
+    aerExt_355_aeronet = group['aerExt_355_aeronet']
+    aerExt_532_aeronet = group['aerExt_532_aeronet']
+    aerExt_1064_aeronet = group['aerExt_1064_aeronet']
+    LR355_raman = group['LR355_raman']
+    LR532_raman = group['LR532_raman']
+    LR355_NR_raman = group['LR355_NR_raman']
+    LR532_NR_raman = group['LR532_NR_raman']
+    ang_bsc_355_532_klett = group['ang_bsc_355_532_klett']
+    ang_bsc_532_1064_klett = group['ang_bsc_532_1064_klett']
+    ang_bsc_355_532_klett_NR = group['ang_bsc_355_532_klett_NR']
+    ang_bsc_355_532_raman = group['ang_bsc_355_532_raman']
+    ang_bsc_532_1064_raman = group['ang_bsc_532_1064_raman']
+    ang_ext_355_532_raman = group['ang_ext_355_532_raman']
+    ang_ext_355_532_raman_NR = group['ang_ext_355_532_raman_NR']
+    ang_bsc_355_532_raman_NR = group['ang_bsc_355_532_raman_NR']
+    voldepol355_klett = group['voldepol355_klett']
+    voldepol532_klett = group['voldepol532_klett']
+    voldepol355_raman = group['voldepol355_raman']
+    voldepol532_raman = group['voldepol532_raman']
+    pardepol355_klett = group['pardepol355_klett']
+    pardepol532_klett = group['pardepol532_klett']
+    pardepolStd355_klett = group['pardepolStd355_klett']
+    pardepolStd532_klett = group['pardepolStd532_klett']
+    pardepol355_raman = group['pardepol355_raman']
+    pardepol532_raman = group['pardepol532_raman']
+    pardepolStd355_raman = group['pardepolStd355_raman']
+    pardepolStd532_raman = group['pardepolStd532_raman']
+    wvmr = group['wvmr']
+    rh = group['rh']
+    rh_meteor = group['rh_meteor']
+    temperature = group['temperature']
+    pressure = group['pressure']
+
     # display signal
     fig = plt.figure(figsize=[5, 8])
     ax = fig.add_axes([0.21, 0.15, 0.74, 0.75])
@@ -224,18 +351,18 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
                       linestyle='-', label='Reference Height')
     if not np.isnan(refHIndx355[0]):
         ax.semilogx(
-            rcs355[refHIndx355[0]:refHIndx355[1]] * 1e6,
-            height[refHIndx355[0]:refHIndx355[1]], color='#000000', zorder=9
+            rcs355[int(refHIndx355[0]):int(refHIndx355[1])] * 1e6,
+            height[int(refHIndx355[0]):int(refHIndx355[1])], color='#000000', zorder=9
             )
     if not np.isnan(refHIndx532[0]):
         ax.semilogx(
-            rcs532[refHIndx532[0]:refHIndx532[1]] * 6e6,
-            height[refHIndx532[0]:refHIndx532[1]], color='#000000', zorder=8
+            rcs532[int(refHIndx532[0]):int(refHIndx532[1])] * 6e6,
+            height[int(refHIndx532[0]):int(refHIndx532[1])], color='#000000', zorder=8
             )
     if not np.isnan(refHIndx1064[0]):
         ax.semilogx(
-            rcs1064[refHIndx1064[0]:refHIndx1064[1]] * 1.2e8,
-            height[refHIndx1064[0]:refHIndx1064[1]], color='#000000', zorder=7
+            rcs1064[int(refHIndx1064[0]):int(refHIndx1064[1])] * 1.2e8,
+            height[int(refHIndx1064[0]):int(refHIndx1064[1])], color='#000000', zorder=7
             )
 
     ax.set_xlabel('Range-Corrected Signal [$Mm^{-1}*sr^{-1}$]', fontsize=15)
@@ -269,7 +396,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.05, 0.02, 'Version: {version}'.format(
         version=version), fontsize=15)
 
-    fig.savefig(os.path.join(
+    save_figure(fig, os.path.join(
         saveFolder, '{dataFile}_{starttime}_{endtime}_SIG.{imgFmt}'.format(
             dataFile=rmext(dataFilename),
             starttime=datenum_to_datetime(starttime).strftime('%H%M'),
@@ -316,7 +443,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Klett'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Bsc_Klett.{imgFmt}'.format(
@@ -370,7 +497,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Klett'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Bsc_Klett_NR.{imgFmt}'.format(
@@ -420,7 +547,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Bsc_Raman.{imgFmt}'.format(
@@ -475,7 +602,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Bsc_Raman_NR.{imgFmt}'.format(
@@ -527,7 +654,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='AERONET'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Bsc_Aeronet.{imgFmt}'.format(
@@ -579,7 +706,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Klett'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Ext_Klett.{imgFmt}'.format(
@@ -635,7 +762,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Klett'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Ext_Klett_NR.{imgFmt}'.format(
@@ -688,7 +815,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(os.path.join(
+    save_figure(fig, os.path.join(
         saveFolder,
         '{dataFile}_{starttime}_{endtime}_Ext_Raman.{imgFmt}'.format(
             dataFile=rmext(dataFilename),
@@ -743,7 +870,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Ext_Raman_NR.{imgFmt}'.format(
@@ -795,7 +922,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='AERONET'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Ext_Aeronet.{imgFmt}'.format(
@@ -845,7 +972,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_LR_Raman.{imgFmt}'.format(
@@ -899,7 +1026,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_LR_Raman_NR.{imgFmt}'.format(
@@ -949,7 +1076,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Klett'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_ANGEXP_Klett.{imgFmt}'.format(
@@ -1001,7 +1128,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_ANGEXP_Raman.{imgFmt}'.format(
@@ -1051,7 +1178,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_ANGEXP_Raman_NR.{imgFmt}'.
@@ -1106,7 +1233,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Klett'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_DepRatio_Klett.{imgFmt}'.format(
@@ -1160,7 +1287,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Method: {method}'.format(
         version=version, method='Raman'), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_DepRatio_Raman.{imgFmt}'.format(
@@ -1206,7 +1333,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Calibrated?: {status}'.format(
         version=version, status=flagWVCalibration), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_WVMR.{imgFmt}'.format(
@@ -1256,7 +1383,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  Calibrated?: {status}'.format(
         version=version, status=flagWVCalibration), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_RH.{imgFmt}'.format(
@@ -1303,7 +1430,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  From: {source}'.format(
         version=version, source=meteorSource), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Meteor_T.{imgFmt}'.format(
@@ -1348,7 +1475,7 @@ def pollyxt_display_retrieving(tmpFile, saveFolder):
     fig.text(0.1, 0.02, 'Version: {version}  From: {source}'.format(
         version=version, source=meteorSource), fontsize=12)
 
-    fig.savefig(
+    save_figure(fig,
         os.path.join(
             saveFolder,
             '{dataFile}_{starttime}_{endtime}_Meteor_P.{imgFmt}'.format(
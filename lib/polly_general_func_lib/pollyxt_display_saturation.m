@@ -6,6 +6,9 @@ function pollyxt_display_saturation(data, taskInfo, config)
 %   data, taskInfo, config
 %History:
 %   2018-12-29. First Edition by Zhenping
+%   2026-10-17. Save the python handoff with save_python_handoff.
+%   2026-10-17. Save the signal status as uint8 for python.
+%   2026-10-17. Save the NaN of the signal status as 255 (no data).
 %Contact:
 %   zhenping@tropos.de
 
@@ -385,15 +388,45 @@ elseif strcmpi(processInfo.visualizationMode, 'python')
         mkdir(tmpFolder);
     end
 
+    % the signal status (0, 1 or 2) is saved as uint8 with 255 for no data
+    % and the missing channels as empty arrays, which reduces the handoff and the memory of
+    % the python script by a factor of 8.
+    SAT_FR_355 = signal_status(SAT_FR_355);
+    SAT_FR_532 = signal_status(SAT_FR_532);
+    SAT_FR_1064 = signal_status(SAT_FR_1064);
+    SAT_NR_532 = signal_status(SAT_NR_532);
+    SAT_NR_355 = signal_status(SAT_NR_355);
+    SAT_FR_407 = signal_status(SAT_FR_407);
+    SAT_FR_387 = signal_status(SAT_FR_387);
+    SAT_FR_607 = signal_status(SAT_FR_607);
+    SAT_NR_387 = signal_status(SAT_NR_387);
+    SAT_NR_607 = signal_status(SAT_NR_607);
+    SAT_FR_355s = signal_status(SAT_FR_355s);
+    SAT_FR_532s = signal_status(SAT_FR_532s);
+
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-    save(tmpFile, 'figDPI', 'time', 'height', 'xtick', 'xtickstr', 'SAT_FR_355', 'SAT_FR_532', 'SAT_FR_1064', 'SAT_NR_532', 'SAT_NR_355', 'SAT_FR_407','SAT_FR_387','SAT_FR_607','SAT_NR_387','SAT_NR_607','SAT_FR_355s', 'SAT_FR_532s', 'yLim_FR_RCS', 'yLim_NR_RCS', 'yLim_WV_RH', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(processInfo.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_display_saturation.py'), tmpFile, saveFolder));
+    tmpFile = save_python_handoff(tmpFile, 'figDPI', 'time', 'height', 'xtick', 'xtickstr', 'SAT_FR_355', 'SAT_FR_532', 'SAT_FR_1064', 'SAT_NR_532', 'SAT_NR_355', 'SAT_FR_407','SAT_FR_387','SAT_FR_607','SAT_NR_387','SAT_NR_607','SAT_FR_355s', 'SAT_FR_532s', 'yLim_FR_RCS', 'yLim_NR_RCS', 'yLim_WV_RH', 'processInfo', 'campaignInfo', 'taskInfo', 'imgFormat');
+    flag = run_python_display(fullfile(pyFolder, 'pollyxt_display_saturation.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyxt_display_saturation.py');
     end
-    delete(tmpFile);
 else
     error('Unknow visualization mode. Please check the settings in pollynet_processing_chain_config.json');
 end
 
-end
\ No newline at end of file
+end
+
+function [status] = signal_status(SAT)
+%SIGNAL_STATUS convert the signal status to uint8 for the python handoff.
+%The missing channels (all NaN) are returned as empty arrays. The other NaN
+%cells are saved as 255 (no data), because uint8 would convert them to 0
+%(good signal).
+
+if all(isnan(SAT(:)))
+    status = uint8([]);
+else
+    SAT(isnan(SAT)) = 255;
+    status = uint8(SAT);
+end
+
+end
@@ -1,8 +1,7 @@
 import os
 import sys
-import scipy.io as spio
+import gc
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,53 +10,18 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_parallel import render_figures, figure_workers
+from polly_mesh import TimeHeightMesh
+from polly_raster import save_quicklook
+from polly_decimate import decimate, axes_pixels
+from polly_cache import set_render_cache
+from polly_handoff import load_variables
+from polly_time import datenum_to_datetime
 
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+# signal status of the cells without data in the uint8 handoff (see
+# signal_status in pollyxt_display_saturation.m)
+STATUS_NO_DATA = 255
 
 
 def rmext(filename):
@@ -93,6 +57,15 @@ def pollyxt_display_saturation(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Render the figures in parallel with 'pyFigureWorkers'.
+    2026-10-17. Crop and reduce the signal status to the pixels of the
+        figure.
+    2026-10-17. Load the memory-mapped handoffs with 'load_handoff'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Reuse the unchanged figures with 'pyRenderCacheFolder'.
+    2026-10-17. Read the uint8 signal status of one channel at a time.
+    2026-10-17. Mask the cells without data in the uint8 signal status.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,33 +74,39 @@ def pollyxt_display_saturation(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        mTime = mat['time'][0][:]
-        height = mat['height'][0][:]
-        SAT_FR_355 = mat['SAT_FR_355'][:]
-        SAT_FR_532 = mat['SAT_FR_532'][:]
-        SAT_FR_1064 = mat['SAT_FR_1064'][:]
-        SAT_NR_355 = mat['SAT_NR_355'][:]
-        SAT_NR_532 = mat['SAT_NR_532'][:]
-        SAT_FR_407 = mat['SAT_FR_407'][:]
-        SAT_FR_387 = mat['SAT_FR_387'][:]
-        SAT_FR_607 = mat['SAT_FR_607'][:]
-        SAT_NR_387 = mat['SAT_NR_387'][:]
-        SAT_NR_607 = mat['SAT_NR_607'][:]
-        SAT_FR_355s = mat['SAT_FR_355s'][:]
-        SAT_FR_532s = mat['SAT_FR_532s'][:]
-        yLim_FR_RCS = mat['yLim_FR_RCS'][:][0]
-        yLim_NR_RCS = mat['yLim_NR_RCS'][:][0]
-        yLim_WV_RH = mat['yLim_WV_RH'][:][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'time': 'vector',
+            'height': 'vector',
+            'yLim_FR_RCS': 'vector',
+            'yLim_NR_RCS': 'vector',
+            'yLim_WV_RH': 'vector',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string',
+            'processInfo': 'struct'
+            })
+        figDPI = mat['figDPI']
+        mTime = mat['time']
+        height = mat['height']
+        yLim_FR_RCS = mat['yLim_FR_RCS']
+        yLim_NR_RCS = mat['yLim_NR_RCS']
+        yLim_WV_RH = mat['yLim_WV_RH']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
+        set_render_cache(mat['processInfo'])
+        nWorkers = figure_workers(mat['processInfo'])
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -137,623 +116,157 @@ def pollyxt_display_saturation(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # meshgrid
-    Time, Height = np.meshgrid(mTime, height)
-
     # load colormap
-    dirname = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    sys.path.append(dirname)
     try:
         from python_colormap import signal_status_colormap
     except Exception as e:
         raise ImportError('python_colormap module is necessary.')
 
-    # display status of 355 FR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_FR_355,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_FR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Far-Range from {instrument} at {location}'.format(
-            wave=355,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_SAT_FR_355.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
-    plt.close()
-
-    # display status of 532 FR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_FR_532,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_FR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title('Signal Status at ' +
-                 '{wave}nm Far-Range from {instrument} at {location}'.format(
-                    wave=532,
-                    instrument=pollyVersion,
-                    location=location
-                    ),
-                 fontsize=15
-                 )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_FR_532.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
-
-    # display status of 1064 FR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_FR_1064,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_FR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Far-Range from {instrument} at {location}'.format(
-            wave=1064,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_FR_1064.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
-
-    # display status of 355 NR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_NR_355,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_NR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(1000))
-    ax.yaxis.set_minor_locator(MultipleLocator(200))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Near-Range from {instrument} at {location}'.format(
-            wave=355,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_NR_355.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
-
-    # display status of 532 NR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_NR_532,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_NR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(1000))
-    ax.yaxis.set_minor_locator(MultipleLocator(200))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Near-Range from {instrument} at {location}'.format(
-            wave=532,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_NR_532.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
-
-    # display status of 407
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_FR_407,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_WV_RH.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(1000))
-    ax.yaxis.set_minor_locator(MultipleLocator(200))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Far-Range from {instrument} at {location}'.format(
-            wave=407,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_FR_407.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
-
-    # display status of 387
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_FR_387,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_FR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Far-Range from {instrument} at {location}'.format(
-            wave=387,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_FR_387.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
-
-    # display status of 607
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_FR_607,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_FR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Far-Range from {instrument} at {location}'.format(
-            wave=607,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_FR_607.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
-
-    # display status of 387NR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_NR_387,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+    # the signal status of each channel is read by its figure, so only one
+    # channel is held in memory (per figure worker)
+    data = {
+        'tmpFile': tmpFile,
+        'time': mTime,
+        'height': height,
+        'cmap': signal_status_colormap(),
+        'xtick': xtick.tolist(),
+        'xticklabel': xticklabel,
+        'date': datenum_to_datetime(mTime[0]).strftime("%Y-%m-%d"),
+        'version': version,
+        'pollyVersion': pollyVersion,
+        'figDPI': figDPI,
+        'figSize': [10, 5],
+        'axPosition': [0.11, 0.15, 0.74, 0.75],
+        'saveFolder': saveFolder,
+        'dataFilename': rmext(dataFilename),
+        'imgFormat': imgFormat
+    }
+
+    # specification of each figure
+    # (channel, wavelength, range label, yLim, major and minor y locator)
+    FR = (yLim_FR_RCS.tolist(), 2500, 500)
+    NR = (yLim_NR_RCS.tolist(), 1000, 200)
+    WV = (yLim_WV_RH.tolist(), 1000, 200)
+    figures = []
+    for channel, wave, rangeLabel, yAxis in [
+            ('FR_355', 355, 'Far-Range', FR),
+            ('FR_532', 532, 'Far-Range', FR),
+            ('FR_1064', 1064, 'Far-Range', FR),
+            ('NR_355', 355, 'Near-Range', NR),
+            ('NR_532', 532, 'Near-Range', NR),
+            ('FR_407', 407, 'Far-Range', WV),
+            ('FR_387', 387, 'Far-Range', FR),
+            ('FR_607', 607, 'Far-Range', FR),
+            ('NR_387', 387, 'Near-Range', NR),
+            ('NR_607', 607, 'Near-Range', NR),
+            ('FR_355s', 355, 'Far-Range-Cross', FR),
+            ('FR_532s', 532, 'Far-Range-Cross', FR)]:
+        figures.append({
+            'channel': channel,
+            'yLim': yAxis[0],
+            'yLocator': yAxis[1:],
+            'title': 'Signal Status at {wave}nm {rangeLabel}'.format(
+                        wave=wave,
+                        rangeLabel=rangeLabel
+                        ) +
+                     ' from {instrument} at {location}'.format(
+                        instrument=pollyVersion,
+                        location=location
+                        )
+        })
+
+    render_figures(_display_saturation_figure, data, figures, nWorkers)
+
+
+def _load_status(data, channel):
+    """
+    Read the signal status of one channel from the handoff.
 
-    ax.set_ylim(yLim_NR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(1000))
-    ax.yaxis.set_minor_locator(MultipleLocator(200))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
+    Parameters
+    ----------
+    data: dict
+        input arrays and settings shared by all the figures.
+    channel: str
+        e.g., 'FR_355'.
 
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Near-Range from {instrument} at {location}'.format(
-            wave=387,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
+    Returns
+    -------
+    status: 2-D array
+        0 (good signal), 1 (saturated) or 2 (low SNR) with the shape of
+        (height, time), as it was saved (uint8 since the handoff of
+        2026-10-17, float64 before). The cells without data (NaN, saved as
+        `STATUS_NO_DATA` in uint8) are masked or NaN. The missing channels
+        (saved as empty arrays or NaN) are NaN. None if it could not be read.
+    """
 
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
+    name = 'SAT_{0}'.format(channel)
+    try:
+        status = load_variables(data['tmpFile'], {name: 'array'})[name]
+    except Exception as e:
+        print(e)
+        print('Failed reading {name} from {tmpFile}'.format(
+            name=name, tmpFile=data['tmpFile']))
+        return None
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_NR_387.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
+    if status.size == 0:
+        # view of NaN without any memory for the full grid
+        status = np.broadcast_to(
+            np.float64(np.nan), (data['height'].size, data['time'].size))
+    elif status.dtype == np.uint8:
+        noData = (status == STATUS_NO_DATA)
+        if noData.any():
+            status = np.ma.masked_array(status, mask=noData)
 
-    # display status of 607NR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_NR_607,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
+    return status
 
-    ax.set_ylim(yLim_NR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(1000))
-    ax.yaxis.set_minor_locator(MultipleLocator(200))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
 
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Near-Range from {instrument} at {location}'.format(
-            wave=607,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
+def _display_saturation_figure(data, figure):
+    """
+    Display the signal status of one channel.
 
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
+    Parameters
+    ----------
+    data: dict
+        input arrays and settings shared by all the figures.
+    figure: dict
+        specification of the figure. (see `pollyxt_display_saturation`)
+    """
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_NR_607.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
+    status = _load_status(data, figure['channel'])
+    if status is None:
+        return
 
-    # display status of 355s FR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_FR_355s,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
+    # crop to the y-limits and reduce to the pixels of the axes (the signal
+    # status is a flag, so the nearest value will be taken)
+    time, height, matrix = decimate(
+        data['time'], data['height'], status, figure['yLim'],
+        axes_pixels(data['figSize'], data['axPosition'], data['figDPI']),
+        reducer='nearest')
+    del status
+
+    fig = plt.figure(figsize=data['figSize'])
+    ax = fig.add_axes(data['axPosition'])
+    mesh = TimeHeightMesh(
+        ax, time, height, matrix,
+        vmin=-0.5, vmax=2.5, cmap=data['cmap'],
         rasterized=True)
     ax.set_xlabel('UTC', fontsize=15)
     ax.set_ylabel('Height (m)', fontsize=15)
 
-    ax.set_ylim(yLim_FR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_ylim(figure['yLim'])
+    ax.yaxis.set_major_locator(MultipleLocator(figure['yLocator'][0]))
+    ax.yaxis.set_minor_locator(MultipleLocator(figure['yLocator'][1]))
+    ax.set_xticks(data['xtick'])
+    ax.set_xticklabels(data['xticklabel'])
     ax.tick_params(axis='both', which='major', labelsize=15,
                    right=True, top=True, width=2, length=5)
     ax.tick_params(axis='both', which='minor', width=1.5,
                    length=3.5, right=True, top=True)
 
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Far-Range-Cross from {instrument} at {location}'.format(
-            wave=355,
-            instrument=pollyVersion,
-            location=location
-            ),
-        fontsize=15
-        )
+    ax.set_title(figure['title'], fontsize=15)
 
     cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
+    cbar = fig.colorbar(mesh.mappable, cax=cb_ax, ticks=[
                         0, 1, 2], orientation='vertical')
     cbar.ax.tick_params(direction='in', pad=5)
     cbar.ax.set_title('', fontsize=9)
@@ -763,75 +276,23 @@ def pollyxt_display_saturation(tmpFile, saveFolder):
     cbar.ax.tick_params(axis='both', which='minor',
                         width=1.5, length=3.5, right=True, top=True)
 
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
+    fig.text(0.05, 0.04, data['date'], fontsize=15)
     fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(os.path.join(
-        saveFolder, '{dataFilename}_SAT_FR_355s.{imgFmt}'.format(
-            dataFilename=rmext(dataFilename),
-            imgFmt=imgFormat
-        )), dpi=figDPI)
+        version=data['version']), fontsize=14)
+
+    save_quicklook(fig, mesh, os.path.join(
+        data['saveFolder'], '{dataFilename}_SAT_{channel}.{imgFmt}'.format(
+            dataFilename=data['dataFilename'],
+            channel=figure['channel'],
+            imgFmt=data['imgFormat']
+        )), data['figDPI'],
+        frameKey=(data['pollyVersion'], 'SAT_{0}'.format(figure['channel']),
+                  data['figDPI']))
     plt.close()
 
-    # display status of 532s FR
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.11, 0.15, 0.74, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, SAT_FR_532s,
-        vmin=-0.5, vmax=2.5, cmap=signal_status_colormap(),
-        rasterized=True)
-    ax.set_xlabel('UTC', fontsize=15)
-    ax.set_ylabel('Height (m)', fontsize=15)
-
-    ax.set_ylim(yLim_FR_RCS.tolist())
-    ax.yaxis.set_major_locator(MultipleLocator(2500))
-    ax.yaxis.set_minor_locator(MultipleLocator(500))
-    ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
-    ax.tick_params(axis='both', which='major', labelsize=15,
-                   right=True, top=True, width=2, length=5)
-    ax.tick_params(axis='both', which='minor', width=1.5,
-                   length=3.5, right=True, top=True)
-
-    ax.set_title(
-        'Signal Status at ' +
-        '{wave}nm Far-Range-Cross from {instrument} at {location}'.format(
-            wave=532,
-            instrument=pollyVersion,
-            location=location
-        ),
-        fontsize=15
-        )
-
-    cb_ax = fig.add_axes([0.865, 0.15, 0.02, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=[
-                        0, 1, 2], orientation='vertical')
-    cbar.ax.tick_params(direction='in', pad=5)
-    cbar.ax.set_title('', fontsize=9)
-    cbar.ax.set_yticklabels(['Good Signal', 'Saturated', 'Low SNR'])
-    cbar.ax.tick_params(axis='both', which='major', labelsize=12,
-                        right=True, top=True, width=2, length=5)
-    cbar.ax.tick_params(axis='both', which='minor',
-                        width=1.5, length=3.5, right=True, top=True)
-
-    fig.text(0.05, 0.04, datenum_to_datetime(
-        mTime[0]).strftime("%Y-%m-%d"), fontsize=15)
-    fig.text(0.8, 0.04, 'Version: {version}'.format(
-        version=version), fontsize=14)
-
-    fig.savefig(
-        os.path.join(
-            saveFolder,
-            '{dataFilename}_SAT_FR_532s.{imgFmt}'.format(
-                dataFilename=rmext(dataFilename),
-                imgFmt=imgFormat
-                )
-            ),
-        dpi=figDPI
-        )
-    plt.close()
+    # the closed figure and its renderer are only freed by the cyclic
+    # garbage collector, which would keep the buffers of several figures
+    gc.collect()
 
 
 def main():
@@ -1,8 +1,6 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,53 +9,14 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_mesh import TimeHeightMesh
+from polly_raster import save_quicklook
+from polly_decimate import decimate, axes_pixels
+from polly_tiles import tile_pyramid_enabled, save_tile_pyramid
+from polly_cache import set_render_cache
+from polly_handoff import load_variables
+from polly_time import datenum_to_datetime
 
 
 def rmext(filename):
@@ -93,6 +52,15 @@ def pollyxt_display_targetclassi_V2(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Draw the classification as an image and save it with
+        polly_raster.
+    2026-10-17. Crop and reduce the classification to the pixels of the
+        figure.
+    2026-10-17. Load the memory-mapped handoffs with 'load_handoff'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Save the tile pyramid with 'pyTilePyramid'.
+    2026-10-17. Reuse the unchanged figures with 'pyRenderCacheFolder'.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,20 +69,37 @@ def pollyxt_display_targetclassi_V2(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        TC_mask = mat['TC_mask'][:]
-        height = mat['height'][0][:]
-        time = mat['time'][0][:]
-        yLim_Quasi_Params = mat['yLim_Quasi_Params'][:][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        xtick = mat['xtick'][0][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'TC_mask': 'array',
+            'height': 'vector',
+            'time': 'vector',
+            'yLim_Quasi_Params': 'vector',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'xtick': 'vector',
+            'xtickstr': 'strings',
+            'imgFormat': 'string',
+            'processInfo': 'struct'
+            })
+        figDPI = mat['figDPI']
+        TC_mask = mat['TC_mask']
+        height = mat['height']
+        time = mat['time']
+        yLim_Quasi_Params = mat['yLim_Quasi_Params']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        xtick = mat['xtick']
         xticklabel = mat['xtickstr']
-        imgFormat = mat['imgFormat'][:][0]
+        imgFormat = mat['imgFormat']
+        set_render_cache(mat['processInfo'])
+        flagTiles = tile_pyramid_enabled(mat['processInfo'])
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -124,9 +109,6 @@ def pollyxt_display_targetclassi_V2(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # meshgrid
-    Time, Height = np.meshgrid(time, height)
-
     # load colormap
     dirname = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     sys.path.append(dirname)
@@ -135,11 +117,19 @@ def pollyxt_display_targetclassi_V2(tmpFile, saveFolder):
     except Exception as e:
         raise ImportError('python_colormap module is necessary.')
 
+    # crop to the y-limits and reduce to the pixels of the axes (the nearest
+    # class will be taken)
+    figSize = [10, 5]
+    axPosition = [0.09, 0.15, 0.67, 0.75]
+    tcTime, tcHeight, tcMask = decimate(
+        time, height, TC_mask, yLim_Quasi_Params,
+        axes_pixels(figSize, axPosition, figDPI), reducer='nearest')
+
     # display aerosol target classification
-    fig = plt.figure(figsize=[10, 5])
-    ax = fig.add_axes([0.09, 0.15, 0.67, 0.75])
-    pcmesh = ax.pcolormesh(
-        Time, Height, TC_mask,
+    fig = plt.figure(figsize=figSize)
+    ax = fig.add_axes(axPosition)
+    mesh = TimeHeightMesh(
+        ax, tcTime, tcHeight, tcMask,
         vmin=-0.5, vmax=11.5, cmap=target_classification_colormap(),
         rasterized=True
         )
@@ -150,7 +140,7 @@ def pollyxt_display_targetclassi_V2(tmpFile, saveFolder):
     ax.yaxis.set_minor_locator(MultipleLocator(500))
     ax.set_ylim(yLim_Quasi_Params.tolist())
     ax.set_xticks(xtick.tolist())
-    ax.set_xticklabels(celltolist(xticklabel))
+    ax.set_xticklabels(xticklabel)
     ax.tick_params(axis='both', which='major', labelsize=12,
                    right=True, top=True, width=2, length=5)
     ax.tick_params(axis='both', which='minor', width=1.5,
@@ -164,7 +154,7 @@ def pollyxt_display_targetclassi_V2(tmpFile, saveFolder):
         )
 
     cb_ax = fig.add_axes([0.77, 0.15, 0.01, 0.75])
-    cbar = fig.colorbar(pcmesh, cax=cb_ax, ticks=np.arange(
+    cbar = fig.colorbar(mesh.mappable, cax=cb_ax, ticks=np.arange(
         0, 12, 1), orientation='vertical')
     cbar.ax.tick_params(direction='out', labelsize=10, pad=5)
     cbar.ax.set_yticklabels(['No signal',
@@ -185,14 +175,25 @@ def pollyxt_display_targetclassi_V2(tmpFile, saveFolder):
     fig.text(0.64, 0.02, 'Version: {version}'.format(
         version=version), fontsize=12)
 
-    fig.savefig(
+    save_quicklook(
+        fig, mesh,
         os.path.join(
             saveFolder,
             '{dataFile}_TC_V2.{imgFmt}'.format(
                 dataFile=rmext(dataFilename),
-                imgFmt=imgFormat)), dpi=figDPI)
+                imgFmt=imgFormat)),
+        figDPI, frameKey=(pollyVersion, 'TC_V2', figDPI))
     plt.close()
 
+    if flagTiles:
+        save_tile_pyramid(
+            os.path.join(saveFolder, '{dataFile}_TC_V2_tiles'.format(
+                dataFile=rmext(dataFilename))),
+            time, height, TC_mask, yLim_Quasi_Params,
+            target_classification_colormap(), [-0.5, 11.5],
+            metadata={'product': 'TC_V2',
+                      'title': 'Target classifications (V2)'})
+
 
 def main():
     pollyxt_display_targetclassi_V2(
@@ -0,0 +1,466 @@
+"""
+Load the data handed over from the MATLAB display functions.
+
+The MATLAB display functions save the variables for the python display
+scripts with `save_python_handoff.m` in one of the formats of
+'pyHandoffFormat' in the pollynet processing chain config:
+
+- 'mat': .mat file (-v6), which is parsed completely by `scipy.io.loadmat`.
+- 'h5': .mat file (-v7.3, HDF5 without compression). The large numeric
+  arrays are memory-mapped from the file and the other variables are read
+  with h5py when they are accessed.
+- 'npy': folder with the large numeric arrays as .npy files (memory-mapped)
+  and all the other variables (structs, strings, scalars) in a small
+  'variables.mat' (-v6).
+- 'shm': folder in the POSIX shared memory (e.g., /dev/shm) with the large
+  numeric arrays as raw buffers, the other variables in 'variables.mat' and
+  the descriptor 'handoff.json' with the names, dtypes and shapes of the
+  buffers. The buffers are attached without copying.
+
+`load_handoff` returns the variables with the same layout as
+`scipy.io.loadmat(tmpFile, struct_as_record=True)` for all the formats. The
+memory-mapped arrays are read-only.
+
+`load_variables` only reads the variables declared by the display function
+and normalizes their shapes (e.g., 1-D vectors, strings and the tick labels)
+once, instead of indexing the layout of `scipy.io.loadmat` in each script.
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Add `load_variables` to read the declared variables only.
+2026-10-17. Add the shared memory handoff.
+2026-10-17. Return writable float32 copies with `float32`.
+2026-10-17. Allow missing fields of the structs with `optional`.
+2026-10-17. Add `load_process_info` for the settings of the display jobs.
+2026-10-17. Close the -v7.3 files after reading the declared variables.
+2026-10-17. Record the timing spans of reading the handoff.
+"""
+
+import os
+import json
+from collections.abc import Mapping
+import numpy as np
+import scipy.io as spio
+
+from polly_timing import span, set_context, array_shapes
+
+# signature of the HDF5 files (MATLAB -v7.3 files start with a user block of
+# 512 bytes)
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+
+# file with the small variables of the npy handoff
+NPY_VARIABLES = 'variables.mat'
+
+# descriptor of the buffers of the shared memory handoff
+SHM_DESCRIPTOR = 'handoff.json'
+
+# kinds of the variables for `load_variables`
+KINDS = ('array', 'vector', 'scalar', 'string', 'strings', 'struct')
+
+
+def load_handoff(tmpFile, variableNames=None):
+    """
+    Load the handoff of the MATLAB display function.
+
+    Parameters
+    ----------
+    tmpFile: str
+        .mat file (-v6 or -v7.3), npy or shared memory handoff folder.
+    variableNames: list
+        names of the variables to be read from the .mat files (-v6). All the
+        variables will be read if it was None.
+
+    Returns
+    -------
+    mat: dict-like
+        variables with the layout of `scipy.io.loadmat`.
+
+    Usage
+    -----
+    mat = load_handoff(tmpFile)
+    figDPI = mat['figDPI'][0][0]
+    """
+
+    with span('loadmat', call='load_handoff'):
+        if os.path.isdir(tmpFile):
+            if os.path.exists(os.path.join(tmpFile, SHM_DESCRIPTOR)):
+                return ShmHandoff(tmpFile, variableNames)
+            return NpyHandoff(tmpFile, variableNames)
+
+        if is_hdf5(tmpFile):
+            return Mat73Handoff(tmpFile)
+
+        return spio.loadmat(tmpFile, struct_as_record=True,
+                            variable_names=variableNames)
+
+
+def load_variables(tmpFile, variables, float32=False, optional=()):
+    """
+    Read the declared variables of the handoff and normalize their shapes.
+
+    Parameters
+    ----------
+    tmpFile: str
+        .mat file (-v6 or -v7.3), npy or shared memory handoff folder.
+    variables: dict
+        kind of each variable. The fields of the structs are declared with
+        'struct.field'.
+        'array': array as it was saved (2-D for the MATLAB vectors).
+        'vector': 1-D array. np.array([]) for the empty variables.
+        'scalar': first element. None for the empty variables.
+        'string': str. '' for the empty variables.
+        'strings': list of str from a cell array (e.g., xtickstr). '' for
+            the empty cells.
+        'struct': struct with the layout of `scipy.io.loadmat` (e.g., for
+            `polly_parallel.figure_workers`).
+    float32: bool
+        return the float 'array' variables as writable float32 copies, which
+        can be masked and scaled in place (the memory-mapped arrays are
+        read-only).
+    optional: list
+        variables (or fields of the structs) which can be missing in the
+        handoff, e.g., for the files of older versions. They will not be in
+        the results.
+
+    Returns
+    -------
+    values: dict
+        normalized variables.
+
+    Usage
+    -----
+    values = load_variables(tmpFile, {
+        'figDPI': 'scalar',
+        'RCS_FR_532': 'array',
+        'mTime': 'vector',
+        'xtickstr': 'strings',
+        'campaignInfo.name': 'string'
+        })
+    """
+
+    for name, kind in variables.items():
+        if kind not in KINDS:
+            raise ValueError('Unknown kind of {0}: {1}'.format(name, kind))
+
+    with span('extract', call='load_variables') as record:
+        values = _load_variables(tmpFile, variables, float32, optional)
+        if record is not None:
+            record['shapes'] = array_shapes(values)
+
+    # the instrument of the timing log (see `polly_timing`)
+    if 'campaignInfo.name' in values:
+        set_context(instrument=values['campaignInfo.name'])
+
+    return values
+
+
+def load_process_info(tmpFile):
+    """
+    Read the processInfo struct of the handoff for the settings of the whole
+    display job (e.g., `polly_encode.png_compress_level`).
+
+    Parameters
+    ----------
+    tmpFile: str
+        .mat file (-v6 or -v7.3), npy or shared memory handoff folder.
+
+    Returns
+    -------
+    processInfo: numpy structured array
+        with the layout of `scipy.io.loadmat`. None if it was missing or the
+        handoff could not be read.
+    """
+
+    try:
+        values = load_variables(tmpFile, {'processInfo': 'struct'},
+                                optional=('processInfo',))
+    except Exception:
+        return None
+
+    return values.get('processInfo')
+
+
+def _load_variables(tmpFile, variables, float32, optional):
+    """
+    Read the declared variables. (see `load_variables`)
+    """
+
+    mat = load_handoff(
+        tmpFile, sorted(set(name.split('.')[0] for name in variables)))
+
+    values = {}
+    try:
+        for name, kind in variables.items():
+            varName, _, fieldName = name.partition('.')
+            if (varName not in mat) and (name in optional):
+                continue
+
+            if fieldName:
+                try:
+                    if isinstance(mat, Mat73Handoff):
+                        value = mat.field(varName, fieldName)
+                    else:
+                        value = mat[varName][fieldName][0][0]
+                except (KeyError, ValueError):
+                    if name in optional:
+                        continue
+                    raise
+            else:
+                value = mat[varName]
+
+            values[name] = _normalize(value, kind, float32)
+    finally:
+        # the memory-mapped arrays do not need the HDF5 file
+        if isinstance(mat, Mat73Handoff):
+            mat.close()
+
+    return values
+
+
+def _normalize(value, kind, float32):
+    """
+    Normalize the variable with the layout of `scipy.io.loadmat`.
+    """
+
+    if kind == 'struct':
+        return value
+
+    value = np.asarray(value)
+
+    if kind == 'array':
+        if float32 and (value.dtype.kind == 'f'):
+            return np.array(value, dtype=np.float32)
+        return value
+
+    if kind == 'vector':
+        return value.ravel() if value.size else np.array([])
+
+    if kind == 'scalar':
+        return value.ravel()[0] if value.size else None
+
+    if kind == 'string':
+        return value.ravel()[0] if value.size else ''
+
+    # cell array of strings
+    return [np.asarray(cell).ravel()[0] if np.size(cell) else ''
+            for cell in value.ravel()]
+
+
+def is_hdf5(filename):
+    """
+    Check the HDF5 signature, which can be at 0, 512, 1024, 2048... bytes.
+    """
+
+    with open(filename, 'rb') as fh:
+        offset = 0
+        while True:
+            fh.seek(offset)
+            signature = fh.read(len(HDF5_SIGNATURE))
+            if signature == HDF5_SIGNATURE:
+                return True
+            if len(signature) < len(HDF5_SIGNATURE):
+                return False
+            offset = 512 if offset == 0 else offset * 2
+
+
+class NpyHandoff(Mapping):
+    """
+    Variables of a npy handoff folder.
+    """
+
+    def __init__(self, folder, variableNames=None):
+        self.folder = folder
+        self._arrays = {}
+        for filename in os.listdir(folder):
+            name, ext = os.path.splitext(filename)
+            if ext == '.npy':
+                self._arrays[name] = os.path.join(folder, filename)
+
+        self._variables = {}
+        if os.path.exists(os.path.join(folder, NPY_VARIABLES)):
+            self._variables = spio.loadmat(
+                os.path.join(folder, NPY_VARIABLES), struct_as_record=True,
+                variable_names=variableNames)
+            for key in ('__header__', '__version__', '__globals__'):
+                self._variables.pop(key, None)
+
+    def __getitem__(self, name):
+        if name in self._arrays:
+            # the arrays were written in fortran order with the MATLAB shape
+            return np.load(self._arrays[name], mmap_mode='r')
+
+        return self._variables[name]
+
+    def __contains__(self, name):
+        return (name in self._arrays) or (name in self._variables)
+
+    def __iter__(self):
+        return iter(list(self._arrays) + list(self._variables))
+
+    def __len__(self):
+        return len(self._arrays) + len(self._variables)
+
+
+class ShmHandoff(NpyHandoff):
+    """
+    Variables of a shared memory handoff folder.
+
+    The raw buffers are described by 'handoff.json':
+    {"version": 1,
+     "arrays": [{"name": "RCS_FR_532", "file": "RCS_FR_532.bin",
+                 "dtype": "<f8", "shape": [3000, 2880], "order": "F",
+                 "class": "double"}],
+     "variables": "variables.mat",
+     "metadata": {"created": "2026-10-17T12:00:00", "tmpFile": "..."}}
+    """
+
+    def __init__(self, folder, variableNames=None):
+        with open(os.path.join(folder, SHM_DESCRIPTOR), 'r') as fh:
+            descriptor = json.load(fh)
+
+        self.folder = folder
+        self.metadata = descriptor.get('metadata', {})
+        self._descriptor = {array['name']: array
+                            for array in descriptor['arrays']}
+        self._arrays = {name: os.path.join(folder, array['file'])
+                        for name, array in self._descriptor.items()}
+
+        self._variables = {}
+        variablesFile = os.path.join(
+            folder, descriptor.get('variables', NPY_VARIABLES))
+        if os.path.exists(variablesFile):
+            self._variables = spio.loadmat(
+                variablesFile, struct_as_record=True,
+                variable_names=variableNames)
+            for key in ('__header__', '__version__', '__globals__'):
+                self._variables.pop(key, None)
+
+    def __getitem__(self, name):
+        if name in self._arrays:
+            array = self._descriptor[name]
+            # the pages of /dev/shm are mapped directly (no copy)
+            return np.memmap(self._arrays[name], dtype=array['dtype'],
+                             mode='r', shape=tuple(array['shape']),
+                             order=array.get('order', 'F'))
+
+        return self._variables[name]
+
+
+class Mat73Handoff(Mapping):
+    """
+    Variables of a MATLAB -v7.3 (HDF5) file.
+    """
+
+    def __init__(self, filename):
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError('h5py is necessary for the -v7.3 handoff.')
+
+        self.filename = filename
+        self._file = h5py.File(filename, 'r')
+        self._h5py = h5py
+        self._names = [name for name in self._file
+                       if not name.startswith('#')]
+
+    def __getitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+
+        return self._convert(self._file[name])
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def field(self, name, fieldName):
+        """
+        Convert only one field of the struct, with the layout of
+        `mat[name][fieldName][0][0]`.
+        """
+
+        return self._convert(self._file[name][fieldName])
+
+    def close(self):
+        self._file.close()
+
+    def _convert(self, obj):
+        """
+        Convert the HDF5 object to the layout of `scipy.io.loadmat`.
+        """
+
+        matClass = obj.attrs.get('MATLAB_class', b'')
+        if isinstance(matClass, bytes):
+            matClass = matClass.decode()
+
+        if isinstance(obj, self._h5py.Group):
+            if matClass != 'struct':
+                raise ValueError(
+                    'Unsupported MATLAB class: {0}'.format(matClass))
+            return self._convert_struct(obj)
+
+        if obj.attrs.get('MATLAB_empty', 0):
+            dims = tuple(int(dim) for dim in np.asarray(obj[()]).ravel())
+            if matClass == 'char':
+                return np.array([], dtype='<U1')
+            return np.zeros(dims if len(dims) else (0, 0))
+
+        if matClass == 'char':
+            codes = np.asarray(obj[()]).T
+            return np.array([''.join(chr(code) for code in row)
+                             for row in np.atleast_2d(codes)])
+
+        if matClass == 'cell':
+            refs = np.asarray(obj[()]).T
+            cell = np.empty(refs.shape, dtype=object)
+            for index in np.ndindex(refs.shape):
+                cell[index] = self._convert(self._file[refs[index]])
+            return cell
+
+        if matClass == 'logical':
+            return np.asarray(obj[()]).T.astype(bool)
+
+        array = self._mmap(obj)
+        if array is None:
+            array = np.asarray(obj[()])
+        if array.dtype.names == ('real', 'imag'):
+            array = array['real'] + 1j * array['imag']
+
+        return array.T
+
+    def _convert_struct(self, group):
+        """
+        Scalar struct as structured array of (1, 1).
+        """
+
+        fields = [name for name in group if not name.startswith('#')]
+        if 'MATLAB_fields' in group.attrs:
+            fields = [b''.join(field).decode()
+                      for field in group.attrs['MATLAB_fields']]
+
+        struct = np.empty((1, 1), dtype=[(field, object) for field in fields])
+        for field in fields:
+            struct[field][0, 0] = self._convert(group[field])
+
+        return struct
+
+    def _mmap(self, dataset):
+        """
+        Memory-map the contiguous and uncompressed numeric datasets.
+        """
+
+        if (dataset.chunks is not None) or (dataset.dtype.kind not in 'biuf'):
+            return None
+
+        offset = dataset.id.get_offset()
+        if offset is None:
+            return None
+
+        return np.memmap(self.filename, dtype=dataset.dtype, mode='r',
+                         offset=offset, shape=dataset.shape)
@@ -0,0 +1,309 @@
+"""
+Read the logbook of the polly instruments (see doc/polly_logbook.md).
+
+The logbook events of the long-term calibration plots used to be parsed
+from the whole logbook file with `read_logbook.m` for each processed file and
+handed over to python. Here, the logbook is read the same way as
+`read_logbook.m`, but `cached_logbook` keeps the parsed entries in a columnar
+cache (.npz) next to the calibration cache and only parses the lines which
+were appended to the logbook after the cache was saved, so the daily parsing
+does not grow with the years of logbook entries.
+
+The logbook is only appended by the logbook program. The cache keeps the
+checksum of the parsed part of the logbook and is rebuilt if it was changed
+(e.g., an old entry was edited).
+
+History
+-------
+2026-10-17. First edition
+"""
+
+import os
+import re
+import json
+import hashlib
+import warnings
+from datetime import datetime
+import numpy as np
+
+# entries of the logbook (the same as `read_logbook.m`)
+ENTRY = re.compile(
+    r'(?P<id>\d+);"(?P<time>.{13})";\[(?P<operators>.*)\];'
+    r'\[(?P<changes>.*)\];\{(?P<ND>.*)\};(?P<comment>.*)')
+
+# flags of the changes and the keyword in the 'changes' of the logbook
+CHANGES = (('flagOverlap', 'overlap'),
+           ('flagWindowwipe', 'windowwipe'),
+           ('flagFlashlamps', 'flashlamps'),
+           ('flagPulsepower', 'pulsepower'),
+           ('flagRestart', 'restarted'))
+
+# columns of the logbook
+COLUMNS = ('datetime',) + tuple(flag for flag, _ in CHANGES) + \
+          ('flag_CH_NDChange',)
+
+# version of the layout of the cache files
+CACHE_VERSION = 1
+
+
+def read_logbook(logbookFile, nChannel, stop=None):
+    """
+    Read the logbook file. (see `read_logbook.m`)
+
+    Parameters
+    ----------
+    logbookFile: str
+        filename of the logbook file. Empty arrays are returned if it does
+        not exist.
+    nChannel: int
+        number of all the channels.
+    stop: datetime
+        only the entries before or at this time are returned. None for all.
+
+    Returns
+    -------
+    logbook: dict
+        'datetime': datetime64[s] array
+            time of the changes.
+        'flagOverlap', 'flagWindowwipe', 'flagFlashlamps', 'flagPulsepower',
+        'flagRestart': bool array
+            whether the operation was applied.
+        'flag_CH_NDChange': 2-D bool array (entry x channel)
+            whether the ND filter of the channel was changed. Channels
+            beyond nChannel in the logbook extend the columns.
+    """
+
+    return cached_logbook(None, logbookFile, nChannel, stop=stop)
+
+
+def cached_logbook(cacheFile, logbookFile, nChannel, stop=None):
+    """
+    Read the logbook file through the incremental cache.
+
+    Only the lines after the cached part of the logbook are parsed and
+    appended to the cache. The cache is rebuilt if it was made for another
+    logbook or the cached part of the logbook was changed.
+
+    Parameters
+    ----------
+    cacheFile: str
+        .npz file of the cache, e.g. in the results folder of the
+        instrument. None to read the logbook without the cache.
+    logbookFile: str
+        filename of the logbook file.
+    nChannel: int
+        number of all the channels.
+    stop: datetime
+        only the entries before or at this time are returned. None for all.
+
+    Returns
+    -------
+    logbook: dict
+        entries of the logbook. (see `read_logbook`)
+
+    Usage
+    -----
+    logbook = cached_logbook(
+        os.path.join(resultsFolder, pollyType, 'longterm_logbook_cache.npz'),
+        logbookFile, nChannel, stop=dataTime)
+    """
+
+    nChannel = int(nChannel)
+    if not os.path.isfile(logbookFile):
+        warnings.warn('logbook does not exist! Please check {0}'.format(
+            logbookFile))
+        return _empty(nChannel)
+
+    with open(logbookFile, 'rb') as fh:
+        content = fh.read()
+
+    signature = json.dumps({'logbookFile': os.path.abspath(logbookFile),
+                            'nChannel': nChannel}, sort_keys=True)
+    cache = None if cacheFile is None else \
+        _load_cache(cacheFile, signature, content)
+
+    if cache is None:
+        # skip the header
+        offset = content.find(b'\n') + 1 if b'\n' in content else \
+            len(content)
+        logbook = _empty(nChannel)
+    else:
+        offset, logbook = cache['offset'], cache['logbook']
+
+    # only the complete lines are cached. The last line could still be
+    # written by the logbook program.
+    complete = content.rfind(b'\n', offset) + 1 or offset
+    logbook = _join(logbook, _parse(content[offset:complete], nChannel))
+
+    if (cacheFile is not None) and \
+       ((cache is None) or (complete > cache['offset'])):
+        try:
+            _save_cache(cacheFile, signature, complete,
+                        hashlib.sha1(content[:complete]).hexdigest(), logbook)
+        except OSError as e:
+            warnings.warn('Failed to save the logbook cache {0}: {1}'.format(
+                cacheFile, e))
+
+    logbook = _join(logbook, _parse(content[complete:], nChannel))
+
+    return _select(logbook, stop)
+
+
+def _parse(content, nChannel):
+    """
+    Parse the lines of the logbook.
+    """
+
+    entries = []
+    for line in content.decode('utf-8', errors='replace').splitlines():
+        if not line.strip():
+            continue
+
+        entry = ENTRY.search(line)
+        try:
+            thisTime = datetime.strptime(entry.group('time'), '%Y%m%d-%H%M')
+            channels = _nd_channels(entry.group('ND'))
+        except (AttributeError, ValueError):
+            warnings.warn('Skip the invalid logbook entry: {0}'.format(line))
+            continue
+
+        entries.append((thisTime, entry.group('changes'), channels))
+
+    logbook = _empty(max([nChannel] + [max(channels, default=0)
+                                       for _, _, channels in entries]))
+    if not entries:
+        return logbook
+
+    logbook['datetime'] = np.array([thisTime for thisTime, _, _ in entries],
+                                   dtype='datetime64[s]')
+    for flag, keyword in CHANGES:
+        logbook[flag] = np.array([keyword in changes
+                                  for _, changes, _ in entries], dtype=bool)
+    logbook['flag_CH_NDChange'] = np.zeros(
+        (len(entries), logbook['flag_CH_NDChange'].shape[1]), dtype=bool)
+    for iEntry, (_, _, channels) in enumerate(entries):
+        logbook['flag_CH_NDChange'][iEntry, np.array(channels, dtype=int) - 1] \
+            = True
+
+    return logbook
+
+
+def _nd_channels(ndFilters):
+    """
+    Channel numbers (starting from 1) with ND filter changes, e.g.,
+    '5 3.8, 6 2' => [5, 6].
+    """
+
+    channels = []
+    for item in ndFilters.split(','):
+        if item.strip():
+            channel = int(item.split()[0])
+            if channel < 1:
+                raise ValueError('Invalid channel: {0}'.format(channel))
+            channels.append(channel)
+
+    return channels
+
+
+def _empty(nChannel):
+    """
+    Logbook without entries.
+    """
+
+    logbook = {'datetime': np.zeros(0, dtype='datetime64[s]')}
+    for flag, _ in CHANGES:
+        logbook[flag] = np.zeros(0, dtype=bool)
+    logbook['flag_CH_NDChange'] = np.zeros((0, nChannel), dtype=bool)
+
+    return logbook
+
+
+def _join(logbook1, logbook2):
+    """
+    Concatenate the entries. The ND filter changes are filled with False for
+    the logbook with less channels (the same as `read_logbook.m`).
+    """
+
+    nChannel = max(logbook1['flag_CH_NDChange'].shape[1],
+                   logbook2['flag_CH_NDChange'].shape[1])
+
+    logbook = {}
+    for column in COLUMNS:
+        values = [logbook1[column], logbook2[column]]
+        if column == 'flag_CH_NDChange':
+            values = [np.pad(value, ((0, 0), (0, nChannel - value.shape[1])))
+                      for value in values]
+        logbook[column] = np.concatenate(values)
+
+    return logbook
+
+
+def _select(logbook, stop):
+    """
+    Entries before or at stop. None for no limit.
+    """
+
+    if stop is None:
+        return logbook
+
+    flag = logbook['datetime'] <= np.datetime64(stop, 's')
+
+    return {column: logbook[column][flag] for column in COLUMNS}
+
+
+def _load_cache(cacheFile, signature, content):
+    """
+    Load the cache. None will be returned if it does not exist, cannot be
+    read, was made for another logbook or the cached part of the logbook was
+    changed.
+    """
+
+    if not os.path.exists(cacheFile):
+        return None
+
+    try:
+        with np.load(cacheFile, allow_pickle=False) as npz:
+            if (int(npz['version']) != CACHE_VERSION) or \
+               (str(npz['signature']) != signature):
+                return None
+            offset = int(npz['offset'])
+            if (offset > len(content)) or \
+               (hashlib.sha1(content[:offset]).hexdigest() !=
+                    str(npz['digest'])):
+                return None
+            return {
+                'offset': offset,
+                'logbook': {column: npz[column] for column in COLUMNS}
+                }
+    except (OSError, ValueError, KeyError) as e:
+        warnings.warn('Rebuild the logbook cache {0}: {1}'.format(
+            cacheFile, e))
+        return None
+
+
+def _save_cache(cacheFile, signature, offset, digest, logbook):
+    """
+    Save the cache to a temporary file and replace the old one, so that the
+    other processes never read a half-written cache.
+    """
+
+    arrays = {
+        'version': np.array(CACHE_VERSION),
+        'signature': np.array(signature),
+        'offset': np.array(offset),
+        'digest': np.array(digest)
+        }
+    arrays.update(logbook)
+
+    folder = os.path.dirname(os.path.abspath(cacheFile))
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+
+    tmpFile = '{0}.{1}.tmp'.format(cacheFile, os.getpid())
+    try:
+        with open(tmpFile, 'wb') as fh:
+            np.savez(fh, **arrays)
+        os.replace(tmpFile, cacheFile)
+    finally:
+        if os.path.exists(tmpFile):
+            os.remove(tmpFile)
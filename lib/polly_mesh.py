@@ -0,0 +1,158 @@
+"""
+Draw the time-height products as an image on a regular grid.
+
+The polly products are saved on a (nearly) regular grid of time and height.
+`pcolormesh` draws every cell as a quadrilateral, which takes long for the
+products of a full day (e.g., 2880 profiles x 3000 bins). If the grid is
+regular, the product will be drawn with `imshow` instead and the missing
+profiles (e.g., the periods without measurements) will be filled with masked
+values, which will be shown with the 'bad' color of the colormap.
+`pcolormesh` is only used for irregular grids.
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Change the grid in `TimeHeightMesh.set_data`.
+"""
+
+import numpy as np
+
+
+def regular_grid(time, height, tolerance=0.25, maxFillRatio=10):
+    """
+    Check whether the time and height are on a regular grid.
+
+    Parameters
+    ----------
+    time: array
+        measurement time of each profile. (datenum)
+    height: array
+        height of each range bin.
+    tolerance: float
+        allowed deviation of the profiles from the regular time grid and of
+        the height steps, relative to the resolution.
+    maxFillRatio: int
+        maximum ratio between the number of columns of the regular time grid
+        and the number of profiles. Data with longer gaps will be drawn with
+        pcolormesh.
+
+    Returns
+    -------
+    grid: dict
+        'timeIndx': column index of each profile in the regular time grid.
+        'nTime': number of columns of the regular time grid.
+        'extent': [left, right, bottom, top] of the image.
+        None will be returned if the grid is not regular.
+    """
+
+    time = np.asarray(time, dtype=np.float64).ravel()
+    height = np.asarray(height, dtype=np.float64).ravel()
+
+    if (time.size < 2) or (height.size < 2):
+        return None
+
+    # time steps can be multiples of the measurement resolution (gaps)
+    tStep = np.diff(time)
+    dt = np.median(tStep)
+    if not (dt > 0):
+        return None
+    nStep = np.rint(tStep / dt)
+    if np.any(nStep < 1):
+        return None
+    timeIndx = np.concatenate(([0], np.cumsum(nStep))).astype(np.int64)
+    nTime = int(timeIndx[-1]) + 1
+    if nTime > maxFillRatio * time.size:
+        return None
+
+    # each profile needs to be close to its column of the regular time grid
+    dt = (time[-1] - time[0]) / timeIndx[-1]
+    if np.any(np.abs(time - time[0] - timeIndx * dt) > tolerance * dt):
+        return None
+
+    # height bins need to be equidistant
+    dh = (height[-1] - height[0]) / (height.size - 1)
+    if (dh == 0) or \
+       np.any(np.abs(np.diff(height) - dh) > tolerance * abs(dh)):
+        return None
+
+    return {
+        'timeIndx': timeIndx,
+        'nTime': nTime,
+        'extent': [time[0] - dt / 2, time[0] + (nTime - 0.5) * dt,
+                   height[0] - dh / 2, height[-1] + dh / 2]
+    }
+
+
+class TimeHeightMesh(object):
+    """
+    Time-height plot of a product (height x time), which is drawn with
+    `imshow` on a regular grid and with `pcolormesh` otherwise.
+
+    Usage
+    -----
+    mesh = TimeHeightMesh(ax, time, height, matrix, vmin=0, vmax=1, cmap=cmap)
+    cbar = fig.colorbar(mesh.mappable, cax=cb_ax)
+    mesh.set_data(matrix2)
+    """
+
+    def __init__(self, ax, time, height, matrix, **kwargs):
+        """
+        Parameters
+        ----------
+        ax: matplotlib axes
+        time: array
+            measurement time of each profile. (datenum)
+        height: array
+            height of each range bin.
+        matrix: 2-D array
+            product with the shape of (height, time). Masked values and NaN
+            will be shown with the 'bad' color of the colormap.
+        kwargs:
+            keywords for `imshow` and `pcolormesh`, e.g., vmin, vmax, cmap.
+        """
+
+        self.grid = regular_grid(time, height)
+
+        if self.grid is None:
+            self.mappable = ax.pcolormesh(
+                np.asarray(time).ravel(), np.asarray(height).ravel(), matrix,
+                **kwargs)
+        else:
+            self.mappable = ax.imshow(
+                self._fill_gaps(matrix), extent=self.grid['extent'],
+                origin='lower', aspect='auto', interpolation='nearest',
+                **kwargs)
+
+    def set_data(self, matrix, time=None, height=None):
+        """
+        Replace the product with a new one. The grid can only be changed
+        with the time and height if both the old and the new grid are
+        regular (e.g., after `polly_decimate.decimate`).
+        """
+
+        if self.grid is None:
+            self.mappable.set_array(matrix)
+            return
+
+        if (time is not None) and (height is not None):
+            grid = regular_grid(time, height)
+            if grid is None:
+                raise ValueError('The new grid is not regular.')
+            self.grid = grid
+            self.mappable.set_extent(grid['extent'])
+
+        self.mappable.set_data(self._fill_gaps(matrix))
+
+    def _fill_gaps(self, matrix):
+        """
+        Put the profiles into the columns of the regular time grid.
+        """
+
+        if self.grid['nTime'] == matrix.shape[1]:
+            return matrix
+
+        filled = np.ma.masked_all(
+            (matrix.shape[0], self.grid['nTime']), dtype=np.float64)
+        filled[:, self.grid['timeIndx']] = matrix
+
+        return filled
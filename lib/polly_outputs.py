@@ -0,0 +1,424 @@
+"""
+Save each figure in several formats and sizes from one rendering.
+
+The figures of the display scripts are saved once with 'imgFormat' and
+'figDPI'. The extra outputs, e.g., PDF or SVG for the reports and small
+thumbnails for the listing pages, are configured by a list of output specs
+('pyOutputSpecs' in the pollynet processing chain config)::
+
+    "pyOutputSpecs": [
+        {"format": "pdf"},
+        {"format": "png", "dpi": 50},
+        {"format": "jpg", "maxSize": 300, "suffix": "_thumb"}
+        ]
+
+format:  image format of the output file.
+dpi:     resolution. 'figDPI' by default.
+maxSize: maximum width and height of the image (pixels). The image is
+         downscaled to fit, keeping its aspect ratio.
+suffix:  added to the file name before the extension, '_thumb' for the specs
+         with maxSize and '' otherwise.
+
+The invalid specs (e.g., an unsupported format) are skipped and an output
+which could not be saved is only reported, so the extra outputs never fail
+the figure or the display function.
+
+The figure is not drawn again for the raster formats up to the resolution of
+the figure: these outputs are resampled from the RGBA buffer of the Agg
+canvas (or the quicklook image of `polly_raster`) in memory. Only the vector
+formats (e.g., PDF, SVG) and the raster formats with a higher resolution are
+saved from the figure with `savefig`. The outputs are saved next to the
+figure, right after it was saved, and the PNG files are written by
+`polly_encode.write_png`.
+
+Usage
+-----
+save the extra outputs of every figure saved by the display function::
+
+    with extra_outputs(output_specs(processInfo)):
+        pollyxt_display_rcs(tmpFile, saveFolder)
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Check the formats and never fail the figure by an extra output.
+2026-10-17. Record the timing spans of the extra outputs.
+"""
+
+import io
+import os
+import contextlib
+
+import numpy as np
+
+from polly_encode import write_png
+from polly_timing import span
+
+# formats which are resampled from the rendered image (see `PIL.Image`)
+RASTER_FORMATS = ('png', 'jpg', 'jpeg', 'tif', 'tiff', 'webp')
+
+# formats which are saved from the figure with `savefig`
+VECTOR_FORMATS = ('pdf', 'svg', 'svgz', 'eps', 'ps')
+
+# names of the raster formats in Pillow
+PIL_FORMATS = {'jpg': 'jpeg', 'tif': 'tiff'}
+
+# default suffix of the outputs with 'maxSize'
+THUMBNAIL_SUFFIX = '_thumb'
+
+# specs of the running block (see `extra_outputs`)
+_SPECS = ()
+
+# the extra outputs are being saved, which are not saved again
+_SAVING = False
+
+# original `Figure.savefig`
+_SAVEFIG = None
+
+
+def output_specs(processInfo):
+    """
+    Read the extra outputs of the figures from the processInfo struct of the
+    .mat file ('pyOutputSpecs' in the pollynet processing chain config).
+
+    Parameters
+    ----------
+    processInfo: numpy structured array
+        mat['processInfo'] from `scipy.io.loadmat`. The specs can be a cell
+        array or a struct array of structs, or a cell array of formats.
+
+    Returns
+    -------
+    specs: list
+        dict with 'format', 'dpi' (None for 'figDPI'), 'maxSize' (None for
+        the full size) and 'suffix' of each output. Empty if it was not
+        configured.
+    """
+
+    specs = []
+    try:
+        if 'pyOutputSpecs' not in processInfo.dtype.names:
+            return specs
+        items = _spec_items(processInfo['pyOutputSpecs'][0][0])
+    except (AttributeError, TypeError, ValueError, IndexError):
+        return specs
+
+    for item in items:
+        if isinstance(item, str):
+            spec = {'format': item}
+        else:
+            spec = {name: _field(item, name)
+                    for name in ('format', 'dpi', 'maxSize', 'suffix')}
+
+        try:
+            specs.append(normalize_spec(spec))
+        except (TypeError, ValueError) as e:
+            print('Invalid output spec {0}: {1}'.format(spec, e))
+
+    return specs
+
+
+def normalize_spec(spec):
+    """
+    Check the output spec and fill in the defaults.
+
+    Parameters
+    ----------
+    spec: dict
+        'format' and optional 'dpi', 'maxSize' and 'suffix'.
+
+    Returns
+    -------
+    spec: dict
+    """
+
+    fmt = str(spec.get('format') or '').lower().lstrip('.')
+    if not fmt:
+        raise ValueError('missing format')
+    if fmt not in RASTER_FORMATS + VECTOR_FORMATS:
+        raise ValueError('unsupported format {0}'.format(fmt))
+
+    dpi = spec.get('dpi')
+    dpi = float(dpi) if dpi is not None else None
+    maxSize = spec.get('maxSize')
+    maxSize = int(maxSize) if maxSize is not None else None
+    if ((dpi is not None) and (dpi <= 0)) or \
+       ((maxSize is not None) and (maxSize <= 0)):
+        raise ValueError('dpi and maxSize must be positive')
+
+    suffix = spec.get('suffix')
+    if suffix is None:
+        suffix = THUMBNAIL_SUFFIX if maxSize is not None else ''
+
+    return {'format': fmt, 'dpi': dpi, 'maxSize': maxSize,
+            'suffix': str(suffix)}
+
+
+@contextlib.contextmanager
+def extra_outputs(specs):
+    """
+    Save the extra outputs of every figure saved within the block (with
+    `savefig`, `polly_cache.save_figure` or the quicklooks of
+    `polly_raster`).
+
+    Parameters
+    ----------
+    specs: list
+        output specs (see `normalize_spec`).
+
+    Usage
+    -----
+    with extra_outputs([{'format': 'pdf'}, {'format': 'png',
+                                            'maxSize': 300}]):
+        fig.savefig('RCS_FR_532.png', dpi=150)
+    """
+
+    global _SPECS
+
+    install()
+    previous = _SPECS
+    _SPECS = tuple(normalize_spec(spec) for spec in specs)
+    try:
+        yield _SPECS
+    finally:
+        _SPECS = previous
+
+
+def save_outputs(fig, filename, dpi=None, rgba=None, cached=False):
+    """
+    Save the extra outputs of the figure, which was just saved as filename.
+
+    Parameters
+    ----------
+    fig: matplotlib figure
+    filename: str
+        file of the figure. The outputs are saved next to it.
+    dpi: float
+        resolution of the figure. `fig.dpi` if it was None.
+    rgba: uint8 array
+        the rendered image of the figure (rows from the top). The figure will
+        be rendered again for the raster outputs if it was None.
+    cached: bool
+        the figure was linked from the render cache (see `polly_cache`). The
+        image of a PNG file is read instead of rendering the figure again.
+
+    Returns
+    -------
+    files: list
+        the saved outputs.
+    """
+
+    global _SAVING
+
+    if (not _SPECS) or _SAVING:
+        return []
+
+    dpi = float(dpi or fig.dpi)
+    stem = os.path.splitext(filename)[0]
+    if (rgba is None) and cached:
+        rgba = _read_png(filename)
+    files = []
+
+    _SAVING = True
+    try:
+        with span('savefig', call='save_outputs',
+                  file=os.path.basename(filename)):
+            for spec in _SPECS:
+                outFile = '{0}{1}.{2}'.format(stem, spec['suffix'],
+                                              spec['format'])
+                if os.path.abspath(outFile) == os.path.abspath(filename):
+                    continue
+
+                try:
+                    _save_output(fig, outFile, spec, dpi, rgba)
+                except Exception as e:
+                    print('Failed saving {0}: {1}'.format(outFile, e))
+                    continue
+
+                files.append(outFile)
+    finally:
+        _SAVING = False
+
+    return files
+
+
+def _save_output(fig, outFile, spec, dpi, rgba):
+    """
+    Save one extra output of the figure.
+    """
+
+    outDpi = spec['dpi'] or dpi
+
+    if spec['format'] not in RASTER_FORMATS:
+        fig.savefig(outFile, dpi=outDpi)
+        return
+
+    # the figure is only drawn again for a higher resolution
+    if (rgba is None) or (outDpi > dpi):
+        image, srcDpi = _render_rgba(fig, outDpi), outDpi
+    else:
+        image, srcDpi = rgba, dpi
+    image = _resample(image, outDpi / srcDpi, spec['maxSize'])
+    if image is rgba:
+        # the buffer is changed by the next figure
+        image = np.array(rgba)
+    _write_raster(outFile, image, spec['format'], outDpi)
+
+
+def install():
+    """
+    Wrap `Figure.savefig`, which saves the extra outputs after the figure.
+    """
+
+    global _SAVEFIG
+    if _SAVEFIG is not None:
+        return
+
+    import functools
+    from matplotlib.figure import Figure
+
+    _SAVEFIG = Figure.savefig
+
+    @functools.wraps(_SAVEFIG)
+    def savefig(self, fname, *args, **kwargs):
+        result = _SAVEFIG(self, fname, *args, **kwargs)
+        if _SPECS and (not _SAVING) and isinstance(fname, (str, os.PathLike)):
+            dpi = _savefig_dpi(self, kwargs.get('dpi'))
+            save_outputs(self, os.fspath(fname), dpi,
+                         _rendered(self, fname, kwargs))
+        return result
+
+    Figure.savefig = savefig
+
+
+def _savefig_dpi(fig, dpi):
+    """
+    Resolution of `savefig`, which defaults to rcParams['savefig.dpi'].
+    """
+
+    import matplotlib
+
+    if dpi is None:
+        dpi = matplotlib.rcParams['savefig.dpi']
+    if dpi == 'figure':
+        dpi = fig.dpi
+
+    return float(dpi)
+
+
+def _rendered(fig, fname, kwargs):
+    """
+    Image left in the Agg canvas by `savefig` of a PNG file. None if the
+    figure was saved in another format or by a temporary canvas.
+    """
+
+    fmt = kwargs.get('format') or os.path.splitext(os.fspath(fname))[1][1:]
+    renderer = getattr(fig.canvas, 'renderer', None)
+    if (fmt.lower() != 'png') or (renderer is None) or \
+       (not hasattr(renderer, 'buffer_rgba')):
+        return None
+
+    return np.asarray(renderer.buffer_rgba())
+
+
+def _render_rgba(fig, dpi):
+    """
+    Render the figure into an RGBA array.
+    """
+
+    import PIL.Image
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi,
+                pil_kwargs={'compress_level': 0})
+    buffer.seek(0)
+
+    return np.asarray(PIL.Image.open(buffer).convert('RGBA'))
+
+
+def _read_png(filename):
+    """
+    RGBA image of the PNG file. None for the other formats.
+    """
+
+    if os.path.splitext(filename)[1].lower() != '.png':
+        return None
+
+    import PIL.Image
+
+    try:
+        with PIL.Image.open(filename) as image:
+            return np.asarray(image.convert('RGBA'))
+    except OSError:
+        return None
+
+
+def _resample(rgba, scale, maxSize):
+    """
+    Downscale the image by the scale factor and to fit in maxSize.
+    """
+
+    height, width = rgba.shape[:2]
+    if maxSize is not None:
+        scale = min(scale, maxSize / float(max(width, height)))
+    if scale >= 1:
+        return rgba
+
+    import PIL.Image
+
+    size = (max(1, int(round(width * scale))),
+            max(1, int(round(height * scale))))
+    image = PIL.Image.fromarray(np.ascontiguousarray(rgba))
+
+    return np.asarray(image.resize(size, PIL.Image.LANCZOS))
+
+
+def _write_raster(filename, rgba, fmt, dpi):
+    """
+    Write the image, the PNG files in the background threads.
+    """
+
+    if fmt == 'png':
+        write_png(filename, rgba, dpi=dpi, strict=False)
+    else:
+        import matplotlib.image as mpimg
+        mpimg.imsave(filename, rgba, format=PIL_FORMATS.get(fmt, fmt),
+                     dpi=dpi)
+
+
+def _spec_items(value):
+    """
+    Specs of the cell array or struct array from `scipy.io.loadmat`.
+    """
+
+    value = np.asarray(value)
+    if value.dtype.names is not None:
+        return list(value.ravel())
+    if value.dtype.kind in 'US':
+        return [str(item) for item in value.ravel()]
+    if value.dtype == object:
+        items = []
+        for item in value.ravel():
+            items.extend(_spec_items(item))
+        return items
+
+    return []
+
+
+def _field(record, name):
+    """
+    Field of the spec struct. None if it was missing or empty.
+    """
+
+    if name not in record.dtype.names:
+        return None
+
+    value = np.asarray(record[name])
+    while (value.dtype == object) and (value.size == 1):
+        value = np.asarray(value.ravel()[0])
+    if value.size == 0:
+        return None
+    if value.dtype.kind in 'US':
+        return str(value.ravel()[0])
+
+    return float(value.ravel()[0])
@@ -0,0 +1,109 @@
+"""
+Parallel rendering of independent figures inside one display function.
+
+The figures of one display function (e.g., RCS at 355, 532 and 1064 nm) only
+share the input arrays. They can be drawn and saved in a pool of worker
+processes. The input arrays are shared with the workers by the copy-on-write
+memory of `fork` and only the small figure specifications are sent to the
+workers, so the arrays are never pickled per figure.
+
+The drawing of each figure is recorded as the span 'figure' of the timing log
+(see `polly_timing`). The spans of the workers are returned to the main
+process.
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Record the timing spans of each figure.
+2026-10-17. Wait for the background writes before forking the workers.
+"""
+
+import multiprocessing
+
+from polly_timing import span, collect_spans, add_spans
+from polly_encode import wait_writes
+
+# drawing function and input data shared with the forked workers
+_SHARED = {}
+
+
+def figure_workers(processInfo):
+    """
+    Read the number of figure workers from the processInfo struct of the
+    .mat file ('pyFigureWorkers' in the pollynet processing chain config).
+
+    Parameters
+    ----------
+    processInfo: numpy structured array
+        mat['processInfo'] from `scipy.io.loadmat`.
+
+    Returns
+    -------
+    nWorkers: int
+        1 if it was not configured.
+    """
+
+    try:
+        if 'pyFigureWorkers' in processInfo.dtype.names:
+            return max(1, int(processInfo['pyFigureWorkers'][0][0][0][0]))
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    return 1
+
+
+def _draw_figure(iFig):
+    drawFunc, data, figures = _SHARED['task']
+    with collect_spans() as spans:
+        with span('figure', index=iFig):
+            drawFunc(data, figures[iFig])
+
+    return spans
+
+
+def render_figures(drawFunc, data, figures, nWorkers=1):
+    """
+    Draw the figures one after another or across a pool of forked processes.
+
+    Parameters
+    ----------
+    drawFunc: callable
+        drawFunc(data, figure), which draws and saves one figure.
+    data: dict
+        input arrays and shared settings for all the figures.
+    figures: list
+        specification of each figure.
+    nWorkers: int
+        number of worker processes. The figures will be drawn in the current
+        process if it is 1, if `fork` is not available (e.g., windows) or if
+        the current process is already a daemonic worker (e.g., the batch
+        runner in polly_display.py).
+    """
+
+    nWorkers = min(nWorkers, len(figures))
+    flagParallel = (nWorkers > 1) and \
+        ('fork' in multiprocessing.get_all_start_methods()) and \
+        (not multiprocessing.current_process().daemon)
+
+    if not flagParallel:
+        for iFig, figure in enumerate(figures):
+            with span('figure', index=iFig):
+                drawFunc(data, figure)
+        return
+
+    # the background writes of the earlier figures must not be running
+    # while the workers are forked (see `polly_encode.wait_writes`)
+    wait_writes()
+
+    _SHARED['task'] = (drawFunc, data, figures)
+    try:
+        ctx = multiprocessing.get_context('fork')
+        with ctx.Pool(nWorkers) as pool:
+            # the workers were forked outside of the span, so the spans of
+            # their figures are not nested in it
+            with span('workers', nWorkers=nWorkers):
+                for spans in pool.map(_draw_figure, range(len(figures)),
+                                      chunksize=1):
+                    add_spans(spans)
+    finally:
+        _SHARED.pop('task', None)
@@ -0,0 +1,606 @@
+"""
+Save the time-height quicklooks without rendering the data by matplotlib.
+
+The figure is rendered without the product only once. This frame contains
+the axes, ticks, labels, title, colorbar and the footer text. It is cached
+for each (instrument, product, figDPI), and it will be rendered again if any
+of the texts, axis limits or ticks were changed. The product is colored with
+a lookup table of the colormap (including the under, over and bad colors)
+only at the pixels of the axes, pasted under the frame and written to the PNG
+file directly.
+
+Only the products on a regular grid (see `polly_mesh.TimeHeightMesh`) with a
+linear color scale are supported. The other figures and formats are saved
+with `savefig`.
+
+The near-real-time processing draws the current file again whenever new
+profiles arrived. `append_quicklook` keeps the image and the frame of the
+last call in a state file. If the figure and the earlier columns of the
+product were not changed, only the new columns are colored and pasted into
+the image before it is encoded again.
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Add `append_quicklook` for the near-real-time quicklooks.
+2026-10-17. Look up the figures in the render cache before saving them.
+2026-10-17. Write the images with `polly_encode.write_png`.
+2026-10-17. Save the extra outputs of `polly_outputs` from the images.
+2026-10-17. Record the timing spans of saving the quicklooks.
+"""
+
+import os
+import time
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from matplotlib.colors import Normalize, to_rgba
+from matplotlib.text import Text
+
+from polly_cache import get_render_cache, figure_key, release_output
+from polly_encode import write_png, after_write
+from polly_outputs import save_outputs
+from polly_timing import span
+
+# maximum number of frames kept in the current process
+MAX_FRAMES = 32
+
+# pre-rendered frames, which are indexed by (instrument, product, figDPI)
+_FRAMES = OrderedDict()
+
+# state files of `append_quicklook` older than this will be removed (s)
+STATE_MAX_AGE = 2 * 86400
+
+# arrays of the frame in the state files
+FRAME_ARRAYS = ('base', 'pixRows', 'pixCols', 'dataRows', 'dataCols',
+                'blendRow', 'blendCol', 'blendFrame', 'background')
+
+
+def colormap_lut(cmap, background='w'):
+    """
+    Lookup table of the colormap with the under, over and bad colors.
+
+    Parameters
+    ----------
+    cmap: matplotlib colormap
+    background: color
+        color behind the colormap (axes facecolor), which will be shown
+        through the transparent colors.
+
+    Returns
+    -------
+    lut: uint8 array
+        (cmap.N + 3) x 3 RGB colors. The last three colors are the under, over
+        and bad colors.
+    """
+
+    colors = np.vstack((
+        cmap(np.arange(cmap.N)),
+        cmap(np.array([-1, cmap.N])),
+        cmap(np.ma.masked_array([0], mask=[True]))
+        ))
+
+    alpha = colors[:, 3:]
+    rgb = colors[:, :3] * alpha + \
+        np.array(to_rgba(background)[:3]) * (1 - alpha)
+
+    return (rgb * 255).astype(np.uint8)
+
+
+def color_index(data, vmin, vmax, N):
+    """
+    Index of the colormap lookup table for each value, the same as the
+    linear normalization of matplotlib.
+
+    Parameters
+    ----------
+    data: array (or masked array)
+    vmin, vmax: float
+        color limits.
+    N: int
+        number of colors of the colormap.
+
+    Returns
+    -------
+    index: array
+        index in the lookup table from `colormap_lut`.
+    """
+
+    values = np.ma.getdata(data).astype(np.float64)
+    bad = np.ma.getmaskarray(data) | np.isnan(values)
+    values[bad] = vmin
+
+    if vmax == vmin:
+        scaled = np.zeros(values.shape)
+    else:
+        scaled = (values - vmin) * (N / (vmax - vmin))
+    scaled[scaled == N] = N - 1
+
+    index = np.clip(scaled, 0, N - 1).astype(np.intp)
+    index[scaled < 0] = N
+    index[scaled >= N] = N + 1
+    index[bad] = N + 2
+
+    return index
+
+
+def save_quicklook(fig, mesh, filename, dpi, frameKey=None):
+    """
+    Save the figure with the product of the mesh rasterized by numpy.
+
+    Parameters
+    ----------
+    fig: matplotlib figure
+    mesh: TimeHeightMesh
+        product in the figure.
+    filename: str
+        output file. Only '.png' is rasterized directly.
+    dpi: int
+        figure resolution.
+    frameKey: tuple
+        (instrument, product, figDPI) to reuse the pre-rendered frame. The
+        frame will not be cached if it was None.
+
+    Usage
+    -----
+    save_quicklook(fig, mesh, 'RCS_FR_355.png', 150,
+                   frameKey=('arielle', 'RCS_FR_355', 150))
+    """
+
+    with span('savefig', call='save_quicklook',
+              file=os.path.basename(filename)):
+        # the same figure was saved before (see `polly_cache`)
+        cache = get_render_cache()
+        if cache is not None:
+            key = figure_key(fig, filename, dpi)
+            if cache.fetch(key, filename):
+                save_outputs(fig, filename, dpi, cached=True)
+                return
+        else:
+            release_output(filename)
+
+        mappable = mesh.mappable
+        if (mesh.grid is None) or \
+           (os.path.splitext(filename)[1].lower() != '.png') or \
+           (type(mappable.norm) is not Normalize) or \
+           (not hasattr(fig.canvas, 'buffer_rgba')):
+            fig.savefig(filename, dpi=dpi)
+        else:
+            frame = _get_frame(fig, mesh, dpi, frameKey)
+            image = _paste_data(frame, mesh)
+            write_png(filename, image, dpi=dpi)
+            save_outputs(fig, filename, dpi, image)
+
+        if cache is not None:
+            after_write(filename, cache.store, key, filename)
+
+
+def quicklook_append_hours(processInfo):
+    """
+    Read the period of the fixed time axis of the near-real-time quicklooks
+    from the processInfo struct of the .mat file ('pyQuicklookAppendHours'
+    in the pollynet processing chain config).
+
+    Parameters
+    ----------
+    processInfo: numpy structured array
+        mat['processInfo'] from `scipy.io.loadmat`.
+
+    Returns
+    -------
+    hours: float
+        0 if it was not configured (no appending).
+    """
+
+    try:
+        if 'pyQuicklookAppendHours' in processInfo.dtype.names:
+            return max(0, float(
+                processInfo['pyQuicklookAppendHours'][0][0][0][0]))
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    return 0
+
+
+def append_quicklook(fig, mesh, filename, dpi, stateFile, lastTime,
+                     frameKey=None):
+    """
+    Save the quicklook of a product on a fixed time axis (e.g., from
+    `polly_decimate.decimate` with `timeLim`), which only colors the columns
+    of the new profiles since the last call.
+
+    The image is made from scratch if the state file does not exist, or the
+    frame, the colors or the earlier columns of the product were changed
+    (e.g., a different lidar constant). The columns after the last profile
+    are left empty.
+
+    Parameters
+    ----------
+    fig: matplotlib figure
+    mesh: TimeHeightMesh
+        product in the figure.
+    filename: str
+        output file. Only '.png' is supported, the other formats are saved
+        with `save_quicklook`.
+    dpi: int
+        figure resolution.
+    stateFile: str
+        .npz file with the image and the frame of the last call. The other
+        state files in the same folder older than `STATE_MAX_AGE` will be
+        removed.
+    lastTime: float
+        time of the last profile. (datenum)
+    frameKey: tuple
+        (instrument, product, figDPI) to reuse the pre-rendered frame of the
+        current process.
+
+    Usage
+    -----
+    time, height, RCS = decimate(
+        mTime, height, RCS_FR_532, yLim, pixels,
+        timeLim=[mTime[0], mTime[0] + 6 / 24])
+    mesh.set_data(RCS, time, height)
+    append_quicklook(fig, mesh, 'RCS_FR_532.png', 150,
+                     'state/RCS_FR_532.npz', mTime[-1])
+    """
+
+    with span('savefig', call='append_quicklook',
+              file=os.path.basename(filename)):
+        mappable = mesh.mappable
+        if (mesh.grid is None) or \
+           (os.path.splitext(filename)[1].lower() != '.png') or \
+           (type(mappable.norm) is not Normalize) or \
+           (not hasattr(fig.canvas, 'buffer_rgba')):
+            save_quicklook(fig, mesh, filename, dpi, frameKey=frameKey)
+            return
+
+        data = mappable.get_array()
+        left, right = mesh.grid['extent'][:2]
+        nTime = mesh.grid['nTime']
+        nFilled = int(np.clip(
+            np.floor((lastTime - left) / (right - left) * nTime) + 1,
+            0, nTime))
+
+        # the frame and the colors need to be the same as the last call
+        frameSignature = _frame_signature(fig, mesh, dpi)
+        signature = _hash(repr(frameSignature).encode())
+        colors = _hash(colormap_lut(mappable.cmap).tobytes(),
+                       np.array(mappable.get_clim(),
+                                dtype=np.float64).tobytes())
+
+        state = _load_state(stateFile)
+        if (state is not None) and (state['signature'] == signature) and \
+           (state['colors'] == colors) and (state['nDone'] <= nFilled) and \
+           (state['done'] == _hash_columns(data, state['nDone'])):
+            frame, image = state['frame'], state['image']
+            nDone = state['nDone']
+        else:
+            frame = _get_frame(fig, mesh, dpi, frameKey, frameSignature)
+            image, nDone = frame['base'].copy(), 0
+
+        _paste_columns(frame, mesh, image, nDone, nFilled)
+        release_output(filename)
+        write_png(filename, image, dpi=dpi)
+        save_outputs(fig, filename, dpi, image)
+
+        # the last column can be changed by the next profiles
+        nDone = max(0, nFilled - 1)
+        _save_state(stateFile, {
+            'signature': signature,
+            'colors': colors,
+            'nDone': nDone,
+            'done': _hash_columns(data, nDone),
+            'frame': frame,
+            'image': image
+            })
+
+
+def release_frames():
+    """
+    Remove all the pre-rendered frames in the current process.
+    """
+
+    _FRAMES.clear()
+
+
+def _get_frame(fig, mesh, dpi, frameKey, signature=None):
+    """
+    Pre-rendered frame of the figure, which is rendered again if the figure
+    was changed.
+    """
+
+    if signature is None:
+        signature = _frame_signature(fig, mesh, dpi)
+    frame = _FRAMES.get(frameKey) if frameKey is not None else None
+    if (frame is None) or (frame['signature'] != signature):
+        frame = _render_frame(fig, mesh, dpi)
+        frame['signature'] = signature
+        if frameKey is not None:
+            _FRAMES[frameKey] = frame
+            while len(_FRAMES) > MAX_FRAMES:
+                _FRAMES.popitem(last=False)
+    elif frameKey is not None:
+        _FRAMES.move_to_end(frameKey)
+
+    return frame
+
+
+def _frame_signature(fig, mesh, dpi):
+    """
+    Everything of the frame which can be changed between the figures.
+    """
+
+    signature = [dpi, tuple(fig.get_size_inches()), mesh.mappable.cmap.name,
+                 tuple(mesh.grid['extent']),
+                 mesh.mappable.get_array().shape]
+
+    # tick labels, axis labels and titles are only placed while drawing. The
+    # tick labels are checked by the formatted ticks below and only the
+    # positions of the texts placed by the scripts are checked.
+    tickLabels = set()
+    for ax in fig.axes:
+        for axis in (ax.xaxis, ax.yaxis):
+            for tick in axis.get_major_ticks() + axis.get_minor_ticks():
+                tickLabels.update((id(tick.label1), id(tick.label2)))
+
+    for text in fig.findobj(Text):
+        if id(text) not in tickLabels:
+            signature.append((text.get_text(), text.get_fontsize(),
+                              text.get_visible()))
+
+    for text in fig.texts + [t for ax in fig.axes for t in ax.texts]:
+        signature.append(tuple(text.get_position()))
+
+    for ax in fig.axes:
+        signature.append((tuple(ax.get_position().bounds),
+                          ax.get_xlim(), ax.get_ylim()))
+        for axis in (ax.xaxis, ax.yaxis):
+            locs = axis.get_majorticklocs()
+            signature.append((
+                tuple(locs),
+                tuple(axis.get_major_formatter().format_ticks(locs)),
+                tuple(axis.get_minorticklocs())
+                ))
+
+    return signature
+
+
+def _render_frame(fig, mesh, dpi):
+    """
+    Render the figure without the product, the figure and axes background.
+    """
+
+    mappable = mesh.mappable
+    ax = mappable.axes
+
+    # render
+    origDPI = fig.dpi
+    visible = (mappable.get_visible(), fig.patch.get_visible(),
+               ax.patch.get_visible())
+    try:
+        fig.set_dpi(dpi)
+        mappable.set_visible(False)
+        fig.patch.set_visible(False)
+        ax.patch.set_visible(False)
+        fig.canvas.draw()
+        rgba = np.array(fig.canvas.buffer_rgba())
+
+        # pixels of the product
+        height, width = rgba.shape[:2]
+        x0, y0, x1, y1 = ax.bbox.extents
+        xDisp = np.arange(width) + 0.5
+        yDisp = height - (np.arange(height) + 0.5)
+        invTrans = ax.transData.inverted()
+        xData = invTrans.transform(
+            np.column_stack((xDisp, np.full(width, y0))))[:, 0]
+        yData = invTrans.transform(
+            np.column_stack((np.full(height, x0), yDisp)))[:, 1]
+    finally:
+        fig.set_dpi(origDPI)
+        mappable.set_visible(visible[0])
+        fig.patch.set_visible(visible[1])
+        ax.patch.set_visible(visible[2])
+
+    left, right, bottom, top = mesh.grid['extent']
+    nTime = mesh.grid['nTime']
+    nHeight = mappable.get_array().shape[0]
+    gridCol = np.floor((xData - left) / (right - left) * nTime)
+    gridRow = np.floor((yData - bottom) / (top - bottom) * nHeight)
+    flagCol = (xDisp >= x0) & (xDisp <= x1) & \
+        (gridCol >= 0) & (gridCol < nTime)
+    flagRow = (yDisp >= y0) & (yDisp <= y1) & \
+        (gridRow >= 0) & (gridRow < nHeight)
+
+    pixRows = np.nonzero(flagRow)[0]
+    pixCols = np.nonzero(flagCol)[0]
+
+    # compose the frame over the background
+    under = np.empty((height, width, 3), dtype=np.uint8)
+    under[:] = _rgb_bytes(fig.get_facecolor())
+    axRows = np.nonzero((yDisp >= y0) & (yDisp <= y1))[0]
+    axCols = np.nonzero((xDisp >= x0) & (xDisp <= x1))[0]
+    under[np.ix_(axRows, axCols)] = _rgb_bytes(ax.get_facecolor())
+    base = _blend(rgba, under)
+
+    # frame pixels (ticks, spines) on top of the product
+    region = np.ix_(pixRows, pixCols)
+    blendRow, blendCol = np.nonzero(rgba[:, :, 3][region] > 0)
+    blendRow = pixRows[blendRow]
+    blendCol = pixCols[blendCol]
+
+    return {
+        'base': base,
+        'region': region,
+        'dataRows': gridRow[pixRows].astype(np.intp),
+        'dataCols': gridCol[pixCols].astype(np.intp),
+        'blendPixel': (blendRow, blendCol),
+        'blendFrame': rgba[blendRow, blendCol],
+        'background': ax.get_facecolor()
+    }
+
+
+def _paste_data(frame, mesh):
+    """
+    Color the product at the pixels of the axes and put it under the frame.
+    """
+
+    mappable = mesh.mappable
+    data = mappable.get_array()
+    cmap = mappable.cmap
+    vmin, vmax = mappable.get_clim()
+
+    # the product at each pixel (nearest, the gaps were already masked)
+    pixData = data[np.ix_(frame['dataRows'], frame['dataCols'])]
+    index = color_index(pixData, vmin, vmax, cmap.N)
+    pixRGB = colormap_lut(cmap, frame['background'])[index]
+
+    image = frame['base'].copy()
+    image[frame['region']] = pixRGB
+
+    # ticks and spines on top of the product
+    image[frame['blendPixel']] = _blend(
+        frame['blendFrame'], image[frame['blendPixel']])
+
+    return image
+
+
+def _paste_columns(frame, mesh, image, start, stop):
+    """
+    Color the columns [start, stop) of the product at the pixels of the axes
+    and put them under the frame in place.
+    """
+
+    flagCol = (frame['dataCols'] >= start) & (frame['dataCols'] < stop)
+    if not np.any(flagCol):
+        return
+
+    mappable = mesh.mappable
+    cmap = mappable.cmap
+    vmin, vmax = mappable.get_clim()
+
+    pixRows = frame['region'][0].ravel()
+    pixCols = frame['region'][1].ravel()[flagCol]
+    pixData = mappable.get_array()[
+        np.ix_(frame['dataRows'], frame['dataCols'][flagCol])]
+    index = color_index(pixData, vmin, vmax, cmap.N)
+    image[np.ix_(pixRows, pixCols)] = \
+        colormap_lut(cmap, frame['background'])[index]
+
+    # ticks and spines on top of the product
+    blendRow, blendCol = frame['blendPixel']
+    flagBlend = np.isin(blendCol, pixCols)
+    pixel = (blendRow[flagBlend], blendCol[flagBlend])
+    image[pixel] = _blend(frame['blendFrame'][flagBlend], image[pixel])
+
+
+def _hash(*chunks):
+    sha1 = hashlib.sha1()
+    for chunk in chunks:
+        sha1.update(chunk)
+
+    return sha1.hexdigest()
+
+
+def _hash_columns(data, nCol):
+    """
+    Hash of the first columns of the product (data and mask).
+    """
+
+    return _hash(
+        np.ascontiguousarray(np.ma.getdata(data)[:, :nCol]).tobytes(),
+        np.ascontiguousarray(np.ma.getmaskarray(data)[:, :nCol]).tobytes())
+
+
+def _load_state(stateFile):
+    """
+    Load the state of `append_quicklook`. None if it does not exist or cannot
+    be read.
+    """
+
+    if not os.path.exists(stateFile):
+        return None
+
+    try:
+        with np.load(stateFile, allow_pickle=False) as npz:
+            arrays = {name: npz['frame.' + name] for name in FRAME_ARRAYS}
+            return {
+                'signature': str(npz['signature']),
+                'colors': str(npz['colors']),
+                'nDone': int(npz['nDone']),
+                'done': str(npz['done']),
+                'image': npz['image'],
+                'frame': {
+                    'base': arrays['base'],
+                    'region': np.ix_(arrays['pixRows'], arrays['pixCols']),
+                    'dataRows': arrays['dataRows'],
+                    'dataCols': arrays['dataCols'],
+                    'blendPixel': (arrays['blendRow'], arrays['blendCol']),
+                    'blendFrame': arrays['blendFrame'],
+                    'background': tuple(arrays['background'])
+                    }
+                }
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _save_state(stateFile, state):
+    """
+    Save the state of `append_quicklook` and remove the old state files in
+    the same folder (e.g., of the files from the days before).
+    """
+
+    frame = state['frame']
+    arrays = {
+        'signature': np.array(state['signature']),
+        'colors': np.array(state['colors']),
+        'nDone': np.array(state['nDone']),
+        'done': np.array(state['done']),
+        'image': state['image'],
+        'frame.base': frame['base'],
+        'frame.pixRows': frame['region'][0].ravel(),
+        'frame.pixCols': frame['region'][1].ravel(),
+        'frame.dataRows': frame['dataRows'],
+        'frame.dataCols': frame['dataCols'],
+        'frame.blendRow': frame['blendPixel'][0],
+        'frame.blendCol': frame['blendPixel'][1],
+        'frame.blendFrame': frame['blendFrame'],
+        'frame.background': np.array(to_rgba(frame['background']))
+        }
+
+    folder = os.path.dirname(os.path.abspath(stateFile))
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+
+    tmpFile = '{0}.{1}.tmp'.format(stateFile, os.getpid())
+    try:
+        with open(tmpFile, 'wb') as fh:
+            np.savez(fh, **arrays)
+        os.replace(tmpFile, stateFile)
+    finally:
+        if os.path.exists(tmpFile):
+            os.remove(tmpFile)
+
+    now = time.time()
+    for filename in os.listdir(folder):
+        filename = os.path.join(folder, filename)
+        try:
+            if filename.endswith('.npz') and \
+               (now - os.path.getmtime(filename) > STATE_MAX_AGE):
+                os.remove(filename)
+        except OSError:
+            pass
+
+
+def _rgb_bytes(color):
+    return (np.array(to_rgba(color)[:3]) * 255).round().astype(np.uint8)
+
+
+def _blend(rgba, rgb):
+    """
+    Put the RGBA pixels over the RGB pixels (both uint8).
+    """
+
+    alpha = rgba[..., 3:].astype(np.uint16)
+
+    return ((rgba[..., :3] * alpha + rgb * (255 - alpha) + 127) // 255
+            ).astype(np.uint8)
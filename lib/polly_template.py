@@ -0,0 +1,69 @@
+"""
+Figure templates for the quicklooks with the same layout.
+
+The time-height quicklooks of one display function (e.g., RCS at 355, 532 and
+1064 nm) share the figure size, axes, locators, tick parameters, colorbar axes
+and the footer text. The figure will be built only once for each layout with
+the first figure and the following figures only update the data, color limits,
+title and the output filename before saving.
+
+The templates are kept per process. Therefore, they can also be used by the
+workers of `polly_parallel.render_figures`.
+
+History
+-------
+2026-10-17. First edition
+"""
+
+import matplotlib.pyplot as plt
+
+# figure templates in the current process, which are indexed by the layout
+_TEMPLATES = {}
+
+
+def figure_template(layout, buildFunc, *args):
+    """
+    Get the figure template of the layout.
+
+    Parameters
+    ----------
+    layout: str
+        name of the layout.
+    buildFunc: callable
+        buildFunc(*args), which builds the figure and returns a dict of the
+        artists to be updated (with at least the key 'fig'). It will only be
+        called for the first figure of the layout.
+    args:
+        arguments for buildFunc.
+
+    Returns
+    -------
+    template: dict
+        artists of the figure template.
+
+    Usage
+    -----
+    template = figure_template('rcs', _build_rcs_template, data, figure,
+                               time, height, matrix)
+    template['mesh'].set_data(matrix, time, height)
+    template['mesh'].mappable.set_clim(cRange)
+    save_quicklook(template['fig'], template['mesh'], picFile, figDPI)
+    """
+
+    if layout not in _TEMPLATES:
+        _TEMPLATES[layout] = buildFunc(*args)
+
+    return _TEMPLATES[layout]
+
+
+def release_templates():
+    """
+    Close all the figure templates in the current process. It needs to be
+    called after all the figures of the display function were saved, because
+    the grid of the templates differs between the measurement files.
+    """
+
+    for template in _TEMPLATES.values():
+        plt.close(template['fig'])
+
+    _TEMPLATES.clear()
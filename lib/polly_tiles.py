@@ -0,0 +1,210 @@
+"""
+Tile pyramids of the time-height products for zoomable quicklooks.
+
+The product is cropped to the y-limits and colored at the resolution of the
+measurements (one pixel for each profile and range bin) with the colormap
+and color range of the quicklook. This raster is the highest zoom level. The
+lower levels are made in the same pass by averaging 2 x 2 pixels of the
+level above, until the whole raster fits in one tile.
+
+The tiles are saved as '{folder}/{z}/{x}/{y}.png', with x counted from the
+first profile and y from the top of the raster. The tiles at the right and
+bottom borders are padded with transparent pixels. 'metadata.json' in the
+folder describes the zoom levels, the time and height extents of the raster
+and the color range.
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Record the timing spans of saving the tiles.
+"""
+
+import os
+import sys
+import json
+import shutil
+import numpy as np
+import matplotlib.image as mpimg
+
+from polly_decimate import decimate
+from polly_mesh import regular_grid
+from polly_raster import colormap_lut, color_index
+from polly_time import datenum_to_datetime64
+from polly_timing import span
+
+# version of the metadata
+TILES_VERSION = 1
+
+# width and height of the tiles (pixels)
+TILE_SIZE = 256
+
+METADATA_FILE = 'metadata.json'
+
+
+def tile_pyramid_enabled(processInfo):
+    """
+    Read 'pyTilePyramid' in the pollynet processing chain config from the
+    processInfo struct of the .mat file.
+
+    Parameters
+    ----------
+    processInfo: numpy structured array
+        mat['processInfo'] from `scipy.io.loadmat`.
+
+    Returns
+    -------
+    flag: bool
+        False if it was not configured.
+    """
+
+    try:
+        if 'pyTilePyramid' in processInfo.dtype.names:
+            return bool(processInfo['pyTilePyramid'][0][0][0][0])
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    return False
+
+
+def save_tile_pyramid(folder, time, height, matrix, yLim, cmap, cRange,
+                      masks=(), scale=1, metadata=None):
+    """
+    Save the tile pyramid of a time-height product.
+
+    Parameters
+    ----------
+    folder: str
+        output folder. The tiles of an earlier call will be replaced.
+    time, height, matrix, yLim, masks, scale:
+        see `polly_decimate.decimate`. The product is not reduced.
+    cmap: matplotlib colormap
+    cRange: list
+        color range [vmin, vmax] of the linear color scale.
+    metadata: dict
+        additional items of 'metadata.json', e.g., the title and unit.
+
+    Returns
+    -------
+    maxZoom: int
+        highest zoom level. None if the product was not on a regular grid.
+
+    Usage
+    -----
+    save_tile_pyramid(
+        os.path.join(saveFolder, '{0}_RCS_FR_532_tiles'.format(dataFile)),
+        mTime, height, RCS_FR_532, [0, 15000], plt.cm.jet, [0, 15],
+        masks=[profileMask], scale=1e-6,
+        metadata={'title': 'Range-Corrected Signal at 532nm'})
+    """
+
+    with span('savefig', call='save_tile_pyramid',
+              file=os.path.basename(folder)):
+        # crop and mask the product on the regular grid without reducing it
+        time, height, product = decimate(
+            time, height, matrix, yLim, (sys.maxsize, sys.maxsize),
+            masks=masks, scale=scale)
+        grid = regular_grid(time, height)
+        if grid is None:
+            print('Skip the tiles of {0} (irregular grid).'.format(folder))
+            return None
+
+        # pixels from the top of the raster
+        rgb = colormap_lut(cmap)[
+            color_index(product, cRange[0], cRange[1], cmap.N)]
+        if height[-1] > height[0]:
+            rgb = rgb[::-1]
+
+        nRow, nCol = rgb.shape[:2]
+        maxZoom = int(max(0, np.ceil(np.log2(max(nRow, nCol) / TILE_SIZE))))
+
+        tmpFolder = '{0}.{1}.tmp'.format(folder.rstrip(os.sep), os.getpid())
+        if os.path.exists(tmpFolder):
+            shutil.rmtree(tmpFolder)
+
+        levels = []
+        try:
+            for zoom in range(maxZoom, -1, -1):
+                levels.append(_save_level(tmpFolder, zoom, rgb))
+                if zoom:
+                    rgb = _downsample(rgb)
+
+            left, right, bottom, top = grid['extent']
+            items = {
+                'version': TILES_VERSION,
+                'tileSize': TILE_SIZE,
+                'minZoom': 0,
+                'maxZoom': maxZoom,
+                'levels': levels[::-1],
+                'time': {
+                    'start': str(datenum_to_datetime64(left)),
+                    'stop': str(datenum_to_datetime64(right)),
+                    'startDatenum': float(left),
+                    'stopDatenum': float(right),
+                    'resolution': round(
+                        float((right - left) / nCol * 86400), 3)
+                    },
+                'height': {
+                    'bottom': float(min(bottom, top)),
+                    'top': float(max(bottom, top)),
+                    'resolution': round(float(abs(top - bottom) / nRow), 3)
+                    },
+                'colorRange': [float(cRange[0]), float(cRange[1])],
+                'colormap': cmap.name
+                }
+            if metadata:
+                items.update(metadata)
+
+            with open(os.path.join(tmpFolder, METADATA_FILE), 'w') as fh:
+                json.dump(items, fh, indent=2)
+
+            if os.path.exists(folder):
+                shutil.rmtree(folder)
+            os.replace(tmpFolder, folder)
+        finally:
+            if os.path.exists(tmpFolder):
+                shutil.rmtree(tmpFolder)
+
+        return maxZoom
+
+
+def _save_level(folder, zoom, rgb):
+    """
+    Save the tiles of one zoom level.
+    """
+
+    nRow, nCol = rgb.shape[:2]
+    nTileX = int(np.ceil(nCol / TILE_SIZE))
+    nTileY = int(np.ceil(nRow / TILE_SIZE))
+
+    tile = np.zeros((TILE_SIZE, TILE_SIZE, 4), dtype=np.uint8)
+    for x in range(nTileX):
+        xFolder = os.path.join(folder, str(zoom), str(x))
+        os.makedirs(xFolder)
+        cols = slice(x * TILE_SIZE, min((x + 1) * TILE_SIZE, nCol))
+        for y in range(nTileY):
+            rows = slice(y * TILE_SIZE, min((y + 1) * TILE_SIZE, nRow))
+            nTileRow = rows.stop - rows.start
+            nTileCol = cols.stop - cols.start
+
+            # transparent outside of the raster
+            tile[:] = 0
+            tile[:nTileRow, :nTileCol, :3] = rgb[rows, cols]
+            tile[:nTileRow, :nTileCol, 3] = 255
+            mpimg.imsave(os.path.join(xFolder, '{0}.png'.format(y)), tile)
+
+    return {'zoom': zoom, 'width': nCol, 'height': nRow,
+            'tilesX': nTileX, 'tilesY': nTileY}
+
+
+def _downsample(rgb):
+    """
+    Average 2 x 2 pixels. The last row and column are repeated for the odd
+    sizes.
+    """
+
+    nRow, nCol = rgb.shape[:2]
+    rgb = np.pad(rgb, ((0, nRow % 2), (0, nCol % 2), (0, 0)), mode='edge')
+    rgb = rgb.astype(np.uint16)
+
+    return ((rgb[0::2, 0::2] + rgb[1::2, 0::2] + rgb[0::2, 1::2] +
+             rgb[1::2, 1::2] + 2) // 4).astype(np.uint8)
@@ -0,0 +1,91 @@
+"""
+Convert the MATLAB datenum to numpy and matplotlib dates.
+
+The display scripts used to convert each datenum to a python datetime with
+several `timedelta` objects. The conversion here is done for the whole array
+at once with the same steps (hours, minutes and seconds of the day, and the
+seconds rounded half to even like `round`), so the dates are identical to the
+old conversion at the level of seconds.
+
+History
+-------
+2026-10-17. First edition
+"""
+
+import numpy as np
+from matplotlib.dates import date2num
+
+# datenum of 1970-01-01
+DATENUM_EPOCH = 719529
+
+
+def datenum_to_datetime64(datenum):
+    """
+    Convert MATLAB datenum to numpy datetime64 with the resolution of
+    seconds.
+
+    Parameters
+    ----------
+    datenum: float or array
+
+    Returns
+    -------
+    dt64: datetime64 array
+        the same shape as the input. NaN will be converted to NaT.
+
+    Usage
+    -----
+    LCTime = datenum_to_datetime64(LCTime)
+    ax.scatter(LCTime, LC)
+    """
+
+    datenum = np.asarray(datenum, dtype=np.float64)
+    flagValid = np.isfinite(datenum)
+    datenum = np.where(flagValid, datenum, DATENUM_EPOCH)
+
+    days = np.floor(datenum)
+    hours = datenum % 1 * 24
+    minutes = hours % 1 * 60
+    seconds = minutes % 1 * 60
+    seconds = (days - DATENUM_EPOCH) * 86400 + np.floor(hours) * 3600 + \
+        np.floor(minutes) * 60 + np.round(seconds)
+    dt64 = np.asarray(seconds).astype(np.int64).astype('datetime64[s]')
+
+    return np.where(flagValid, dt64, np.datetime64('NaT'))
+
+
+def datenum_to_mpl(datenum):
+    """
+    Convert MATLAB datenum to the date numbers of matplotlib.
+
+    Parameters
+    ----------
+    datenum: float or array
+
+    Returns
+    -------
+    num: float array
+        days since the epoch of matplotlib (see `matplotlib.dates`).
+    """
+
+    return date2num(datenum_to_datetime64(datenum))
+
+
+def datenum_to_datetime(datenum):
+    """
+    Convert a MATLAB datenum to python datetime, e.g., for the titles.
+
+    Parameters
+    ----------
+    datenum: float
+
+    Returns
+    -------
+    dtObj: datetime object
+
+    Usage
+    -----
+    datenum_to_datetime(mTime[0]).strftime('%Y-%m-%d')
+    """
+
+    return datenum_to_datetime64(float(datenum)).item()
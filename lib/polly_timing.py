@@ -0,0 +1,437 @@
+"""
+Timing spans of the python display functions.
+
+The steps of the display functions are timed with explicit spans in the
+functions of the library:
+
+    loadmat:  reading the handoff (`polly_handoff.load_handoff`)
+    extract:  reading and normalizing the declared variables
+              (`polly_handoff.load_variables`, including the nested
+              'loadmat')
+    mask:     cropping, reducing and masking the products
+              (`polly_decimate.decimate`, `polly_decimate.profile_mask`)
+    savefig:  rendering and saving the figures (the PNG files of `savefig`
+              through `polly_encode`, `polly_raster.save_quicklook`,
+              `polly_cache.save_figure`, the extra outputs of
+              `polly_outputs` and the tile pyramids)
+    encoding: compressing the images (`polly_encode.write_png`, nested in
+              'savefig', or in the background threads of `polly_encode`)
+
+The whole display function is the span 'display' and each figure drawn by
+`polly_parallel.render_figures` is the span 'figure'. The time of these spans
+which is not spent in any other span is the creation of the artists, which is
+saved as the span 'artists' of the job. The spans of the background threads
+overlap with the other spans and are not nested in them ('background').
+
+All the spans of one job are written as JSON lines into
+'{log_folder}/display_timing_{yyyymmdd}.jsonl', with the instrument, the
+display function, the product and the shapes of the arrays. The log folder
+is given by the caller (see `timing_log_folder`) and the instrument is the
+'campaignInfo.name' which the display script requested from
+`load_variables`.
+
+Usage
+-----
+run the display function as a job::
+
+    processInfo = load_process_info(tmpFile)
+    with display_job(funcName, tmpFile, saveFolder,
+                     logFolder=timing_log_folder(processInfo)):
+        func(tmpFile, saveFolder)
+
+and time a step in the library::
+
+    with span('mask', shape=list(matrix.shape)):
+        ...
+
+History
+-------
+2026-10-17. First edition
+2026-10-17. Add the spans of the background threads.
+2026-10-17. Replace the wrappers of the functions with explicit spans.
+"""
+
+import os
+import json
+import time
+import threading
+import contextlib
+from datetime import datetime, timedelta, timezone
+
+# version of the span records
+TIMING_VERSION = 1
+
+TIMING_FILE = 'display_timing_{date}.jsonl'
+
+# spans which only group the spans of the display function
+CONTAINER_SPANS = ('display', 'figure')
+
+# trace of the running job
+_CURRENT = None
+
+
+class Trace(object):
+    """
+    Spans of one display job.
+    """
+
+    def __init__(self, funcName):
+        self.funcName = funcName
+        self.context = {}
+        self.spans = []
+        self.status = 'success'
+        self._stack = []
+        self._thread = threading.get_ident()
+        self._tStart = time.perf_counter()
+        self._wallStart = datetime.now(timezone.utc)
+
+    def open(self, name, attrs=None):
+        record = {
+            'span': name,
+            'parent': self._stack[-1]['span'] if self._stack else None,
+            'depth': len(self._stack),
+            'outermost': all(parent['span'] in CONTAINER_SPANS
+                             for parent in self._stack),
+            'start': time.perf_counter() - self._tStart,
+            '_children': 0.0
+            }
+        if attrs:
+            record.update(attrs)
+        self._stack.append(record)
+
+        return record
+
+    def close(self, record):
+        record['duration'] = time.perf_counter() - self._tStart - \
+            record['start']
+        record['self'] = max(0.0, record['duration'] -
+                             record.pop('_children'))
+
+        # spans are closed in the reversed order of opening
+        while self._stack and (self._stack.pop() is not record):
+            pass
+        if self._stack:
+            self._stack[-1]['_children'] += record['duration']
+
+        self.spans.append(record)
+
+    def owned(self):
+        """
+        Whether the current thread is the thread of the display function.
+        Only its calls are nested in the spans.
+        """
+
+        return threading.get_ident() == self._thread
+
+    def artists(self):
+        """
+        Time of the display function and figures which is not spent in any
+        other span. (s)
+        """
+
+        return sum(record['self'] for record in self.spans
+                   if record['span'] in CONTAINER_SPANS)
+
+    def records(self):
+        """
+        Span records of the job for the log, ordered by the start time.
+        """
+
+        product = self.funcName.partition('_display_')[2] or self.funcName
+        common = {
+            'version': TIMING_VERSION,
+            'job': '{0}-{1}'.format(
+                os.getpid(), self._wallStart.strftime('%Y%m%d%H%M%S%f')),
+            'pid': os.getpid(),
+            'instrument': self.context.get('instrument', ''),
+            'func': self.funcName,
+            'product': product,
+            'status': self.status
+            }
+
+        spans = sorted(self.spans, key=lambda record: record['start'])
+        spans.append({'span': 'artists', 'parent': 'display', 'depth': 1,
+                      'outermost': True, 'start': 0.0,
+                      'duration': self.artists(), 'self': self.artists()})
+
+        records = []
+        for span in spans:
+            record = dict(common)
+            record['time'] = (self._wallStart + timedelta(
+                seconds=span['start'])).isoformat(timespec='milliseconds')
+            record.update(span)
+            records.append(record)
+
+        return records
+
+
+@contextlib.contextmanager
+def display_job(funcName, tmpFile, saveFolder, logFolder=None, save=True):
+    """
+    Record the spans of one display function.
+
+    Parameters
+    ----------
+    funcName: str
+        display function name, e.g., 'pollyxt_display_rcs'.
+    tmpFile: str
+        handoff of the display function.
+    saveFolder: str
+        folder to save the figures.
+    logFolder: str
+        folder of the timing log (see `timing_log_folder`). Nothing will be
+        written if it was empty.
+    save: bool
+        whether to write the spans into the timing log.
+
+    Returns
+    -------
+    trace: Trace
+        the spans are available after the job was finished.
+
+    Usage
+    -----
+    with display_job('pollyxt_display_rcs', tmpFile, saveFolder,
+                     logFolder=timing_log_folder(processInfo)):
+        pollyxt_display_rcs(tmpFile, saveFolder)
+    """
+
+    global _CURRENT
+
+    trace = Trace(funcName)
+    previous = _CURRENT
+    _CURRENT = trace
+
+    try:
+        with span('display', tmpFile=os.path.basename(tmpFile),
+                  saveFolder=saveFolder):
+            yield trace
+    except BaseException:
+        trace.status = 'failure'
+        raise
+    finally:
+        _CURRENT = previous
+
+        if save and logFolder:
+            try:
+                save_spans(logFolder, trace)
+            except OSError as e:
+                print('Failed writing the timing log in {0}: {1}'.format(
+                    logFolder, e))
+
+
+@contextlib.contextmanager
+def span(name, **attrs):
+    """
+    Record a span of the running job. Nothing will be recorded outside of
+    `display_job`.
+
+    Usage
+    -----
+    with span('figure', index=iFig):
+        drawFunc(data, figure)
+    """
+
+    trace = _CURRENT
+    if (trace is None) or (not trace.owned()):
+        yield None
+        return
+
+    record = trace.open(name, attrs)
+    try:
+        yield record
+    finally:
+        trace.close(record)
+
+
+def set_context(**context):
+    """
+    Set the context of the running job, which is saved with each span, e.g.,
+    the instrument from the variables of the display script.
+
+    Usage
+    -----
+    set_context(instrument=values['campaignInfo.name'])
+    """
+
+    if _CURRENT is not None:
+        _CURRENT.context.update(context)
+
+
+def array_shapes(values):
+    """
+    Shapes of the numeric arrays for the span records.
+
+    Parameters
+    ----------
+    values: dict
+        variables, e.g., from `polly_handoff.load_variables`.
+
+    Returns
+    -------
+    shapes: dict
+        {name: shape}
+    """
+
+    return {name: list(value.shape) for name, value in values.items()
+            if (getattr(value, 'ndim', 0) > 0) and
+            (getattr(value, 'dtype', None) is not None) and
+            (value.dtype.names is None)}
+
+
+def timing_log_folder(processInfo):
+    """
+    Read the folder of the timing log from the processInfo struct of the
+    .mat file ('log_folder' in the pollynet processing chain config).
+
+    Parameters
+    ----------
+    processInfo: numpy structured array
+        mat['processInfo'] from `scipy.io.loadmat`.
+
+    Returns
+    -------
+    logFolder: str
+        None if it was not configured.
+    """
+
+    try:
+        if 'log_folder' in processInfo.dtype.names:
+            value = processInfo['log_folder'][0][0]
+            return str(value[0]) if len(value) else None
+    except (AttributeError, TypeError, ValueError, IndexError):
+        pass
+
+    return None
+
+
+@contextlib.contextmanager
+def background_span(name, **attrs):
+    """
+    Record a span of a background thread of the running job (e.g., the PNG
+    encoding of `polly_encode`), which is not nested in the other spans.
+
+    Usage
+    -----
+    with background_span('encoding', file='RCS_FR_532.png'):
+        image.save('RCS_FR_532.png')
+    """
+
+    trace = _CURRENT
+    if trace is None:
+        yield None
+        return
+
+    record = {
+        'span': name,
+        'parent': None,
+        'depth': 0,
+        'outermost': False,
+        'background': True,
+        'start': time.perf_counter() - trace._tStart
+        }
+    record.update(attrs)
+    try:
+        yield record
+    finally:
+        record['duration'] = time.perf_counter() - trace._tStart - \
+            record['start']
+        record['self'] = record['duration']
+        trace.spans.append(record)
+
+
+@contextlib.contextmanager
+def collect_spans():
+    """
+    Collect the spans recorded in a forked worker, which are returned to the
+    main process and added with `add_spans`.
+
+    Usage
+    -----
+    with collect_spans() as spans:
+        drawFunc(data, figure)
+    return spans
+    """
+
+    spans = []
+    trace = _CURRENT
+    nSpans = len(trace.spans) if trace is not None else 0
+    try:
+        yield spans
+    finally:
+        if trace is not None:
+            spans.extend(dict(record, worker=os.getpid())
+                         for record in trace.spans[nSpans:])
+            del trace.spans[nSpans:]
+
+
+def add_spans(spans):
+    """
+    Add the spans of a worker process to the running job.
+    """
+
+    if (_CURRENT is not None) and spans:
+        _CURRENT.spans.extend(spans)
+
+
+def save_spans(logFolder, trace):
+    """
+    Append the spans of the job to the timing log of the day.
+
+    Parameters
+    ----------
+    logFolder: str
+    trace: Trace
+
+    Returns
+    -------
+    logFile: str
+    """
+
+    if not os.path.exists(logFolder):
+        os.makedirs(logFolder, exist_ok=True)
+
+    logFile = os.path.join(logFolder, TIMING_FILE.format(
+        date=datetime.now(timezone.utc).strftime('%Y%m%d')))
+    lines = ''.join(json.dumps(record, default=str) + '\n'
+                    for record in trace.records())
+
+    # one write for all the lines, which are not interleaved with the jobs
+    # of other processes in append mode
+    with open(logFile, 'a') as fh:
+        fh.write(lines)
+
+    return logFile
+
+
+def outermost_durations(spans):
+    """
+    Total duration of each span, only counting the spans which are not
+    nested in other spans (except 'display' and 'figure').
+
+    Returns
+    -------
+    durations: dict
+        {span: seconds}
+    """
+
+    durations = {}
+    for record in spans:
+        if record['outermost'] and (record['span'] not in CONTAINER_SPANS):
+            durations[record['span']] = durations.get(record['span'], 0.0) + \
+                record['duration']
+
+    return durations
+
+
+def _own_after_fork():
+    """
+    The forked process continues the running job in its only thread.
+    """
+
+    if _CURRENT is not None:
+        _CURRENT._thread = threading.get_ident()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_own_after_fork)
@@ -1,8 +1,6 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,53 +9,9 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
                              MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -93,6 +47,8 @@ def pollyxt_dwd_display_depolcali(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     """
 
     if not os.path.exists(tmpFile):
@@ -101,35 +57,64 @@ def pollyxt_dwd_display_depolcali(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        sig_t_p = np.transpose(np.concatenate(mat['sig_t_p']))
-        sig_t_m = np.transpose(np.concatenate(mat['sig_t_m']))
-        sig_x_p = np.transpose(np.concatenate(mat['sig_x_p']))
-        sig_x_m = np.transpose(np.concatenate(mat['sig_x_m']))
-        wavelength = mat['wavelength'][0][0]
-        time = np.concatenate(mat['time'])
-        height = np.concatenate(mat['height'])
-        caliHIndxRange = np.concatenate(mat['caliHIndxRange'])
-        indx_45m = np.concatenate(mat['indx_45m'])
-        indx_45p = np.concatenate(mat['indx_45p'])
-        dplus = np.transpose(np.concatenate(mat['dplus']))
-        dminus = np.transpose(np.concatenate(mat['dminus']))
-        segmentLen = np.concatenate(mat['segmentLen'])
-        indx = np.concatenate(mat['indx'])
-        mean_dplus_tmp = np.concatenate(mat['mean_dplus_tmp'])
-        std_dplus_tmp = np.concatenate(mat['std_dplus_tmp'])
-        mean_dminus_tmp = np.concatenate(mat['mean_dminus_tmp'])
-        std_dminus_tmp = np.concatenate(mat['std_dminus_tmp'])
-        TRt = np.concatenate(mat['TR_t'])
-        TRx = np.concatenate(mat['TR_x'])
-        segIndx = np.concatenate(mat['segIndx'])
-        caliTime = np.concatenate(mat['caliTime'])
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        imgFormat = mat['imgFormat'][:][0]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'sig_t_p': 'vector',
+            'sig_t_m': 'vector',
+            'sig_x_p': 'vector',
+            'sig_x_m': 'vector',
+            'wavelength': 'scalar',
+            'time': 'vector',
+            'height': 'vector',
+            'caliHIndxRange': 'vector',
+            'indx_45m': 'vector',
+            'indx_45p': 'vector',
+            'dplus': 'vector',
+            'dminus': 'vector',
+            'segmentLen': 'vector',
+            'indx': 'vector',
+            'mean_dplus_tmp': 'vector',
+            'std_dplus_tmp': 'vector',
+            'mean_dminus_tmp': 'vector',
+            'std_dminus_tmp': 'vector',
+            'TR_t': 'vector',
+            'TR_x': 'vector',
+            'segIndx': 'vector',
+            'caliTime': 'vector',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        sig_t_p = mat['sig_t_p']
+        sig_t_m = mat['sig_t_m']
+        sig_x_p = mat['sig_x_p']
+        sig_x_m = mat['sig_x_m']
+        wavelength = mat['wavelength']
+        time = mat['time']
+        height = mat['height']
+        caliHIndxRange = mat['caliHIndxRange']
+        indx_45m = mat['indx_45m']
+        indx_45p = mat['indx_45p']
+        dplus = mat['dplus']
+        dminus = mat['dminus']
+        segmentLen = mat['segmentLen']
+        indx = mat['indx']
+        mean_dplus_tmp = mat['mean_dplus_tmp']
+        std_dplus_tmp = mat['std_dplus_tmp']
+        mean_dminus_tmp = mat['mean_dminus_tmp']
+        std_dminus_tmp = mat['std_dminus_tmp']
+        TRt = mat['TR_t']
+        TRx = mat['TR_x']
+        segIndx = mat['segIndx']
+        caliTime = mat['caliTime']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
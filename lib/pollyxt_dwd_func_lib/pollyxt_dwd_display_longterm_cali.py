@@ -1,8 +1,7 @@
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 import numpy as np
-import scipy.io as spio
 from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 from matplotlib.colors import ListedColormap
@@ -10,53 +9,9 @@ import matplotlib.pyplot as plt
 import matplotlib
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime, datenum_to_datetime64
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -92,6 +47,8 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Convert the dates of the history at once with 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     '''
 
     if not os.path.exists(tmpFile):
@@ -100,161 +57,100 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        if mat['LCTime355'].size:
-            thisLCTime355 = mat['LCTime355'][0][:]
-        else:
-            thisLCTime355 = np.array([])
-        if mat['LCTime532'].size:
-            thisLCTime532 = mat['LCTime532'][0][:]
-        else:
-            thisLCTime532 = np.array([])
-        if mat['LCTime1064'].size:
-            thisLCTime1064 = mat['LCTime1064'][0][:]
-        else:
-            thisLCTime1064 = np.array([])
-        if mat['LCTime387'].size:
-            thisLCTime387 = mat['LCTime387'][0][:]
-        else:
-            thisLCTime387 = np.array([])
-        if mat['LCTime607'].size:
-            thisLCTime607 = mat['LCTime607'][0][:]
-        else:
-            thisLCTime607 = np.array([])
-        if mat['LC355Status'].size:
-            LC355Status = mat['LC355Status'][0][:]
-        else:
-            LC355Status = np.array([])
-        if mat['LC532Status'].size:
-            LC532Status = mat['LC532Status'][0][:]
-        else:
-            LC532Status = np.array([])
-        if mat['LC1064Status'].size:
-            LC1064Status = mat['LC1064Status'][0][:]
-        else:
-            LC1064Status = np.array([])
-        if mat['LC387Status'].size:
-            LC387Status = mat['LC387Status'][0][:]
-        else:
-            LC387Status = np.array([])
-        if mat['LC607Status'].size:
-            LC607Status = mat['LC607Status'][0][:]
-        else:
-            LC607Status = np.array([])
-        if mat['LC355History'].size:
-            LC355History = mat['LC355History'][0][:]
-        else:
-            LC355History = np.array([])
-        if mat['LC532History'].size:
-            LC532History = mat['LC532History'][0][:]
-        else:
-            LC532History = np.array([])
-        if mat['LC1064History'].size:
-            LC1064History = mat['LC1064History'][0][:]
-        else:
-            LC1064History = np.array([])
-        if mat['LC387History'].size:
-            LC387History = mat['LC387History'][0][:]
-        else:
-            LC387History = np.array([])
-        if mat['LC607History'].size:
-            LC607History = mat['LC607History'][0][:]
-        else:
-            LC607History = np.array([])
-        if mat['logbookTime'].size:
-            thisLogbookTime = mat['logbookTime'][0][:]
-        else:
-            thisLogbookTime = np.array([])
-        if mat['flagOverlap'].size:
-            flagOverlap = mat['flagOverlap'][0][:]
-        else:
-            flagOverlap = np.array([])
-        if mat['flagWindowwipe'].size:
-            flagWindowwipe = mat['flagWindowwipe'][0][:]
-        else:
-            flagWindowwipe = np.array([])
-        if mat['flagFlashlamps'].size:
-            flagFlashlamps = mat['flagFlashlamps'][0][:]
-        else:
-            flagFlashlamps = np.array([])
-        if mat['flagPulsepower'].size:
-            flagPulsepower = mat['flagPulsepower'][0][:]
-        else:
-            flagPulsepower = np.array([])
-        if mat['flagRestart'].size:
-            flagRestart = mat['flagRestart'][0][:]
-        else:
-            flagRestart = np.array([])
-        if mat['flag_CH_NDChange'].size:
-            flag_CH_NDChange = mat['flag_CH_NDChange'][:]
-        else:
-            flag_CH_NDChange = np.array([])
-        if mat['flagCH355FR'].size:
-            flagCH355FR = mat['flagCH355FR'][0][:]
-        else:
-            flagCH355FR = np.array([])
-        if mat['flagCH532FR'].size:
-            flagCH532FR = mat['flagCH532FR'][0][:]
-        else:
-            flagCH532FR = np.array([])
-        if mat['flagCH1064FR'].size:
-            flagCH1064FR = mat['flagCH1064FR'][0][:]
-        else:
-            flagCH1064FR = np.array([])
-        if mat['flagCH387FR'].size:
-            flagCH387FR = mat['flagCH387FR'][0][:]
-        else:
-            flagCH387FR = np.array([])
-        if mat['flagCH607FR'].size:
-            flagCH607FR = mat['flagCH607FR'][0][:]
-        else:
-            flagCH607FR = np.array([])
-        if mat['flagCH532FR_X'].size:
-            flagCH532FR_X = mat['flagCH532FR_X'][0][:]
-        else:
-            flagCH532FR_X = np.array([])
-        else_time = mat['else_time'][:]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'LCTime355': 'vector',
+            'LCTime532': 'vector',
+            'LCTime1064': 'vector',
+            'LCTime387': 'vector',
+            'LCTime607': 'vector',
+            'LC355Status': 'vector',
+            'LC532Status': 'vector',
+            'LC1064Status': 'vector',
+            'LC387Status': 'vector',
+            'LC607Status': 'vector',
+            'LC355History': 'vector',
+            'LC532History': 'vector',
+            'LC1064History': 'vector',
+            'LC387History': 'vector',
+            'LC607History': 'vector',
+            'logbookTime': 'vector',
+            'flagOverlap': 'vector',
+            'flagWindowwipe': 'vector',
+            'flagFlashlamps': 'vector',
+            'flagPulsepower': 'vector',
+            'flagRestart': 'vector',
+            'flag_CH_NDChange': 'array',
+            'flagCH355FR': 'vector',
+            'flagCH532FR': 'vector',
+            'flagCH1064FR': 'vector',
+            'flagCH387FR': 'vector',
+            'flagCH607FR': 'vector',
+            'flagCH532FR_X': 'vector',
+            'else_time': 'array',
+            'else_label': 'array',
+            'depolCaliTime532': 'vector',
+            'depolCaliConst532': 'vector',
+            'yLim355': 'vector',
+            'yLim532': 'vector',
+            'yLim1064': 'vector',
+            'yLim_LC_ratio_355_387': 'vector',
+            'yLim_LC_ratio_532_607': 'vector',
+            'depolConstLim532': 'vector',
+            'campaignInfo.name': 'string',
+            'taskInfo.dataTime': 'scalar',
+            'campaignInfo.location': 'string',
+            'campaignInfo.startTime': 'scalar',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        thisLCTime355 = mat['LCTime355']
+        thisLCTime532 = mat['LCTime532']
+        thisLCTime1064 = mat['LCTime1064']
+        thisLCTime387 = mat['LCTime387']
+        thisLCTime607 = mat['LCTime607']
+        LC355Status = mat['LC355Status']
+        LC532Status = mat['LC532Status']
+        LC1064Status = mat['LC1064Status']
+        LC387Status = mat['LC387Status']
+        LC607Status = mat['LC607Status']
+        LC355History = mat['LC355History']
+        LC532History = mat['LC532History']
+        LC1064History = mat['LC1064History']
+        LC387History = mat['LC387History']
+        LC607History = mat['LC607History']
+        thisLogbookTime = mat['logbookTime']
+        flagOverlap = mat['flagOverlap']
+        flagWindowwipe = mat['flagWindowwipe']
+        flagFlashlamps = mat['flagFlashlamps']
+        flagPulsepower = mat['flagPulsepower']
+        flagRestart = mat['flagRestart']
+        flag_CH_NDChange = mat['flag_CH_NDChange']
+        flagCH355FR = mat['flagCH355FR']
+        flagCH532FR = mat['flagCH532FR']
+        flagCH1064FR = mat['flagCH1064FR']
+        flagCH387FR = mat['flagCH387FR']
+        flagCH607FR = mat['flagCH607FR']
+        flagCH532FR_X = mat['flagCH532FR_X']
+        else_time = mat['else_time']
         else_label = mat['else_label']
-        if mat['depolCaliTime532'].size:
-            thisDepolCaliTime532 = mat['depolCaliTime532'][0][:]
-        else:
-            thisDepolCaliTime532 = np.array([])
-        if mat['depolCaliConst532'].size:
-            depolCaliConst532 = mat['depolCaliConst532'][0][:]
-        else:
-            depolCaliConst532 = np.array([])
-        if mat['yLim355'].size:
-            yLim355 = mat['yLim355'][0][:]
-        else:
-            yLim355 = np.array([])
-        if mat['yLim532'].size:
-            yLim532 = mat['yLim532'][0][:]
-        else:
-            yLim532 = np.array([])
-        if mat['yLim1064'].size:
-            yLim1064 = mat['yLim1064'][0][:]
-        else:
-            yLim1064 = np.array([])
-        if mat['yLim_LC_ratio_355_387'].size:
-            yLim_LC_ratio_355_387 = mat['yLim_LC_ratio_355_387'][0][:]
-        else:
-            yLim_LC_ratio_355_387 = np.array([])
-        if mat['yLim_LC_ratio_532_607'].size:
-            yLim_LC_ratio_532_607 = mat['yLim_LC_ratio_532_607'][0][:]
-        else:
-            yLim_LC_ratio_532_607 = np.array([])
-        if mat['depolConstLim532'].size:
-            depolConstLim532 = mat['depolConstLim532'][0][:]
-        else:
-            depolConstLim532 = np.array([])
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        dataTime = mat['taskInfo']['dataTime'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        startTime = mat['campaignInfo']['startTime'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        imgFormat = mat['imgFormat'][:][0]
+        thisDepolCaliTime532 = mat['depolCaliTime532']
+        depolCaliConst532 = mat['depolCaliConst532']
+        yLim355 = mat['yLim355']
+        yLim532 = mat['yLim532']
+        yLim1064 = mat['yLim1064']
+        yLim_LC_ratio_355_387 = mat['yLim_LC_ratio_355_387']
+        yLim_LC_ratio_532_607 = mat['yLim_LC_ratio_532_607']
+        depolConstLim532 = mat['depolConstLim532']
+        pollyVersion = mat['campaignInfo.name']
+        dataTime = mat['taskInfo.dataTime']
+        location = mat['campaignInfo.location']
+        startTime = mat['campaignInfo.startTime']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -264,20 +160,17 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
     matplotlib.rcParams['font.sans-serif'] = fontname
     matplotlib.rcParams['font.family'] = "sans-serif"
 
-    # convert matlab datenum tp datetime
-    startTime = datenum_to_datetime(float(startTime[0]))
-    dataTime = datenum_to_datetime(float(dataTime[0]))
-    LCTime355 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime355]
-    LCTime532 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime532]
-    LCTime1064 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime1064]
-    LCTime387 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime387]
-    LCTime607 = [datenum_to_datetime(thisTime) for thisTime in thisLCTime607]
-    logbookTime = [datenum_to_datetime(thisTime)
-                   for thisTime in thisLogbookTime]
-    elseTime = [datenum_to_datetime(thisElseTime)
-                for thisElseTime in else_time]
-    depolCaliTime532 = [datenum_to_datetime(
-        thisTime) for thisTime in thisDepolCaliTime532]
+    # convert matlab datenum to datetime64
+    startTime = datenum_to_datetime(float(startTime))
+    dataTime = datenum_to_datetime(float(dataTime))
+    LCTime355 = datenum_to_datetime64(thisLCTime355)
+    LCTime532 = datenum_to_datetime64(thisLCTime532)
+    LCTime1064 = datenum_to_datetime64(thisLCTime1064)
+    LCTime387 = datenum_to_datetime64(thisLCTime387)
+    LCTime607 = datenum_to_datetime64(thisLCTime607)
+    logbookTime = datenum_to_datetime64(thisLogbookTime)
+    elseTime = datenum_to_datetime64(np.ravel(else_time))
+    depolCaliTime532 = datenum_to_datetime64(thisDepolCaliTime532)
 
     lineColor = {
         'overlap': '#f48f42',
@@ -297,9 +190,7 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
     plt.subplots_adjust(top=0.96, bottom=0.05, left=0.07, right=0.98)
 
     # lidar constants at 355 nm
-    LCTime355 = [
-        LCTime355[indx]
-        for indx in np.arange(0, len(LCTime355)) if LC355Status[indx] == 2]
+    LCTime355 = LCTime355[LC355Status == 2]
     p1 = ax1.scatter(
         LCTime355, LC355History[LC355Status == 2],
         s=7, c='#0000ff', marker='o', label='lidar constant')
@@ -343,8 +234,8 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
             ax1.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax1.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax1.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax1.set_ylabel('LC @ 355nm')
     ax1.grid(False)
@@ -354,9 +245,7 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
     ax1.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # lidar constant at 532 nm
-    LCTime532 = [
-        LCTime532[indx]
-        for indx in np.arange(0, len(LCTime532)) if LC532Status[indx] == 2]
+    LCTime532 = LCTime532[LC532Status == 2]
     p1 = ax2.scatter(
         LCTime532, LC532History[LC532Status == 2],
         s=7, c='#0000ff', marker='o')
@@ -381,8 +270,8 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
             ax2.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax2.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax2.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax2.set_ylabel('LC @ 532nm')
     ax2.grid(False)
@@ -390,10 +279,7 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
     ax2.set_xlim([startTime - timedelta(days=2), dataTime + timedelta(days=2)])
 
     # lidar constant at 1064 nm
-    LCTime1064 = [
-        LCTime1064[indx]
-        for indx in np.arange(0, len(LCTime1064))
-        if LC1064Status[indx] == 2]
+    LCTime1064 = LCTime1064[LC1064Status == 2]
     p1 = ax3.scatter(
         LCTime1064, LC1064History[LC1064Status == 2],
         s=7, c='#0000ff', marker='o')
@@ -418,8 +304,8 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
             ax3.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax3.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax3.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax3.set_ylabel('LC @ 1064nm')
     ax3.grid(False)
@@ -428,10 +314,7 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
 
     # transmission ratio at 355/387 nm
     flagRamanLC = np.logical_and(LC355Status == 2, LC387Status == 2)
-    LCTimeRaman = [
-        LCTime387[indx]
-        for indx in np.arange(0, len(LCTime387))
-        if flagRamanLC[indx]]
+    LCTimeRaman = LCTime387[flagRamanLC]
     p1 = ax4.scatter(
         LCTimeRaman, LC355History[flagRamanLC] / LC387History[flagRamanLC],
         s=7, c='#0000ff', marker='o')
@@ -457,8 +340,8 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
             ax4.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax4.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax4.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax4.set_ylabel('Ratio 355/387')
     ax4.grid(False)
@@ -467,9 +350,7 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
 
     # transmission ratio at 532/607 nm
     flagRamanLC = np.logical_and(LC532Status == 2, LC607Status == 2)
-    LCTimeRaman = [
-        LCTime607[indx]
-        for indx in np.arange(0, len(LCTime607)) if flagRamanLC[indx]]
+    LCTimeRaman = LCTime607[flagRamanLC]
     p1 = ax5.scatter(
         LCTimeRaman, LC532History[flagRamanLC] / LC607History[flagRamanLC],
         s=7, c='#0000ff', marker='o')
@@ -495,8 +376,8 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
             ax5.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax5.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax5.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax5.set_ylabel('Ratio 532/607')
     ax5.grid(False)
@@ -528,8 +409,8 @@ def pollyxt_dwd_display_longterm_cali(tmpFile, saveFolder):
             ax6.axvline(x=logbookTime[iLogbookInfo],
                         linestyle='--', color=lineColor['NDChange'])
 
-    for elseTime in else_time:
-        ax6.axvline(x=elseTime, linestyle='--', color=lineColor['else'])
+    for thisElseTime in elseTime:
+        ax6.axvline(x=thisElseTime, linestyle='--', color=lineColor['else'])
 
     ax6.set_ylabel('V* 532')
     ax6.set_xlabel('Date (mm-dd)')
@@ -6,12 +6,14 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import re
 plt.switch_backend('Agg')
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_handoff import load_variables
+
 
 def parse_polly_filename(pollyFile):
     """
@@ -33,54 +35,6 @@ def parse_polly_filename(pollyFile):
     return dt
 
 
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
-
-
 def rmext(filename):
     """
     remove the file extension.
@@ -114,6 +68,8 @@ def pollyxt_ift_display_overlap(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Remove the unused 'datenum_to_datetime'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     """
 
     if not os.path.exists(tmpFile):
@@ -122,22 +78,38 @@ def pollyxt_ift_display_overlap(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        overlap532 = mat['overlap532'].reshape(-1)
-        overlap532Defaults = mat['overlap532Defaults'].reshape(-1)
-        sig532FR = mat['sig532FR'].reshape(-1)
-        sig532NR = mat['sig532NR'].reshape(-1)
-        sig532Gl = mat['sig532Gl'].reshape(-1)
-        sigRatio532 = mat['sigRatio532'].reshape(-1)
-        normRange532 = mat['normRange532'].reshape(-1)
-        height = mat['height'].reshape(-1)
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        imgFormat = mat['imgFormat'][:][0]
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'overlap532': 'vector',
+            'overlap532Defaults': 'vector',
+            'sig532FR': 'vector',
+            'sig532NR': 'vector',
+            'sig532Gl': 'vector',
+            'sigRatio532': 'vector',
+            'normRange532': 'vector',
+            'height': 'vector',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        overlap532 = mat['overlap532']
+        overlap532Defaults = mat['overlap532Defaults']
+        sig532FR = mat['sig532FR']
+        sig532NR = mat['sig532NR']
+        sig532Gl = mat['sig532Gl']
+        sigRatio532 = mat['sigRatio532']
+        normRange532 = mat['normRange532']
+        height = mat['height']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
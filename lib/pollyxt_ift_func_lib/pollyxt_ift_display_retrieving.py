@@ -1,8 +1,6 @@
 import os
 import sys
-import scipy.io as spio
 import numpy as np
-from datetime import datetime, timedelta
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
@@ -11,53 +9,9 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 plt.switch_backend('Agg')
 
-
-def celltolist(xtickstr):
-    """
-    convert list of list to list of string.
-
-    Examples
-    --------
-
-    [['2010-10-11'], [], ['2011-10-12]] =>
-    ['2010-10-11], '', '2011-10-12']
-    """
-
-    tmp = []
-    for iElement in range(0, len(xtickstr)):
-        if not len(xtickstr[iElement][0]):
-            tmp.append('')
-        else:
-            tmp.append(xtickstr[iElement][0][0])
-
-    return tmp
-
-
-def datenum_to_datetime(datenum):
-    """
-    Convert Matlab datenum into Python datetime.
-
-    Parameters
-    ----------
-    Date: float
-
-    Returns
-    -------
-    dtObj: datetime object
-
-    """
-    days = datenum % 1
-    hours = days % 1 * 24
-    minutes = hours % 1 * 60
-    seconds = minutes % 1 * 60
-
-    dtObj = datetime.fromordinal(int(datenum)) + \
-        timedelta(days=int(days)) + \
-        timedelta(hours=int(hours)) + \
-        timedelta(minutes=int(minutes)) + \
-        timedelta(seconds=round(seconds)) - timedelta(days=366)
-
-    return dtObj
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from polly_time import datenum_to_datetime
+from polly_handoff import load_variables
 
 
 def rmext(filename):
@@ -93,6 +47,8 @@ def pollyxt_ift_display_lidarconst(tmpFile, saveFolder):
     History
     -------
     2019-01-10. First edition by Zhenping
+    2026-10-17. Use 'datenum_to_datetime' of 'polly_time'.
+    2026-10-17. Read only the declared variables with 'load_variables'.
     '''
 
     if not os.path.exists(tmpFile):
@@ -101,81 +57,153 @@ def pollyxt_ift_display_lidarconst(tmpFile, saveFolder):
 
     # read data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
-        figDPI = mat['figDPI'][0][0]
-        startIndx = mat['startIndx'][:][0][0]
-        endIndx = mat['endIndx'][:][0][0]
-        rcs355 = mat['rcs355'][:][0]
-        rcs532 = mat['rcs532'][:][0]
-        rcs1064 = mat['rcs1064'][:][0]
-        height = mat['height'][:][0]
-        time = mat['time'][:][0]
-        molRCS355 = mat['molRCS355'][:][0]
-        molRCS532 = mat['molRCS532'][:][0]
-        molRCS1064 = mat['molRCS1064'][:][0]
-        refHIndx355 = mat['refHIndx355'][:][0]
-        refHIndx532 = mat['refHIndx532'][:][0]
-        refHIndx1064 = mat['refHIndx1064'][:][0]
-        aerBsc_355_klett = mat['aerBsc_355_klett'][:][0]
-        aerBsc_532_klett = mat['aerBsc_532_klett'][:][0]
-        aerBsc_1064_klett = mat['aerBsc_1064_klett'][:][0]
-        aerBsc_355_raman = mat['aerBsc_355_raman'][:][0]
-        aerBsc_532_raman = mat['aerBsc_532_raman'][:][0]
-        aerBsc_1064_raman = mat['aerBsc_1064_raman'][:][0]
-        aerBsc_355_aeronet = mat['aerBsc_355_aeronet'][:][0]
-        aerBsc_532_aeronet = mat['aerBsc_532_aeronet'][:][0]
-        aerBsc_1064_aeronet = mat['aerBsc_1064_aeronet'][:][0]
-        aerExt_355_klett = mat['aerExt_355_klett'][:][0]
-        aerExt_532_klett = mat['aerExt_532_klett'][:][0]
-        aerExt_1064_klett = mat['aerExt_1064_klett'][:][0]
-        aerExt_355_raman = mat['aerExt_355_raman'][:][0]
-        aerExt_532_raman = mat['aerExt_532_raman'][:][0]
-        aerExt_1064_raman = mat['aerExt_1064_raman'][:][0]
-        aerExt_355_aeronet = mat['aerExt_355_aeronet'][:][0]
-        aerExt_532_aeronet = mat['aerExt_532_aeronet'][:][0]
-        aerExt_1064_aeronet = mat['aerExt_1064_aeronet'][:][0]
-        LR355_raman = mat['LR355_raman'][:][0]
-        LR532_raman = mat['LR532_raman'][:][0]
-        ang_bsc_355_532_klett = mat['ang_bsc_355_532_klett'][:][0]
-        ang_bsc_532_1064_klett = mat['ang_bsc_532_1064_klett'][:][0]
-        ang_bsc_355_532_raman = mat['ang_bsc_355_532_raman'][:][0]
-        ang_bsc_532_1064_raman = mat['ang_bsc_532_1064_raman'][:][0]
-        ang_ext_355_532_raman = mat['ang_ext_355_532_raman'][:][0]
-        voldepol532_klett = mat['voldepol532_klett'][:][0]
-        voldepol532_raman = mat['voldepol532_raman'][:][0]
-        pardepol532_klett = mat['pardepol532_klett'][:][0]
-        pardepolStd532_klett = mat['pardepolStd532_klett'][:][0]
-        pardepol532_raman = mat['pardepol532_raman'][:][0]
-        pardepolStd532_raman = mat['pardepolStd532_raman'][:][0]
-        wvmr = mat['wvmr'][:][0]
-        flagWVCalibration = mat['flagWVCalibration'][:][0]
-        flagWVCalibration = mat['flagWVCalibration'][:][0]
-        rh = mat['rh'][:][0]
-        rh_meteor = mat['rh_meteor'][:][0]
-        meteorSource = mat['meteorSource'][:][0]
-        temperature = mat['temperature'][:][0]
-        pressure = mat['pressure'][:][0]
-        pollyVersion = mat['campaignInfo']['name'][0][0][0]
-        location = mat['campaignInfo']['location'][0][0][0]
-        version = mat['processInfo']['programVersion'][0][0][0]
-        fontname = mat['processInfo']['fontname'][0][0][0]
-        dataFilename = mat['taskInfo']['dataFilename'][0][0][0]
-        yLim_Profi_Ext = mat['yLim_Profi_Ext'][:][0]
-        yLim_Profi_LR = mat['yLim_Profi_LR'][:][0]
-        yLim_Profi_DR = mat['yLim_Profi_DR'][:][0]
-        yLim_Profi_Bsc = mat['yLim_Profi_Bsc'][:][0]
-        yLim_Profi_WV_RH = mat['yLim_Profi_WV_RH'][:][0]
-        yLim_FR_RCS = mat['yLim_FR_RCS'][:][0]
-        yLim_NR_RCS = mat['yLim_NR_RCS'][:][0]
-        xLim_Profi_Bsc = mat['xLim_Profi_Bsc'][:][0]
-        xLim_Profi_NR_Bsc = mat['xLim_Profi_NR_Bsc'][:][0]
-        xLim_Profi_Ext = mat['xLim_Profi_Ext'][:][0]
-        xLim_Profi_NR_Ext = mat['xLim_Profi_NR_Ext'][:][0]
-        xLim_Profi_WV_RH = mat['xLim_Profi_WV_RH'][:][0]
-        xLim_Profi_RCS = mat['xLim_Profi_RCS'][:][0]
-        xLim_Profi_LR = mat['xLim_Profi_LR'][:][0]
-        imgFormat = mat['imgFormat'][:][]
-
+        mat = load_variables(tmpFile, {
+            'figDPI': 'scalar',
+            'startIndx': 'scalar',
+            'endIndx': 'scalar',
+            'rcs355': 'vector',
+            'rcs532': 'vector',
+            'rcs1064': 'vector',
+            'height': 'vector',
+            'time': 'vector',
+            'molRCS355': 'vector',
+            'molRCS532': 'vector',
+            'molRCS1064': 'vector',
+            'refHIndx355': 'vector',
+            'refHIndx532': 'vector',
+            'refHIndx1064': 'vector',
+            'aerBsc_355_klett': 'vector',
+            'aerBsc_532_klett': 'vector',
+            'aerBsc_1064_klett': 'vector',
+            'aerBsc_355_raman': 'vector',
+            'aerBsc_532_raman': 'vector',
+            'aerBsc_1064_raman': 'vector',
+            'aerBsc_355_aeronet': 'vector',
+            'aerBsc_532_aeronet': 'vector',
+            'aerBsc_1064_aeronet': 'vector',
+            'aerExt_355_klett': 'vector',
+            'aerExt_532_klett': 'vector',
+            'aerExt_1064_klett': 'vector',
+            'aerExt_355_raman': 'vector',
+            'aerExt_532_raman': 'vector',
+            'aerExt_1064_raman': 'vector',
+            'aerExt_355_aeronet': 'vector',
+            'aerExt_532_aeronet': 'vector',
+            'aerExt_1064_aeronet': 'vector',
+            'LR355_raman': 'vector',
+            'LR532_raman': 'vector',
+            'ang_bsc_355_532_klett': 'vector',
+            'ang_bsc_532_1064_klett': 'vector',
+            'ang_bsc_355_532_raman': 'vector',
+            'ang_bsc_532_1064_raman': 'vector',
+            'ang_ext_355_532_raman': 'vector',
+            'voldepol532_klett': 'vector',
+            'voldepol532_raman': 'vector',
+            'pardepol532_klett': 'vector',
+            'pardepolStd532_klett': 'vector',
+            'pardepol532_raman': 'vector',
+            'pardepolStd532_raman': 'vector',
+            'wvmr': 'vector',
+            'flagWVCalibration': 'string',
+            'rh': 'vector',
+            'rh_meteor': 'vector',
+            'meteorSource': 'string',
+            'temperature': 'vector',
+            'pressure': 'vector',
+            'campaignInfo.name': 'string',
+            'campaignInfo.location': 'string',
+            'processInfo.programVersion': 'string',
+            'processInfo.fontname': 'string',
+            'taskInfo.dataFilename': 'string',
+            'yLim_Profi_Ext': 'vector',
+            'yLim_Profi_LR': 'vector',
+            'yLim_Profi_DR': 'vector',
+            'yLim_Profi_Bsc': 'vector',
+            'yLim_Profi_WV_RH': 'vector',
+            'yLim_FR_RCS': 'vector',
+            'yLim_NR_RCS': 'vector',
+            'xLim_Profi_Bsc': 'vector',
+            'xLim_Profi_NR_Bsc': 'vector',
+            'xLim_Profi_Ext': 'vector',
+            'xLim_Profi_NR_Ext': 'vector',
+            'xLim_Profi_WV_RH': 'vector',
+            'xLim_Profi_RCS': 'vector',
+            'xLim_Profi_LR': 'vector',
+            'imgFormat': 'string'
+            })
+        figDPI = mat['figDPI']
+        startIndx = mat['startIndx']
+        endIndx = mat['endIndx']
+        rcs355 = mat['rcs355']
+        rcs532 = mat['rcs532']
+        rcs1064 = mat['rcs1064']
+        height = mat['height']
+        time = mat['time']
+        molRCS355 = mat['molRCS355']
+        molRCS532 = mat['molRCS532']
+        molRCS1064 = mat['molRCS1064']
+        refHIndx355 = mat['refHIndx355']
+        refHIndx532 = mat['refHIndx532']
+        refHIndx1064 = mat['refHIndx1064']
+        aerBsc_355_klett = mat['aerBsc_355_klett']
+        aerBsc_532_klett = mat['aerBsc_532_klett']
+        aerBsc_1064_klett = mat['aerBsc_1064_klett']
+        aerBsc_355_raman = mat['aerBsc_355_raman']
+        aerBsc_532_raman = mat['aerBsc_532_raman']
+        aerBsc_1064_raman = mat['aerBsc_1064_raman']
+        aerBsc_355_aeronet = mat['aerBsc_355_aeronet']
+        aerBsc_532_aeronet = mat['aerBsc_532_aeronet']
+        aerBsc_1064_aeronet = mat['aerBsc_1064_aeronet']
+        aerExt_355_klett = mat['aerExt_355_klett']
+        aerExt_532_klett = mat['aerExt_532_klett']
+        aerExt_1064_klett = mat['aerExt_1064_klett']
+        aerExt_355_raman = mat['aerExt_355_raman']
+        aerExt_532_raman = mat['aerExt_532_raman']
+        aerExt_1064_raman = mat['aerExt_1064_raman']
+        aerExt_355_aeronet = mat['aerExt_355_aeronet']
+        aerExt_532_aeronet = mat['aerExt_532_aeronet']
+        aerExt_1064_aeronet = mat['aerExt_1064_aeronet']
+        LR355_raman = mat['LR355_raman']
+        LR532_raman = mat['LR532_raman']
+        ang_bsc_355_532_klett = mat['ang_bsc_355_532_klett']
+        ang_bsc_532_1064_klett = mat['ang_bsc_532_1064_klett']
+        ang_bsc_355_532_raman = mat['ang_bsc_355_532_raman']
+        ang_bsc_532_1064_raman = mat['ang_bsc_532_1064_raman']
+        ang_ext_355_532_raman = mat['ang_ext_355_532_raman']
+        voldepol532_klett = mat['voldepol532_klett']
+        voldepol532_raman = mat['voldepol532_raman']
+        pardepol532_klett = mat['pardepol532_klett']
+        pardepolStd532_klett = mat['pardepolStd532_klett']
+        pardepol532_raman = mat['pardepol532_raman']
+        pardepolStd532_raman = mat['pardepolStd532_raman']
+        wvmr = mat['wvmr']
+        flagWVCalibration = mat['flagWVCalibration']
+        flagWVCalibration = mat['flagWVCalibration']
+        rh = mat['rh']
+        rh_meteor = mat['rh_meteor']
+        meteorSource = mat['meteorSource']
+        temperature = mat['temperature']
+        pressure = mat['pressure']
+        pollyVersion = mat['campaignInfo.name']
+        location = mat['campaignInfo.location']
+        version = mat['processInfo.programVersion']
+        fontname = mat['processInfo.fontname']
+        dataFilename = mat['taskInfo.dataFilename']
+        yLim_Profi_Ext = mat['yLim_Profi_Ext']
+        yLim_Profi_LR = mat['yLim_Profi_LR']
+        yLim_Profi_DR = mat['yLim_Profi_DR']
+        yLim_Profi_Bsc = mat['yLim_Profi_Bsc']
+        yLim_Profi_WV_RH = mat['yLim_Profi_WV_RH']
+        yLim_FR_RCS = mat['yLim_FR_RCS']
+        yLim_NR_RCS = mat['yLim_NR_RCS']
+        xLim_Profi_Bsc = mat['xLim_Profi_Bsc']
+        xLim_Profi_NR_Bsc = mat['xLim_Profi_NR_Bsc']
+        xLim_Profi_Ext = mat['xLim_Profi_Ext']
+        xLim_Profi_NR_Ext = mat['xLim_Profi_NR_Ext']
+        xLim_Profi_WV_RH = mat['xLim_Profi_WV_RH']
+        xLim_Profi_RCS = mat['xLim_Profi_RCS']
+        xLim_Profi_LR = mat['xLim_Profi_LR']
+        imgFormat = mat['imgFormat']
     except Exception as e:
         print(e)
         print('Failed reading %s' % (tmpFile))
@@ -0,0 +1,120 @@
+function python_display_batch(action)
+%PYTHON_DISPLAY_BATCH queue the python display jobs of one measurement file and
+%render them within one python interpreter with a pool of workers.
+%Example:
+%   python_display_batch('start')
+%   pollyxt_display_rcs(data, taskInfo, config);   % queued
+%   ...
+%   python_display_batch('run')
+%Inputs:
+%   action: char
+%       'start': start to queue the display jobs. Nothing will be done if
+%                'flagPyDisplayBatch' was not enabled in the pollynet
+%                processing chain config or the visualization mode is not
+%                python.
+%       'run': write all the queued jobs into a manifest file and render them
+%              with 'lib/polly_display.py run'. The number of workers is
+%              controlled by 'pyDisplayWorkers'.
+%History:
+%   2026-10-17. First Edition
+%   2026-10-17. Delete the npy handoff folders.
+%   2026-10-17. Use the shared escape_json.
+
+global processInfo pyDisplayJobs
+
+switch lower(action)
+case 'start'
+    pyDisplayJobs = [];
+
+    if ~ strcmpi(processInfo.visualizationMode, 'python')
+        return;
+    end
+    if ~ isfield(processInfo, 'flagPyDisplayBatch') || ...
+       ~ processInfo.flagPyDisplayBatch
+        return;
+    end
+
+    pyDisplayJobs = struct('func', {}, 'tmpFile', {}, 'saveFolder', {});
+
+case 'run'
+    if ~ isstruct(pyDisplayJobs)
+        return;
+    end
+
+    jobs = pyDisplayJobs;
+    pyDisplayJobs = [];   % stop queuing
+    if isempty(jobs)
+        return;
+    end
+
+    nWorkers = 1;
+    if isfield(processInfo, 'pyDisplayWorkers')
+        nWorkers = processInfo.pyDisplayWorkers;
+    end
+
+    %% write the manifest file
+    tmpFolder = fileparts(jobs(1).tmpFile);
+    manifestFile = fullfile(tmpFolder, [basename(tempname), '.json']);
+    summaryFile = [rmext(manifestFile), '_summary.json'];
+
+    fid = fopen(manifestFile, 'w');
+    fprintf(fid, '{\n    "workers": %d,\n    "jobs": [\n', nWorkers);
+    for iJob = 1:length(jobs)
+        fprintf(fid, '        {"func": "%s", "tmpFile": "%s", "saveFolder": "%s"}', ...
+                jobs(iJob).func, escape_json(jobs(iJob).tmpFile), ...
+                escape_json(jobs(iJob).saveFolder));
+        if iJob < length(jobs)
+            fprintf(fid, ',\n');
+        else
+            fprintf(fid, '\n');
+        end
+    end
+    fprintf(fid, '    ]\n}\n');
+    fclose(fid);
+
+    %% render
+    fprintf('[%s] Render %d python display jobs with %d workers.\n', ...
+            tNow(), length(jobs), nWorkers);
+    flag = system(sprintf('%s %s run %s --summary %s', ...
+                  fullfile(processInfo.pyBinDir, 'python'), ...
+                  fullfile(fileparts(mfilename('fullpath')), 'polly_display.py'), ...
+                  manifestFile, summaryFile));
+
+    if flag ~= 0
+        if exist(summaryFile, 'file') == 2
+            summary = loadjson(summaryFile);
+            for iJob = 1:length(summary.jobs)
+                if iscell(summary.jobs)
+                    job = summary.jobs{iJob};
+                else
+                    job = summary.jobs(iJob);
+                end
+
+                if job.status ~= 0
+                    warning('Error in executing %s.py', job.func);
+                end
+            end
+        else
+            warning('Error in executing the python display jobs in %s', ...
+                    manifestFile);
+        end
+    end
+
+    %% cleanup
+    for iJob = 1:length(jobs)
+        if exist(jobs(iJob).tmpFile, 'dir') == 7
+            rmdir(jobs(iJob).tmpFile, 's');
+        elseif exist(jobs(iJob).tmpFile, 'file') == 2
+            delete(jobs(iJob).tmpFile);
+        end
+    end
+    delete(manifestFile);
+    if exist(summaryFile, 'file') == 2
+        delete(summaryFile);
+    end
+
+otherwise
+    error('Unknown action %s', action);
+end
+
+end
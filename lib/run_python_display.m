@@ -0,0 +1,108 @@
+function [flag] = run_python_display(pyFile, tmpFile, saveFolder)
+%RUN_PYTHON_DISPLAY run the python display script with the temporary data file.
+%If 'pyDisplayServer' was set in the pollynet processing chain config, the job
+%will be sent to the running render server (lib/polly_display.py), which saves
+%the start-up time of python interpreter and the imports of numpy, scipy and
+%matplotlib for each figure. If the batch mode was started by
+%python_display_batch, the job will be queued and rendered together with the
+%other products of the same measurement file.
+%Example:
+%   [flag] = run_python_display(pyFile, tmpFile, saveFolder)
+%Inputs:
+%   pyFile: char
+%       absolute path of the python display script.
+%       e.g., '/lib/polly_general_func_lib/pollyxt_display_rcs.py'
+%   tmpFile: char
+%       .mat file or npy folder with the data for visualization (see
+%       save_python_handoff). It will be deleted after the job was finished.
+%   saveFolder: char
+%       folder to save the figures.
+%Outputs:
+%   flag: integer
+%       status of the display job. 0 means success.
+%History:
+%   2026-10-17. First Edition
+%   2026-10-17. Queue the jobs in batch mode and delete the tmpFile.
+%   2026-10-17. Delete the npy handoff folder.
+%   2026-10-17. Run the standalone scripts with the timing spans.
+%   2026-10-17. Use the shared escape_json.
+
+global processInfo pyDisplayJobs
+
+if isstruct(pyDisplayJobs)
+    % batch mode: the job will be rendered by python_display_batch('run')
+    pyDisplayJobs(end + 1).func = rmext(basename(pyFile));
+    pyDisplayJobs(end).tmpFile = tmpFile;
+    pyDisplayJobs(end).saveFolder = saveFolder;
+    flag = 0;
+    return;
+end
+
+pyBin = fullfile(processInfo.pyBinDir, 'python');
+pyDisplayServer = '';
+if isfield(processInfo, 'pyDisplayServer')
+    pyDisplayServer = processInfo.pyDisplayServer;
+end
+
+% the standalone scripts are executed by polly_display.py, which records the
+% timing spans of the display function in the log_folder.
+pyDisplay = fullfile(fileparts(mfilename('fullpath')), 'polly_display.py');
+
+if isempty(pyDisplayServer)
+    flag = system(sprintf('%s %s exec %s %s %s', pyBin, pyDisplay, ...
+                  pyFile, tmpFile, saveFolder));
+    delete_handoff(tmpFile);
+    return;
+end
+
+funcName = rmext(basename(pyFile));
+tcpAddr = regexp(pyDisplayServer, '^(?<host>[^:/\\]*):(?<port>\d+)$', 'names');
+
+if ~ isempty(tcpAddr)
+    % talk to the render server through the java socket of MATLAB, without
+    % any new process.
+    try
+        request = sprintf('{"func": "%s", "tmpFile": "%s", "saveFolder": "%s"}', ...
+                          funcName, escape_json(tmpFile), ...
+                          escape_json(saveFolder));
+        sock = java.net.Socket(tcpAddr.host, str2double(tcpAddr.port));
+        writer = java.io.PrintWriter(java.io.OutputStreamWriter(sock.getOutputStream(), 'UTF-8'), true);
+        reader = java.io.BufferedReader(java.io.InputStreamReader(sock.getInputStream(), 'UTF-8'));
+        writer.println(request);
+        response = char(reader.readLine());
+        sock.close();
+
+        res = loadjson(response);
+        fprintf('%s', res.output);
+        flag = res.status;
+        delete_handoff(tmpFile);
+        return;
+    catch ME
+        warning('Render server %s is not available: %s', pyDisplayServer, ME.message);
+    end
+else
+    % unix socket is not supported by the java of MATLAB. Use the light-weight
+    % client, which only imports the python standard library.
+    flag = system(sprintf('%s %s send --server %s %s %s %s', pyBin, ...
+                  pyDisplay, pyDisplayServer, funcName, tmpFile, saveFolder));
+    if flag ~= 4
+        % 4 means the render server is not reachable
+        delete_handoff(tmpFile);
+        return;
+    end
+end
+
+% fall back to the standalone python script
+flag = system(sprintf('%s %s exec %s %s %s', pyBin, pyDisplay, pyFile, ...
+              tmpFile, saveFolder));
+delete_handoff(tmpFile);
+
+end
+
+function delete_handoff(tmpFile)
+    if exist(tmpFile, 'dir') == 7
+        rmdir(tmpFile, 's');
+    elseif exist(tmpFile, 'file') == 2
+        delete(tmpFile);
+    end
+end
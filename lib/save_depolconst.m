@@ -24,6 +24,7 @@ function save_depolconst(dbFile, depolconst, depolconstStd, ...
 %       wavelength. ('355' or '532')
 %History:
 %   2020-04-18. First edition.
+%   2026-10-17. Add the index for the time-windowed queries.
 %Contact:
 %   zhenping@tropos.de
 
@@ -40,6 +41,9 @@ exec(conn, ['CREATE TABLE IF NOT EXISTS depol_calibration_constant ', ...
 exec(conn, ['CREATE UNIQUE INDEX IF NOT EXISTS uniq_index ON ', ...
             'depol_calibration_constant(cali_start_time, cali_stop_time, ', ...
             'wavelength, polly_type);']);
+exec(conn, ['CREATE INDEX IF NOT EXISTS depol_query_index ON ', ...
+            'depol_calibration_constant(polly_type, wavelength, ', ...
+            'cali_start_time);']);
 commit(conn);
 
 %% insert data
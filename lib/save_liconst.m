@@ -32,6 +32,7 @@ function save_liconst(dbFile, liconst, liconstStd, ...
 %       ('near_range', or 'far_range')
 %History:
 %   2020-04-18. First edition.
+%   2026-10-17. Add the index for the time-windowed queries.
 %Contact:
 %   zhenping@tropos.de
 
@@ -49,6 +50,9 @@ exec(conn, ['CREATE TABLE IF NOT EXISTS lidar_calibration_constant ', ...
 exec(conn, ['CREATE UNIQUE INDEX IF NOT EXISTS uniq1_index ON ', ...
             'lidar_calibration_constant(cali_start_time, cali_stop_time, ', ...
             'wavelength, cali_method, polly_type, telescope);']);
+exec(conn, ['CREATE INDEX IF NOT EXISTS lc_query_index ON ', ...
+            'lidar_calibration_constant(polly_type, wavelength, ', ...
+            'cali_method, telescope, cali_start_time);']);
 commit(conn);
 
 %% insert data
@@ -0,0 +1,197 @@
+function [handoff] = save_python_handoff(tmpFile, varargin)
+%SAVE_PYTHON_HANDOFF save the variables of the display function for the python
+%display script. The format is controlled by 'pyHandoffFormat' in the
+%pollynet processing chain config:
+%   'mat': .mat file (-v6), which is parsed completely by scipy.io.loadmat.
+%   'h5': .mat file (-v7.3, HDF5 without compression). The large arrays will
+%         be memory-mapped by python. (MATLAB R2017a or later)
+%   'npy': folder with the large numeric arrays as .npy files, which will be
+%          memory-mapped by python, and all the other variables in
+%          'variables.mat' (-v6).
+%   'shm': folder in the POSIX shared memory ('pyHandoffShmFolder', default
+%          '/dev/shm') with the large numeric arrays as raw buffers, all the
+%          other variables in 'variables.mat' (-v6) and the descriptor
+%          'handoff.json' with the names, dtypes and shapes of the buffers.
+%          Nothing will be written to the tmpFolder. It falls back to 'mat'
+%          if the shared memory folder does not exist.
+%All the formats are loaded by 'load_handoff' in lib/polly_handoff.py.
+%Example:
+%   [handoff] = save_python_handoff(tmpFile, 'figDPI', 'mTime', 'height')
+%Inputs:
+%   tmpFile: char
+%       .mat file for the handoff.
+%   varargin: cell
+%       names of the variables in the workspace of the caller.
+%Outputs:
+%   handoff: char
+%       .mat file or folder of the handoff, which needs to be passed to
+%       run_python_display.
+%History:
+%   2026-10-17. First Edition
+%   2026-10-17. Add the shared memory handoff 'shm'.
+
+global processInfo
+
+% minimum number of elements of the arrays saved as .npy files or raw
+% buffers
+NPY_MIN_NUMEL = 1024;
+
+handoffFormat = 'mat';
+if isfield(processInfo, 'pyHandoffFormat') && ...
+   (~ isempty(processInfo.pyHandoffFormat))
+    handoffFormat = lower(processInfo.pyHandoffFormat);
+end
+
+shmFolder = '/dev/shm';
+if isfield(processInfo, 'pyHandoffShmFolder') && ...
+   (~ isempty(processInfo.pyHandoffShmFolder))
+    shmFolder = processInfo.pyHandoffShmFolder;
+end
+if strcmpi(handoffFormat, 'shm') && (exist(shmFolder, 'dir') ~= 7)
+    warning('Shared memory folder %s does not exist. Use .mat handoff.', ...
+            shmFolder);
+    handoffFormat = 'mat';
+end
+
+vars = struct();
+for iVar = 1:length(varargin)
+    vars.(varargin{iVar}) = evalin('caller', varargin{iVar});
+end
+
+switch handoffFormat
+case 'mat'
+    handoff = tmpFile;
+    save(handoff, '-struct', 'vars', '-v6');
+
+case 'h5'
+    handoff = tmpFile;
+    save(handoff, '-struct', 'vars', '-v7.3', '-nocompression');
+
+case 'npy'
+    handoff = rmext(tmpFile);
+    mkdir(handoff);
+
+    smallVars = struct();
+    for iVar = 1:length(varargin)
+        value = vars.(varargin{iVar});
+        if (isnumeric(value) || islogical(value)) && isreal(value) && ...
+           (~ issparse(value)) && (numel(value) >= NPY_MIN_NUMEL)
+            write_npy(fullfile(handoff, [varargin{iVar}, '.npy']), value);
+        else
+            smallVars.(varargin{iVar}) = value;
+        end
+    end
+    save(fullfile(handoff, 'variables.mat'), '-struct', 'smallVars', '-v6');
+
+case 'shm'
+    handoff = fullfile(shmFolder, rmext(basename(tmpFile)));
+    mkdir(handoff);
+
+    smallVars = struct();
+    arrays = {};
+    for iVar = 1:length(varargin)
+        value = vars.(varargin{iVar});
+        if (isnumeric(value) || islogical(value)) && isreal(value) && ...
+           (~ issparse(value)) && (numel(value) >= NPY_MIN_NUMEL)
+            matClass = class(value);
+            [descr, value] = npy_descr(value);
+            write_raw(fullfile(handoff, [varargin{iVar}, '.bin']), value);
+            arrays{end + 1} = sprintf(['{"name": "%s", "file": "%s.bin", ', ...
+                '"dtype": "%s", "shape": [%s], "order": "F", ', ...
+                '"class": "%s"}'], varargin{iVar}, varargin{iVar}, descr, ...
+                strjoin(arrayfun(@num2str, size(value), ...
+                                 'UniformOutput', false), ', '), matClass);
+        else
+            smallVars.(varargin{iVar}) = value;
+        end
+    end
+    save(fullfile(handoff, 'variables.mat'), '-struct', 'smallVars', '-v6');
+
+    % the descriptor is written at last
+    fid = fopen(fullfile(handoff, 'handoff.json'), 'w');
+    if fid == -1
+        error('Failed to create the handoff descriptor in %s', handoff);
+    end
+    fprintf(fid, ['{"version": 1, "arrays": [%s], ', ...
+                  '"variables": "variables.mat", ', ...
+                  '"metadata": {"created": "%s", "tmpFile": "%s"}}'], ...
+            strjoin(arrays, ', '), datestr(now, 'yyyy-mm-ddTHH:MM:SS'), ...
+            strrep(strrep(tmpFile, '\', '\\'), '"', '\"'));
+    fclose(fid);
+
+otherwise
+    error('Unknown pyHandoffFormat %s', handoffFormat);
+end
+
+end
+
+function [descr, value] = npy_descr(value)
+%NPY_DESCR numpy type string of the array. The logical arrays are converted to
+%uint8.
+
+    switch class(value)
+    case 'double'
+        descr = '<f8';
+    case 'single'
+        descr = '<f4';
+    case 'int8'
+        descr = '|i1';
+    case 'uint8'
+        descr = '|u1';
+    case 'int16'
+        descr = '<i2';
+    case 'uint16'
+        descr = '<u2';
+    case 'int32'
+        descr = '<i4';
+    case 'uint32'
+        descr = '<u4';
+    case 'int64'
+        descr = '<i8';
+    case 'uint64'
+        descr = '<u8';
+    case 'logical'
+        descr = '|b1';
+        value = uint8(value);
+    otherwise
+        error('Unsupported class %s for the python handoff', class(value));
+    end
+end
+
+function write_npy(file, value)
+%WRITE_NPY write the array as .npy file (version 1.0) in fortran order, which
+%keeps the dimensions of MATLAB without transposing.
+
+    [descr, value] = npy_descr(value);
+
+    shapeStr = strjoin(arrayfun(@num2str, size(value), ...
+                                'UniformOutput', false), ', ');
+    header = sprintf('{''descr'': ''%s'', ''fortran_order'': True, ''shape'': (%s), }', ...
+                     descr, shapeStr);
+
+    % the header is padded with spaces to a multiple of 64 bytes (including
+    % the magic string, version and header length)
+    nPad = mod(64 - mod(10 + length(header) + 1, 64), 64);
+    header = [header, repmat(' ', 1, nPad), sprintf('\n')];
+
+    fid = fopen(file, 'w', 'l');
+    if fid == -1
+        error('Failed to create %s', file);
+    end
+    fwrite(fid, [147, double('NUMPY'), 1, 0], 'uint8');
+    fwrite(fid, length(header), 'uint16');
+    fwrite(fid, header, 'char');
+    fwrite(fid, value, class(value));
+    fclose(fid);
+end
+
+function write_raw(file, value)
+%WRITE_RAW write the array as raw little-endian buffer in column-major order.
+
+    fid = fopen(file, 'w', 'l');
+    if fid == -1
+        error('Failed to create %s', file);
+    end
+    fwrite(fid, value, class(value));
+    fclose(fid);
+end
@@ -39,6 +39,7 @@ function save_wvconst(dbFile, wvconst, wvconstStd, WVCaliInfo, IWVAttri, ...
 %               no calibration constants.
 %   2019-08-09. Saving the real applied water vapor constant instead of the 
 %               defaults. And remove the outputs of the function.
+%   2026-10-17. Add the index for the time-windowed queries.
 %Contact:
 %   zhenping@tropos.de
 
@@ -55,6 +56,8 @@ exec(conn, ['CREATE TABLE IF NOT EXISTS wv_calibration_constant ', ...
 exec(conn, ['CREATE UNIQUE INDEX IF NOT EXISTS uniq2_index ON ', ...
             'wv_calibration_constant(cali_start_time, cali_stop_time, ', ...
             'standard_instrument, polly_type);']);
+exec(conn, ['CREATE INDEX IF NOT EXISTS wv_query_index ON ', ...
+            'wv_calibration_constant(polly_type, cali_start_time);']);
 commit(conn);
 
 %% insert data